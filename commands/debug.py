@@ -7,6 +7,10 @@ Group structure:
 /debug initiative - Test initiative system
 /debug combat - Test combat system
 /debug movesets - Test moveset system
+/debug loglevel - Change log verbosity per subsystem
+/debug perf - Command latency and database call report
+/debug profile - Profile the live bot (owners only)
+/debug memory - Allocation growth over a window (owners only)
 """
 
 # General imports
@@ -15,6 +19,8 @@ from discord import app_commands
 from discord.ext import commands
 import logging
 import asyncio
+import io
+import time
 from typing import Optional, List, Tuple
 
 # Core imports
@@ -31,10 +37,21 @@ from modules.moves.loader import MoveLoader
 from utils.error_handler import handle_error
 from utils.test_helper import process_turns
 from utils.test_helper import recreate_test_characters, run_move_effect_tests
+from utils.logging_config import SUBSYSTEMS, LEVELS, set_level, get_levels
+from utils.perf import perf, format_ms
+from utils.profiling import CaptureBusy, MAX_CAPTURE_SECONDS, profile_capture, memory_capture
 
 
 logger = logging.getLogger(__name__)
 
+def owner_only():
+    """App command check limited to the bot's owners"""
+    async def predicate(interaction: discord.Interaction) -> bool:
+        if not await interaction.client.is_owner(interaction.user):
+            raise app_commands.CheckFailure("This command is limited to bot owners")
+        return True
+    return app_commands.check(predicate)
+
 class DebugCommands(commands.GroupCog, name="debug"):
     def __init__(self, bot):
         self.bot = bot
@@ -69,6 +86,175 @@ class DebugCommands(commands.GroupCog, name="debug"):
             logger.error(f"Error in reset command: {e}")
             await interaction.followup.send(f"Error in debug command: {str(e)}")
 
+    @app_commands.command(name="loglevel")
+    @app_commands.describe(
+        subsystem="Subsystem to change (leave empty to show current levels)",
+        level="New log level"
+    )
+    @app_commands.choices(
+        subsystem=[app_commands.Choice(name="all", value="all")] + [
+            app_commands.Choice(name=name, value=name) for name in SUBSYSTEMS
+        ],
+        level=[app_commands.Choice(name=name, value=name) for name in LEVELS]
+    )
+    @app_commands.checks.has_permissions(administrator=True)
+    async def log_level(
+        self,
+        interaction: discord.Interaction,
+        subsystem: Optional[str] = None,
+        level: Optional[str] = None
+    ):
+        """Show or change logging verbosity per subsystem"""
+        if subsystem and level:
+            try:
+                set_level(subsystem, level)
+            except ValueError as e:
+                await interaction.response.send_message(f"❌ {str(e)}", ephemeral=True)
+                return
+            logger.info("Log level for %s set to %s by %s", subsystem, level, interaction.user.name)
+        
+        levels = "\n".join(f"{name}: {value}" for name, value in get_levels().items())
+        await interaction.response.send_message(
+            f"**Log Levels**\n```\n{levels}\n```",
+            ephemeral=True
+        )
+
+    @app_commands.command(name="perf")
+    @app_commands.describe(
+        prometheus="Also attach all metrics in Prometheus text format",
+        reset="Clear all collected metrics after showing them"
+    )
+    @app_commands.checks.has_permissions(administrator=True)
+    async def perf_report(
+        self,
+        interaction: discord.Interaction,
+        prometheus: bool = False,
+        reset: bool = False
+    ):
+        """Show command latency percentiles and database call counts"""
+        uptime = int(time.time() - perf.started)
+        embed = discord.Embed(
+            title="Performance Report",
+            description=f"Collected over the last {uptime // 3600}h {uptime % 3600 // 60}m",
+            color=discord.Color.blue()
+        )
+
+        def rows(metric: str) -> str:
+            lines = [
+                f"{name[:24]:<24} {hist.count:>5} {format_ms(hist.percentile(50)):>8} "
+                f"{format_ms(hist.percentile(95)):>8} {format_ms(hist.percentile(99)):>8}"
+                for name, hist in perf.top(metric, limit=10)
+            ]
+            if not lines:
+                return "No data yet"
+            header = f"{'name':<24} {'count':>5} {'p50':>8} {'p95':>8} {'p99':>8}"
+            return "```\n" + "\n".join([header] + lines) + "\n```"
+
+        embed.add_field(name="Slowest Commands (by p95)", value=rows("command"), inline=False)
+        embed.add_field(name="Slowest Spans (by p95)", value=rows("span"), inline=False)
+
+        # Event loop stalls from the watchdog, blamed on the blocking source line
+        lag = dict(perf.top("loop")).get("lag")
+        if lag:
+            embed.add_field(
+                name="Event Loop Lag",
+                value=f"p50 {format_ms(lag.percentile(50))} | p99 {format_ms(lag.percentile(99))} | "
+                      f"max {format_ms(lag.max)}",
+                inline=False
+            )
+        stalls = [
+            f"`{location}`\n{hist.count} stalls, p95 {format_ms(hist.percentile(95))}, max {format_ms(hist.max)}"
+            for location, hist in perf.top("blocking", limit=5)
+        ]
+        embed.add_field(
+            name="Event Loop Stalls (by p95)",
+            value="\n".join(stalls)[:1024] if stalls else "None detected",
+            inline=False
+        )
+
+        counters = [
+            f"{name}{f' ({op})' if op else ''}: {value:g}"
+            for (name, op), value in sorted(perf.counters.items())
+        ]
+        embed.add_field(
+            name="Counters",
+            value="```\n" + "\n".join(counters)[:1000] + "\n```" if counters else "No data yet",
+            inline=False
+        )
+
+        files = []
+        if prometheus:
+            files.append(discord.File(io.BytesIO(perf.prometheus().encode("utf-8")), filename="metrics.txt"))
+        if reset:
+            perf.reset()
+            embed.set_footer(text="Metrics have been reset")
+
+        await interaction.response.send_message(embed=embed, files=files, ephemeral=True)
+
+    @app_commands.command(name="profile")
+    @app_commands.describe(
+        seconds=f"How long to profile (max {MAX_CAPTURE_SECONDS})",
+        commands="Stop early after this many slash commands complete",
+        sort="How to rank functions"
+    )
+    @app_commands.choices(sort=[
+        app_commands.Choice(name="Cumulative time", value="cumulative"),
+        app_commands.Choice(name="Own time", value="tottime"),
+        app_commands.Choice(name="Call count", value="ncalls")
+    ])
+    @owner_only()
+    async def profile(
+        self,
+        interaction: discord.Interaction,
+        seconds: app_commands.Range[int, 1, MAX_CAPTURE_SECONDS] = 30,
+        commands: Optional[app_commands.Range[int, 1, 100]] = None,
+        sort: str = "cumulative"
+    ):
+        """Profile the live bot for a while and attach the results"""
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        try:
+            report, raw = await profile_capture(seconds, commands, sort)
+        except CaptureBusy as e:
+            await interaction.followup.send(f"❌ {str(e)}", ephemeral=True)
+            return
+
+        logger.info("Profile captured by %s", interaction.user.name)
+        await interaction.followup.send(
+            "📊 Profile results (open the .pstats file with `python -m pstats` or snakeviz)",
+            files=[
+                discord.File(io.BytesIO(report.encode("utf-8")), filename="profile.txt"),
+                discord.File(io.BytesIO(raw), filename="profile.pstats")
+            ],
+            ephemeral=True
+        )
+
+    @app_commands.command(name="memory")
+    @app_commands.describe(
+        seconds=f"How long to watch allocations (max {MAX_CAPTURE_SECONDS})",
+        commands="Stop early after this many slash commands complete"
+    )
+    @owner_only()
+    async def memory(
+        self,
+        interaction: discord.Interaction,
+        seconds: app_commands.Range[int, 1, MAX_CAPTURE_SECONDS] = 30,
+        commands: Optional[app_commands.Range[int, 1, 100]] = None
+    ):
+        """Show which code allocated the most memory over a window"""
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        try:
+            report = await memory_capture(seconds, commands)
+        except CaptureBusy as e:
+            await interaction.followup.send(f"❌ {str(e)}", ephemeral=True)
+            return
+
+        logger.info("Memory snapshot captured by %s", interaction.user.name)
+        await interaction.followup.send(
+            "🧠 Allocation growth by source line",
+            file=discord.File(io.BytesIO(report.encode("utf-8")), filename="memory.txt"),
+            ephemeral=True
+        )
+
     @app_commands.command(name="movesets")
     @app_commands.checks.has_permissions(administrator=True)
     async def debug_movesets(self, interaction: discord.Interaction, enable_firebase_logging: bool = False):
@@ -1079,8 +1265,8 @@ class DebugCommands(commands.GroupCog, name="debug"):
                 has_effect = any(e.name == test_move.name for e in source.effects)
                 print(f"\nEffect still present: {has_effect} (expected: False)")
                 
-                # Check if move is on cooldown in action stars
-                in_cooldown = test_move.name in source.action_stars.used_moves
+                # Check if move is on cooldown in the combat's scheduler
+                in_cooldown = bot.initiative_tracker.cooldown_remaining(source, test_move.name) > 0
                 print(f"Move in cooldown: {in_cooldown} (expected: False after full cycle)")
             else:
                 print("No suitable test move found")
@@ -547,8 +547,8 @@ async def test_move_initiative(interaction: discord.Interaction, bot):
             has_effect = any(e.name == test_move.name for e in source.effects)
             print(f"\nEffect still present: {has_effect} (expected: False)")
             
-            # Check if move is on cooldown in action stars
-            in_cooldown = test_move.name in source.action_stars.used_moves
+            # Check if move is on cooldown in the combat's scheduler
+            in_cooldown = bot.initiative_tracker.cooldown_remaining(source, test_move.name) > 0
             print(f"Move in cooldown: {in_cooldown} (expected: False after full cycle)")
         else:
             print("No suitable test move found")
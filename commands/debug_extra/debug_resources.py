@@ -10,7 +10,7 @@ from discord import app_commands
 from discord.ext import commands
 
 from core.character import Character
-from core.effects.combat import DamageCalculator, DamageType, TempHPEffect
+from core.effects.combat import DamageCalculator, DamageType, TempHPEffect, invalidate_damage_modifiers
 from utils.dice import DiceRoller
 
 logger = logging.getLogger(__name__)
@@ -123,6 +123,7 @@ async def _test_resistances(debug_cog, interaction):
     resist_type = "fire"
     resist_amount = 50  # 50% resistance
     char.defense.damage_resistances[resist_type] = resist_amount
+    invalidate_damage_modifiers(char)
     
     # Simulate damage command
     damage_amount = 20
@@ -140,6 +141,7 @@ async def _test_resistances(debug_cog, interaction):
     # Restore character
     char.resources.current_hp = old_hp
     char.defense.damage_resistances = {}
+    invalidate_damage_modifiers(char)
     await debug_cog.bot.db.save_character(char)
 
 async def _test_vulnerabilities(debug_cog, interaction):
@@ -159,6 +161,7 @@ async def _test_vulnerabilities(debug_cog, interaction):
     vuln_type = "cold"
     vuln_amount = 50  # 50% vulnerability
     char.defense.damage_vulnerabilities[vuln_type] = vuln_amount
+    invalidate_damage_modifiers(char)
     
     # Simulate damage command
     damage_amount = 10
@@ -176,6 +179,7 @@ async def _test_vulnerabilities(debug_cog, interaction):
     # Restore character
     char.resources.current_hp = old_hp
     char.defense.damage_vulnerabilities = {}
+    invalidate_damage_modifiers(char)
     await debug_cog.bot.db.save_character(char)
 
 async def _test_multi_damage(debug_cog, interaction):
@@ -25,7 +25,8 @@ from core.effects.base import EffectRegistry, BaseEffect, EffectCategory, Custom
 from core.effects.manager import apply_effect, remove_effect, get_effect_summary
 from core.effects.combat import (
     SourceHeatWaveEffect, TargetHeatWaveEffect, 
-    TempHPEffect, ResistanceEffect, VulnerabilityEffect, WeaknessEffect, ShockEffect
+    TempHPEffect, ResistanceEffect, VulnerabilityEffect, WeaknessEffect, ShockEffect,
+    invalidate_damage_modifiers
 )
 from core.effects.burn_effect import BurnEffect
 from core.effects.resource import DrainEffect, RegenEffect
@@ -466,6 +467,7 @@ class EffectCommands(commands.GroupCog, name="effect"):
             # Clear effect-based resistances/vulnerabilities
             char.defense.damage_resistances = {}
             char.defense.damage_vulnerabilities = {}
+            invalidate_damage_modifiers(char)
             
             await self.bot.db.save_character(char)
             await interaction.followup.send(f"✨ `Removed all effects from {character}` ✨")
@@ -1060,6 +1062,7 @@ class EffectCommands(commands.GroupCog, name="effect"):
             if remove:
                 if damage_type in char.defense.natural_resistances:
                     del char.defense.natural_resistances[damage_type]
+                    invalidate_damage_modifiers(char)
                     await self.bot.db.save_character(char)
                     await interaction.followup.send(
                         f"🛡️ `Removed natural {damage_type} resistance from {character}` 🛡️"
@@ -1070,6 +1073,7 @@ class EffectCommands(commands.GroupCog, name="effect"):
                     )
             else:
                 char.defense.natural_resistances[damage_type] = percentage
+                invalidate_damage_modifiers(char)
                 await self.bot.db.save_character(char)
                 await interaction.followup.send(
                     f"🛡️ `Added {percentage}% natural {damage_type} resistance to {character}` 🛡️"
@@ -1108,6 +1112,7 @@ class EffectCommands(commands.GroupCog, name="effect"):
             if remove:
                 if damage_type in char.defense.natural_vulnerabilities:
                     del char.defense.natural_vulnerabilities[damage_type]
+                    invalidate_damage_modifiers(char)
                     await self.bot.db.save_character(char)
                     await interaction.followup.send(
                         f"⚔️ `Removed natural {damage_type} vulnerability from {character}` ⚔️"
@@ -1118,6 +1123,7 @@ class EffectCommands(commands.GroupCog, name="effect"):
                     )
             else:
                 char.defense.natural_vulnerabilities[damage_type] = percentage
+                invalidate_damage_modifiers(char)
                 await self.bot.db.save_character(char)
                 await interaction.followup.send(
                     f"⚔️ `Added {percentage}% natural {damage_type} vulnerability to {character}` ⚔️"
@@ -1194,7 +1200,7 @@ class EffectCommands(commands.GroupCog, name="effect"):
                 chars.append(char)
 
             print("Initializing debug session...")
-            self.tracker.logger = CombatLogger(interaction.channel_id)
+            self.tracker.logger = CombatLogger(interaction.channel_id, self.tracker.logger.event_stores)
             
             # Enable quiet mode for cleaner output
             print("Setting quiet mode...")
@@ -1401,6 +1407,7 @@ class EffectCommands(commands.GroupCog, name="effect"):
             char.defense.current_ac = char.defense.base_ac
             char.defense.damage_resistances = {}
             char.defense.damage_vulnerabilities = {}
+            invalidate_damage_modifiers(char)
             
             # Clear any resource modifications
             if hasattr(char, 'heat_stacks'):
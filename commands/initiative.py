@@ -11,7 +11,9 @@ import logging
 
 from utils.error_handler import handle_error
 from modules.combat.initiative import InitiativeTracker
+from modules.combat.auto_advance import should_auto_advance
 from modules.combat.save_handler import SaveConfirmView
+from core.state import CombatEventType
 from datetime import datetime, date
 
 logger = logging.getLogger(__name__)
@@ -25,10 +27,10 @@ class InitiativeCommands(commands.GroupCog, name="initiative"):
         self.tracker = InitiativeTracker(bot)
         self.quiet_mode = False  # For suppressing debug prints
 
-    def debug_print(self, *args, **kwargs):
-        """Print debug info only if not in quiet mode"""
+    def debug_print(self, message, *args):
+        """Log debug info unless in quiet mode. Args are %-formatted only when logged."""
         if not self.quiet_mode:
-            print(*args, **kwargs)        
+            logger.debug(message.strip(), *args)
             
     @app_commands.command(name="start")
     @app_commands.describe(
@@ -44,7 +46,7 @@ class InitiativeCommands(commands.GroupCog, name="initiative"):
             await interaction.response.defer()
             
             # Log command usage
-            self.debug_print(f"\n=== Starting Combat with: {characters} ===")
+            self.debug_print("\n=== Starting Combat with: %s ===", characters)
             
             # Split character names and validate they exist
             char_list = [name.strip() for name in characters.split()]
@@ -59,7 +61,7 @@ class InitiativeCommands(commands.GroupCog, name="initiative"):
                     )
                     return
                 combat_chars.append(char)
-                self.debug_print(f"Added character: {name}")
+                self.debug_print("Added character: %s", name)
             
             # Start combat with DEX contest
             success, message = await self.tracker.start_combat(combat_chars, interaction)
@@ -94,8 +96,8 @@ class InitiativeCommands(commands.GroupCog, name="initiative"):
         try:
             await interaction.response.defer()
             
-            self.debug_print(f"\n=== Setting Battle: Round {round_number}, Turn {current_turn} ===")
-            self.debug_print(f"Order: {order}")
+            self.debug_print("\n=== Setting Battle: Round %s, Turn %s ===", round_number, current_turn)
+            self.debug_print("Order: %s", order)
             
             # Split character names and validate they exist
             char_list = [name.strip() for name in order.split()]
@@ -147,29 +149,71 @@ class InitiativeCommands(commands.GroupCog, name="initiative"):
             await handle_error(interaction, e)
 
     @app_commands.command(name="next")
-    async def next_turn(self, interaction: discord.Interaction):
+    @app_commands.describe(
+        until="Run turns automatically until this character is up"
+    )
+    async def next_turn(self, interaction: discord.Interaction, until: Optional[str] = None):
         """Advance to the next turn"""
         try:
-            # Process turn
-            success, message, effect_messages = await self.tracker.next_turn(interaction)
+            round_before = self.tracker.round_number
+            
+            # Process turn - automated turns (until a character, or flagged NPCs up next) run in one pass
+            auto_turns = should_auto_advance(
+                [turn.auto for turn in self.tracker.turn_order],
+                self.tracker.current_index,
+                until
+            )
+            if auto_turns and self.tracker.state.value == 'active':
+                success, message, effect_messages = await self.tracker.auto_advance(interaction, until)
+            else:
+                success, message, effect_messages = await self.tracker.next_turn(interaction)
             
             if not success:
                 await interaction.followup.send(f"❌ `{message}` ❌")
                 return
                 
-            # Handle autosave
+            # Queue autosave - written in the background, saves right away on a new round
             if self.tracker.save_handler.autosave_enabled:
-                order = [turn.character_name for turn in self.tracker.turn_order]
-                await self.tracker.save_handler.autosave(
-                    order,
-                    self.tracker.current_index,
-                    self.tracker.round_number
+                self.tracker.autosave.mark_dirty(
+                    round_boundary=self.tracker.round_number != round_before
                 )
                 
         except Exception as e:
-            self.debug_print(f"Error in next command: {e}")
+            self.debug_print("Error in next command: %s", e)
             await interaction.followup.send(f"❌ `An error occurred processing the turn` ❌")
 
+    @app_commands.command(name="auto")
+    @app_commands.describe(
+        character="Character whose turns /next should run automatically",
+        enabled="Turn automatic turns on or off (default: on)"
+    )
+    async def auto_turns(
+        self,
+        interaction: discord.Interaction,
+        character: str,
+        enabled: Optional[bool] = True
+    ):
+        """Run a combatant's turns automatically (for NPCs that only tick effects)"""
+        try:
+            await interaction.response.defer()
+            
+            if not self.tracker.set_auto_turn(character, enabled):
+                await interaction.followup.send(
+                    f"❌ `{character} is not in combat` ❌",
+                    ephemeral=True
+                )
+                return
+                
+            status = "will now run automatically" if enabled else "will no longer run automatically"
+            await interaction.followup.send(f"⏩ `{character}'s turns {status}`")
+            
+            # Flags are part of the combat state
+            if self.tracker.save_handler.autosave_enabled:
+                self.tracker.autosave.mark_dirty()
+
+        except Exception as e:
+            await handle_error(interaction, e)
+
     @app_commands.command(name="quicksave")
     async def quicksave(self, interaction: discord.Interaction):
         """Create a quicksave of the current initiative state"""
@@ -191,7 +235,8 @@ class InitiativeCommands(commands.GroupCog, name="initiative"):
                 interaction,
                 order,
                 self.tracker.current_index,
-                self.tracker.round_number
+                self.tracker.round_number,
+                state=self.tracker.get_checkpoint_state()
             )
 
         except Exception as e:
@@ -209,7 +254,7 @@ class InitiativeCommands(commands.GroupCog, name="initiative"):
             await interaction.response.defer()
             
             # Log command without redundant logging
-            self.debug_print(f"\n=== Saving Initiative State: {name or 'auto-named'} ===")
+            self.debug_print("\n=== Saving Initiative State: %s ===", name or 'auto-named')
             
             if not self.tracker.turn_order:
                 await interaction.followup.send(
@@ -225,7 +270,8 @@ class InitiativeCommands(commands.GroupCog, name="initiative"):
                 order,
                 self.tracker.current_index,
                 self.tracker.round_number,
-                name
+                name,
+                state=self.tracker.get_checkpoint_state()
             )
 
         except Exception as e:
@@ -239,8 +285,8 @@ class InitiativeCommands(commands.GroupCog, name="initiative"):
             
             self.debug_print("\n=== Listing Initiative Saves ===")
             
-            # Get and sort saves
-            saves = self.tracker.save_handler.list_saves()  # Synchronous
+            # Get saves from the index (already sorted newest first)
+            saves = await self.tracker.save_handler.list_saves()
             
             if not saves:
                 await interaction.followup.send(
@@ -305,7 +351,7 @@ class InitiativeCommands(commands.GroupCog, name="initiative"):
             )
 
         except Exception as e:
-            self.debug_print(f"Error in listsaves command: {e}")
+            self.debug_print("Error in listsaves command: %s", e)
             await interaction.followup.send(
                 "❌ An error occurred while listing saves.",
                 ephemeral=True
@@ -322,7 +368,7 @@ class InitiativeCommands(commands.GroupCog, name="initiative"):
         try:
             await interaction.response.defer()
             
-            self.debug_print(f"\n=== Loading Save: {save_name} ===")
+            self.debug_print("\n=== Loading Save: %s ===", save_name)
             
             # Check if combat is active
             if self.tracker.turn_order:
@@ -361,6 +407,10 @@ class InitiativeCommands(commands.GroupCog, name="initiative"):
                 )
                 return
                 
+            # Restore HP, effects, stars and cooldowns if the save has a checkpoint
+            if save_data.state:
+                await self.tracker.restore_checkpoint(save_data.state)
+                
             # Show load embed
             embed = await self.tracker.save_handler.create_load_embed(save_data)
             await interaction.followup.send(embed=embed)
@@ -371,6 +421,22 @@ class InitiativeCommands(commands.GroupCog, name="initiative"):
         except Exception as e:
             await handle_error(interaction, e)
 
+    @load_save.autocomplete('save_name')
+    async def save_name_autocomplete(
+        self,
+        interaction: discord.Interaction,
+        current: str
+    ) -> List[app_commands.Choice[str]]:
+        """Autocomplete save names from the cached save index"""
+        try:
+            return [
+                app_commands.Choice(name=name, value=name)
+                for name in self.tracker.save_handler.search_saves(current)
+            ]
+        except Exception as e:
+            logger.error(f"Error in save name autocomplete: {e}", exc_info=True)
+            return []
+
     @app_commands.command(name="addcombat")
     @app_commands.describe(
         character="Character to add to combat"
@@ -384,7 +450,7 @@ class InitiativeCommands(commands.GroupCog, name="initiative"):
         try:
             await interaction.response.defer()
             
-            self.debug_print(f"\n=== Adding Combatant: {character} ===")
+            self.debug_print("\n=== Adding Combatant: %s ===", character)
             
             char = self.bot.game_state.get_character(character)
             if not char:
@@ -418,7 +484,7 @@ class InitiativeCommands(commands.GroupCog, name="initiative"):
         try:
             await interaction.response.defer()
             
-            self.debug_print(f"\n=== Removing Combatant: {character} ===")
+            self.debug_print("\n=== Removing Combatant: %s ===", character)
             
             success, message = await self.tracker.remove_combatant(character, interaction)
             
@@ -480,44 +546,89 @@ class InitiativeCommands(commands.GroupCog, name="initiative"):
             await handle_error(interaction, e)
 
     @app_commands.command(name="log")
+    @app_commands.describe(
+        character="Only show events for this character",
+        event_type="Only show this kind of event",
+        round="Only show events from this round",
+        limit="Number of events to show (default 10)"
+    )
+    @app_commands.choices(event_type=[
+        app_commands.Choice(name=event.value.replace('_', ' ').title(), value=event.value)
+        for event in CombatEventType
+    ])
     async def view_log(
         self,
-        interaction: discord.Interaction
+        interaction: discord.Interaction,
+        character: Optional[str] = None,
+        event_type: Optional[str] = None,
+        round: Optional[app_commands.Range[int, 0]] = None,
+        limit: Optional[app_commands.Range[int, 1, 25]] = 10
     ):
-        """Show recent combat actions"""
+        """Show combat events, optionally filtered by character, type and round"""
         try:
             await interaction.response.defer(ephemeral=True)
             
             self.debug_print("\n=== Viewing Combat Log ===")
             
-            entries = self.tracker.combat_log.entries[-5:]  # Last 5 entries
+            events = self.tracker.logger.get_events() if self.tracker.logger else None
+            entries = events.query(
+                character=character,
+                event_type=event_type,
+                round_number=round,
+                limit=limit
+            ) if events else []
             
             if not entries:
                 await interaction.followup.send(
-                    "📜 No combat actions yet.",
+                    "📜 No matching combat events.",
                     ephemeral=True
                 )
                 return
                 
             log_text = []
-            for entry in reversed(entries):
+            for entry in entries:
                 icon = {
-                    "action": "⚔️",
-                    "effect": "✨",
-                    "system": "📢",
-                    "damage": "💥",
-                    "heal": "💚"
-                }.get(entry["type"], "ℹ️")
+                    "turn_start": "▶️",
+                    "effect_applied": "✨",
+                    "effect_expired": "⌛",
+                    "system_message": "📢",
+                    "damage_dealt": "💥",
+                    "healing_done": "💚",
+                    "resource_change": "🔷",
+                    "status_update": "⚠️"
+                }.get(entry.type, "ℹ️")
                 
-                log_text.append(f"{icon} {entry['message']}")
+                who = f"**{entry.character}**: " if entry.character else ""
+                log_text.append(f"{icon} `R{entry.round}` {who}{entry.message}")
+                
+            # Stay under Discord's message limit
+            text = "\n".join(log_text)
+            if len(text) > 1900:
+                text = text[:1900] + "\n..."
                 
             await interaction.followup.send(
-                "📜 Recent actions:\n" + "\n".join(log_text),
+                "📜 Combat log (newest first):\n" + text,
                 ephemeral=True
             )
 
         except Exception as e:
             await handle_error(interaction, e)
 
+    @view_log.autocomplete('character')
+    async def log_character_autocomplete(
+        self,
+        interaction: discord.Interaction,
+        current: str
+    ) -> List[app_commands.Choice[str]]:
+        """Autocomplete characters that appear in the combat log"""
+        events = self.tracker.logger.get_events() if self.tracker.logger else None
+        if not events:
+            return []
+        current = current.lower()
+        return [
+            app_commands.Choice(name=name, value=name)
+            for name in events.characters() if current in name.lower()
+        ][:25]
+
 async def setup(bot):
     await bot.add_cog(InitiativeCommands(bot))
\ No newline at end of file
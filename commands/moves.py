@@ -216,7 +216,10 @@ class MoveCommands(commands.GroupCog, name="move"):
             
             # Check if move can be used (cooldown, uses)
             try:
-                can_use, reason = move.can_use(current_round)
+                if in_combat:
+                    can_use, reason = self.bot.initiative_tracker.can_use_move(char, move)
+                else:
+                    can_use, reason = move.can_use(current_round)
                 if not can_use:
                     await interaction.followup.send(f"Cannot use {name}: {reason}")
                     return
@@ -226,7 +229,7 @@ class MoveCommands(commands.GroupCog, name="move"):
                 
             # Check action star cost
             if hasattr(char, 'can_use_move') and move.star_cost > 0:
-                can_use, reason = char.can_use_move(move.star_cost, move.name)
+                can_use, reason = char.can_use_move(move.star_cost)
                 if not can_use:
                     await interaction.followup.send(f"Cannot use {name}: {reason}")
                     return
@@ -263,18 +266,18 @@ class MoveCommands(commands.GroupCog, name="move"):
             result = await char.add_effect(move_effect, current_round)
             
             # Mark move as used
-            move.use(current_round)
+            if in_combat:
+                self.bot.initiative_tracker.record_move_use(char, move)
+            else:
+                move.use(current_round)
             
             # Use action stars if required
             if hasattr(char, 'use_move_stars') and move.star_cost > 0:
                 char.use_move_stars(move.star_cost, move.name)
             
-            # Save character state
-            await self.bot.db.save_character(char)
-            
-            # Save any targets that were modified
-            for target_char in targets:
-                await self.bot.db.save_character(target_char)
+            # Save the user and every target in one batched write
+            affected = {c.name: c for c in [char, *targets]}
+            await self.bot.db.save_characters(affected.values())
                 
             # Display result
             await interaction.followup.send(result)
@@ -363,7 +366,7 @@ class MoveCommands(commands.GroupCog, name="move"):
                 
             # Check action star cost
             if hasattr(char, 'can_use_move') and star_cost > 0:
-                can_use, reason = char.can_use_move(star_cost, name)
+                can_use, reason = char.can_use_move(star_cost)
                 if not can_use:
                     await interaction.followup.send(f"Cannot use {name}: {reason}")
                     return
@@ -424,12 +427,9 @@ class MoveCommands(commands.GroupCog, name="move"):
             if hasattr(char, 'use_move_stars') and star_cost > 0:
                 char.use_move_stars(star_cost, name)
             
-            # Save character state
-            await self.bot.db.save_character(char)
-            
-            # Save any targets that were modified
-            for target_char in targets:
-                await self.bot.db.save_character(target_char)
+            # Save the user and every target in one batched write
+            affected = {c.name: c for c in [char, *targets]}
+            await self.bot.db.save_characters(affected.values())
                 
             # Display result
             await interaction.followup.send(result)
@@ -960,18 +960,16 @@ class MoveCommands(commands.GroupCog, name="move"):
                         line += f" ({', '.join(costs)})"
                         
                     # Uses if limited
+                    in_combat = (hasattr(self.bot, 'initiative_tracker') and 
+                                 self.bot.initiative_tracker.state.value == 'active')
+                    epoch = self.bot.initiative_tracker.cooldowns.epoch if in_combat else None
                     if move.uses is not None:
-                        line += f" - {move.uses_remaining}/{move.uses} uses"
+                        line += f" - {move.uses_left(epoch)}/{move.uses} uses"
                         
                     # Cooldown status if in combat
-                    if (move.cooldown and move.last_used_round and 
-                        hasattr(self.bot, 'initiative_tracker') and 
-                        self.bot.initiative_tracker.state.value == 'active'):
-                        
-                        current_round = self.bot.initiative_tracker.round_number
-                        rounds_since = current_round - move.last_used_round
-                        if rounds_since < move.cooldown:
-                            remaining = move.cooldown - rounds_since
+                    if in_combat:
+                        remaining = self.bot.initiative_tracker.cooldown_remaining(char, move.name)
+                        if remaining:
                             line += f" (CD: {remaining})"
                     
                     # Add roll modifier info if present
@@ -1073,14 +1071,12 @@ class MoveCommands(commands.GroupCog, name="move"):
                 timing.append(f"⌛ Cooldown: {move.cooldown} turn(s)")
                 
                 # Show cooldown status if applicable
-                if (move.last_used_round and 
-                    hasattr(self.bot, 'initiative_tracker') and 
+                if (hasattr(self.bot, 'initiative_tracker') and 
                     self.bot.initiative_tracker.state.value == 'active'):
                     
-                    current_round = self.bot.initiative_tracker.round_number
-                    rounds_since = current_round - move.last_used_round
-                    if rounds_since < move.cooldown:
-                        remaining = move.cooldown - rounds_since
+                    tracker = self.bot.initiative_tracker
+                    remaining = tracker.cooldown_remaining(char, move.name)
+                    if remaining:
                         timing.append(f"⏳ On cooldown: {remaining} turn(s) remaining")
                 
             if timing:
@@ -1128,21 +1124,17 @@ class MoveCommands(commands.GroupCog, name="move"):
                 
             # Add usage info
             usage = []
+            tracker = getattr(self.bot, 'initiative_tracker', None)
+            in_combat = tracker is not None and tracker.state.value == 'active'
+            epoch = tracker.cooldowns.epoch if in_combat else None
             if hasattr(move, 'uses') and move.uses is not None:
-                uses_text = f"Uses: {move.uses}"
-                if hasattr(move, 'uses_remaining') and move.uses_remaining is not None:
-                    uses_text = f"Uses: {move.uses_remaining}/{move.uses}"
-                usage.append(uses_text)
+                usage.append(f"Uses: {move.uses_left(epoch)}/{move.uses}")
                 
             # Check cooldown status
-            if hasattr(move, 'cooldown') and move.cooldown and hasattr(move, 'last_used_round') and move.last_used_round:
-                current_round = 1  # Default
-                if hasattr(self.bot, 'initiative_tracker') and self.bot.initiative_tracker.state != 'inactive':
-                    current_round = self.bot.initiative_tracker.round_number
-                    
-                if move.last_used_round >= current_round - move.cooldown:
-                    rounds_left = move.cooldown - (current_round - move.last_used_round)
-                    usage.append(f"On Cooldown: {rounds_left} round(s) remaining")
+            current_round = tracker.round_number if in_combat else 1
+            rounds_left = move.cooldown_remaining(current_round, epoch)
+            if rounds_left:
+                usage.append(f"On Cooldown: {rounds_left} round(s) remaining")
                     
             if usage:
                 embed.add_field(
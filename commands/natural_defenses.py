@@ -7,7 +7,7 @@ from typing import Optional
 import logging
 
 from utils.error_handler import handle_error
-from core.effects.combat import DamageType
+from core.effects.combat import DamageType, invalidate_damage_modifiers
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +44,7 @@ class NaturalDefenseCommands(commands.Cog):
             if remove:
                 if damage_type in char.defense.natural_resistances:
                     del char.defense.natural_resistances[damage_type]
+                    invalidate_damage_modifiers(char)
                     await self.bot.db.save_character(char)
                     await interaction.followup.send(
                         f"🛡️ `Removed natural {damage_type} resistance from {character}` 🛡️"
@@ -54,6 +55,7 @@ class NaturalDefenseCommands(commands.Cog):
                     )
             else:
                 char.defense.natural_resistances[damage_type] = percentage
+                invalidate_damage_modifiers(char)
                 await self.bot.db.save_character(char)
                 await interaction.followup.send(
                     f"🛡️ `Added {percentage}% natural {damage_type} resistance to {character}` 🛡️"
@@ -91,6 +93,7 @@ class NaturalDefenseCommands(commands.Cog):
             if remove:
                 if damage_type in char.defense.natural_vulnerabilities:
                     del char.defense.natural_vulnerabilities[damage_type]
+                    invalidate_damage_modifiers(char)
                     await self.bot.db.save_character(char)
                     await interaction.followup.send(
                         f"⚔️ `Removed natural {damage_type} vulnerability from {character}` ⚔️"
@@ -101,6 +104,7 @@ class NaturalDefenseCommands(commands.Cog):
                     )
             else:
                 char.defense.natural_vulnerabilities[damage_type] = percentage
+                invalidate_damage_modifiers(char)
                 await self.bot.db.save_character(char)
                 await interaction.followup.send(
                     f"⚔️ `Added {percentage}% natural {damage_type} vulnerability to {character}` ⚔️"
@@ -8,44 +8,92 @@ Commands:
 - /say: Sends a direct message to the channel with optional media attachments
 - /embed: Creates a customizable embed that sends directly to a channel
 - /artqueue: Manages an art request queue with filtering and tagging
+
+Art queue layout in Firebase:
+- art_queue/<id>: request data (ids are push IDs, so key order is creation order)
+- art_queue_status/<status>/<id>: last edit date, for status filters and cleanup
+- art_queue_tag_index/<tag>/<id>: True, for tag filters
+- art_queue_tags/<tag>: True, list of every tag used
 """
 
 import os
+import asyncio
 import discord
 from discord import app_commands
 from discord.ext import commands
 import re
 import logging
 import aiohttp
-import io
 import json
 import datetime
-from typing import Optional, List, Dict, Any, Union, Literal
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Union, Literal, Tuple
+from utils.attachment_store import AttachmentStore, AttachmentError, CHUNK_SIZE
+from utils.thumbnails import ThumbnailService
+from utils.media_cache import MediaCache, MediaFetcher, MediaError, MAX_CONCURRENT_FETCHES
 
 logger = logging.getLogger(__name__)
 
+ART_PAGE_SIZE = 5
+ART_INDEX_VERSION = 1
+ART_CLEANUP_DAYS = 10
+ART_CLEANUP_INTERVAL = 6 * 60 * 60  # seconds between background cleanups
+ART_READ_CONCURRENCY = 8  # parallel single-request reads for filtered pages and cleanup
+ART_REFERENCE_DIR = "assets/art_references"
+ART_THUMBNAIL_DIR = "assets/art_references/thumbnails"
+ART_MODAL_TIMEOUT = 15 * 60  # seconds before an unsubmitted modal gives up its uploaded reference
+MEDIA_CACHE_DIR = "assets/media_cache"
+
+def _index_key(value: str) -> str:
+    """Lowercase a tag/status and strip characters Firebase doesn't allow in keys"""
+    return re.sub(r'[.#$\[\]/]', '_', str(value).strip().lower()) or '_'
+
+def _art_date(request: Dict[str, Any]) -> str:
+    """Date a request was last changed"""
+    return request.get('last_edited') or request.get('timestamp') or ''
+
 class ArtQueueView(discord.ui.View):
-    """Interactive view for art queue management"""
+    """Interactive view for art queue management. Pages are fetched on demand."""
     
-    def __init__(self, cog, entries, page=0, tag_filter=None, status_filter=None, ephemeral=True):
+    def __init__(self, cog, tag_filter=None, status_filter=None, ephemeral=True):
         super().__init__(timeout=300)  # 5 minute timeout
         self.cog = cog
-        self.entries = entries
-        self.page = page
-        self.total_pages = max(1, (len(entries) + 4) // 5)  # 5 entries per page
+        self.entries = []
+        self.page = 0
         self.tag_filter = tag_filter or []
         self.status_filter = status_filter
         self.ephemeral = ephemeral
         
+        # Cursor for the start of each page we've seen (None = newest)
+        self._cursors = [None]
+        self._has_next = False
+        
         # Update button states
         self._update_buttons()
     
+    async def load_page(self, page: int):
+        """Fetch a page of requests from the database"""
+        self.entries, next_cursor = await self.cog.get_art_page(
+            self.tag_filter,
+            self.status_filter,
+            cursor=self._cursors[page]
+        )
+        self.page = page
+        self._has_next = next_cursor is not None
+        
+        # Remember where the next page starts
+        if next_cursor is not None:
+            del self._cursors[page + 1:]
+            self._cursors.append(next_cursor)
+            
+        self._update_buttons()
+    
     def _update_buttons(self):
         """Update button states based on current page and filters"""
         # Disable prev button on first page
         self.prev_button.disabled = (self.page == 0)
         # Disable next button on last page
-        self.next_button.disabled = (self.page >= self.total_pages - 1)
+        self.next_button.disabled = not self._has_next
         
         # Update filter button label
         filter_label = "Filters: "
@@ -59,11 +107,39 @@ class ArtQueueView(discord.ui.View):
             
         self.filter_button.label = filter_label
     
+    async def get_page_files(self) -> List[discord.File]:
+        """Thumbnail previews for the current page's local reference images"""
+        numbered = [
+            (self.page * ART_PAGE_SIZE + i, entry['reference_url'].replace('local:', ''))
+            for i, entry in enumerate(self.entries, start=1)
+            if (entry.get('reference_url') or '').startswith('local:')
+        ]
+        if not numbered:
+            return []
+            
+        # Thumbnails are generated in parallel in worker processes
+        thumbnails = await asyncio.gather(
+            *(self.cog.thumbnails.get(path) for _, path in numbered)
+        )
+        
+        return [
+            discord.File(thumbnail, filename=f"preview_{number}{os.path.splitext(thumbnail)[1]}")
+            for (number, _), thumbnail in zip(numbered, thumbnails)
+            if thumbnail
+        ]
+    
+    async def render_page(self) -> Tuple[discord.Embed, List[discord.File]]:
+        """Get the embed and preview attachments for the current page"""
+        files = await self.get_page_files()
+        embed = await self.get_current_page_embed()
+        if files:
+            embed.set_thumbnail(url=f"attachment://{files[0].filename}")
+        return embed, files
+    
     async def get_current_page_embed(self):
         """Generate the embed for the current page"""
-        start_idx = self.page * 5
-        end_idx = min(start_idx + 5, len(self.entries))
-        current_entries = self.entries[start_idx:end_idx]
+        start_idx = self.page * ART_PAGE_SIZE
+        current_entries = self.entries
         
         embed = discord.Embed(
             title="🎨 Art Request Queue", 
@@ -129,27 +205,27 @@ class ArtQueueView(discord.ui.View):
             )
         
         # Add pagination footer
-        embed.set_footer(text=f"Page {self.page + 1}/{self.total_pages} | Total: {len(self.entries)} requests")
+        more = " | More on next page" if self._has_next else ""
+        embed.set_footer(text=f"Page {self.page + 1}{more}")
         
         return embed
     
     @discord.ui.button(label="Previous", style=discord.ButtonStyle.secondary, emoji="⬅️")
     async def prev_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Go to previous page"""
-        self.page = max(0, self.page - 1)
-        self._update_buttons()
+        await self.load_page(max(0, self.page - 1))
         
-        embed = await self.get_current_page_embed()
-        await interaction.response.edit_message(embed=embed, view=self)
+        embed, files = await self.render_page()
+        await interaction.response.edit_message(embed=embed, view=self, attachments=files)
     
     @discord.ui.button(label="Next", style=discord.ButtonStyle.secondary, emoji="➡️")
     async def next_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Go to next page"""
-        self.page = min(self.total_pages - 1, self.page + 1)
-        self._update_buttons()
+        if self._has_next:
+            await self.load_page(self.page + 1)
         
-        embed = await self.get_current_page_embed()
-        await interaction.response.edit_message(embed=embed, view=self)
+        embed, files = await self.render_page()
+        await interaction.response.edit_message(embed=embed, view=self, attachments=files)
     
     @discord.ui.button(label="Filters: None", style=discord.ButtonStyle.primary, emoji="🔍")
     async def filter_button(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -202,29 +278,90 @@ class FilterModal(discord.ui.Modal, title="Filter Art Requests"):
         # Get status
         status_filter = self.status.value.strip().lower() if self.status.value.strip() else None
         
-        # Apply filters and refresh the queue
-        filtered_entries = await self.queue_view.cog.filter_art_queue(tag_filter, status_filter)
-        
-        # Create a new view with the filtered results
+        # Create a new view with the filters and load its first page
         new_view = ArtQueueView(
             self.queue_view.cog, 
-            filtered_entries, 
-            page=0,  # Reset to first page
             tag_filter=tag_filter,
             status_filter=status_filter,
             ephemeral=self.queue_view.ephemeral
         )
+        await new_view.load_page(0)
         
         # Update the message
-        embed = await new_view.get_current_page_embed()
-        await interaction.response.edit_message(embed=embed, view=new_view)
+        embed, files = await new_view.render_page()
+        await interaction.response.edit_message(embed=embed, view=new_view, attachments=files)
 
-class AddRequestModal(discord.ui.Modal, title="Add Art Request"):
-    """Modal for adding a new art request"""
+class ReferenceModal(discord.ui.Modal):
+    """
+    Base for modals opened with a freshly uploaded reference file.
     
-    def __init__(self, cog):
-        super().__init__(title="Add Art Request")
+    The upload already holds a reference in the attachment store, so it's
+    released again if the modal is never submitted, fails, or is submitted
+    with a different reference URL.
+    
+    Local references can't be typed in: released references are deleted
+    from disk, so only this modal's upload or the request's current
+    reference are accepted.
+    """
+    
+    def __init__(
+            self,
+            cog,
+            title: str,
+            uploaded_reference: Optional[str] = None,
+            uploader_id: Optional[str] = None,
+            current_reference: Optional[str] = None
+        ):
+        super().__init__(title=title, timeout=ART_MODAL_TIMEOUT)
         self.cog = cog
+        self.uploaded_reference = uploaded_reference
+        self.uploader_id = uploader_id
+        self.current_reference = current_reference
+    
+    def reference_allowed(self, reference_url: Optional[str]) -> bool:
+        """Whether a submitted reference URL can be saved"""
+        if not reference_url or not reference_url.startswith('local:'):
+            return True
+        return reference_url in (self.uploaded_reference, self.current_reference)
+    
+    async def reject_reference(self, interaction: discord.Interaction) -> None:
+        """Turn down a typed local reference, giving up the upload"""
+        await self.discard_upload()
+        await interaction.response.send_message(
+            "❌ Local references can only come from an uploaded attachment.",
+            ephemeral=True
+        )
+    
+    def reference_fields(self, reference_url: Optional[str]) -> Dict[str, Any]:
+        """The request's reference fields, keeping the upload if it's still being used"""
+        if self.uploaded_reference and reference_url == self.uploaded_reference:
+            self.uploaded_reference = None
+            return {"reference_url": reference_url, "reference_owner": self.uploader_id}
+        return {"reference_url": reference_url}
+    
+    async def discard_upload(self) -> None:
+        """Release an uploaded reference that didn't end up in a request"""
+        if self.uploaded_reference:
+            reference, self.uploaded_reference = self.uploaded_reference, None
+            await self.cog._release_reference(reference, self.uploader_id)
+    
+    async def release_kept(self, fields: Dict[str, Any]) -> None:
+        """Release a kept upload again when the request couldn't be saved"""
+        if fields.get("reference_owner"):
+            await self.cog._release_reference(fields.get("reference_url"), fields["reference_owner"])
+    
+    async def on_timeout(self) -> None:
+        await self.discard_upload()
+    
+    async def on_error(self, interaction: discord.Interaction, error: Exception) -> None:
+        await self.discard_upload()
+        logger.error(f"Error in {self.title} modal: {str(error)}", exc_info=error)
+
+class AddRequestModal(ReferenceModal):
+    """Modal for adding a new art request"""
+    
+    def __init__(self, cog, uploaded_reference: Optional[str] = None, uploader_id: Optional[str] = None):
+        super().__init__(cog, "Add Art Request", uploaded_reference, uploader_id)
         
         # Create the TextInput fields
         self.title_input = discord.ui.TextInput(
@@ -260,13 +397,18 @@ class AddRequestModal(discord.ui.Modal, title="Add Art Request"):
         self.reference_url_input = discord.ui.TextInput(
             label="Reference URL (optional)",
             placeholder="Link to reference image or materials",
-            required=False
+            required=False,
+            default=uploaded_reference
         )
         self.add_item(self.reference_url_input)
     
     async def on_submit(self, interaction: discord.Interaction):
         # Parse inputs - getting value as strings
         tags_list = [tag.strip().lower() for tag in self.tags_input.value.split(',') if tag.strip()]
+        reference_url = self.reference_url_input.value.strip() or None
+        if not self.reference_allowed(reference_url):
+            await self.reject_reference(interaction)
+            return
         
         # Create request object with only serializable values
         request = {
@@ -277,11 +419,14 @@ class AddRequestModal(discord.ui.Modal, title="Add Art Request"):
             "to": self.to_user_input.value,
             "status": "pending",
             "timestamp": datetime.datetime.now().strftime("%Y-%m-%d %H:%M"),
-            "reference_url": self.reference_url_input.value if self.reference_url_input.value.strip() else None
+            **self.reference_fields(reference_url)
         }
         
         # Add to database
         success = await self.cog.add_art_request(request)
+        if not success:
+            await self.release_kept(request)
+        await self.discard_upload()
         
         if success:
             await interaction.response.send_message(
@@ -294,12 +439,19 @@ class AddRequestModal(discord.ui.Modal, title="Add Art Request"):
                 ephemeral=True
             )
 
-class EditRequestModal(discord.ui.Modal, title="Edit Art Request"):
+class EditRequestModal(ReferenceModal):
     """Modal for editing an art request"""
     
-    def __init__(self, cog, request_data, request_id):
-        super().__init__(title="Edit Art Request")
-        self.cog = cog
+    def __init__(
+            self,
+            cog,
+            request_data,
+            request_id,
+            uploaded_reference: Optional[str] = None,
+            uploader_id: Optional[str] = None,
+            current_reference: Optional[str] = None
+        ):
+        super().__init__(cog, "Edit Art Request", uploaded_reference, uploader_id, current_reference)
         self.request_id = request_id
         
         # Create the TextInput fields with pre-filled data
@@ -350,6 +502,10 @@ class EditRequestModal(discord.ui.Modal, title="Edit Art Request"):
     async def on_submit(self, interaction: discord.Interaction):
         # Parse inputs
         tags_list = [tag.strip().lower() for tag in self.tags_input.value.split(',') if tag.strip()]
+        reference_url = self.reference_url_input.value.strip() or None
+        if not self.reference_allowed(reference_url):
+            await self.reject_reference(interaction)
+            return
         
         # Create update object
         updates = {
@@ -357,12 +513,15 @@ class EditRequestModal(discord.ui.Modal, title="Edit Art Request"):
             "description": self.description_input.value,
             "tags": tags_list,
             "to": self.to_user_input.value,
-            "reference_url": self.reference_url_input.value if self.reference_url_input.value.strip() else None,
             "last_edited": datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
         }
+        updates.update(self.reference_fields(reference_url))
         
         # Update in database
         success = await self.cog.update_art_request(self.request_id, updates)
+        if not success:
+            await self.release_kept(updates)
+        await self.discard_upload()
         
         if success:
             await interaction.response.send_message(
@@ -412,59 +571,55 @@ class QOLCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.session = None
+        self._art_indexed = False
+        self.attachments = AttachmentStore(ART_REFERENCE_DIR)
+        self.thumbnails = ThumbnailService(ART_THUMBNAIL_DIR, source_root=ART_REFERENCE_DIR)
+        self.media = MediaFetcher(MediaCache(MEDIA_CACHE_DIR))
+        self._cleanup_task = None
+        self._art_reader = ThreadPoolExecutor(max_workers=ART_READ_CONCURRENCY)
     
     async def cog_load(self):
-        """Initialize the aiohttp session when the cog loads"""
-        self.session = aiohttp.ClientSession()
+        """Initialize the aiohttp session and art queue cleanup when the cog loads"""
+        self.session = self._create_session()
+        self._cleanup_task = asyncio.create_task(self._art_cleanup_loop())
     
     async def cog_unload(self):
-        """Close the aiohttp session when the cog unloads"""
+        """Close the aiohttp session and stop background work when the cog unloads"""
+        if self._cleanup_task:
+            self._cleanup_task.cancel()
+        self.thumbnails.shutdown()
+        self._art_reader.shutdown(wait=False)
         if self.session:
             await self.session.close()
     
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Shared HTTP session with limited connections per host"""
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=MAX_CONCURRENT_FETCHES * 2, limit_per_host=MAX_CONCURRENT_FETCHES),
+            timeout=aiohttp.ClientTimeout(total=60, sock_read=15)
+        )
+    
     async def fetch_media(self, url):
         """
         Fetches media from a URL and returns it as a file-like object.
+        Downloads are size limited and cached by URL.
         
         Args:
             url: The URL to fetch media from
             
         Returns:
             tuple: (filename, file_data)
+            
+        Raises:
+            MediaError: If the media is too large, isn't media, or can't be fetched
         """
         if not self.session:
-            self.session = aiohttp.ClientSession()
+            self.session = self._create_session()
             
-        async with self.session.get(url) as response:
-            if response.status != 200:
-                raise ValueError(f"Failed to fetch media: {response.status}")
-                
-            data = await response.read()
-            
-            # Get the filename from the URL or use a default
-            content_disposition = response.headers.get('Content-Disposition')
-            if content_disposition:
-                filename_match = re.search(r'filename="?([^"]+)"?', content_disposition)
-                if filename_match:
-                    filename = filename_match.group(1)
-                else:
-                    filename = 'attachment'
-            else:
-                filename = url.split('/')[-1].split('?')[0] or 'attachment'
-                
-            # Add appropriate extension based on content-type if missing
-            content_type = response.headers.get('Content-Type', '')
-            if '.' not in filename:
-                if 'image/png' in content_type:
-                    filename += '.png'
-                elif 'image/jpeg' in content_type or 'image/jpg' in content_type:
-                    filename += '.jpg'
-                elif 'image/gif' in content_type:
-                    filename += '.gif'
-                elif 'video/' in content_type:
-                    filename += '.mp4'
-                
-            return filename, io.BytesIO(data)
+        try:
+            return await self.media.fetch(self.session, url)
+        except aiohttp.ClientError as e:
+            raise MediaError(f"Failed to fetch media: {str(e)}")
     
     @app_commands.command(name="say", description="Makes the bot send a message with optional media")
     @app_commands.describe(
@@ -512,8 +667,8 @@ class QOLCommands(commands.Cog):
             # Handle files directly attached to the command message
             if interaction.message and interaction.message.attachments:
                 for attachment in interaction.message.attachments:
-                    file_data = await attachment.read()
-                    files.append(discord.File(io.BytesIO(file_data), filename=attachment.filename))
+                    _, file_data = await self.fetch_media(attachment.url)
+                    files.append(discord.File(file_data, filename=attachment.filename))
             
             # Send the message with any files
             if files:
@@ -532,6 +687,8 @@ class QOLCommands(commands.Cog):
                 ephemeral=True
             )
             
+        except MediaError as e:
+            await interaction.response.send_message(f"❌ {str(e)}", ephemeral=True)
         except Exception as e:
             logger.error(f"Error in say command: {str(e)}", exc_info=True)
             await interaction.response.send_message(
@@ -630,9 +787,9 @@ class QOLCommands(commands.Cog):
                             continue
                     
                     # For non-image files or additional images, add them as attachments
-                    file_data = await attachment.read()
+                    _, file_data = await self.fetch_media(attachment.url)
                     files.append(
-                        discord.File(io.BytesIO(file_data), filename=attachment.filename)
+                        discord.File(file_data, filename=attachment.filename)
                     )
             
             # Send the embed directly to the channel
@@ -650,6 +807,8 @@ class QOLCommands(commands.Cog):
                 ephemeral=True
             )
             
+        except MediaError as e:
+            await interaction.response.send_message(f"❌ {str(e)}", ephemeral=True)
         except Exception as e:
             logger.error(f"Error in embed command: {str(e)}", exc_info=True)
             await interaction.response.send_message(
@@ -753,38 +912,173 @@ class QOLCommands(commands.Cog):
             if 'art_queue' not in self.bot.db._refs:
                 self.bot.db._refs['art_queue'] = self.bot.db._db.child('art_queue')
                 self.bot.db._refs['art_queue_tags'] = self.bot.db._db.child('art_queue_tags')
+                self.bot.db._refs['art_queue_status'] = self.bot.db._db.child('art_queue_status')
+                self.bot.db._refs['art_queue_tag_index'] = self.bot.db._db.child('art_queue_tag_index')
                 print("Art queue database references initialized")
             
+            if not self._art_indexed:
+                await asyncio.to_thread(self._ensure_art_indexes)
+                self._art_indexed = True
+            
             return True
         except Exception as e:
             logger.error(f"Failed to initialize art queue: {str(e)}", exc_info=True)
             return False
     
-    async def get_all_art_requests(self) -> List[Dict[str, Any]]:
-        """Get all art requests from the database"""
+    def _art_index_paths(self, request_id: str, request: Dict[str, Any], remove: bool = False) -> Dict[str, Any]:
+        """
+        Get the status and tag index entries for a request, as multi-path update paths.
+        With remove=True the paths delete those entries instead.
+        """
+        status = _index_key(request.get('status') or 'pending')
+        paths = {f"art_queue_status/{status}/{request_id}": None if remove else (_art_date(request) or True)}
+        
+        for tag in request.get('tags') or []:
+            paths[f"art_queue_tag_index/{_index_key(tag)}/{request_id}"] = None if remove else True
+            
+        return paths
+    
+    def _ensure_art_indexes(self):
+        """Build the status and tag indexes once for requests stored before they existed"""
+        version_ref = self.bot.db._db.child('art_queue_meta').child('index_version')
+        if (version_ref.get() or 0) >= ART_INDEX_VERSION:
+            return
+            
+        requests_data = self.bot.db._refs['art_queue'].get() or {}
+        paths = {'art_queue_meta/index_version': ART_INDEX_VERSION}
+        for request_id, request in requests_data.items():
+            if isinstance(request, dict):
+                paths.update(self._art_index_paths(request_id, request))
+                
+        self.bot.db._db.update(paths)
+        print(f"[/artqueue] Indexed {len(requests_data)} existing requests")
+    
+    async def get_art_request(self, request_id: str) -> Optional[Dict[str, Any]]:
+        """Get a single art request by ID"""
         if not await self.initialize_art_queue():
-            return []
+            return None
             
         try:
-            # Get all requests
-            requests_data = self.bot.db._refs['art_queue'].get()
+            request = await asyncio.to_thread(self.bot.db._refs['art_queue'].child(request_id).get)
+            if not isinstance(request, dict):
+                return None
+            request['id'] = request_id
+            return request
+        except Exception as e:
+            logger.error(f"Failed to get art request {request_id}: {str(e)}", exc_info=True)
+            return None
+    
+    async def get_art_page(
+            self,
+            tags: List[str] = None,
+            status: str = None,
+            cursor: Optional[str] = None,
+            limit: int = ART_PAGE_SIZE
+        ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get one page of art requests, newest first
+        
+        Args:
+            tags: Tags to filter by (AND logic - must have all)
+            status: Status to filter by
+            cursor: ID of the last request on the previous page (None for the first page)
+            limit: Requests per page
             
-            if not requests_data:
-                return []
-                
-            # Convert to list format
-            requests_list = []
-            for request_id, request in requests_data.items():
-                request['id'] = request_id
-                requests_list.append(request)
-                
-            # Sort by timestamp (newest first)
-            requests_list.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
+        Returns:
+            (requests, next_cursor) - next_cursor is None on the last page
+        """
+        if not await self.initialize_art_queue():
+            return [], None
             
-            return requests_list
+        try:
+            return await asyncio.to_thread(self._fetch_art_page, tags or [], status, cursor, limit)
         except Exception as e:
             logger.error(f"Failed to get art requests: {str(e)}", exc_info=True)
-            return []
+            return [], None
+    
+    def _fetch_art_page(
+            self,
+            tags: List[str],
+            status: Optional[str],
+            cursor: Optional[str],
+            limit: int
+        ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Walk an index newest first until a page of matching requests is found"""
+        requests_ref = self.bot.db._refs['art_queue']
+        tag_keys = [_index_key(tag) for tag in tags]
+        
+        # Walk the narrowest index available, check other tags against their member sets
+        if status:
+            primary = self.bot.db._refs['art_queue_status'].child(_index_key(status))
+            other_tags = tag_keys
+        elif tag_keys:
+            primary = self.bot.db._refs['art_queue_tag_index'].child(tag_keys[0])
+            other_tags = tag_keys[1:]
+        else:
+            primary = requests_ref
+            other_tags = []
+            
+        required = [
+            set((self.bot.db._refs['art_queue_tag_index'].child(tag).get(shallow=True) or {}).keys())
+            for tag in other_tags
+        ]
+        inline = primary is requests_ref
+        
+        # Collect one extra match to know whether there's another page
+        found = []
+        batch_size = limit + 1
+        while len(found) <= limit:
+            query = primary.order_by_key()
+            if cursor:
+                query = query.end_at(cursor)
+            batch = query.limit_to_last(batch_size).get() or {}
+            
+            keys = sorted(batch.keys(), reverse=True)
+            if cursor and keys and keys[0] == cursor:
+                keys = keys[1:]
+            if not keys:
+                break
+                
+            # Index keys that pass the other filters, up to what the page still needs
+            matches = []
+            for key in keys:
+                cursor = key
+                if any(key not in members for members in required):
+                    continue
+                matches.append(key)
+                if len(found) + len(matches) > limit:
+                    break
+                    
+            requests = batch if inline else self._fetch_art_requests(matches)
+            for key in matches:
+                request = requests.get(key)
+                if not isinstance(request, dict):
+                    continue  # Stale index entry
+                    
+                request['id'] = key
+                found.append(request)
+                    
+            if len(batch) < batch_size:
+                break
+                
+        if len(found) > limit:
+            return found[:limit], found[limit - 1]['id']
+        return found, None
+    
+    def _fetch_art_requests(self, request_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several requests by ID, reading only those requests.
+        The reads run in parallel, at most ART_READ_CONCURRENCY at a time.
+        """
+        if not request_ids:
+            return {}
+            
+        requests_ref = self.bot.db._refs['art_queue']
+        results = self._art_reader.map(lambda key: requests_ref.child(key).get(), request_ids)
+        return {
+            key: request for key, request in zip(request_ids, results)
+            if isinstance(request, dict)
+        }
     
     async def get_all_tags(self) -> List[str]:
         """Get all unique tags used in art requests"""
@@ -792,8 +1086,8 @@ class QOLCommands(commands.Cog):
             return []
             
         try:
-            # Get tags from the dedicated tags collection
-            tags_data = self.bot.db._refs['art_queue_tags'].get()
+            # Get tags from the dedicated tags collection (keys only)
+            tags_data = self.bot.db._refs['art_queue_tags'].get(shallow=True)
             
             if not tags_data:
                 return []
@@ -817,16 +1111,17 @@ class QOLCommands(commands.Cog):
             return False
             
         try:
-            # Push the new request to get a unique ID
-            new_ref = self.bot.db._refs['art_queue'].push()
-            new_ref.set(request)
-            request_id = new_ref.key
-            
-            print(f"[/artqueue] Added new request: {request['title']} (ID: {request_id})")
+            # Push IDs are generated locally and sort by creation time
+            request_id = self.bot.db._refs['art_queue'].push().key
             
-            # Update tags collection
+            # Write the request, its index entries and tags together
+            paths = {f"art_queue/{request_id}": request}
+            paths.update(self._art_index_paths(request_id, request))
             for tag in request.get('tags', []):
-                self.bot.db._refs['art_queue_tags'].child(tag.lower()).set(True)
+                paths[f"art_queue_tags/{tag.lower()}"] = True
+            await asyncio.to_thread(self.bot.db._db.update, paths)
+            
+            print(f"[/artqueue] Added new request: {request['title']} (ID: {request_id})")
                 
             return True
         except Exception as e:
@@ -848,15 +1143,29 @@ class QOLCommands(commands.Cog):
             return False
             
         try:
-            # Update the request
-            self.bot.db._refs['art_queue'].child(request_id).update(updates)
+            old_request = await asyncio.to_thread(self.bot.db._refs['art_queue'].child(request_id).get)
+            if not isinstance(old_request, dict):
+                return False
+            # A replaced reference no longer belongs to the old uploader
+            old_reference = old_request.get('reference_url')
+            if 'reference_url' in updates and updates['reference_url'] != old_reference:
+                updates.setdefault('reference_owner', None)
+            new_request = {**old_request, **updates}
+            
+            # Move the index entries and update the request in one write
+            paths = self._art_index_paths(request_id, old_request, remove=True)
+            paths.update(self._art_index_paths(request_id, new_request))
+            for key, value in updates.items():
+                paths[f"art_queue/{request_id}/{key}"] = value
+            for tag in updates.get('tags') or []:
+                paths[f"art_queue_tags/{tag.lower()}"] = True
+            await asyncio.to_thread(self.bot.db._db.update, paths)
+            
+            # Release the old local reference if it was replaced
+            if 'reference_url' in updates and updates['reference_url'] != old_reference:
+                await self._release_reference(old_reference, old_request.get('reference_owner'))
             
             print(f"[/artqueue] Updated request: {request_id}")
-            
-            # If tags were updated, update tags collection
-            if 'tags' in updates:
-                for tag in updates['tags']:
-                    self.bot.db._refs['art_queue_tags'].child(tag.lower()).set(True)
                     
             return True
         except Exception as e:
@@ -877,8 +1186,15 @@ class QOLCommands(commands.Cog):
             return False
             
         try:
-            # Delete the request
-            self.bot.db._refs['art_queue'].child(request_id).delete()
+            # Delete the request and its index entries
+            request = await asyncio.to_thread(self.bot.db._refs['art_queue'].child(request_id).get)
+            paths = {f"art_queue/{request_id}": None}
+            if isinstance(request, dict):
+                paths.update(self._art_index_paths(request_id, request, remove=True))
+            await asyncio.to_thread(self.bot.db._db.update, paths)
+            
+            if isinstance(request, dict):
+                await self._release_reference(request.get('reference_url'), request.get('reference_owner'))
             
             print(f"[/artqueue] Deleted request: {request_id}")
             return True
@@ -886,43 +1202,6 @@ class QOLCommands(commands.Cog):
             logger.error(f"Failed to delete art request: {str(e)}", exc_info=True)
             return False
     
-    async def filter_art_queue(self, tags: List[str] = None, status: str = None) -> List[Dict[str, Any]]:
-        """
-        Filter art requests by tags and status
-        
-        Args:
-            tags: List of tags to filter by (AND logic - must have all)
-            status: Status to filter by
-            
-        Returns:
-            List of filtered requests
-        """
-        # Get all requests
-        all_requests = await self.get_all_art_requests()
-        
-        # No filters, return all
-        if not tags and not status:
-            return all_requests
-            
-        # Apply filters
-        filtered_requests = []
-        
-        for request in all_requests:
-            # Status filter
-            if status and request.get('status', '').lower() != status.lower():
-                continue
-                
-            # Tags filter (must have ALL specified tags)
-            if tags:
-                request_tags = [tag.lower() for tag in request.get('tags', [])]
-                if not all(tag.lower() in request_tags for tag in tags):
-                    continue
-                    
-            # Passed all filters
-            filtered_requests.append(request)
-            
-        return filtered_requests
-    
     # Art Queue command group
     artqueue = app_commands.Group(
         name="artqueue", 
@@ -945,90 +1224,92 @@ class QOLCommands(commands.Cog):
         """Display the art request queue with optional filtering"""
         await interaction.response.defer(ephemeral=ephemeral)
         
-        # Run cleanup of old completed requests
-        deleted_count = await self.cleanup_old_completed_requests()
-        if deleted_count > 0:
-            print(f"[/artqueue show] Auto-cleanup removed {deleted_count} old completed requests")
-        
         # Parse tag filter
         tags = []
         if tag_filter:
             tags = [tag.strip().lower() for tag in tag_filter.split(',') if tag.strip()]
         
-        # Get filtered requests
-        requests = await self.filter_art_queue(tags, status)
-        
-        # Create view and embed
+        # Create view and fetch the first page
         view = ArtQueueView(
             self, 
-            requests, 
             tag_filter=tags, 
             status_filter=status,
             ephemeral=ephemeral
         )
+        await view.load_page(0)
         
-        # Get the embed for the first page
-        embed = await view.get_current_page_embed()
+        # Get the embed and previews for the first page
+        embed, files = await view.render_page()
         
         # Send the message
-        await interaction.followup.send(embed=embed, view=view, ephemeral=ephemeral)
+        await interaction.followup.send(embed=embed, view=view, files=files, ephemeral=ephemeral)
         
-        print(f"[/artqueue show] Displayed queue with {len(requests)} entries")
+        print(f"[/artqueue show] Displayed queue page with {len(view.entries)} entries")
         if tags:
             print(f"[/artqueue show] Tag filters: {', '.join(tags)}")
         if status:
             print(f"[/artqueue show] Status filter: {status}")
     
-    async def cleanup_old_completed_requests(self):
-        """Delete completed requests that are older than 10 days"""
+    async def _art_cleanup_loop(self):
+        """Background task that periodically removes old completed requests"""
+        while True:
+            deleted_count = await self.cleanup_old_completed_requests()
+            if deleted_count > 0:
+                print(f"[Auto-cleanup] Removed {deleted_count} old completed requests")
+            await asyncio.sleep(ART_CLEANUP_INTERVAL)
+    
+    async def cleanup_old_completed_requests(self) -> int:
+        """Delete completed requests older than 10 days in a single write"""
+        if not await self.initialize_art_queue():
+            return 0
+            
         try:
-            # Get all requests
-            all_requests = await self.get_all_art_requests()
+            # The completed index stores each request's last edit date
+            completed = await asyncio.to_thread(
+                self.bot.db._refs['art_queue_status'].child('completed').get
+            ) or {}
             current_time = datetime.datetime.now()
-            deleted_count = 0
             
-            for request in all_requests:
-                # Only process completed requests
-                if request.get('status', '').lower() != 'completed':
-                    continue
-                    
-                # Parse the timestamp
+            old = {}
+            for request_id, date_str in completed.items():
                 try:
-                    # Get either last_edited (if exists) or timestamp
-                    date_str = request.get('last_edited', request.get('timestamp', ''))
-                    if not date_str:
-                        continue
-                        
                     request_date = datetime.datetime.strptime(date_str, "%Y-%m-%d %H:%M")
+                except (ValueError, TypeError):
+                    continue
                     
-                    # Calculate days since completion
-                    days_since = (current_time - request_date).days
+                # Calculate days since completion
+                days_since = (current_time - request_date).days
+                if days_since >= ART_CLEANUP_DAYS:
+                    old[request_id] = days_since
                     
-                    # Delete if older than 10 days
-                    if days_since >= 10:
-                        # Delete local file if exists
-                        reference_url = request.get('reference_url')
-                        if reference_url and reference_url.startswith('local:'):
-                            try:
-                                local_path = reference_url.replace('local:', '')
-                                if os.path.exists(local_path):
-                                    os.remove(local_path)
-                                    print(f"[Auto-cleanup] Removed local file: {local_path}")
-                            except Exception as e:
-                                print(f"[Auto-cleanup] Error removing file: {str(e)}")
+            if not old:
+                return 0
+                
+            # Read just the old requests, not the rest of the queue
+            requests = await asyncio.to_thread(self._fetch_art_requests, list(old))
+            
+            paths = {}
+            references = []
+            
+            for request_id, days_since in old.items():
+                request = requests.get(request_id)
+                if request:
+                    paths.update(self._art_index_paths(request_id, request, remove=True))
+                    references.append((request.get('reference_url'), request.get('reference_owner')))
                         
-                        # Delete request
-                        await self.delete_art_request(request.get('id'))
-                        deleted_count += 1
-                        print(f"[Auto-cleanup] Deleted completed request {request.get('id')} ({days_since} days old)")
+                paths[f"art_queue/{request_id}"] = None
+                paths[f"art_queue_status/completed/{request_id}"] = None
+                print(f"[Auto-cleanup] Deleting completed request {request_id} ({days_since} days old)")
                 
-                except (ValueError, TypeError) as e:
-                    print(f"[Auto-cleanup] Error parsing date: {str(e)}")
-                    continue
+            # One multi-path delete for every old request and its index entries
+            await asyncio.to_thread(self.bot.db._db.update, paths)
+            
+            # Release local files once the requests are gone
+            for reference_url, owner in references:
+                await self._release_reference(reference_url, owner)
                     
-            if deleted_count > 0:
-                print(f"[Auto-cleanup] Deleted {deleted_count} completed requests older than 10 days")
-                
+            deleted_count = sum(1 for path in paths if path.startswith("art_queue/"))
+            print(f"[Auto-cleanup] Deleted {deleted_count} completed requests older than {ART_CLEANUP_DAYS} days")
             return deleted_count
         
         except Exception as e:
@@ -1066,63 +1347,84 @@ class QOLCommands(commands.Cog):
                 else:
                     attachment_url = attachment.url
                     print(f"[/artqueue add] Using CDN URL: {attachment.url}")
+            except AttachmentError as e:
+                await interaction.response.send_message(f"❌ {str(e)}", ephemeral=True)
+                return
             except Exception as e:
                 print(f"[/artqueue add] Error handling attachment: {str(e)}")
                 attachment_url = attachment.url
         
-        # Send the modal with the attachment info
-        modal = AddRequestModal(self)
-        
-        # If we have an attachment URL, set it in the modal
-        if attachment_url:
-            # Pre-fill the reference URL field with the attachment URL or local path
-            for child in modal.children:
-                if child.label == "Reference URL (optional)":
-                    child.default = attachment_url
-                    break
+        # Send the modal with the attachment info pre-filled
+        uploaded_reference = attachment_url if local_path else None
+        modal = AddRequestModal(self, uploaded_reference, str(interaction.user.id))
+        if attachment_url and not local_path:
+            modal.reference_url_input.default = attachment_url
         
-        await interaction.response.send_modal(modal)
+        try:
+            await interaction.response.send_modal(modal)
+        except discord.HTTPException:
+            await modal.discard_upload()
+            raise
         print(f"[/artqueue add] {interaction.user.name} opened add request modal")
     
     async def save_attachment_locally(self, attachment, user_id):
         """
-        Downloads an attachment and saves it to a local folder
+        Streams an attachment into local content-addressed storage.
+        Identical files are only stored once.
         
         Args:
             attachment: Discord attachment object
             user_id: ID of the user who uploaded it
             
         Returns:
-            str: Local path to the saved file
-        """
-        try:
-            # Create assets directory if it doesn't exist
-            assets_dir = "assets/art_references"
-            os.makedirs(assets_dir, exist_ok=True)
-            
-            # Create user directory if it doesn't exist
-            user_dir = f"{assets_dir}/{user_id}"
-            os.makedirs(user_dir, exist_ok=True)
-            
-            # Generate a filename with timestamp to avoid collisions
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{timestamp}_{attachment.filename}"
-            filepath = f"{user_dir}/{filename}"
+            str: Local path to the saved file, or None if it couldn't be saved
             
-            # Download the file content
-            file_data = await attachment.read()
+        Raises:
+            AttachmentError: If the file is too large or the user is over their quota
+        """
+        # Check limits before downloading anything
+        await self.attachments.check_upload(user_id, attachment.size)
+        
+        if not self.session:
+            self.session = self._create_session()
             
-            # Write the file locally
-            with open(filepath, 'wb') as f:
-                f.write(file_data)
+        try:
+            async with self.session.get(attachment.url) as response:
+                if response.status != 200:
+                    raise ValueError(f"Failed to download attachment: {response.status}")
+                    
+                filepath = await self.attachments.store(
+                    response.content.iter_chunked(CHUNK_SIZE),
+                    attachment.filename,
+                    user_id,
+                    size=attachment.size
+                )
             
             print(f"[/artqueue] Saved attachment to {filepath}")
             return filepath
             
+        except AttachmentError:
+            raise
         except Exception as e:
             logger.error(f"Error saving attachment: {str(e)}", exc_info=True)
             print(f"Failed to save attachment: {str(e)}")
             return None
+    
+    async def _release_reference(self, reference_url: Optional[str], user_id: Optional[str] = None):
+        """
+        Release a request's local reference file, if it has one.
+        user_id is who uploaded it (the request's reference_owner), so their quota goes down.
+        """
+        if not reference_url or not reference_url.startswith('local:'):
+            return
+            
+        local_path = reference_url.replace('local:', '')
+        try:
+            if await self.attachments.release(local_path, user_id):
+                self.thumbnails.discard(local_path)
+                print(f"[/artqueue] Removed local file: {local_path}")
+        except Exception as e:
+            print(f"[/artqueue] Error removing file: {str(e)}")
 
     async def upload_to_firebase(self, file_data, filename, user_id):
         """Upload a file to Firebase Storage"""
@@ -1177,15 +1479,8 @@ class QOLCommands(commands.Cog):
         attachment: Optional[discord.Attachment] = None
     ):
         """Edit an existing art request with optional new attachment"""
-        # Get all requests
-        all_requests = await self.get_all_art_requests()
-        
         # Find the request by ID
-        found_request = None
-        for request in all_requests:
-            if request.get('id') == id:
-                found_request = request
-                break
+        found_request = await self.get_art_request(id)
         
         if not found_request:
             await interaction.response.send_message(
@@ -1203,13 +1498,23 @@ class QOLCommands(commands.Cog):
             return
         
         # Handle new attachment if provided
+        uploaded_reference = None
+        current_reference = found_request.get('reference_url')
         if attachment:
             # Save locally
-            local_path = await self.save_attachment_locally(attachment, interaction.user.id)
+            try:
+                local_path = await self.save_attachment_locally(attachment, interaction.user.id)
+            except AttachmentError as e:
+                await interaction.response.send_message(f"❌ {str(e)}", ephemeral=True)
+                return
             
-            if local_path:
-                # Update reference URL in the request data
-                found_request['reference_url'] = f"local:{local_path}"
+            if local_path and f"local:{local_path}" == found_request.get('reference_url'):
+                # Same file as the current reference: the request already holds it
+                await self._release_reference(found_request['reference_url'], str(interaction.user.id))
+            elif local_path:
+                # Pre-fill the new reference; it's released again if the edit isn't submitted
+                uploaded_reference = f"local:{local_path}"
+                found_request['reference_url'] = uploaded_reference
                 print(f"[/artqueue edit] Updated reference to {local_path}")
             else:
                 # Fall back to Discord CDN
@@ -1217,8 +1522,14 @@ class QOLCommands(commands.Cog):
                 print(f"[/artqueue edit] Updated reference to CDN URL: {attachment.url}")
         
         # Open edit modal
-        modal = EditRequestModal(self, found_request, id)
-        await interaction.response.send_modal(modal)
+        modal = EditRequestModal(
+            self, found_request, id, uploaded_reference, str(interaction.user.id), current_reference
+        )
+        try:
+            await interaction.response.send_modal(modal)
+        except discord.HTTPException:
+            await modal.discard_upload()
+            raise
         print(f"[/artqueue edit] Opened edit modal for request {id}")
 
     @artqueue.command(name="delete", description="Delete an art request")
@@ -1233,15 +1544,8 @@ class QOLCommands(commands.Cog):
         """Delete an art request after confirmation"""
         await interaction.response.defer(ephemeral=True)
         
-        # Get all requests
-        all_requests = await self.get_all_art_requests()
-        
         # Find the request by ID
-        found_request = None
-        for request in all_requests:
-            if request.get('id') == id:
-                found_request = request
-                break
+        found_request = await self.get_art_request(id)
         
         if not found_request:
             await interaction.followup.send(
@@ -1265,16 +1569,7 @@ class QOLCommands(commands.Cog):
             view=view,
             ephemeral=True
         )
-        
-        # If there's a local reference file, clean it up when deleting
-        reference_url = found_request.get('reference_url')
-        if reference_url and reference_url.startswith('local:'):
-            local_path = reference_url.replace('local:', '')
-            try:
-                os.remove(local_path)
-                print(f"[/artqueue delete] Removed local file: {local_path}")
-            except Exception as e:
-                print(f"[/artqueue delete] Failed to remove local file: {str(e)}")
+
 
     @artqueue.command(name="tags", description="List all available tags")
     async def art_queue_tags(self, interaction: discord.Interaction):
@@ -1347,20 +1642,10 @@ class QOLCommands(commands.Cog):
         """Update the status of an art request"""
         await interaction.response.defer(ephemeral=True)
         
-        # Get all requests
-        all_requests = await self.get_all_art_requests()
-        
         # Find the request with matching ID
-        found = False
-        request_id = None
-        
-        for request in all_requests:
-            if request.get('id') == id:
-                request_id = id
-                found = True
-                break
+        request_id = id if await self.get_art_request(id) else None
                 
-        if not found:
+        if not request_id:
             await interaction.followup.send(
                 f"❌ Request with ID '{id}' not found.",
                 ephemeral=True
@@ -2,7 +2,8 @@
 Skill Check Command (src/commands/skillcheck.py)
 
 Handles all types of character checks (ability checks, saving throws, and skill checks).
-Supports both DC-based and contested checks with optional advantage/disadvantage.
+Supports both DC-based and contested checks with optional advantage/disadvantage,
+and group checks that roll a whole party or combat at once.
 """
 
 import discord
@@ -16,6 +17,7 @@ from core.character import Character, StatType
 from utils.advanced_dice.parser import DiceParser
 from utils.advanced_dice.calculator import DiceCalculator
 from utils.error_handler import ErrorTranslator
+from utils.group_checks import GroupCheckResult, resolve_group
 
 logger = logging.getLogger(__name__)
 
@@ -779,5 +781,147 @@ class SkillCheck(commands.Cog):
                 if current.lower() in choice.name.lower()
             ]
 
+    @skillcheck.command(name="group")
+    @app_commands.describe(
+        characters="Comma separated names, 'combat' for everyone in initiative, or 'all'",
+        type="Type of check",
+        stat_or_skill="Ability score or skill to use",  # This will be autocompleted
+        dc="Target DC (optional, shows pass/fail counts)",
+        advantage="Everyone rolls with advantage",
+        disadvantage="Everyone rolls with disadvantage",
+        modifier="Additional modifier for everyone",
+        reason="Reason for the check (e.g., 'Spotting the ambush')"
+    )
+    @app_commands.choices(
+        type=[
+            app_commands.Choice(name="Saving Throw", value="save"),
+            app_commands.Choice(name="Ability Check", value="ability"),
+            app_commands.Choice(name="Skill Check", value="skill")
+        ]
+    )
+    async def group(
+        self,
+        interaction: discord.Interaction,
+        characters: str,
+        type: app_commands.Choice[str],
+        stat_or_skill: str,
+        dc: Optional[int] = None,
+        advantage: bool = False,
+        disadvantage: bool = False,
+        modifier: Optional[int] = 0,
+        reason: Optional[str] = None
+    ):
+        """Make the same check for a group of characters"""
+        try:
+            # Validate stat/skill based on type
+            check_type = CheckType(type.value)
+            stat_or_skill = stat_or_skill.lower()
+            if check_type == CheckType.SKILL:
+                if stat_or_skill not in SKILL_ABILITIES:
+                    await interaction.response.send_message(
+                        f"Invalid skill: {stat_or_skill}",
+                        ephemeral=True
+                    )
+                    return
+            else:
+                try:
+                    StatType(stat_or_skill)
+                except ValueError:
+                    await interaction.response.send_message(
+                        f"Invalid ability score: {stat_or_skill}",
+                        ephemeral=True
+                    )
+                    return
+
+            # Find everyone in the group
+            tracker = getattr(self.bot, 'initiative_tracker', None)
+            roster = [turn.character_name for turn in tracker.turn_order] if tracker else []
+            chars, missing = resolve_group(
+                characters,
+                self.bot.game_state.get_character,
+                self.bot.game_state.get_all_characters,
+                roster
+            )
+            if not chars:
+                await interaction.response.send_message(
+                    "No characters found" + (f": {', '.join(missing)}" if missing else ""),
+                    ephemeral=True
+                )
+                return
+
+            # Roll everyone with their own proficiencies and modifiers
+            result = GroupCheckResult(dc=dc)
+            for char in chars:
+                expression = build_roll_expression(
+                    char,
+                    check_type,
+                    stat_or_skill,
+                    advantage,
+                    disadvantage,
+                    modifier
+                )
+                total, formatted, _ = DiceCalculator.calculate_complex(
+                    expression,
+                    character=char,
+                    concise=True
+                )
+                result.add(char.name, total, formatted)
+
+            # One embed for the whole group
+            kind = "Save" if check_type == CheckType.SAVE else "Check"
+            embed = discord.Embed(
+                title=f"🎲 Group {stat_or_skill.replace('_', ' ').title()} {kind}",
+                description=result.description(),
+                color=discord.Color.blue()
+            )
+
+            if advantage != disadvantage:
+                embed.add_field(
+                    name="Roll Type",
+                    value="Advantage" if advantage else "Disadvantage",
+                    inline=True
+                )
+
+            if dc is not None:
+                passed, failed = result.counts()
+                embed.add_field(name="Target DC", value=str(dc), inline=True)
+                embed.add_field(
+                    name="Outcome",
+                    value=f"✅ {passed} passed • ❌ {failed} failed",
+                    inline=True
+                )
+
+            if missing:
+                embed.add_field(
+                    name="Not Found",
+                    value=", ".join(missing)[:1024],
+                    inline=False
+                )
+
+            if reason:
+                embed.set_footer(text=f"Reason: {reason}")
+
+            await interaction.response.send_message(embed=embed)
+
+        except Exception as e:
+            logger.error(f"Error in group check command: {e}", exc_info=True)
+            await interaction.response.send_message(
+                f"Error processing group check: {ErrorTranslator.translate_error(e)}",
+                ephemeral=True
+            )
+
+    @group.autocomplete('stat_or_skill')
+    async def group_autocomplete(
+        self,
+        interaction: discord.Interaction,
+        current: str,
+    ) -> List[app_commands.Choice[str]]:
+        choices = SKILL_CHOICES if interaction.namespace.type == "skill" else ABILITY_CHOICES
+        return [
+            app_commands.Choice(name=choice.name, value=choice.value)
+            for choice in choices
+            if current.lower() in choice.name.lower()
+        ][:25]
+
 async def setup(bot):
     await bot.add_cog(SkillCheck(bot))
\ No newline at end of file
@@ -203,11 +203,14 @@ class Character:
         self.base_proficiency = base_proficiency  
         self.version = version  
         self.effects: List["Effect"] = []  
+        self.effects_version = 0  # Bumped whenever effects are added or removed
         self.effect_feedback: List[EffectFeedback] = []  # Track recently expired effects
         self.proficiencies = Proficiencies()  
         self.action_stars = ActionStars()  
         self.style = None  # Will be set during character creation  
         self.custom_parameters: Dict[str, Any] = {}  # For future extensions  
+        self._damage_modifiers = None  # Cached by core.effects.combat.DamageModifierTable
+        self._roll_modifiers = None  # Cached by core.effects.rollmod.RollModifierStack
          
         # Initialize derived stats  
         self._update_derived_stats()
@@ -297,9 +300,12 @@ class Character:
             return new_ac  
         return self.defense.current_ac  
      
-    def can_use_move(self, cost: int, move_name: Optional[str] = None) -> tuple[bool, str]:  
-        """Check if character can use a move with the given cost."""  
-        return self.action_stars.can_use(cost, move_name)
+    def can_use_move(self, cost: int) -> tuple[bool, str]:  
+        """
+        Check if character has the stars for a move with the given cost.
+        Uses and cooldowns are checked by the initiative tracker.
+        """  
+        return self.action_stars.can_use(cost)
 
     def use_move_stars(self, cost: int, move_name: Optional[str] = None) -> None:  
         """Use stars for a move."""  
@@ -310,10 +316,7 @@ class Character:
         self.action_stars.refresh()
 
     def clear_cooldowns(self) -> None:  
-        """Clear all move cooldowns."""  
-        self.action_stars.clear_cooldowns()  
-         
-        # Also clear cooldowns in moveset  
+        """Clear all move cooldowns and uses."""  
         if hasattr(self, 'moveset'):  
             self.moveset.refresh_all()
 
@@ -325,6 +328,7 @@ class Character:
         try:  
             if effect in self.effects:  
                 self.effects.remove(effect)  
+                self.effects_version += 1
                 return True  
             return False  
         except ValueError:  
@@ -362,6 +366,7 @@ class Character:
         for effect in effects_to_remove:  
             if effect in self.effects:  # Double-check it's still there  
                 self.effects.remove(effect)  
+        self.effects_version += 1
          
         # Reset resources affected by temporary effects  
         self.resources.current_temp_hp = 0  
@@ -370,6 +375,7 @@ class Character:
         # Clear effect-based resistances/vulnerabilities  
         self.defense.damage_resistances = {}  
         self.defense.damage_vulnerabilities = {}  
+        self._damage_modifiers = None  
          
         # Reset AC to base but preserve AC manager  
         if hasattr(self, 'ac_manager'):  
@@ -403,21 +409,8 @@ class Character:
         # Reset action stars  
         self.refresh_stars()  
          
-        # Clear move cooldowns  
+        # Clear move cooldowns and uses (action stars and moveset)  
         self.clear_cooldowns()  
-         
-        # Reset moveset - clear all cooldowns and usage tracking  
-        if hasattr(self, 'moveset'):  
-            for move_name in self.list_moves():  
-                move = self.get_move(move_name)  
-                if move:  
-                    # Reset usages if tracking uses  
-                    if hasattr(move, 'uses') and move.uses is not None:  
-                        move.uses_remaining = move.uses  
-                         
-                    # Clear cooldown tracking  
-                    if hasattr(move, 'last_used_round'):  
-                        move.last_used_round = None
                         
         # Clear effect feedback as well
         self.effect_feedback = []
@@ -443,6 +436,7 @@ class Character:
         for effect in effects_to_remove:  
             if effect in self.effects:  # Double-check it's still there  
                 self.effects.remove(effect)
+        self.effects_version += 1
                 
         # Clear effect feedback as well
         self.effect_feedback = []
@@ -542,6 +536,7 @@ class Character:
              
             # Apply new effect  
             self.effects.append(effect)  
+            self.effects_version += 1
             # Use round 1 if no round number provided  
             current_round = round_number if round_number is not None else 1  
             return effect.on_apply(self, current_round)  
@@ -704,9 +699,86 @@ class Character:
              
             # Update all derived stats  
             character._update_derived_stats()  
+            
+            # Data has been read into the current layout, so save it back as current
+            character.version = cls.CURRENT_VERSION
              
             return character  
              
         except Exception as e:  
             logger.error(f"Error reconstructing character: {str(e)}")  
-            return None
\ No newline at end of file
+            return None
+
+    @classmethod
+    def needs_upgrade(cls, data: dict) -> bool:
+        """
+        Check if stored character data is older than the current schema.
+        
+        Covers the character's own version, its moves and any move effects
+        still using legacy keys. Loaders use this to queue a one-time write-back
+        of the upgraded data instead of re-running the shims on every load.
+        """
+        if not isinstance(data, dict):
+            return False
+        if data.get('version', 1) < cls.CURRENT_VERSION:
+            return True
+            
+        # Import here to avoid circular import
+        from modules.moves.data import Moveset, MoveData
+        if Moveset.needs_upgrade(data.get('moveset')):
+            return True
+            
+        # Move effects keep their own copy of the legacy move keys
+        for effect_data in data.get('effects', []) or []:
+            if isinstance(effect_data, dict) and effect_data.get('type') == 'MoveEffect':
+                if any(key in effect_data for key in MoveData.LEGACY_KEYS):
+                    return True
+                    
+        return False
+
+    @classmethod
+    def upgrade_dict(cls, data: dict) -> Optional[dict]:
+        """
+        Upgrade stored character data to the current schema.
+        
+        Works on the stored dictionary itself rather than a from_dict/to_dict
+        round trip, so fields the loader doesn't carry over (style, effect
+        data an effect class doesn't restore) are written back unchanged.
+        Only outdated moves and move effects with legacy keys are rebuilt.
+        Returns the upgraded dictionary, or None if the data isn't a character.
+        """
+        if not isinstance(data, dict) or 'name' not in data:
+            return None
+            
+        # Import here to avoid circular import
+        from modules.moves.data import MoveData
+        
+        upgraded = dict(data)
+        
+        # Fields added by later versions (see Version History)
+        upgraded.setdefault('custom_parameters', {})
+        upgraded.setdefault('effect_feedback', [])
+        upgraded['version'] = cls.CURRENT_VERSION
+        
+        moveset = upgraded.get('moveset')
+        if isinstance(moveset, dict) and isinstance(moveset.get('moves'), dict):
+            moves = dict(moveset['moves'])
+            for key, move_data in moves.items():
+                if isinstance(move_data, dict) and MoveData.needs_upgrade(move_data):
+                    moves[key] = MoveData.from_dict(move_data).to_dict()
+            upgraded['moveset'] = {**moveset, 'moves': moves}
+            
+        # Move effects keep their own copy of the legacy move keys
+        effects = []
+        for effect_data in data.get('effects', []) or []:
+            if (
+                isinstance(effect_data, dict)
+                and effect_data.get('type') == 'MoveEffect'
+                and any(key in effect_data for key in MoveData.LEGACY_KEYS)
+                and (effect := EffectRegistry.from_dict(effect_data))
+            ):
+                effect_data = effect.to_dict()
+            effects.append(effect_data)
+        upgraded['effects'] = effects
+            
+        return upgraded
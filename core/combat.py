@@ -329,7 +329,7 @@ class CompoundMove:
             if character.resources.current_mp < self.params.mp_cost:
                 return False, f"Not enough MP ({character.resources.current_mp}/{self.params.mp_cost})"
                 
-        can_use, reason = character.can_use_move(self.params.star_cost, self.params.name)
+        can_use, reason = character.can_use_move(self.params.star_cost)
         if not can_use:
             return False, reason
             
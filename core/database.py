@@ -9,6 +9,8 @@ Key Features:
 - Efficient batch operations
 - Automated error handling and logging
 - Migration support for old data structure
+- Lazy write-back of documents stored at an old schema version
+- Shallow (key-only) queries for listing and existence checks
 
 When to Modify:
 - Adding new types of data to save/load
@@ -25,13 +27,27 @@ Dependencies:
 from datetime import datetime  
 import os  
 import logging  
+import asyncio
+import json
 import firebase_admin  
 from firebase_admin import credentials, db  
 from typing import Optional, Dict, Any, List
 from dotenv import load_dotenv
 
+from utils.perf import perf, timed
+
 logger = logging.getLogger(__name__)
 
+# How many documents go into one multi-path update when writing migrations
+MIGRATION_BATCH_SIZE = 50
+
+# Payload sizes are measured on one in this many calls per operation and
+# scaled up, since serializing every payload costs as much as sending it
+BYTES_SAMPLE_EVERY = 20
+
+# Keys under 'characters' that aren't character documents
+NON_CHARACTER_KEYS = {'movesets', 'combat_state'}
+
 class Database:  
     """Handles all database operations using Firebase Realtime Database."""  
      
@@ -39,6 +55,9 @@ class Database:
         self.initialized = False  
         self._db = None  
         self._refs = {}
+        self._pending_migrations: Dict[str, Any] = {}  # path -> upgraded data
+        self._migration_task: Optional[asyncio.Task] = None
+        self._track_calls: Dict[str, int] = {}  # op -> calls, for sampling payload sizes
 
     async def initialize(self) -> None:  
         """Initialize Firebase connection and run any needed migrations"""  
@@ -77,7 +96,8 @@ class Database:
                 'characters': db.reference('characters'),  
                 'shared_movesets': db.reference('shared_movesets'),  
                 'shared_moves': db.reference('shared_moves'),  
-                'initiative_saves': db.reference('initiative_saves')
+                'initiative_saves': db.reference('initiative_saves'),
+                'initiative_saves_index': db.reference('initiative_saves_index')
             }
 
             await self._check_and_migrate()  
@@ -88,7 +108,19 @@ class Database:
             logger.error(f"Failed to initialize database: {str(e)}", exc_info=True)  
             raise
 
+    ### Instrumentation ###
+    def _track(self, op: str, data: Any = None) -> None:
+        """Count a Firebase round trip and estimate the bytes it moved from a sample of payloads"""
+        perf.count("firebase.calls", op=op)
+        if data is None:
+            return
+        calls = self._track_calls.get(op, 0)
+        self._track_calls[op] = calls + 1
+        if calls % BYTES_SAMPLE_EVERY == 0:
+            perf.count("firebase.bytes", len(json.dumps(data, default=str)) * BYTES_SAMPLE_EVERY, op=op)
+
     # Move Management Methods
+    @timed("db.save_moveset")
     async def save_moveset(self, name: str, moveset_data: Dict[str, Any]) -> None:
         """Save a moveset to the database"""
         if not self.initialized:
@@ -96,12 +128,13 @@ class Database:
             
         try:
             self._refs['movesets'].child(name).set(moveset_data)
-            print(f"Moveset {name} saved successfully")
+            logger.debug("Moveset %s saved successfully", name)
             
         except Exception as e:
             logger.error(f"Failed to save moveset: {str(e)}", exc_info=True)
             raise
 
+    @timed("db.load_moveset")
     async def load_moveset(self, name: str) -> Optional[Dict[str, Any]]:
         """Load a moveset from the database"""
         if not self.initialized:
@@ -114,13 +147,14 @@ class Database:
                 logger.warning(f"Moveset {name} not found in database")
                 return None
                 
-            print(f"Moveset {name} loaded successfully")
+            logger.debug("Moveset %s loaded successfully", name)
             return moveset
             
         except Exception as e:
             logger.error(f"Failed to load moveset: {str(e)}", exc_info=True)
             raise
             
+    @timed("db.share_move")
     async def share_move(self, move_data: Dict[str, Any]) -> str:
         """
         Share a move to make it available to other characters.
@@ -140,13 +174,14 @@ class Database:
                 'created_at': {'.sv': 'timestamp'}
             })
             
-            print(f"Move shared successfully with ID: {share_id}")
+            logger.debug("Move shared successfully with ID: %s", share_id)
             return share_id
             
         except Exception as e:
             logger.error(f"Failed to share move: {str(e)}", exc_info=True)
             raise
             
+    @timed("db.get_shared_move")
     async def get_shared_move(self, share_id: str) -> Optional[Dict[str, Any]]:
         """Get a shared move by its share ID"""
         if not self.initialized:
@@ -159,25 +194,25 @@ class Database:
                 logger.warning(f"Shared move {share_id} not found")
                 return None
                 
-            print(f"Shared move {share_id} loaded successfully")
+            logger.debug("Shared move %s loaded successfully", share_id)
             return move_data.get('data')
             
         except Exception as e:
             logger.error(f"Failed to load shared move: {str(e)}", exc_info=True)
             raise
 
+    @timed("db.delete_shared_move")
     async def delete_shared_move(self, share_id: str) -> bool:
         """Delete a shared move. Returns True if found and deleted."""
         if not self.initialized:
             await self.initialize()
             
         try:
-            if not self._refs['shared_moves'].child(share_id).get():
-                logger.warning(f"Shared move {share_id} not found")
+            if not self._delete_if_exists(self._refs['shared_moves'].child(share_id)):
+                logger.warning("Shared move %s not found", share_id)
                 return False
                 
-            self._refs['shared_moves'].child(share_id).delete()
-            print(f"Shared move {share_id} deleted successfully")
+            logger.info("Shared move %s deleted successfully", share_id)
             return True
             
         except Exception as e:
@@ -251,6 +286,7 @@ class Database:
             logger.error(f"Error during migration: {str(e)}", exc_info=True)
             raise
 
+    @timed("db.save_character")
     async def save_character(self, character, debug_paths=None) -> None:
         """
         Save character data to the database with optional change tracking
@@ -273,6 +309,10 @@ class Database:
             
             # Save directly to characters collection
             self._refs['characters'].child(character.name).set(char_dict)
+            self._track("set", char_dict)
+            
+            # A full save already writes the current schema
+            self._pending_migrations.pop(f"characters/{character.name}", None)
             
             # Show changes if debug paths specified
             if debug_paths and old_data:
@@ -280,14 +320,43 @@ class Database:
                 for path in debug_paths:
                     self._print_path_changes(old_data, char_dict, path)
             
-            # Normal logging
-            if not getattr(self, 'debug_mode', False):
-                print(f"Character {character.name} saved successfully")
+            logger.debug("Character %s saved successfully", character.name)
             
         except Exception as e:
             logger.error(f"Failed to save character: {str(e)}", exc_info=True)
             raise
 
+    @timed("db.save_characters")
+    async def save_characters(self, characters) -> None:
+        """
+        Save several characters in one multi-path update.
+        Used when many characters change at once (e.g. restoring a combat save).
+        """
+        if not self.initialized:
+            await self.initialize()
+
+        try:
+            updates = {
+                f"characters/{character.name}": character.to_dict()
+                for character in characters
+            }
+            if not updates:
+                return
+                
+            self._db.update(updates)
+            self._track("update", updates)
+            
+            # Full saves already write the current schema
+            for path in updates:
+                self._pending_migrations.pop(path, None)
+                
+            logger.debug("Saved %s characters", len(updates))
+            
+        except Exception as e:
+            logger.error(f"Failed to save characters: {str(e)}", exc_info=True)
+            raise
+
+    @timed("db.load_character")
     async def load_character(self, name: str) -> Optional[Dict[str, Any]]:
         """Load character data from the database"""
         if not self.initialized:
@@ -296,10 +365,15 @@ class Database:
         try:
             # Get character data
             char_data = self._refs['characters'].child(name).get()
+            self._track("get", char_data)
             
             if not char_data:
                 logger.warning(f"Character {name} not found in database")
                 return None
+                
+            # Upgrade old documents once and write them back in the background
+            char_data = self._upgrade_character_data(name, char_data)
+            self.schedule_migration_flush()
 
             # Ensure proficiency and spell_save_dc exist
             if 'proficiency' not in char_data:
@@ -316,46 +390,237 @@ class Database:
                 ]
                 char_data['spell_save_dc'] = 8 + proficiency + max(spellcasting_mods)
 
-            print(f"Character {name} loaded successfully")
+            logger.debug("Character %s loaded successfully", name)
             return char_data
             
         except Exception as e:
             logger.error(f"Failed to load character: {str(e)}", exc_info=True)
             raise
 
+    @timed("db.delete_character")
     async def delete_character(self, name: str) -> bool:
         """Delete a character from the database"""
         if not self.initialized:
             await self.initialize()
 
         try:
-            # Check if character exists
-            if not self._refs['characters'].child(name).get():
-                logger.warning(f"Character {name} not found in database")
-                return False
-
-            # Delete from characters collection
-            self._refs['characters'].child(name).delete()
-            
-            print(f"Character {name} deleted successfully")
+            self._delete(self._refs['characters'].child(name))
+            logger.info("Character %s deleted successfully", name)
             return True
             
         except Exception as e:
             logger.error(f"Failed to delete character: {str(e)}", exc_info=True)
             raise
 
+    @timed("db.list_characters")
     async def list_characters(self) -> List[str]:
         """Get a list of all character names in the database"""
         if not self.initialized:
             await self.initialize()
 
         try:
-            char_data = self._refs['characters'].get()
-            return list(char_data.keys()) if char_data else []
+            # Shallow query only returns the keys, not the character documents
+            return [
+                name for name in self.list_keys('characters')
+                if name not in NON_CHARACTER_KEYS
+            ]
         except Exception as e:
             logger.error(f"Failed to list characters: {str(e)}", exc_info=True)
             raise
 
+    ### Shallow queries ###
+    def list_keys(self, collection: str) -> List[str]:
+        """
+        Get the child keys of a collection using a shallow query.
+        Only the keys are downloaded, not the documents under them.
+        """
+        data = self._refs[collection].get(shallow=True)
+        self._track("get_shallow", data)
+        return list(data.keys()) if isinstance(data, dict) else []
+
+    def _exists(self, ref) -> bool:
+        """Check if a node exists using a shallow query"""
+        data = ref.get(shallow=True)
+        self._track("get_shallow")
+        return data is not None
+
+    def _delete(self, ref) -> None:
+        """Delete a node. Deletes are idempotent, so there's no existence check first."""
+        ref.delete()
+        self._track("delete")
+
+    def _delete_if_exists(self, ref) -> bool:
+        """
+        Delete a node only if it exists. Returns True if it was deleted.
+        For deletes that report "not found" back to the user.
+        """
+        if not self._exists(ref):
+            return False
+        self._delete(ref)
+        return True
+
+    ### Schema migration ###
+    def queue_migration(self, path: str, data: Dict[str, Any]) -> None:
+        """
+        Queue upgraded data to be written back to the given path.
+        Written in one batch by flush_migrations().
+        """
+        self._pending_migrations[path] = data
+
+    @property
+    def pending_migrations(self) -> int:
+        """Number of upgraded documents waiting to be written"""
+        return len(self._pending_migrations)
+
+    def schedule_migration_flush(self) -> None:
+        """Flush queued migrations in a background task if one isn't already running"""
+        if not self._pending_migrations:
+            return
+        if self._migration_task and not self._migration_task.done():
+            return
+        self._migration_task = asyncio.create_task(self.flush_migrations())
+
+    @timed("db.flush_migrations")
+    async def flush_migrations(self, batch_size: int = MIGRATION_BATCH_SIZE) -> int:
+        """
+        Write all queued migrations using multi-path updates.
+        Returns the number of documents written.
+        """
+        if not self._pending_migrations:
+            return 0
+        if not self.initialized:
+            await self.initialize()
+            
+        paths = list(self._pending_migrations)
+        written = 0
+        batch = {}
+        
+        try:
+            for i in range(0, len(paths), batch_size):
+                # Take each path only if it's still queued: a full save since the
+                # flush started already wrote newer data, so its migration is dropped
+                batch = {
+                    path: self._pending_migrations.pop(path)
+                    for path in paths[i:i + batch_size]
+                    if path in self._pending_migrations
+                }
+                if not batch:
+                    continue
+                await asyncio.to_thread(self._db.update, batch)
+                self._track("update", batch)
+                written += len(batch)
+                batch = {}
+                
+            logger.info("Migrated %s documents to the current schema", written)
+            return written
+            
+        except Exception as e:
+            # Put back the batch that failed; later batches are still queued
+            for path, data in batch.items():
+                self._pending_migrations.setdefault(path, data)
+            logger.error(f"Failed to write migrations: {str(e)}", exc_info=True)
+            return written
+
+    def _upgrade_character_data(self, name: str, char_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Upgrade character data if it's outdated and queue the write-back"""
+        # Import here to avoid circular import
+        from core.character import Character
+        
+        if not Character.needs_upgrade(char_data):
+            return char_data
+            
+        upgraded = Character.upgrade_dict(char_data)
+        if upgraded is None:
+            return char_data
+            
+        self.queue_migration(f"characters/{name}", upgraded)
+        return upgraded
+
+    def _upgrade_moves_data(self, path: str, moves_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Upgrade outdated moves in a moves dictionary and queue their write-back"""
+        # Import here to avoid circular import
+        from modules.moves.data import MoveData
+        
+        if not isinstance(moves_data, dict):
+            return moves_data
+            
+        upgraded = dict(moves_data)
+        for key, move_data in moves_data.items():
+            if MoveData.needs_upgrade(move_data):
+                upgraded[key] = MoveData.from_dict(move_data).to_dict()
+                self.queue_migration(f"{path}/{key}", upgraded[key])
+                
+        return upgraded
+
+    async def _iter_batches(self, ref, batch_size: int):
+        """Page through a collection by key, yielding dictionaries of batch_size entries"""
+        start_key = None
+        while True:
+            query = ref.order_by_key()
+            if start_key is not None:
+                # start_at is inclusive, so fetch one extra and drop the repeat
+                query = query.start_at(start_key).limit_to_first(batch_size + 1)
+            else:
+                query = query.limit_to_first(batch_size)
+                
+            page = await asyncio.to_thread(query.get) or {}
+            items = [(k, v) for k, v in page.items() if k != start_key]
+            if not items:
+                return
+                
+            yield dict(items)
+            
+            if len(items) < batch_size:
+                return
+            start_key = items[-1][0]
+
+    async def migrate_all(self, batch_size: int = MIGRATION_BATCH_SIZE, dry_run: bool = False) -> Dict[str, int]:
+        """
+        Upgrade every stored character and shared moveset to the current schema.
+        
+        Reads and writes in batches so the whole database never has to be held
+        in memory at once. Intended to be run offline (see migrate_database.py).
+        
+        Returns counts of documents checked and upgraded.
+        """
+        if not self.initialized:
+            await self.initialize()
+            
+        # Import here to avoid circular import
+        from core.character import Character
+        
+        counts = {"checked": 0, "characters": 0, "moves": 0}
+        
+        async for batch in self._iter_batches(self._refs['characters'], batch_size):
+            for name, data in batch.items():
+                counts["checked"] += 1
+                if name in NON_CHARACTER_KEYS or not Character.needs_upgrade(data):
+                    continue
+                self._upgrade_character_data(name, data)
+                counts["characters"] += 1
+                
+            if not dry_run:
+                await self.flush_migrations(batch_size)
+                
+        async for batch in self._iter_batches(self._refs['shared_movesets'], batch_size):
+            for name, data in batch.items():
+                counts["checked"] += 1
+                before = self.pending_migrations
+                self._upgrade_moves_data(f"shared_movesets/{name}/moves", (data or {}).get('moves', {}))
+                counts["moves"] += self.pending_migrations - before
+                
+            if not dry_run:
+                await self.flush_migrations(batch_size)
+                
+        if dry_run:
+            self._pending_migrations = {}
+            
+        logger.info(
+            "Migration %s complete: %s characters and %s moves out of date (%s documents checked)",
+            'check' if dry_run else 'run', counts['characters'], counts['moves'], counts['checked']
+        )
+        return counts
+
     ### Firebase real-time logging ###
     def _print_path_changes(self, old_data, new_data, path):
         """
@@ -511,6 +776,7 @@ class Database:
     ### End of firebase real-time logging ###
 
     # Moveset Management Methods
+    @timed("db.save_moveset")
     async def save_moveset(self, name: str, moves_data: Dict[str, Any], description: Optional[str] = None) -> bool:
         """Save a moveset to the global movesets collection"""
         if not self.initialized:
@@ -526,18 +792,18 @@ class Database:
             }
             
             # Save to global movesets collection with metadata
-            self._refs['shared_movesets'].child(name).set({
-                "metadata": metadata,
-                "moves": moves_data
-            })
+            moveset = {"metadata": metadata, "moves": moves_data}
+            self._refs['shared_movesets'].child(name).set(moveset)
+            self._track("set", moveset)
             
-            print(f"Moveset {name} saved successfully")
+            logger.debug("Moveset %s saved successfully", name)
             return True
             
         except Exception as e:
             logger.error(f"Failed to save moveset: {str(e)}", exc_info=True)
             return False
 
+    @timed("db.load_moveset")
     async def load_moveset(self, name: str) -> Optional[Dict[str, Any]]:
         """Load a moveset from the global collection"""
         if not self.initialized:
@@ -546,21 +812,27 @@ class Database:
         try:
             # Get data from shared movesets
             moveset_data = self._refs['shared_movesets'].child(name).get()
+            self._track("get", moveset_data)
             
             if not moveset_data:
                 logger.warning(f"Moveset {name} not found in database")
                 return None
                 
             # Extract just the moves data
-            moves_data = moveset_data.get('moves', {})
+            moves_data = self._upgrade_moves_data(
+                f"shared_movesets/{name}/moves",
+                moveset_data.get('moves', {})
+            )
+            self.schedule_migration_flush()
             
-            print(f"Moveset {name} loaded successfully")
+            logger.debug("Moveset %s loaded successfully", name)
             return moves_data
             
         except Exception as e:
             logger.error(f"Failed to load moveset: {str(e)}", exc_info=True)
             return None
 
+    @timed("db.list_movesets")
     async def list_movesets(self) -> List[Dict[str, Any]]:
         """List all available shared movesets with metadata"""
         if not self.initialized:
@@ -569,6 +841,7 @@ class Database:
         try:
             # Get all movesets
             movesets_data = self._refs['shared_movesets'].get()
+            self._track("get", movesets_data)
             
             if not movesets_data:
                 return []
@@ -596,27 +869,25 @@ class Database:
             logger.error(f"Failed to list movesets: {str(e)}", exc_info=True)
             return []
 
+    @timed("db.delete_moveset")
     async def delete_moveset(self, name: str) -> bool:
-        """Delete a moveset from the global collection"""
+        """Delete a moveset from the global collection. Returns True if found and deleted."""
         if not self.initialized:
             await self.initialize()
             
         try:
-            # Check if moveset exists
-            if not self._refs['shared_movesets'].child(name).get():
-                logger.warning(f"Moveset {name} not found")
+            if not self._delete_if_exists(self._refs['shared_movesets'].child(name)):
+                logger.warning("Moveset %s not found", name)
                 return False
                 
-            # Delete the moveset
-            self._refs['shared_movesets'].child(name).delete()
-            
-            print(f"Moveset {name} deleted successfully")
+            logger.info("Moveset %s deleted successfully", name)
             return True
             
         except Exception as e:
             logger.error(f"Failed to delete moveset: {str(e)}", exc_info=True)
             return False
 
+    @timed("db.get_moveset_metadata")
     async def get_moveset_metadata(self, name: str) -> Optional[Dict[str, Any]]:
         """Get metadata for a specific moveset"""
         if not self.initialized:
@@ -8,7 +8,8 @@ The effect system is designed to handle temporary and permanent status effects o
 
 IMPLEMENTATION MANDATES:
 - All new effects MUST inherit from BaseEffect
-- Use format_effect_message() for ALL message formatting
+- Use format_effect_message() for ALL message formatting (or event() for
+  turn messages, which is formatted the same way when sent)
 - Never add backticks manually - they're handled by the formatting system
 - Always implement on_expire() for cleanup
 - Always use process_duration() for duration tracking
@@ -60,6 +61,8 @@ from datetime import datetime
 import logging
 import inspect
 
+from .events import EffectEvent, EffectEventKind, format_message, render_event
+
 logger = logging.getLogger(__name__)
 
 """
@@ -249,7 +252,8 @@ class BaseEffect:
         - Triggering status effects
         - Processing stacks
         
-        Returns list of effect messages to display.
+        Returns effect messages to display: EffectEvents (see events.py)
+        or pre-formatted strings.
         Override in subclasses to add turn start behavior.
         """
         # Process template-specific turn start logic if using a template
@@ -270,7 +274,8 @@ class BaseEffect:
         - Cleaning up expired effects
         - Processing end-of-turn triggers
         
-        Returns list of effect messages to display.
+        Returns effect messages to display: EffectEvents (see events.py)
+        or pre-formatted strings.
         Override in subclasses to add turn end behavior.
         """
         # Process template-specific turn end logic if using a template
@@ -282,43 +287,7 @@ class BaseEffect:
             return []
             
         # Use standardized duration tracking
-        turns_remaining, will_expire_next, should_expire_now = self.process_duration(
-            round_number, turn_name
-        )
-        
-        # Handle expiry with standardized flag
-        if should_expire_now:
-            if not self._expiry_message_sent:
-                self._expiry_message_sent = True
-                self._marked_for_expiry = True
-                
-                # Create expiry message
-                expiry_msg = self.format_effect_message(
-                    f"{self.name} has worn off from {character.name}"
-                )
-                
-                # Add to feedback system for reliable display
-                self._add_expiry_feedback(character, expiry_msg, round_number)
-                
-                return [expiry_msg]
-        
-        # Handle final turn warning
-        if will_expire_next:
-            self._will_expire_next = True
-            return [self.format_effect_message(
-                f"{self.name} continues",
-                [f"Final turn - will expire after this turn"]
-            )]
-            
-        # Regular duration update
-        if turns_remaining is not None and turns_remaining > 0:
-            s = "s" if turns_remaining != 1 else ""
-            return [self.format_effect_message(
-                f"{self.name} continues",
-                [f"{turns_remaining} turn{s} remaining"]
-            )]
-            
-        return []
+        return self.duration_events(character, round_number, turn_name)
 
     def on_expire(self, character) -> str:
         """
@@ -447,7 +416,7 @@ class BaseEffect:
             
         # Check if duration completed
         return self.timing.duration <= 0
-    
+
     def process_duration(self, round_number: int, turn_name: str) -> Tuple[int, bool, bool]:
         """
         Improved duration calculation that accounts for application timing.
@@ -570,8 +539,24 @@ class BaseEffect:
             return []
             
         # Process duration tracking
+        return self.duration_events(character, round_number, turn_name)
+
+    def duration_events(
+        self,
+        character,
+        round_number: int,
+        turn_name: str,
+        label: Optional[str] = None,
+        emoji: Optional[str] = None
+    ) -> List[EffectEvent]:
+        """
+        Standard end-of-turn duration events: expiry, final turn warning, or
+        turns remaining. Marks the effect for expiry when its time is up.
+        
+        label replaces the effect name in the messages (e.g. "Burn effect").
+        """
+        label = label or self.name
         turns_remaining, will_expire_next, should_expire_now = self.process_duration(round_number, turn_name)
-        messages = []
         
         # Handle expiry with standardized flag
         if should_expire_now:
@@ -579,33 +564,41 @@ class BaseEffect:
                 self._expiry_message_sent = True
                 self._marked_for_expiry = True
                 
-                # Create expiry message
-                expiry_msg = self.format_effect_message(
-                    f"{self.name} has worn off from {character.name}"
+                expiry = self.event(
+                    EffectEventKind.EXPIRY,
+                    character,
+                    f"{label} has worn off from {character.name}",
+                    emoji=emoji
                 )
                 
                 # Add to feedback system for reliable display
-                self._add_expiry_feedback(character, expiry_msg, round_number)
+                self._add_expiry_feedback(character, render_event(expiry), round_number)
                 
-                return [expiry_msg]
+                return [expiry]
         
         # Handle final turn warning
         if will_expire_next:
             self._will_expire_next = True
-            return [self.format_effect_message(
-                f"{self.name} continues",
-                [f"Final turn - will expire after this turn"]
+            return [self.event(
+                EffectEventKind.EXPIRY_WARNING,
+                character,
+                f"{label} continues",
+                ["Final turn - will expire after this turn"],
+                emoji=emoji
             )]
             
         # Regular duration update
         if turns_remaining is not None and turns_remaining > 0:
             s = "s" if turns_remaining != 1 else ""
-            messages.append(self.format_effect_message(
-                f"{self.name} continues",
-                [f"{turns_remaining} turn{s} remaining"]
-            ))
+            return [self.event(
+                EffectEventKind.STATUS,
+                character,
+                f"{label} continues",
+                [f"{turns_remaining} turn{s} remaining"],
+                emoji=emoji
+            )]
             
-        return messages
+        return []
 
     def format_effect_message(
         self,
@@ -625,32 +618,42 @@ class BaseEffect:
         Returns:
             Formatted message with proper backticks and emoji
         """
-        # Strip any existing backticks to prevent doubles
-        message = message.strip('` ')
-        
-        # Get emoji based on category if not provided
-        if not emoji:
-            emoji = self._custom_emoji or {
-                EffectCategory.COMBAT: "⚔️",
-                EffectCategory.RESOURCE: "💫",
-                EffectCategory.STATUS: "✨",
-                EffectCategory.CUSTOM: "✨"
-            }.get(self.category, "✨")
-            
-        # Format main message
-        formatted = f"{emoji} `{message}` {emoji}"
-        
-        # Add details if provided
-        if details:
-            # Clean and format each detail
-            detail_lines = []
-            for detail in details:
-                if detail := detail.strip('` '):
-                    detail_lines.append(f"• `{detail}`")
-            if detail_lines:
-                formatted += "\n" + "\n".join(detail_lines)
-                
-        return formatted
+        return format_message(message, details, self.message_emoji(emoji))
+    
+    def message_emoji(self, emoji: Optional[str] = None) -> str:
+        """Emoji for this effect's messages (override, custom, then category default)"""
+        if emoji:
+            return emoji
+        return self._custom_emoji or {
+            EffectCategory.COMBAT: "⚔️",
+            EffectCategory.RESOURCE: "💫",
+            EffectCategory.STATUS: "✨",
+            EffectCategory.CUSTOM: "✨"
+        }.get(self.category, "✨")
+    
+    def event(
+        self,
+        kind: EffectEventKind,
+        character,
+        message: str,
+        details: Optional[List[str]] = None,
+        emoji: Optional[str] = None,
+        **data
+    ) -> EffectEvent:
+        """
+        Create a typed event for this effect. Formatted the same way as
+        format_effect_message, but only when it's sent (see events.render_event).
+        """
+        return EffectEvent(
+            kind=kind,
+            effect_name=self.name,
+            character_name=character.name,
+            message=message.strip('` '),
+            details=tuple(details or ()),
+            emoji=self.message_emoji(emoji),
+            round_number=getattr(character, 'round_number', None),
+            **data
+        )
     
     def is_move_effect(self) -> bool:
         """Check if this is a move effect (for special handling)"""
@@ -713,7 +716,7 @@ class BaseEffect:
             phase: Which phase to process ('start' or 'end')
             
         Returns:
-            List of formatted message strings
+            List of formatted message strings (events are rendered here)
 
         INDIVIDUAL effect processing for a SINGLE effect.
         This is called BY manager.process_effects, not directly.
@@ -762,7 +765,7 @@ class BaseEffect:
                             messages.append(msg)
                         character.effects.remove(self)
                         
-        return messages
+        return [msg if isinstance(msg, str) else render_event(msg) for msg in messages]
     
     def _add_expiry_feedback(self, character, message: str, round_number: int) -> None:
         """
@@ -1039,41 +1042,7 @@ class BaseEffect:
             return []
         
         # Use standardized duration tracking for all template types
-        turns_remaining, will_expire_next, should_expire_now = self.process_duration(round_number, turn_name)
-        
-        # Handle expiry with standardized flag
-        if should_expire_now:
-            if not self._expiry_message_sent:
-                self._expiry_message_sent = True
-                self._marked_for_expiry = True
-                
-                # Create expiry message
-                expiry_msg = self.format_effect_message(
-                    f"{self.name} has worn off from {character.name}"
-                )
-                
-                # Add to feedback system for reliable display
-                self._add_expiry_feedback(character, expiry_msg, round_number)
-                
-                return [expiry_msg]
-        
-        # Handle final turn warning
-        if will_expire_next:
-            self._will_expire_next = True
-            return [self.format_effect_message(
-                f"{self.name} continues",
-                ["Final turn - will expire after this turn"]
-            )]
-            
-        # Regular duration update
-        if turns_remaining is not None and turns_remaining > 0:
-            s = "s" if turns_remaining != 1 else ""
-            return [self.format_effect_message(
-                f"{self.name} continues",
-                [f"{turns_remaining} turn{s} remaining"]
-            )]
-            
-        return []
+        return self.duration_events(character, round_number, turn_name)
     
     def _process_template_expire(self, character) -> str:
         """Process template-specific expire logic"""
@@ -1171,11 +1140,15 @@ class BaseEffect:
             if remaining_turns <= 1 or self._will_expire_next:
                 details.append("Final turn - will expire after this turn")
         
-        # Return formatted message
-        return [self.format_effect_message(
+        return [self.event(
+            EffectEventKind.TICK_DAMAGE,
+            character,
             f"{character.name} takes {damage_amount} {damage_type} damage from {self.name.lower()}",
             details,
-            emoji=self._custom_emoji
+            emoji=self._custom_emoji,
+            amount=damage_amount,
+            resource="hp",
+            damage_type=damage_type
         )]
     
     # ======== STAT MOD TEMPLATE HELPERS ========
@@ -1364,11 +1337,14 @@ class BaseEffect:
         else:
             message = f"{character.name} recovers {resource_amount} {resource_type.upper()} from {self.name.lower()}"
         
-        # Return formatted message
-        return [self.format_effect_message(
+        return [self.event(
+            EffectEventKind.RESOURCE_CHANGE,
+            character,
             message,
             details,
-            emoji=self._custom_emoji
+            emoji=self._custom_emoji,
+            amount=-resource_amount if is_drain else resource_amount,
+            resource=resource_type
         )]
     
     def _get_character_from_name(self, character, target_name: str):
@@ -1558,41 +1534,7 @@ class CustomEffect(BaseEffect):
             return []
             
         # Use standardized duration tracking
-        turns_remaining, will_expire_next, should_expire_now = self.process_duration(round_number, turn_name)
-        
-        # Handle expiry with standardized flag
-        if should_expire_now:
-            if not self._expiry_message_sent:
-                self._expiry_message_sent = True
-                self._marked_for_expiry = True
-                
-                # Create expiry message
-                expiry_msg = self.format_effect_message(
-                    f"{self.name} has worn off from {character.name}"
-                )
-                
-                # Add to feedback system for reliable display
-                self._add_expiry_feedback(character, expiry_msg, round_number)
-                
-                return [expiry_msg]
-        
-        # Handle final turn warning
-        if will_expire_next:
-            self._will_expire_next = True
-            return [self.format_effect_message(
-                f"{self.name} continues",
-                [f"Final turn - will expire after this turn"]
-            )]
-            
-        # Regular duration update
-        if turns_remaining is not None and turns_remaining > 0:
-            s = "s" if turns_remaining != 1 else ""
-            return [self.format_effect_message(
-                f"{self.name} continues",
-                [f"{turns_remaining} turn{s} remaining"]
-            )]
-                
-        return []
+        return self.duration_events(character, round_number, turn_name)
 
     def on_expire(self, character) -> str:
         """Handle effect expiry with feedback"""
@@ -1787,6 +1729,14 @@ class EffectRegistry:
             return effect_class(*args, **kwargs)
         return None
 
+    @classmethod
+    def is_registered(cls, effect_type: Optional[str]) -> bool:
+        """Check if an effect class name (as stored in 'type') is registered"""
+        return any(
+            effect_class.__name__ == effect_type
+            for effect_class in cls._effects.values()
+        )
+
     @classmethod
     def from_dict(cls, data: dict) -> Optional[BaseEffect]:
         """
@@ -1815,12 +1765,10 @@ class EffectRegistry:
         - None if effect type not found
         """
         
-        print(f"\nReconstructing effect:")
-        print(f"  Data received: {data}")
+        logger.debug("Reconstructing effect from data: %s", data)
         
         # Find effect class
         effect_type = data.get('type')
-        print(f"  Looking for effect type: {effect_type}")
         effect_class = next(
             (effect_class for effect_class in cls._effects.values() 
             if effect_class.__name__ == effect_type),
@@ -1829,21 +1777,17 @@ class EffectRegistry:
         
         # If no matching effect class found, we can't reconstruct it
         if not effect_class:
-            print(f"  No matching effect class found for type: {effect_type}")
+            logger.debug("No matching effect class found for type: %s", effect_type)
             return None
             
-        print(f"  Found effect class: {effect_class.__name__}")
-        
         # If effect has custom loading logic, use that instead
         if hasattr(effect_class, 'from_dict'):
-            print("  Using effect's custom from_dict method")
             reconstructed = effect_class.from_dict(data)
-            print(f"  Reconstructed effect: {reconstructed.__dict__ if reconstructed else None}")
+            logger.debug("Reconstructed %s with its from_dict", effect_type)
             return reconstructed
             
         try:
             # Create base instance
-            print("  Creating base instance")
             effect = effect_class.__new__(effect_class)
             
             # Get required init params from data
@@ -1855,8 +1799,6 @@ class EffectRegistry:
             if 'duration' in data:
                 params['duration'] = data['duration']
             
-            print(f"  Init params: {params}")
-            
             # Initialize with available params
             effect_class.__init__(effect, **params)
             
@@ -1872,7 +1814,6 @@ class EffectRegistry:
             
             # Restore timing information if it was saved
             if timing_data := data.get('timing'):
-                print(f"  Restoring timing: {timing_data}")
                 effect.timing = EffectTiming(**timing_data)
             
             # Restore effect flags
@@ -1889,7 +1830,6 @@ class EffectRegistry:
                             'description', 'timing', 'source_character', 'stacks',
                             '_marked_for_expiry', '_will_expire_next', '_custom_emoji',
                             '_application_round', '_application_turn', '_expiry_message_sent']:
-                    print(f"  Restoring attribute: {key} = {value}")
                     setattr(effect, key, value)
             
             # Restore template data if present
@@ -1897,10 +1837,9 @@ class EffectRegistry:
                 effect._template_type = data['_template_type']
                 effect._template_data = data.get('_template_data', {})
                     
-            print(f"  Final reconstructed effect: {effect.__dict__}")
+            logger.debug("Reconstructed effect: %s", effect.__dict__)
             return effect
             
         except Exception as e:
             logger.error(f"Failed to reconstruct effect {effect_type}: {str(e)}")
-            print(f"  Error during reconstruction: {str(e)}")
             return None
\ No newline at end of file
@@ -13,6 +13,7 @@ backward compatibility with existing code.
 """
 
 from core.effects.base import BaseEffect, EffectCategory, EffectTiming
+from core.effects.events import EffectEventKind, render_event
 from typing import List, Optional, Dict, Any, Tuple
 import logging
 
@@ -168,11 +169,15 @@ class BurnEffect(BaseEffect):
                 s = "s" if turns_remaining != 1 else ""
                 details.append(f"{turns_remaining} turn{s} remaining")
         
-        # Return formatted message
-        return [self.format_effect_message(
+        return [self.event(
+            EffectEventKind.TICK_DAMAGE,
+            character,
             f"{character.name} takes {damage_amount} fire damage from burn",
             details,
-            emoji="🔥"
+            emoji="🔥",
+            amount=damage_amount,
+            resource="hp",
+            damage_type="fire"
         )]
 
     def on_turn_end(self, character, round_number: int, turn_name: str) -> List[str]:
@@ -193,26 +198,30 @@ class BurnEffect(BaseEffect):
             # Mark for expiry first
             self._marked_for_expiry = True
             
-            # Create expiry message
-            expiry_msg = self.format_effect_message(
+            # Create expiry event
+            expiry = self.event(
+                EffectEventKind.EXPIRY,
+                character,
                 f"Burn effect has worn off from {character.name}",
                 emoji="🔥"
             )
             
             # Add to feedback system for reliable display on next turn
-            self._add_expiry_feedback(character, expiry_msg, round_number)
+            self._add_expiry_feedback(character, render_event(expiry), round_number)
             
             # Set flag to prevent duplicate messages
             self._expiry_message_sent = True
             
             # FIXED: Return message for immediate display in end-of-turn embed
-            return [expiry_msg]
+            return [expiry]
         
         # Handle final turn warning
         if will_expire_next:
             self._will_expire_next = True
-            return [self.format_effect_message(
-                f"Burn effect continues",
+            return [self.event(
+                EffectEventKind.EXPIRY_WARNING,
+                character,
+                "Burn effect continues",
                 ["Final turn - will expire after this turn"],
                 emoji="🔥"
             )]
@@ -220,8 +229,10 @@ class BurnEffect(BaseEffect):
         # Regular duration update
         if turns_remaining is not None and turns_remaining > 0:
             s = "s" if turns_remaining != 1 else ""
-            return [self.format_effect_message(
-                f"Burn effect continues",
+            return [self.event(
+                EffectEventKind.STATUS,
+                character,
+                "Burn effect continues",
                 [f"{turns_remaining} turn{s} remaining"],
                 emoji="🔥"
             )]
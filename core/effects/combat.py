@@ -322,6 +322,7 @@ class TargetHeatWaveEffect(BaseEffect):
         # Apply fire vulnerability at 3 stacks
         if self.stacks >= 3:
             character.defense.damage_vulnerabilities["fire"] = 50
+            invalidate_damage_modifiers(character)
             messages.append(self.format_effect_message(
                 "Maximum heat reached!",
                 ["Now vulnerable to fire damage"],
@@ -383,6 +384,7 @@ class TargetHeatWaveEffect(BaseEffect):
                     if old_stacks >= 3 and self.stacks < 3:
                         if "fire" in character.defense.damage_vulnerabilities:
                             del character.defense.damage_vulnerabilities["fire"]
+                            invalidate_damage_modifiers(character)
                     
                     messages.append(self.format_effect_message(
                         f"Heat reduced to {self.stacks}/3", 
@@ -417,6 +419,7 @@ class TargetHeatWaveEffect(BaseEffect):
             # Remove vulnerability if it was applied
             if self.stacks >= 3 and "fire" in character.defense.damage_vulnerabilities:
                 del character.defense.damage_vulnerabilities["fire"]
+                invalidate_damage_modifiers(character)
                 
             return self.format_effect_message(
                 f"Heat effect has worn off from {character.name}",
@@ -443,6 +446,7 @@ class TargetHeatWaveEffect(BaseEffect):
         messages = []
         if old_stacks < 3 and new_stacks >= 3:
             character.defense.damage_vulnerabilities["fire"] = 50
+            invalidate_damage_modifiers(character)
             messages.append(self.format_effect_message(
                 f"{character.name} burning up!",
                 [f"Heat Level {new_stacks}/3",
@@ -598,6 +602,89 @@ class DamageResult:
             
         return messages
 
+class DamageModifierTable:
+    """
+    Cached damage modifiers for one character, keyed by DamageType.
+    
+    Holds the character's total resistance and vulnerability, the weakness
+    applied to damage it deals, and its temp HP shields in the order they
+    absorb damage. Entries are filled in the first time a damage type is
+    hit and reused until a resistance, vulnerability, weakness or temp HP
+    effect is applied or expires (those effects call
+    invalidate_damage_modifiers, as does anything that edits the
+    character's defenses directly). Effects added or removed through the
+    Character (which bumps effects_version) and a replaced effects list are
+    also detected.
+    """
+    def __init__(self, character: 'Character'):
+        self.character = character
+        self._effects = character.effects
+        self._version = character.effects_version
+        self._entries: Dict[DamageType, Tuple[int, int, int]] = {}
+        self._weaknesses = [e for e in character.effects if isinstance(e, WeaknessEffect)]
+        self._temp_hp: Optional[List['TempHPEffect']] = None
+
+    def is_current(self, character: 'Character') -> bool:
+        return character.effects is self._effects and character.effects_version == self._version
+
+    @classmethod
+    def for_character(cls, character: 'Character') -> 'DamageModifierTable':
+        """Get the character's table, rebuilding it if it's out of date"""
+        table = getattr(character, '_damage_modifiers', None)
+        if table is None or not table.is_current(character):
+            table = cls(character)
+            character._damage_modifiers = table
+        return table
+
+    def get(self, damage_type: DamageType) -> Tuple[int, int, int]:
+        """(resistance, vulnerability, outgoing weakness) percentages for a damage type"""
+        entry = self._entries.get(damage_type)
+        if entry is None:
+            defense = self.character.defense
+            entry = (
+                defense.get_total_resistance(str(damage_type)),
+                defense.get_total_vulnerability(str(damage_type)),
+                sum(e.percentage for e in self._weaknesses if e.applies_to_damage_type(damage_type))
+            )
+            self._entries[damage_type] = entry
+        return entry
+
+    def resistance(self, damage_type: DamageType) -> int:
+        return self.get(damage_type)[0]
+
+    def vulnerability(self, damage_type: DamageType) -> int:
+        return self.get(damage_type)[1]
+
+    def weakness(self, damage_type: DamageType) -> int:
+        return self.get(damage_type)[2]
+
+    @property
+    def temp_hp(self) -> List['TempHPEffect']:
+        """
+        Temp HP shields, lowest remaining first. Absorbing only lowers the
+        front shield's remaining, so the order holds until the next rebuild.
+        """
+        if self._temp_hp is None:
+            self._temp_hp = sorted(
+                (e for e in self.character.effects if isinstance(e, TempHPEffect)),
+                key=lambda e: e.remaining
+            )
+        return self._temp_hp
+
+    def absorb(self, damage: int) -> Tuple[int, int]:
+        """Run damage through the temp HP shields. Returns (absorbed, remaining damage)."""
+        absorbed = 0
+        for effect in self.temp_hp:
+            if damage <= 0:
+                break
+            shield_absorbed, damage = effect.absorb_damage(damage)
+            absorbed += shield_absorbed
+        return absorbed, damage
+
+def invalidate_damage_modifiers(character: 'Character') -> None:
+    """Drop a character's cached damage modifiers after its defenses change"""
+    character._damage_modifiers = None
+
 class DamageCalculator:
     """Handles damage calculations including resistances and vulnerabilities"""
     
@@ -615,32 +702,17 @@ class DamageCalculator:
         if damage_type == DamageType.TRUE:
             return DamageResult(base_damage, base_damage)
             
-        # Get all damage modifiers
-        total_res = target.defense.get_total_resistance(str(damage_type))
-        total_vul = target.defense.get_total_vulnerability(str(damage_type))
-        weakness = 0
-        
-        # Attacker weakness
-        if attacker:
-            for effect in attacker.effects:
-                if isinstance(effect, WeaknessEffect):
-                    if effect.applies_to_damage_type(damage_type):
-                        weakness += effect.percentage
+        # Get all damage modifiers from the cached tables
+        modifiers = DamageModifierTable.for_character(target)
+        total_res, total_vul, _ = modifiers.get(damage_type)
+        weakness = DamageModifierTable.for_character(attacker).weakness(damage_type) if attacker else 0
         
         # Calculate damage before temp HP
         multiplier = (100 - total_res + total_vul - weakness) / 100
         modified_damage = round(base_damage * max(0, multiplier))
         
         # Handle temp HP
-        absorbed = 0
-        final_damage = modified_damage
-        temp_hp_effects = [e for e in target.effects if isinstance(e, TempHPEffect)]
-        
-        for effect in sorted(temp_hp_effects, key=lambda e: e.remaining):  # Use lowest remaining first
-            if final_damage <= 0:
-                break
-            temp_absorbed, final_damage = effect.absorb_damage(final_damage)
-            absorbed += temp_absorbed
+        absorbed, final_damage = modifiers.absorb(modified_damage)
             
         return DamageResult(
             final_damage=final_damage,
@@ -677,6 +749,7 @@ class ResistanceEffect(BaseEffect):
         
         # Add to effect-based resistances
         character.defense.damage_resistances[str(self.damage_type)] = self.percentage
+        invalidate_damage_modifiers(character)
         
         # Calculate total resistance
         total = character.defense.get_total_resistance(str(self.damage_type))
@@ -768,6 +841,7 @@ class ResistanceEffect(BaseEffect):
         """Remove resistance and show remaining"""
         if str(self.damage_type) in character.defense.damage_resistances:
             del character.defense.damage_resistances[str(self.damage_type)]
+            invalidate_damage_modifiers(character)
             
             # Check remaining resistance
             natural = character.defense.natural_resistances.get(str(self.damage_type), 0)
@@ -871,6 +945,7 @@ class VulnerabilityEffect(BaseEffect):
         
         # Add to effect-based vulnerabilities
         character.defense.damage_vulnerabilities[str(self.damage_type)] = self.percentage
+        invalidate_damage_modifiers(character)
         
         # Calculate total vulnerability
         total = character.defense.get_total_vulnerability(str(self.damage_type))
@@ -962,6 +1037,7 @@ class VulnerabilityEffect(BaseEffect):
         """Remove vulnerability and show remaining"""
         if str(self.damage_type) in character.defense.damage_vulnerabilities:
             del character.defense.damage_vulnerabilities[str(self.damage_type)]
+            invalidate_damage_modifiers(character)
             
             # Check remaining vulnerability
             natural = character.defense.natural_vulnerabilities.get(str(self.damage_type), 0)
@@ -1064,6 +1140,7 @@ class WeaknessEffect(BaseEffect):
     def on_apply(self, character, round_number: int) -> str:
         """Apply weakness with formatted message"""
         self.initialize_timing(round_number, character.name)
+        invalidate_damage_modifiers(character)
         
         # Format details
         details = [f"Damage reduced by {self.percentage}%"]
@@ -1128,6 +1205,7 @@ class WeaknessEffect(BaseEffect):
         
     def on_expire(self, character) -> str:
         """Clean message when effect expires"""
+        invalidate_damage_modifiers(character)
         return self.format_effect_message(
             f"{character.name} is no longer weak against {self.damage_type} damage",
             emoji="💔"
@@ -1181,6 +1259,7 @@ class TempHPEffect(BaseEffect):
             character.resources.current_temp_hp = self.amount
             character.resources.max_temp_hp = self.amount
             self.applied = True
+            invalidate_damage_modifiers(character)
             
             details = []
             if self.permanent:
@@ -1263,6 +1342,7 @@ class TempHPEffect(BaseEffect):
 
     def on_expire(self, character) -> str:
         """Clean up temp HP when effect expires"""
+        invalidate_damage_modifiers(character)
         if self.applied:
             character.resources.current_temp_hp = 0
             character.resources.max_temp_hp = 0
@@ -0,0 +1,141 @@
+"""
+Typed effect events.
+
+Effects report what happened on a turn as EffectEvents (tick damage,
+resource changes, phase changes, expiry warnings, expiries) instead of
+pre-formatted strings. Consumers work from the event kind: the initiative
+tracker groups events into its embeds without scanning message text, and
+the combat logger stores each event's data in the event store for the
+combat log and statistics. Text is only formatted, by render_event, when
+a message is actually sent.
+
+Hooks may still return plain strings (older effects, custom text). Those
+are wrapped as events of the kind their hook implies: EXPIRY for
+on_expire, STATUS otherwise.
+"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class EffectEventKind(str, Enum):
+    """What an effect event reports"""
+    STATUS = "status"                  # Effect is active / continues
+    TICK_DAMAGE = "tick_damage"        # Damage over time dealt
+    RESOURCE_CHANGE = "resource_change"  # HP/MP/temp HP changed by the effect
+    PHASE_CHANGE = "phase_change"      # Casting → active → cooldown
+    EXPIRY_WARNING = "expiry_warning"  # Final turn, expires after this turn
+    EXPIRY = "expiry"                  # Effect wore off
+
+
+@dataclass
+class EffectEvent:
+    """One thing an effect did or reported on a turn"""
+    kind: EffectEventKind
+    effect_name: str
+    character_name: str
+    message: str                               # Main line, unformatted
+    details: Tuple[str, ...] = ()
+    emoji: str = "✨"
+    round_number: Optional[int] = None
+    amount: Optional[int] = None               # Damage dealt or resource change
+    resource: Optional[str] = None             # 'hp', 'mp', 'temp_hp'
+    damage_type: Optional[str] = None
+    phase: Optional[str] = None                # Phase entered on a phase change
+    formatted: Optional[str] = field(default=None, repr=False)  # Text a hook returned ready-made
+
+    @classmethod
+    def from_message(
+            cls,
+            message: str,
+            kind: EffectEventKind,
+            effect_name: str,
+            character_name: str,
+            round_number: Optional[int] = None
+        ) -> 'EffectEvent':
+        """Wrap a pre-formatted message returned by a hook"""
+        return cls(
+            kind=kind,
+            effect_name=effect_name,
+            character_name=character_name,
+            message=message,
+            round_number=round_number,
+            formatted=message
+        )
+
+    def __str__(self) -> str:
+        return render_event(self)
+
+    @property
+    def is_expiry(self) -> bool:
+        return self.kind == EffectEventKind.EXPIRY
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Event data for the combat event store (no formatting)"""
+        data = {
+            "kind": self.kind.value,
+            "effect": self.effect_name,
+            "character": self.character_name,
+            "round": self.round_number
+        }
+        for key in ("amount", "resource", "damage_type", "phase"):
+            value = getattr(self, key)
+            if value is not None:
+                data[key] = value
+        return data
+
+
+def format_message(message: str, details: Optional[List[str]] = None, emoji: str = "✨") -> str:
+    """Effect message styling: emoji-wrapped main line with bulleted details"""
+    # Strip any existing backticks to prevent doubles
+    message = message.strip('` ')
+    formatted = f"{emoji} `{message}` {emoji}"
+
+    if details:
+        detail_lines = []
+        for detail in details:
+            if detail := detail.strip('` '):
+                detail_lines.append(f"• `{detail}`")
+        if detail_lines:
+            formatted += "\n" + "\n".join(detail_lines)
+
+    return formatted
+
+
+def render_event(event: EffectEvent) -> str:
+    """Format an event for a Discord message"""
+    if event.formatted is not None:
+        return event.formatted
+    return format_message(event.message, list(event.details), event.emoji)
+
+
+def render_events(events: List[EffectEvent]) -> List[str]:
+    return [render_event(event) for event in events]
+
+
+def as_events(
+        result: Any,
+        kind: EffectEventKind,
+        effect_name: str,
+        character_name: str,
+        round_number: Optional[int] = None
+    ) -> List[EffectEvent]:
+    """
+    Normalize a hook's return value (None, a string, an event, or a list of
+    them) into events. Strings become events of the given kind.
+    """
+    if not result:
+        return []
+    if not isinstance(result, list):
+        result = [result]
+
+    events = []
+    for item in result:
+        if isinstance(item, EffectEvent):
+            if item.round_number is None:
+                item.round_number = round_number
+            events.append(item)
+        elif item:
+            events.append(EffectEvent.from_message(str(item), kind, effect_name, character_name, round_number))
+    return events
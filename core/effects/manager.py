@@ -23,7 +23,10 @@ import inspect
 import logging
 import asyncio
 
+from utils.perf import timed
+
 from .base import BaseEffect, EffectRegistry, EffectCategory, CustomEffect
+from .events import EffectEvent, EffectEventKind, as_events, render_events
 from .burn_effect import BurnEffect
 
 # We'll import other effects as needed
@@ -195,12 +198,13 @@ async def remove_effect(
         logger.error(f"Error removing effect: {str(e)}", exc_info=True)
         return f"Error removing {effect_name}: {str(e)}"
 
-async def process_effects(
+@timed("effects.process")
+async def process_effect_events(
     character,
     round_number: int,
     turn_name: str,
     combat_logger = None
-) -> Tuple[bool, List[str], List[str]]:
+) -> Tuple[bool, List[EffectEvent], List[EffectEvent]]:
     """
     Process all effects for a character's turn with improved feedback handling.
     
@@ -211,6 +215,10 @@ async def process_effects(
     4. Properly removes expired effects
     5. Maintains effect feedback for reliable expiry messages
     
+    Effects report typed events (see events.py); messages they return as
+    strings are wrapped as events. Events are recorded in the combat logger
+    and only formatted when sent (events.render_event).
+    
     Args:
         character: Character being processed
         round_number: Current round number
@@ -218,12 +226,19 @@ async def process_effects(
         combat_logger: Optional combat logger
         
     Returns:
-        Tuple of (was_turn_skipped, start_messages, end_messages)
+        Tuple of (was_turn_skipped, start_events, end_events)
     """
-    start_messages = []
-    end_messages = []
+    start_events: List[EffectEvent] = []
+    end_events: List[EffectEvent] = []
     was_skipped = False
     effects_to_remove = []
+    feedback_count = 0
+    
+    def add_expiry(events: List[EffectEvent], effect, message) -> None:
+        """Add an on_expire message unless the effect already reported its expiry"""
+        if any(event.is_expiry and event.effect_name == effect.name for event in events):
+            return
+        events.extend(as_events(message, EffectEventKind.EXPIRY, effect.name, character.name, round_number))
     
     try:
         # ===== TURN START PHASE =====
@@ -235,7 +250,14 @@ async def process_effects(
                 for feedback in pending_feedback:
                     if feedback.expiry_message and not feedback.displayed:
                         # Add to start messages so it shows at turn start
-                        start_messages.append(feedback.expiry_message)
+                        start_events.append(EffectEvent.from_message(
+                            feedback.expiry_message,
+                            EffectEventKind.EXPIRY,
+                            feedback.effect_name,
+                            character.name,
+                            feedback.round_expired
+                        ))
+                feedback_count = len(start_events)
                 
                 # Mark feedback as displayed only on this character's turn
                 if character.name == turn_name:
@@ -270,12 +292,10 @@ async def process_effects(
                     else:
                         start_result = effect.on_turn_start(character, round_number, turn_name)
                     
-                    # Add messages to collection
-                    if start_result:
-                        if isinstance(start_result, list):
-                            start_messages.extend(start_result)
-                        else:
-                            start_messages.append(start_result)
+                    # Add events to collection
+                    start_events.extend(as_events(
+                        start_result, EffectEventKind.STATUS, effect.name, character.name, round_number
+                    ))
                 
                 # Check for skip effect
                 if hasattr(effect, 'skips_turn') and effect.skips_turn:
@@ -302,9 +322,8 @@ async def process_effects(
                     else:
                         expire_msg = effect.on_expire(character)
                     
-                    # Add expiry message to start messages if it exists
-                    if expire_msg and expire_msg not in start_messages:
-                        start_messages.append(expire_msg)
+                    # Add expiry to start events if it exists
+                    add_expiry(start_events, effect, expire_msg)
                     
                     # FIXED: Explicitly remove effect from character's list
                     character.effects.remove(effect)
@@ -333,15 +352,10 @@ async def process_effects(
                     else:
                         end_result = effect.on_turn_end(character, round_number, turn_name)
                     
-                    # IMPROVED: Collect all end messages
-                    if end_result:
-                        if isinstance(end_result, list):
-                            for msg in end_result:
-                                if not msg:
-                                    continue
-                                end_messages.append(msg)
-                        else:
-                            end_messages.append(end_result)
+                    # IMPROVED: Collect all end events
+                    end_events.extend(as_events(
+                        end_result, EffectEventKind.STATUS, effect.name, character.name, round_number
+                    ))
                 
                 # Check for is_expired at end of turn
                 if hasattr(effect, 'is_expired') and effect.is_expired:
@@ -377,9 +391,8 @@ async def process_effects(
                             else:
                                 expire_msg = effect.on_expire(character)
                             
-                            # Add expiry message to the list if it exists and not already there
-                            if expire_msg and expire_msg not in end_messages:
-                                end_messages.append(expire_msg)
+                            # Add expiry unless the effect already reported it
+                            add_expiry(end_events, effect, expire_msg)
                     else:
                         # Standard effect - always call on_expire
                         if inspect.iscoroutinefunction(effect.on_expire):
@@ -387,9 +400,8 @@ async def process_effects(
                         else:
                             expire_msg = effect.on_expire(character)
                         
-                        # Add expiry message to the list if it exists
-                        if expire_msg and expire_msg not in end_messages:
-                            end_messages.append(expire_msg)
+                        # Add expiry unless the effect already reported it
+                        add_expiry(end_events, effect, expire_msg)
                     
                     # FIXED: Always remove the effect from character's list
                     character.effects.remove(effect)
@@ -400,13 +412,35 @@ async def process_effects(
             
             # FIXED: No need to append expiry messages here - already handled above
         
-        return was_skipped, start_messages, end_messages
+        # Record what happened (feedback was recorded when it first happened)
+        if combat_logger and hasattr(combat_logger, 'log_effect_events'):
+            combat_logger.log_effect_events(start_events[feedback_count:] + end_events)
+        
+        return was_skipped, start_events, end_events
         
     except Exception as e:
         logger.error(f"Error processing effects: {str(e)}", exc_info=True)
         if hasattr(character, 'round_number'):
             delattr(character, 'round_number')
         return False, [], []
+
+async def process_effects(
+    character,
+    round_number: int,
+    turn_name: str,
+    combat_logger = None
+) -> Tuple[bool, List[str], List[str]]:
+    """
+    Process all effects for a character's turn (see process_effect_events).
+    
+    Returns:
+        Tuple of (was_turn_skipped, start_messages, end_messages) with the
+        events formatted as message strings
+    """
+    was_skipped, start_events, end_events = await process_effect_events(
+        character, round_number, turn_name, combat_logger
+    )
+    return was_skipped, render_events(start_events), render_events(end_events)
     
 def get_effect_summary(character) -> List[str]:
     """
@@ -24,13 +24,15 @@ from enum import Enum, auto
 import logging
 import inspect
 import time
-import random
 
 from core.effects.base import BaseEffect, EffectCategory, EffectTiming
-from core.effects.rollmod import RollModifierType, RollModifierEffect
+from core.effects.events import EffectEventKind, render_event
+from core.effects.rollmod import RollModifierType, RollModifierEffect, add_roll_modifier
 from core.effects.condition import ConditionType
 from utils.advanced_dice.calculator import DiceCalculator
-from core.character import StatType
+from utils.advanced_dice.aoe_resolver import (
+    CompiledAttack, CompiledDC, SaveCheck, TargetOutcome, STAT_NAMES
+)
 
 logger = logging.getLogger(__name__)
 
@@ -68,7 +70,7 @@ class MoveStateMachine:
         self.duration = duration
         self.cooldown = cooldown
         
-        self.debug_print(f"Initializing with cast={cast_time}, duration={duration}, cooldown={cooldown}")
+        self.debug_print("Initializing with cast=%s, duration=%s, cooldown=%s", cast_time, duration, cooldown)
         
         # Initialize the first state
         if cast_time and cast_time > 0:
@@ -95,12 +97,12 @@ class MoveStateMachine:
         # FIX: Track internal duration adjustments
         self.duration_adjusted = False
         
-        self.debug_print(f"Starting in state: {self.state.value} with {self.turns_remaining} turns remaining")
+        self.debug_print("Starting in state: %s with %s turns remaining", self.state.value, self.turns_remaining)
     
-    def debug_print(self, message):
-        """Print debug messages if debug mode is enabled"""
-        if self.debug_mode:
-            print(f"[{self.debug_id}] {message}")
+    def debug_print(self, message, *args):
+        """Log a debug message if debug mode is enabled. Args are %-formatted only when logged."""
+        if self.debug_mode and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[%s] %s", self.debug_id, message % args if args else message)
             
     def get_current_state(self) -> MoveState:
         """Get the current state"""
@@ -120,7 +122,7 @@ class MoveStateMachine:
         # Prevent double-processing
         if (self.last_processed_round == round_number and 
             self.last_processed_turn == turn_name):
-            self.debug_print(f"Skipping duplicate process_turn call for round {round_number}, turn {turn_name}")
+            self.debug_print("Skipping duplicate process_turn call for round %s, turn %s", round_number, turn_name)
             return False, None
             
         self.last_processed_round = round_number
@@ -135,7 +137,7 @@ class MoveStateMachine:
             return False, None
             
         # Decrement turns remaining
-        self.debug_print(f"Processing turn from {self.turns_remaining} turns remaining")
+        self.debug_print("Processing turn from %s turns remaining", self.turns_remaining)
         self.turns_remaining -= 1
         
         # FIX: Handle the case where turns_remaining is negative
@@ -185,12 +187,12 @@ class MoveStateMachine:
                 self.should_be_removed = True
             
             self.transition_message = message
-            self.debug_print(f"Transition: {old_state.value} → {self.state.value} with message: {message}")
+            self.debug_print("Transition: %s → %s with message: %s", old_state.value, self.state.value, message)
             if self.should_be_removed:
                 self.debug_print("Effect marked for removal during transition")
             return True, message
             
-        self.debug_print(f"No transition needed. Remaining turns: {self.turns_remaining}")
+        self.debug_print("No transition needed. Remaining turns: %s", self.turns_remaining)
         return False, None
         
     def to_dict(self) -> dict:
@@ -236,16 +238,59 @@ class SavingThrowProcessor:
     - Formatted messages for save results
     - Optional damage application
     - Half-damage on successful save option
+    
+    DC expressions are compiled once (CompiledDC) and the resulting save
+    check is cached per source, so repeat saves only roll dice. All targets
+    are resolved in one batch (CompiledAttack.resolve).
     """
     def __init__(self, debug_mode=True):
         self.debug_mode = debug_mode
         self.targets_saved = set()
         self.last_save_round = None
+        self._save_checks: Dict[str, Tuple[Tuple, SaveCheck]] = {}  # Source name -> (DC inputs, check)
+        self._damage: Dict[Tuple[str, Optional[str]], CompiledAttack] = {}  # (source, damage) -> compiled damage
+        
+    def debug_print(self, message, *args):
+        """Log a debug message if debug mode is enabled. Args are %-formatted only when logged."""
+        if self.debug_mode and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[%s] %s", "SavingThrowProcessor", message % args if args else message)
+            
+    def save_check(self, source, save_type: str, save_dc: Optional[str], half_on_save: bool = False) -> SaveCheck:
+        """
+        The save targets make against a source's DC. Cached per source until
+        the proficiency or stats the DC uses change.
+        """
+        compiled = CompiledDC.compile(save_dc)
+        inputs = (save_type, save_dc, half_on_save, *compiled.inputs(source))
+        cached = self._save_checks.get(source.name)
+        if cached and cached[0] == inputs:
+            return cached[1]
+            
+        check = SaveCheck(STAT_NAMES.get(save_type.lower()), compiled.evaluate(source), half_on_save)
+        self._save_checks[source.name] = (inputs, check)
+        self.debug_print("Calculated DC: %s", check.dc)
+        return check
+        
+    def resolve_saves(
+            self,
+            source,
+            targets,
+            check: SaveCheck,
+            damage: Optional[str] = None
+        ) -> List[TargetOutcome]:
+        """
+        Roll every target's save in one batch and apply damage to those who
+        fail (or half to those who save, with half_on_save). Returns each
+        target's outcome: save roll and total, whether it saved, damage.
+        """
+        key = (source.name, damage)
+        compiled = self._damage.get(key)
+        if compiled is None or compiled.character is not source:
+            compiled = self._damage[key] = CompiledAttack(None, damage, character=source)
+        outcomes = compiled.resolve(targets, save=check, apply_damage=True).outcomes
         
-    def debug_print(self, message):
-        """Print debug messages if debug mode is enabled"""
-        if self.debug_mode:
-            print(f"[SavingThrowProcessor] {message}")
+        self.targets_saved.update(outcome.target.name for outcome in outcomes if outcome.saved)
+        return outcomes
             
     async def process_save(self,
                          source, 
@@ -276,112 +321,34 @@ class SavingThrowProcessor:
             
         # Track when we last processed saves
         self.last_save_round = getattr(source, 'round_number', None)
-            
-        # Import utility functions
-        from utils.dice import DiceRoller
-        
-        self.debug_print(f"Processing saves for {len(targets)} targets")
-        messages = []
         
-        # Calculate actual DC
-        dc_value = 10  # Default DC
-        if save_dc:
-            # Parse expressions like "8+prof+int"
-            try:
-                parts = save_dc.lower().replace(" ", "").split("+")
-                dc_value = 0
-                
-                for part in parts:
-                    if part.isdigit():
-                        dc_value += int(part)
-                    elif part == "prof":
-                        dc_value += source.base_proficiency
-                    elif part in ["str", "strength"]:
-                        dc_value += source.stats.get_modifier(StatType.STRENGTH)
-                    elif part in ["dex", "dexterity"]:
-                        dc_value += source.stats.get_modifier(StatType.DEXTERITY)
-                    elif part in ["con", "constitution"]:
-                        dc_value += source.stats.get_modifier(StatType.CONSTITUTION)
-                    elif part in ["int", "intelligence"]:
-                        dc_value += source.stats.get_modifier(StatType.INTELLIGENCE)
-                    elif part in ["wis", "wisdom"]:
-                        dc_value += source.stats.get_modifier(StatType.WISDOM)
-                    elif part in ["cha", "charisma"]:
-                        dc_value += source.stats.get_modifier(StatType.CHARISMA)
-            except Exception as e:
-                self.debug_print(f"Error parsing save DC: {e}")
-                
-        self.debug_print(f"Calculated DC: {dc_value}")
+        self.debug_print("Processing saves for %s targets", len(targets))
+        check = self.save_check(source, save_type, save_dc, half_on_save)
+        outcomes = self.resolve_saves(source, targets, check, damage)
             
         # Format a single message with all save results
-        main_message = f"{save_type.upper()} Save DC {dc_value} | {effect_name}"
+        main_message = f"{save_type.upper()} Save DC {check.dc} | {effect_name}"
         
-        # Process each target's save
         target_results = []
-        for target in targets:
-            # Get save modifier based on type
-            save_mod = 0
-            if save_type.lower() in ["str", "strength"]:
-                save_mod = target.saves.get(StatType.STRENGTH, 0)
-            elif save_type.lower() in ["dex", "dexterity"]:
-                save_mod = target.saves.get(StatType.DEXTERITY, 0)
-            elif save_type.lower() in ["con", "constitution"]:
-                save_mod = target.saves.get(StatType.CONSTITUTION, 0)
-            elif save_type.lower() in ["int", "intelligence"]:
-                save_mod = target.saves.get(StatType.INTELLIGENCE, 0)
-            elif save_type.lower() in ["wis", "wisdom"]:
-                save_mod = target.saves.get(StatType.WISDOM, 0)
-            elif save_type.lower() in ["cha", "charisma"]:
-                save_mod = target.saves.get(StatType.CHARISMA, 0)
-                
-            # Roll the save
-            roll_result = random.randint(1, 20)
-            total = roll_result + save_mod
-            
-            # Check if save succeeds
-            success = total >= dc_value
-            if success:
-                self.targets_saved.add(target.name)
-                
-            # Format target result
-            result_text = f"{target.name}: {roll_result}+{save_mod}={total} | {'✅' if success else '❌'}"
+        for outcome in outcomes:
+            save_mod = outcome.save_total - outcome.save_roll
+            result_text = (
+                f"{outcome.target.name}: {outcome.save_roll}+{save_mod}={outcome.save_total} | "
+                f"{'✅' if outcome.saved else '❌'}"
+            )
             
-            # Handle damage if applicable
-            if damage:
-                damage_dealt = 0
-                
-                if not success:
-                    # Full damage on failure
-                    damage_roll, _ = DiceRoller.roll_dice(damage, target)
-                    damage_dealt = damage_roll
-                elif half_on_save:
-                    # Half damage on success with half_on_save
-                    damage_roll, _ = DiceRoller.roll_dice(damage, target)
-                    damage_dealt = damage_roll // 2
-                    result_text += f" | Half dmg: {damage_dealt}"
-                
-                # Apply the damage
-                if damage_dealt > 0:
-                    # Handle any temp HP first
-                    if target.resources.current_temp_hp > 0:
-                        absorbed = min(target.resources.current_temp_hp, damage_dealt)
-                        target.resources.current_temp_hp -= absorbed
-                        damage_dealt -= absorbed
-                        
-                        if absorbed > 0:
-                            result_text += f" | {absorbed} absorbed"
-                    
-                    # Apply remaining damage to regular HP
-                    if damage_dealt > 0:
-                        old_hp = target.resources.current_hp
-                        target.resources.current_hp = max(0, old_hp - damage_dealt)
-                        
-                        if not success:
-                            result_text += f" | {damage_dealt} damage"
+            if outcome.damage_rolls:
+                if outcome.saved:
+                    result_text += f" | Half dmg: {outcome.total_damage}"
+                if outcome.absorbed:
+                    result_text += f" | {outcome.absorbed} absorbed"
+                if not outcome.saved and outcome.damage_taken:
+                    result_text += f" | {outcome.damage_taken} damage"
             
             target_results.append(result_text)
             
         # Format final message with all results
+        messages = []
         if target_results:
             formatted = f"🎯 `{main_message}` 🎯\n" + "\n".join(f"• `{result}`" for result in target_results)
             messages.append(formatted)
@@ -412,10 +379,10 @@ class BonusOnHit:
         self.debug_mode = debug_mode
         self.hit_count = 0
         
-    def debug_print(self, message):
-        """Print debug messages if debug mode is enabled"""
-        if self.debug_mode:
-            print(f"[BonusOnHit] {message}")
+    def debug_print(self, message, *args):
+        """Log a debug message if debug mode is enabled. Args are %-formatted only when logged."""
+        if self.debug_mode and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[%s] %s", "BonusOnHit", message % args if args else message)
     
     def has_bonuses(self) -> bool:
         """Check if any bonuses are configured"""
@@ -427,7 +394,7 @@ class BonusOnHit:
     def register_hit(self):
         """Register a successful hit"""
         self.hit_count += 1
-        self.debug_print(f"Registered hit. Total hits: {self.hit_count}")
+        self.debug_print("Registered hit. Total hits: %s", self.hit_count)
     
     def reset(self):
         """Reset hit counter"""
@@ -445,7 +412,7 @@ class BonusOnHit:
         # Import dice roller here to avoid circular imports
         from utils.dice import DiceRoller
         
-        self.debug_print(f"Applying bonuses for {self.hit_count} hits")
+        self.debug_print("Applying bonuses for %s hits", self.hit_count)
         
         # Calculate total bonuses
         totals = {}
@@ -460,7 +427,7 @@ class BonusOnHit:
                 for _ in range(self.hit_count):
                     mp_roll, _ = DiceRoller.roll_dice(self.mp_bonus, character)
                     total_mp += mp_roll
-                self.debug_print(f"Rolled MP bonus {self.mp_bonus} × {self.hit_count} = {total_mp}")
+                self.debug_print("Rolled MP bonus %s × %s = %s", self.mp_bonus, self.hit_count, total_mp)
             else:
                 # It's a fixed number
                 total_mp = int(self.mp_bonus) * self.hit_count
@@ -485,7 +452,7 @@ class BonusOnHit:
                 for _ in range(self.hit_count):
                     hp_roll, _ = DiceRoller.roll_dice(self.hp_bonus, character)
                     total_hp += hp_roll
-                self.debug_print(f"Rolled HP dice {self.hp_bonus} × {self.hit_count} = {total_hp}")
+                self.debug_print("Rolled HP dice %s × %s = %s", self.hp_bonus, self.hit_count, total_hp)
             else:
                 # It's a fixed number
                 total_hp = int(self.hp_bonus) * self.hit_count
@@ -510,7 +477,7 @@ class BonusOnHit:
                 for _ in range(self.hit_count):
                     stars_roll, _ = DiceRoller.roll_dice(self.star_bonus, character)
                     total_stars += stars_roll
-                self.debug_print(f"Rolled star dice {self.star_bonus} × {self.hit_count} = {total_stars}")
+                self.debug_print("Rolled star dice %s × %s = %s", self.star_bonus, self.hit_count, total_stars)
             else:
                 # It's a fixed number
                 total_stars = int(self.star_bonus) * self.hit_count
@@ -547,7 +514,7 @@ class BonusOnHit:
             return cls()
         
         # Debug the incoming data
-        print(f"[BonusOnHit] Creating from data: {data}")
+        logger.debug("[BonusOnHit] Creating from data: %s", data)
             
         # Handle both direct values and nested dictionaries
         if isinstance(data, dict):
@@ -591,10 +558,10 @@ class CombatProcessor:
         self.aoe_mode = 'single'
         self.debug_mode = debug_mode
         
-    def debug_print(self, message):
-        """Print debug messages if debug mode is enabled"""
-        if self.debug_mode:
-            print(f"[CombatProcessor] {message}")
+    def debug_print(self, message, *args):
+        """Log a debug message if debug mode is enabled. Args are %-formatted only when logged."""
+        if self.debug_mode and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[%s] %s", "CombatProcessor", message % args if args else message)
             
     async def process_attack(self, 
                            source, 
@@ -611,7 +578,7 @@ class CombatProcessor:
 
         # Track attack count
         self.attacks_this_turn += 1
-        self.debug_print(f"Processing attack (count: {self.attacks_this_turn})")
+        self.debug_print("Processing attack (count: %s)", self.attacks_this_turn)
         messages = []
         
         # Import here to avoid circular import
@@ -626,7 +593,7 @@ class CombatProcessor:
             # Convert dictionary to BonusOnHit
             hit_bonus = BonusOnHit.from_dict(bonus_on_hit)
         
-        self.debug_print(f"Using hit bonus tracker: {hit_bonus.__dict__}")
+        self.debug_print("Using hit bonus tracker: %s", hit_bonus.__dict__)
         
         # Handle no targets case
         if not targets:
@@ -641,7 +608,7 @@ class CombatProcessor:
             )
             
             # Process attack - this call is already awaitable
-            self.debug_print(f"Processing no-target attack with {attack_roll}")
+            self.debug_print("Processing no-target attack with %s", attack_roll)
             message, _ = await AttackCalculator.process_attack(params)
             messages.append(message)
             return messages
@@ -658,12 +625,12 @@ class CombatProcessor:
         )
 
         # Process attack with all targets - get message and hit data
-        self.debug_print(f"Processing attack with {attack_roll} against {len(targets)} targets")
+        self.debug_print("Processing attack with %s against %s targets", attack_roll, len(targets))
         message, hit_data = await AttackCalculator.process_attack(params)
         messages.append(message)
         
         # Debug output for hit data
-        self.debug_print(f"Got hit data: {hit_data}")
+        self.debug_print("Got hit data: %s", hit_data)
         
         # Process hit tracking
         if isinstance(hit_data, dict) and hit_data:  # Ensure it's a dictionary with entries
@@ -671,18 +638,18 @@ class CombatProcessor:
             hit_count = 0
             for target_name, target_hit_data in hit_data.items():
                 if target_hit_data.get('hit', False):
-                    self.debug_print(f"Target hit: {target_name}")
+                    self.debug_print("Target hit: %s", target_name)
                     self.targets_hit.add(target_name)
                     hit_bonus.register_hit()
                     hit_count += 1
             
-            self.debug_print(f"Total hits: {hit_count}, Has bonuses: {hit_bonus.has_bonuses()}")
+            self.debug_print("Total hits: %s, Has bonuses: %s", hit_count, hit_bonus.has_bonuses())
             
             # Apply bonuses on hit if any hits occurred and we have bonuses configured
             if hit_count > 0 and hit_bonus.has_bonuses():
-                self.debug_print(f"Applying bonuses for {hit_count} hits")
+                self.debug_print("Applying bonuses for %s hits", hit_count)
                 bonus_totals, bonus_message = hit_bonus.apply_bonuses(source)
-                self.debug_print(f"Bonus message: {bonus_message}")
+                self.debug_print("Bonus message: %s", bonus_message)
                 if bonus_message:
                     messages.append(f"• `{bonus_message}`")
         
@@ -727,7 +694,7 @@ class MoveEffect(BaseEffect):
         # Create specialized state machine and processors
         self.debug_mode = True
         self.debug_id = f"MoveEffect-{int(time.time() * 1000) % 10000}"
-        self.debug_print(f"Initializing {name}")
+        self.debug_print("Initializing %s", name)
         
         # Ensure cooldown is None if it's 0 or less
         if cooldown is not None and cooldown <= 0:
@@ -786,16 +753,16 @@ class MoveEffect(BaseEffect):
         # Initialize bonus on hit
         # Convert legacy heat tracking to bonus_on_hit if needed
         if bonus_on_hit is None and (enable_heat_tracking or enable_hit_bonus):
-            self.debug_print(f"Converting legacy heat tracking to bonus_on_hit")
+            self.debug_print("Converting legacy heat tracking to bonus_on_hit")
             bonus_on_hit = {'stars': 1}
         
         # Ensure bonus_on_hit is properly initialized
-        self.debug_print(f"Original bonus_on_hit: {bonus_on_hit}")
+        self.debug_print("Original bonus_on_hit: %s", bonus_on_hit)
         
         # Special handling for bonus_on_hit parameter
         if bonus_on_hit is not None:
             # Print the raw value for debugging
-            self.debug_print(f"Raw bonus_on_hit value: {bonus_on_hit}")
+            self.debug_print("Raw bonus_on_hit value: %s", bonus_on_hit)
             
             # Handle string values (common in Discord commands)
             if isinstance(bonus_on_hit, str):
@@ -803,14 +770,14 @@ class MoveEffect(BaseEffect):
                     import json
                     # Try to parse as JSON
                     parsed_bonus = json.loads(bonus_on_hit)
-                    self.debug_print(f"Parsed bonus_on_hit from JSON: {parsed_bonus}")
+                    self.debug_print("Parsed bonus_on_hit from JSON: %s", parsed_bonus)
                     bonus_on_hit = parsed_bonus
                 except:
                     # If parsing fails, use a default value
-                    self.debug_print(f"Failed to parse bonus_on_hit from string, using default")
+                    self.debug_print("Failed to parse bonus_on_hit from string, using default")
                     bonus_on_hit = {'stars': 1}
         
-        self.debug_print(f"Final bonus_on_hit: {bonus_on_hit}")
+        self.debug_print("Final bonus_on_hit: %s", bonus_on_hit)
         self.bonus_on_hit = BonusOnHit.from_dict(bonus_on_hit)
         
         # Initialize roll modifier if provided
@@ -819,7 +786,7 @@ class MoveEffect(BaseEffect):
 
         # Apply roll modifier if specified
         if roll_modifier:
-            self.debug_print(f"Processing roll modifier data: {roll_modifier}")
+            self.debug_print("Processing roll modifier data: %s", roll_modifier)
             
             # Expected format: {"type": "bonus|advantage|disadvantage", "value": int, "next_roll": bool}
             mod_type = roll_modifier.get("type", "bonus").lower()
@@ -864,12 +831,12 @@ class MoveEffect(BaseEffect):
         self.applied_during_own_turn = False
         self.displayed_duration = initial_duration  # For user-facing display
         
-        self.debug_print(f"Initialized with state {self.state}")
+        self.debug_print("Initialized with state %s", self.state)
 
-    def debug_print(self, message):
-        """Print debug messages if debug mode is enabled"""
-        if self.debug_mode:
-            print(f"[{self.debug_id}] {message}")
+    def debug_print(self, message, *args):
+        """Log a debug message if debug mode is enabled. Args are %-formatted only when logged."""
+        if self.debug_mode and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[%s] %s", self.debug_id, message % args if args else message)
     
     def determine_roll_timing(self, roll_timing_str):
         """
@@ -892,7 +859,7 @@ class MoveEffect(BaseEffect):
             # If a move has an attack roll and no cast time, make it INSTANT by default
             # unless explicitly specified as something else
             self.roll_timing = RollTiming.INSTANT
-            self.debug_print(f"Auto-detected INSTANT roll timing for attack roll")
+            self.debug_print("Auto-detected INSTANT roll timing for attack roll")
 
     # Property accessors for state
     @property
@@ -912,7 +879,7 @@ class MoveEffect(BaseEffect):
     def get_remaining_turns(self) -> int:
         """Get the number of turns remaining in the current phase"""
         return self.state_machine.get_remaining_turns()
-    
+
     # Resource handling
     def apply_costs(self, character) -> List[str]:
         """Apply resource costs and return messages"""
@@ -931,7 +898,7 @@ class MoveEffect(BaseEffect):
                 mp_roll, roll_desc = DiceRoller.roll_dice(mp_cost, character)
                 mp_cost = mp_roll
                 mp_roll_message = f"Rolled MP cost: {roll_desc}"
-                self.debug_print(f"Rolled MP cost: {mp_cost} from {self.mp_cost}")
+                self.debug_print("Rolled MP cost: %s from %s", mp_cost, self.mp_cost)
             
             # Handle MP gain or loss
             if mp_cost > 0:
@@ -960,7 +927,7 @@ class MoveEffect(BaseEffect):
                 hp_roll, roll_desc = DiceRoller.roll_dice(hp_cost, character)
                 hp_cost = hp_roll
                 hp_roll_message = f"Rolled HP cost: {roll_desc}"
-                self.debug_print(f"Rolled HP cost: {hp_cost} from {self.hp_cost}")
+                self.debug_print("Rolled HP cost: %s from %s", hp_cost, self.hp_cost)
             
             # Handle HP gain or loss
             if hp_cost > 0:
@@ -984,12 +951,12 @@ class MoveEffect(BaseEffect):
                 if hasattr(character.action_stars, 'use_stars'):
                     # Use the standard method that should handle all the tracking
                     character.action_stars.use_stars(self.star_cost, self.name)
-                    self.debug_print(f"Applied star cost: {self.star_cost} for move: {self.name}")
+                    self.debug_print("Applied star cost: %s for move: %s", self.star_cost, self.name)
                 else:
                     # Fallback to simpler approach if use_stars is not available
                     if hasattr(character.action_stars, 'current_stars'):
                         character.action_stars.current_stars = max(0, character.action_stars.current_stars - self.star_cost)
-                        self.debug_print(f"Applied star cost using direct attribute: {self.star_cost}")
+                        self.debug_print("Applied star cost using direct attribute: %s", self.star_cost)
                     
             messages.append(f"Uses {self.star_cost} Stars")
         
@@ -1037,7 +1004,7 @@ class MoveEffect(BaseEffect):
         
         FIX: Added special handling for moves used during character's own turn
         """
-        self.debug_print(f"on_apply called for {character.name} on round {round_number}")
+        self.debug_print("on_apply called for %s on round %s", character.name, round_number)
         
         # Initialize timing
         self.initialize_timing(round_number, character.name)
@@ -1051,7 +1018,7 @@ class MoveEffect(BaseEffect):
                 # Check if it's this character's turn
                 if (hasattr(tracker, 'current_turn') and tracker.current_turn and 
                     tracker.current_turn.character_name == character.name):
-                    self.debug_print(f"Move used during character's own turn")
+                    self.debug_print("Move used during character's own turn")
                     self.applied_during_own_turn = True
                     self.state_machine.used_during_own_turn = True
                     
@@ -1061,11 +1028,11 @@ class MoveEffect(BaseEffect):
                         self.state_machine.turns_remaining += 1
                         self.displayed_duration = self.state_machine.duration  # Original value
                         self.state_machine.duration_adjusted = True
-                        self.debug_print(f"Adjusted internal duration: +1 (now {self.state_machine.turns_remaining}) but displayed as {self.displayed_duration}")
+                        self.debug_print("Adjusted internal duration: +1 (now %s) but displayed as %s", self.state_machine.turns_remaining, self.displayed_duration)
                     elif self.state == MoveState.CASTING and self.state_machine.duration:
                         # Mark for later adjustment when move becomes active
                         self.state_machine.duration_adjusted = True
-                        self.debug_print(f"Marked for duration adjustment when active")
+                        self.debug_print("Marked for duration adjustment when active")
         
         # Apply costs and format messages
         details = []
@@ -1130,7 +1097,7 @@ class MoveEffect(BaseEffect):
             
         # Process instant attack rolls immediately
         if self.attack_roll and self.roll_timing == RollTiming.INSTANT:
-            self.debug_print(f"Processing instant attack roll")
+            self.debug_print("Processing instant attack roll")
             # Process attack immediately
             attack_results = await self.combat.process_attack(
                 source=character,
@@ -1196,11 +1163,8 @@ class MoveEffect(BaseEffect):
             # Ensure it gets proper timing setup
             self.roll_modifier_effect.initialize_timing(round_number, character.name)
             
-            # Add to character's custom parameters
-            if 'roll_modifiers' not in character.custom_parameters:
-                character.custom_parameters['roll_modifiers'] = []
-                
-            character.custom_parameters['roll_modifiers'].append(self.roll_modifier_effect)
+            # Add to character's roll modifiers
+            add_roll_modifier(character, self.roll_modifier_effect)
             
             # Add info to message
             if isinstance(self.roll_modifier_effect.modifier_type, RollModifierType):
@@ -1232,7 +1196,7 @@ class MoveEffect(BaseEffect):
         if self.state == MoveState.INSTANT and self.state_machine.cooldown is None:
             self.marked_for_removal = True
         
-        self.debug_print(f"on_apply complete, returning formatted message")
+        self.debug_print("on_apply complete, returning formatted message")
         return formatted_message
     
     async def on_turn_start(self, character, round_number: int, turn_name: str) -> List[str]:
@@ -1249,13 +1213,13 @@ class MoveEffect(BaseEffect):
         if character.name != turn_name:
             return []
 
-        self.debug_print(f"on_turn_start for {character.name} on round {round_number}")
+        self.debug_print("on_turn_start for %s on round %s", character.name, round_number)
         messages = []
         
         # Display message based on current state
         if self.state == MoveState.CASTING:
             remaining = self.get_remaining_turns()
-            self.debug_print(f"Casting phase, {remaining} turns remaining")
+            self.debug_print("Casting phase, %s turns remaining", remaining)
             cast_msg = self.format_effect_message(
                 f"Casting {self.name}",
                 [f"{remaining} turn{'s' if remaining != 1 else ''} remaining"]
@@ -1267,7 +1231,7 @@ class MoveEffect(BaseEffect):
             if (self.state_machine.used_during_own_turn and 
                 self.state_machine.duration_adjusted and
                 self.state_machine.was_just_activated):
-                self.debug_print(f"Adding +1 to duration after transitioning to active state")
+                self.debug_print("Adding +1 to duration after transitioning to active state")
                 self.state_machine.turns_remaining += 1
                 self.displayed_duration = self.state_machine.duration  # Original value
                 self.state_machine.duration_adjusted = True
@@ -1278,7 +1242,7 @@ class MoveEffect(BaseEffect):
             
             # Process attack if needed (PER_TURN or newly ACTIVE)
             if self.attack_roll and (is_per_turn or just_activated):
-                self.debug_print(f"Processing turn start attack roll")
+                self.debug_print("Processing turn start attack roll")
                 self.last_roll_round = round_number
                 
                 # Reset bonus tracker for new rolls
@@ -1297,7 +1261,7 @@ class MoveEffect(BaseEffect):
                 if attack_results:
                     messages.extend(attack_results)
             else:
-                self.debug_print(f"Skipping attack roll - timing: {self.roll_timing.value}, last_roll_round: {self.last_roll_round}")
+                self.debug_print("Skipping attack roll - timing: %s, last_roll_round: %s", self.roll_timing.value, self.last_roll_round)
             
             # Show active message
             remaining = self.get_remaining_turns()
@@ -1316,7 +1280,7 @@ class MoveEffect(BaseEffect):
                 # Find out how many display turns remain
                 display_remaining = max(0, remaining - 1)
                 details.append(f"{display_remaining} turn{'s' if display_remaining != 1 else ''} remaining")
-                self.debug_print(f"Showing {display_remaining} turns remaining (internal: {remaining})")
+                self.debug_print("Showing %s turns remaining (internal: %s)", display_remaining, remaining)
             else:
                 details.append(f"{remaining} turn{'s' if remaining != 1 else ''} remaining")
             
@@ -1351,7 +1315,7 @@ class MoveEffect(BaseEffect):
         if character.name != turn_name:
             return []
             
-        self.debug_print(f"on_turn_end for {character.name} on round {round_number}")
+        self.debug_print("on_turn_end for %s on round %s", character.name, round_number)
         messages = []
         
         # Get pre-transition state for comparison
@@ -1360,7 +1324,7 @@ class MoveEffect(BaseEffect):
         
         # FIX: Check if already marked for removal
         if self.marked_for_removal or self.state_machine.should_be_removed:
-            self.debug_print(f"Effect already marked for removal, skipping further processing")
+            self.debug_print("Effect already marked for removal, skipping further processing")
             # FIX: Add to feedback system with proper expiry message
             expiry_msg = self.format_effect_message(
                 f"{self.name} has worn off from {character.name}"
@@ -1370,7 +1334,7 @@ class MoveEffect(BaseEffect):
         
         # Check transition count to prevent infinite transitions
         if self.transition_count > 10:  # Set a reasonable limit
-            self.debug_print(f"Too many transitions detected ({self.transition_count}), forcing removal")
+            self.debug_print("Too many transitions detected (%s), forcing removal", self.transition_count)
             self.marked_for_removal = True
             return []
         
@@ -1379,7 +1343,7 @@ class MoveEffect(BaseEffect):
         
         # Check if the state machine now indicates removal
         if self.state_machine.should_be_removed:
-            self.debug_print(f"State machine indicates removal is needed after transition")
+            self.debug_print("State machine indicates removal is needed after transition")
             self.marked_for_removal = True
             
             # FIX: Add a proper expiry message that will show up in the effect update
@@ -1391,9 +1355,11 @@ class MoveEffect(BaseEffect):
             
             # Return special wears off message for final cleanup
             if transition_msg == "wears off" or transition_msg == "final removal":
-                messages.append(self.format_effect_message(
+                messages.append(self.event(
+                    EffectEventKind.EXPIRY,
+                    character,
                     f"{self.name} wears off",
-                    [f"Effect has ended"]
+                    ["Effect has ended"]
                 ))
             return messages
         
@@ -1408,14 +1374,18 @@ class MoveEffect(BaseEffect):
                 if self.applied_during_own_turn and self.state == MoveState.ACTIVE and self.state_machine.duration_adjusted:
                     # The real remaining turns is one more than what we show
                     display_remaining = max(0, remaining - 1)
-                    continue_msg = self.format_effect_message(
+                    continue_msg = self.event(
+                        EffectEventKind.STATUS,
+                        character,
                         f"{self.name} continues",
                         [f"{display_remaining} turn{'s' if display_remaining != 1 else ''} remaining"]
                     )
-                    self.debug_print(f"Showing {display_remaining} turns remaining (internal: {remaining})")
+                    self.debug_print("Showing %s turns remaining (internal: %s)", display_remaining, remaining)
                 else:
                     # Normal display of remaining turns
-                    continue_msg = self.format_effect_message(
+                    continue_msg = self.event(
+                        EffectEventKind.STATUS,
+                        character,
                         f"{self.name} continues",
                         [f"{remaining} turn{'s' if remaining != 1 else ''} remaining"]
                     )
@@ -1424,7 +1394,9 @@ class MoveEffect(BaseEffect):
             # Show casting continuation
             elif self.state == MoveState.CASTING and old_remaining > 0:
                 remaining = self.get_remaining_turns()
-                cast_msg = self.format_effect_message(
+                cast_msg = self.event(
+                    EffectEventKind.STATUS,
+                    character,
                     f"Casting {self.name}",
                     [f"{remaining} turn{'s' if remaining != 1 else ''} remaining"]
                 )
@@ -1432,7 +1404,7 @@ class MoveEffect(BaseEffect):
         
         # Show transition message if needed - with enhanced formatting
         if did_transition and transition_msg:
-            self.debug_print(f"State transition: {transition_msg}")
+            self.debug_print("State transition: %s", transition_msg)
             self.transition_count += 1
             
             # Format transition message based on new state
@@ -1441,31 +1413,39 @@ class MoveEffect(BaseEffect):
                 # FIX: For moves used during character's own turn, duration needs adjustment
                 if self.applied_during_own_turn and self.state_machine.duration_adjusted:
                     display_duration = self.displayed_duration
-                    self.debug_print(f"Showing {display_duration} display duration (internal: {self.state_machine.duration}) for transition to active")
+                    self.debug_print("Showing %s display duration (internal: %s) for transition to active", display_duration, self.state_machine.duration)
                 else:
                     display_duration = self.get_remaining_turns()
                 
-                msg = self.format_effect_message(
+                msg = self.event(
+                    EffectEventKind.PHASE_CHANGE,
+                    character,
                     f"{self.name} {transition_msg}",
                     [
                         f"Cast time complete!",
                         f"Effect active for {display_duration} turn{'s' if display_duration != 1 else ''}"
                     ],
-                    emoji="✨"
+                    emoji="✨",
+                    phase=MoveState.ACTIVE.value
                 )
             elif self.state == MoveState.COOLDOWN:
                 # Active to Cooldown transition
-                msg = self.format_effect_message(
+                msg = self.event(
+                    EffectEventKind.PHASE_CHANGE,
+                    character,
                     f"{self.name} {transition_msg}",
                     [
                         f"Effect duration complete",
                         f"Cooldown: {self.get_remaining_turns()} turn{'s' if self.get_remaining_turns() != 1 else ''}"
                     ],
-                    emoji="⏳"
+                    emoji="⏳",
+                    phase=MoveState.COOLDOWN.value
                 )
             elif transition_msg == "cooldown has ended":
                 # Cooldown ended
-                msg = self.format_effect_message(
+                msg = self.event(
+                    EffectEventKind.EXPIRY,
+                    character,
                     f"{self.name} cooldown has ended",
                     ["Ready to use again"],
                     emoji="✅"
@@ -1474,7 +1454,9 @@ class MoveEffect(BaseEffect):
                 self.marked_for_removal = True
             elif transition_msg == "wears off" or transition_msg == "final removal":
                 # Effect wears off (no further phases)
-                msg = self.format_effect_message(
+                msg = self.event(
+                    EffectEventKind.EXPIRY,
+                    character,
                     f"{self.name} wears off",
                     ["Effect has ended"],
                     emoji="✨"
@@ -1483,14 +1465,14 @@ class MoveEffect(BaseEffect):
                 self.marked_for_removal = True
             else:
                 # Generic transition
-                msg = self.format_effect_message(f"{self.name} {transition_msg}")
+                msg = self.event(EffectEventKind.PHASE_CHANGE, character, f"{self.name} {transition_msg}")
                 
             messages.append(msg)
             
             # FIX: Add to feedback system if this is a final transition
             if self.marked_for_removal:
-                self.debug_print(f"Adding to feedback system for final transition")
-                self._add_expiry_feedback(character, msg, round_number)
+                self.debug_print("Adding to feedback system for final transition")
+                self._add_expiry_feedback(character, render_event(msg), round_number)
         
         return messages
 
@@ -1505,26 +1487,26 @@ class MoveEffect(BaseEffect):
         """
         # If explicitly marked for removal
         if self.marked_for_removal:
-            self.debug_print(f"is_expired: True (marked for removal)")
+            self.debug_print("is_expired: True (marked for removal)")
             return True
             
         # INSTANT effects expire after processing
         if self.state == MoveState.INSTANT:
-            self.debug_print(f"is_expired: True (INSTANT state)")
+            self.debug_print("is_expired: True (INSTANT state)")
             return True
             
         # If state machine says to remove
         if hasattr(self.state_machine, 'should_be_removed') and self.state_machine.should_be_removed:
-            self.debug_print(f"is_expired: True (state machine says to remove)")
+            self.debug_print("is_expired: True (state machine says to remove)")
             return True
         
         # Otherwise, not expired
-        self.debug_print(f"is_expired: False (state: {self.state.value}, remaining: {self.get_remaining_turns()})")
+        self.debug_print("is_expired: False (state: %s, remaining: %s)", self.state.value, self.get_remaining_turns())
         return False
 
     def on_expire(self, character) -> str:
         """Handle move expiry and ensure complete removal"""
-        self.debug_print(f"on_expire for {character.name}")
+        self.debug_print("on_expire for %s", character.name)
         
         if self.state == MoveState.INSTANT:
             return None
@@ -1677,7 +1659,7 @@ class MoveEffect(BaseEffect):
             return effect
                 
         except Exception as e:
-            print(f"Error reconstructing MoveEffect: {str(e)}")
+            logger.error(f"Error reconstructing MoveEffect: {str(e)}", exc_info=True)
             return None
             
     # Special method to retrieve async results 
@@ -1695,21 +1677,21 @@ class MoveEffect(BaseEffect):
         # Process any attack coroutines
         if 'attack_coroutine' in self._internal_cache:
             try:
-                self.debug_print(f"Processing async attack coroutine")
+                self.debug_print("Processing async attack coroutine")
                 attack_messages = await self._internal_cache['attack_coroutine']
                 messages.extend(attack_messages)
                 del self._internal_cache['attack_coroutine']
             except Exception as e:
-                self.debug_print(f"Error processing attack coroutine: {str(e)}")
+                self.debug_print("Error processing attack coroutine: %s", e)
                 
         # Process any save coroutines
         if 'save_coroutine' in self._internal_cache:
             try:
-                self.debug_print(f"Processing async save coroutine")
+                self.debug_print("Processing async save coroutine")
                 save_messages = await self._internal_cache['save_coroutine']
                 messages.extend(save_messages)
                 del self._internal_cache['save_coroutine']
             except Exception as e:
-                self.debug_print(f"Error processing save coroutine: {str(e)}")
+                self.debug_print("Error processing save coroutine: %s", e)
                 
         return messages
\ No newline at end of file
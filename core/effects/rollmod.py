@@ -6,6 +6,9 @@ Supports advantage/disadvantage and numeric modifiers.
 from typing import Optional, List, Dict, Any
 from .base import BaseEffect, EffectCategory
 from enum import Enum
+import logging
+
+logger = logging.getLogger(__name__)
 
 class RollModifierType(Enum):
     """Types of roll modifiers"""
@@ -235,4 +238,88 @@ class RollModifierEffect(BaseEffect):
         # Set used state
         effect.used = data.get('used', False)
         
-        return effect
\ No newline at end of file
+        return effect
+
+
+class RollModifierStack:
+    """
+    A character's roll modifiers folded into one net advantage level
+    (positive for advantage, negative for disadvantage) and one flat bonus.
+    
+    Built from the character's custom_parameters['roll_modifiers'] and
+    kept up to date as modifiers are added (add_roll_modifier) or used up
+    by a roll (consume_next_roll), so a roll reads the totals instead of
+    going through the list. Replacing the list or changing it directly is
+    also detected, the same way DamageModifierTable watches effects.
+    """
+    def __init__(self, character):
+        self._modifiers = character.custom_parameters.get('roll_modifiers')
+        self._count = len(self._modifiers or [])
+        self.advantage = 0
+        self.bonus = 0
+        self.next_roll: List[RollModifierEffect] = []
+        for modifier in self._modifiers or []:
+            self._fold(modifier, 1)
+
+    def is_current(self, character) -> bool:
+        modifiers = character.custom_parameters.get('roll_modifiers')
+        return modifiers is self._modifiers and len(modifiers or []) == self._count
+
+    @classmethod
+    def for_character(cls, character) -> 'RollModifierStack':
+        """Get the character's stack, rebuilding it if it's out of date"""
+        stack = getattr(character, '_roll_modifiers', None)
+        if stack is None or not stack.is_current(character):
+            stack = cls(character)
+            character._roll_modifiers = stack
+        return stack
+
+    def _fold(self, modifier, sign: int) -> None:
+        """Add (sign 1) or take out (sign -1) one modifier's contribution"""
+        if not hasattr(modifier, 'modifier_type'):
+            return
+            
+        modifier_type = modifier.modifier_type.value
+        if modifier_type == 'bonus':
+            self.bonus += sign * modifier.value
+        elif modifier_type == 'advantage':
+            self.advantage += sign * modifier.value
+        elif modifier_type == 'disadvantage':
+            self.advantage -= sign * modifier.value
+            
+        if getattr(modifier, 'next_roll_only', False):
+            if sign > 0:
+                self.next_roll.append(modifier)
+            elif modifier in self.next_roll:
+                self.next_roll.remove(modifier)
+
+    def add(self, character, modifier) -> None:
+        """Add a modifier to the character and the stack"""
+        modifiers = character.custom_parameters.setdefault('roll_modifiers', [])
+        modifiers.append(modifier)
+        if modifiers is self._modifiers:
+            self._count += 1
+            self._fold(modifier, 1)
+        else:
+            character._roll_modifiers = None
+
+    def consume_next_roll(self) -> List['RollModifierEffect']:
+        """
+        Use up next-roll-only modifiers after a roll: mark them used and
+        take them off the character. Returns the modifiers used.
+        """
+        used = self.next_roll[:]
+        for modifier in used:
+            if hasattr(modifier, 'mark_used'):
+                modifier.mark_used()
+            self._modifiers.remove(modifier)
+            self._fold(modifier, -1)
+        self._count = len(self._modifiers or [])
+        if used:
+            logger.debug(f"Consumed next roll modifiers: {[m.name for m in used]}")
+        return used
+
+
+def add_roll_modifier(character, modifier: RollModifierEffect) -> None:
+    """Give a character a roll modifier, updating its stack in place"""
+    RollModifierStack.for_character(character).add(character, modifier)
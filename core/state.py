@@ -13,6 +13,7 @@ import re
 from enum import Enum
 
 from .character import Character
+from .effects.events import EffectEvent, EffectEventKind
 
 logger = logging.getLogger(__name__)
 
@@ -37,19 +38,28 @@ class CombatLogger:
     
     Features:
     - Console output of all combat events
+    - Persistent, queryable event store per combat, when given a store type
+      (modules.combat.event_store.CombatEventStore, passed in by the bot)
     - Character state tracking
     - Command parameter logging
     - Embed content display
     - Turn progression visualization
     """
     
-    def __init__(self, channel_id: Optional[int] = None):
+    def __init__(self, channel_id: Optional[int] = None, event_stores: Optional[Any] = None):
+        """
+        Args:
+            channel_id: Channel the combat runs in
+            event_stores: Event store type with start() and latest(); events aren't stored without one
+        """
         self.channel_id = channel_id
+        self.event_stores = event_stores
         self.current_combat_id = None
         self.current_round = 0
         self.debug_mode = False  # Controls verbosity
         self._last_message = None  # For deduplication
         self.show_commands = True  # Whether to show command parameters
+        self.events = None  # Current (or last) combat's event store
 
     def _clean_message(self, msg: str) -> str:
         """Remove emojis and clean up formatting for console output"""
@@ -108,13 +118,39 @@ class CombatLogger:
         
         print("")  # Empty line for spacing
         self.current_round = 1
+        
+        # Start a new event log for this combat
+        if self.events:
+            self.events.flush_sync()
+        if not self.event_stores:
+            return
+        self.events = self.event_stores.start()
+        self.current_combat_id = self.events.combat_id
+        self.events.append(
+            CombatEventType.COMBAT_START,
+            "Combat started",
+            round_number=self.current_round,
+            details={"participants": [c.name for c in characters or []]}
+        )
 
     def end_combat(self) -> None:
         """Log combat end with summary information"""
         print("\n=== Combat Ended ===\n")
+        if self.events:
+            self.events.append(CombatEventType.COMBAT_END, "Combat ended", round_number=self.current_round)
+            self.events.flush_sync()
         self.current_combat_id = None
         self.current_round = 0
 
+    def get_events(self):
+        """Event store for the current or most recent combat, loading it from disk after a restart"""
+        if self.events is None and self.event_stores:
+            try:
+                self.events = self.event_stores.latest()
+            except OSError as e:
+                logger.error(f"Failed to load combat events: {e}")
+        return self.events
+
     def add_event(
         self,
         event_type: CombatEventType,
@@ -128,6 +164,16 @@ class CombatLogger:
         if not message:
             return
             
+        # Record in the combat's event store
+        if self.events and self.current_combat_id:
+            self.events.append(
+                event_type,
+                message,
+                character=character,
+                round_number=round_number or self.current_round,
+                details=details
+            )
+            
         # Format message with character name if provided
         formatted_msg = f"{character}: {message}" if character else message
         
@@ -143,6 +189,32 @@ class CombatLogger:
                         continue  # Skip redundant info
                     print(f"  {key}: {value}")
 
+    def log_effect_events(self, events: List[EffectEvent]) -> None:
+        """
+        Record typed effect events in the combat's event store. The event
+        data (kind, amount, resource, phase) is kept as details so the log
+        and statistics don't have to parse messages.
+        """
+        if not (self.events and self.current_combat_id):
+            return
+
+        event_types = {
+            EffectEventKind.TICK_DAMAGE: CombatEventType.DAMAGE_DEALT,
+            EffectEventKind.RESOURCE_CHANGE: CombatEventType.RESOURCE_CHANGE,
+            EffectEventKind.EXPIRY: CombatEventType.EFFECT_EXPIRED
+        }
+        for event in events:
+            message = self._clean_message(event.message)
+            if not message:
+                continue
+            self.events.append(
+                event_types.get(event.kind, CombatEventType.STATUS_UPDATE),
+                message,
+                character=event.character_name,
+                round_number=event.round_number or self.current_round,
+                details=event.to_dict()
+            )
+
     def log_embed(self, title: str, fields: Dict[str, str]) -> None:
         """Display embed content in console-friendly format"""
         title = self._clean_message(title)
@@ -333,14 +405,14 @@ class GameState:
     Manages the active game state, including characters and combat status.  
     Acts as an in-memory cache to reduce database calls.  
     """  
-    def __init__(self):  
+    def __init__(self, event_stores: Optional[Any] = None):  
         self.characters: Dict[str, Character] = {}  
         self.combat_active: bool = False  
         self.round_number: int = 0  
         self.initiative_order: List[str] = []  
         self.current_turn: int = 0  
         self.db = None  # Will be set during load
-        self.logger = CombatLogger()  # Initialize the logger
+        self.logger = CombatLogger(event_stores=event_stores)  # Initialize the logger
 
     async def load(self, database) -> None:  
         """Load all characters from database into memory"""  
@@ -355,11 +427,20 @@ class GameState:
                     if name != 'movesets':  # Skip movesets collection  
                         try:  
                             self.characters[name] = Character.from_dict(data)  
+                            
+                            # Queue a one-time write-back for outdated data
+                            if self.characters[name] and Character.needs_upgrade(data):
+                                self.db._upgrade_character_data(name, data)
                         except Exception as e:  
                             print(f"Error loading character {name}: {e}")  
                             continue  
                              
             print(f"Loaded {len(self.characters)} characters into game state")  
+            
+            # Write upgraded characters back without holding up startup
+            if self.db.pending_migrations:
+                logger.info("Upgrading %s outdated characters in the background", self.db.pending_migrations)
+                self.db.schedule_migration_flush()
              
         except Exception as e:  
             print(f"Error loading game state: {e}")  
@@ -88,12 +88,17 @@ from core.effects.manager import register_effects, process_effects
 
 
 # Module imports
+from modules.combat.event_store import CombatEventStore
 from modules.menu.character_creation import StatGenerationView, display_creation_result
 from modules.menu.character_viewer import CharacterViewer
 from modules.menu.defense_handler import DefenseHandler
 
 # Load error handler
 from utils.error_handler import setup as error_handler_setup
+from utils.logging_config import setup_logging, stop_logging
+from utils.perf import perf
+from utils.loop_watchdog import LoopWatchdog
+from utils import profiling
 
 
 # Load environment variables  
@@ -114,15 +119,8 @@ MESSAGINGSENDERID = os.getenv('MESSAGINGSENDERID')
 APPID = os.getenv('APPID')
 MEASUREMENTID = os.getenv('MEASUREMENTID')
 
-# Configure logging  
-logging.basicConfig(  
-    level=logging.INFO,  
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  
-    handlers=[  
-        logging.FileHandler('bot.log'),  
-        logging.StreamHandler()  
-    ]  
-)  
+# Configure logging (queued, rotating bot.log - see utils/logging_config.py)
+setup_logging(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # List of guild IDs where commands will be available  
@@ -147,15 +145,21 @@ class GameBot(commands.Bot):
          
         # Initialize core systems  
         self.db = Database()  
-        self.game_state = GameState()  
+        self.game_state = GameState(event_stores=CombatEventStore)  
          
         # Sync status  
         self.synced = False
 
+        # Event loop lag watchdog (stalls show up in /debug perf)
+        self.loop_watchdog = LoopWatchdog()
+
     async def setup_hook(self):  
         """Called when the bot is starting up"""  
         # Register all effect types  
         register_effects()  
+
+        # Start watching for blocking calls on the event loop
+        self.loop_watchdog.start()
          
         # Load data from database  
         await self.db.initialize()  
@@ -186,6 +190,17 @@ class GameBot(commands.Bot):
         print(f'Logged in as {self.user} (ID: {self.user.id})')  
         print(f'{self.user}: ok i pull up')
 
+    async def close(self):
+        """Stop background watchers before shutting down"""
+        await self.loop_watchdog.stop()
+        await super().close()
+
+    async def on_app_command_completion(self, interaction: discord.Interaction, command):
+        """Record how long each slash command took, from the interaction to completion"""
+        elapsed = (discord.utils.utcnow() - interaction.created_at).total_seconds()
+        perf.observe("command", command.qualified_name, elapsed)
+        profiling.window.note_command()
+
 bot = GameBot()
 
 
@@ -450,4 +465,8 @@ async def stop(ctx):
 
 
 if __name__ == "__main__":
-    bot.run(TOKEN)
\ No newline at end of file
+    try:
+        # log_handler=None keeps discord.py on our queued handlers
+        bot.run(TOKEN, log_handler=None)
+    finally:
+        stop_logging()
\ No newline at end of file
@@ -0,0 +1,37 @@
+"""
+Offline schema migration for the Firebase database.
+
+Upgrades every stored character and shared moveset to the current schema
+version in batches, so the bot's load path only ever sees current data.
+Run it while the bot is stopped:
+
+    python migrate_database.py              # upgrade everything
+    python migrate_database.py --dry-run    # only report what's out of date
+    python migrate_database.py --batch-size 100
+"""
+
+import argparse
+import asyncio
+
+from core.database import Database, MIGRATION_BATCH_SIZE
+from core.effects.manager import register_effects
+
+
+async def main(batch_size: int, dry_run: bool) -> None:
+    # Effects must be registered so stored effects can be rebuilt
+    register_effects()
+
+    db = Database()
+    await db.initialize()
+    await db.migrate_all(batch_size=batch_size, dry_run=dry_run)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Upgrade stored data to the current schema")
+    parser.add_argument('--batch-size', type=int, default=MIGRATION_BATCH_SIZE,
+                        help="Documents read and written per batch")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="Only report how many documents are out of date")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.batch_size, args.dry_run))
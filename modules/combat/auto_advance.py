@@ -0,0 +1,99 @@
+"""
+Summaries for auto-advanced turns.
+
+/next can run through turns that need no input from the GM (NPCs flagged
+as automatic, or every turn until a given character is up) in one pass.
+Those turns only tick effects, so instead of a turn announcement and an
+effects update for each one, their messages are collected here and sent
+as a single summary embed.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+# Discord embed limits
+MAX_FIELDS = 25
+MAX_FIELD_LENGTH = 1024
+MAX_EMBED_LENGTH = 6000
+
+
+@dataclass
+class AutoTurn:
+    """One turn that was run automatically"""
+    character_name: str
+    round_number: int
+    skipped: bool = False
+    messages: List[str] = field(default_factory=list)
+
+    @property
+    def title(self) -> str:
+        status = " (skipped)" if self.skipped else ""
+        return f"Round {self.round_number} • {self.character_name}{status}"
+
+
+@dataclass
+class AutoAdvanceSummary:
+    """Turns run in one auto-advance pass, in order"""
+    turns: List[AutoTurn] = field(default_factory=list)
+
+    def begin_turn(self, character_name: str, round_number: int, skipped: bool = False) -> AutoTurn:
+        turn = AutoTurn(character_name, round_number, skipped)
+        self.turns.append(turn)
+        return turn
+
+    def add_messages(self, messages: List[str]) -> None:
+        """Add messages to the latest turn"""
+        if self.turns:
+            self.turns[-1].messages.extend(msg for msg in messages if msg)
+
+    def __len__(self) -> int:
+        return len(self.turns)
+
+    def fields(self) -> List[Tuple[str, str]]:
+        """
+        Embed fields (name, value) for the summary, one per turn, kept
+        inside Discord's limits. Turns past the limit are counted in a
+        final field instead of listed.
+        """
+        fields = []
+        total = 0
+        for index, turn in enumerate(self.turns):
+            value = "\n".join(
+                msg if '`' in msg else f"`{msg}`" for msg in turn.messages
+            ) or "No effects"
+            if len(value) > MAX_FIELD_LENGTH:
+                value = value[:MAX_FIELD_LENGTH - 1] + "…"
+
+            remaining = len(self.turns) - index
+            size = len(turn.title) + len(value)
+            # Leave room for the overflow field
+            if (len(fields) >= MAX_FIELDS - 1 and remaining > 1) or total + size > MAX_EMBED_LENGTH - 100:
+                fields.append(("More Turns", f"`{remaining} more turn(s) processed`"))
+                break
+
+            fields.append((turn.title, value))
+            total += size
+        return fields
+
+
+def stops_auto_advance(character_name: str, auto: bool, until: Optional[str] = None) -> bool:
+    """
+    Whether auto-advance stops at a character's turn: at `until` when one
+    is given, otherwise at the first character not flagged as automatic.
+    """
+    if until:
+        return character_name.lower() == until.lower()
+    return not auto
+
+
+def should_auto_advance(auto_flags: Sequence[bool], current_index: int, until: Optional[str] = None) -> bool:
+    """
+    Whether /next should run an auto-advance pass instead of a normal turn:
+    always when `until` is given, otherwise only when the next combatant's
+    turns are flagged as automatic.
+    """
+    if until:
+        return True
+    if not auto_flags:
+        return False
+    return bool(auto_flags[(current_index + 1) % len(auto_flags)])
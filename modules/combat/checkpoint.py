@@ -0,0 +1,175 @@
+"""
+Combat checkpoints for initiative saves.
+
+A checkpoint is the full mutable state of a fight: the tracker (turn order,
+current turn, round) plus each combatant's modified stats, HP, effects,
+stars, feedback and move uses/cooldowns. Checkpoints are stored as a base
+snapshot followed by small deltas, so repeated quicksaves/autosaves only
+write what changed since the previous checkpoint.
+
+Deltas are lists of operations:
+- {"p": [key, ...], "v": value}  set the value at a key path
+- {"p": [key, ...], "d": True}   delete the key at a key path
+
+Lists are compared and replaced as whole values. Key paths are stored as
+lists because Firebase doesn't allow '/' inside keys.
+"""
+
+import copy
+from typing import Any, Dict, List, Optional
+
+# Per-combatant checkpoint fields and the empty value each one falls back to.
+# Firebase drops empty lists/dicts, so a field missing from a stored state means empty.
+# Everything else (name, base stats, defense, moves, custom parameters, ...) belongs
+# to the character sheet and is left untouched on restore.
+COMBATANT_FIELDS = {
+    "stats": dict,
+    "resources": dict,
+    "effects": list,
+    "action_stars": dict,
+    "effect_feedback": list,
+    "moves": dict
+}
+
+# Move fields that change during combat
+MOVE_USAGE_FIELDS = ("uses_remaining", "last_used_round", "combat_epoch")
+
+# After this many deltas the next checkpoint is written as a fresh base
+MAX_DELTAS = 20
+
+
+def capture_combatant(character) -> Dict[str, Any]:
+    """Get the combat state of a character"""
+    data = character.to_dict()
+    moves = (data.get("moveset") or {}).get("moves") or {}
+    return {
+        "stats": {"modified": data["stats"]["modified"]},
+        "resources": data["resources"],
+        "effects": data.get("effects", []),
+        "action_stars": data.get("action_stars", {}),
+        "effect_feedback": data.get("effect_feedback", []),
+        "moves": {
+            name: {key: move[key] for key in MOVE_USAGE_FIELDS if key in move}
+            for name, move in moves.items()
+        }
+    }
+
+
+def normalize_combatant(state: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Fill in fields that were stored empty (or dropped) with empty containers"""
+    state = dict(state or {})
+
+    # Checkpoints written before moves were trimmed to their usage fields
+    if "moves" not in state and isinstance(state.get("moveset"), dict):
+        state["moves"] = state["moveset"].get("moves") or {}
+
+    for key, empty in COMBATANT_FIELDS.items():
+        if not isinstance(state.get(key), empty):
+            state[key] = empty()
+    return state
+
+
+def restore_combatant(character, state: Dict[str, Any]) -> None:
+    """
+    Apply a captured combat state to an existing character in place.
+    Only combat state is replaced; moves keep their definitions and only
+    get their uses and cooldown fields back.
+    """
+    # Import here to avoid circular import
+    from core.character import EffectFeedback, StatType
+    from core.effects.base import EffectRegistry
+    from utils.action_stars import ActionStars
+
+    state = normalize_combatant(state)
+
+    for stat, value in (state["stats"].get("modified") or {}).items():
+        try:
+            character.stats.modified[StatType(stat)] = value
+        except ValueError:
+            continue
+
+    resources = state["resources"]
+    for key in ("current_hp", "max_hp", "current_mp", "max_mp", "current_temp_hp", "max_temp_hp"):
+        setattr(character.resources, key, resources.get(key, 0))
+
+    character.effects = [
+        effect for effect in map(EffectRegistry.from_dict, state["effects"]) if effect
+    ]
+    character.action_stars = ActionStars.from_dict(state["action_stars"])
+    character.effect_feedback = [EffectFeedback.from_dict(data) for data in state["effect_feedback"]]
+
+    for name, move in character.moveset.moves.items():
+        usage = state["moves"].get(name) or {}
+        for key in MOVE_USAGE_FIELDS:
+            setattr(move, key, usage.get(key))
+
+    character._update_derived_stats()
+
+
+def diff_state(old: Any, new: Any, path: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """Get the operations that turn old into new"""
+    path = path or []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = []
+        for key in old:
+            if key not in new:
+                ops.append({"p": path + [key], "d": True})
+        for key, value in new.items():
+            if key not in old:
+                ops.append({"p": path + [key], "v": copy.deepcopy(value)})
+            elif old[key] != value:
+                ops.extend(diff_state(old[key], value, path + [key]))
+        return ops
+
+    if old != new:
+        return [{"p": path, "v": copy.deepcopy(new)}]
+    return []
+
+
+def apply_delta(state: Dict[str, Any], ops: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Apply delta operations to a state in place and return it"""
+    for op in ops or []:
+        path = list(op.get("p") or [])
+        if not path:
+            # Whole-state replacement
+            if not op.get("d"):
+                state.clear()
+                state.update(copy.deepcopy(op.get("v") or {}))
+            continue
+
+        # Walk to the parent, creating levels that Firebase dropped as empty
+        parent = state
+        for key in path[:-1]:
+            if not isinstance(parent.get(key), dict):
+                parent[key] = {}
+            parent = parent[key]
+
+        # Firebase stores a set-to-empty op without its value; treat it like
+        # the stored state does and leave the key out (read back as empty)
+        if op.get("d") or op.get("v") is None:
+            parent.pop(path[-1], None)
+        else:
+            parent[path[-1]] = copy.deepcopy(op["v"])
+
+    return state
+
+
+def rebuild_state(checkpoint: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Rebuild the latest state from a stored checkpoint (base + ordered deltas).
+    Returns None if the checkpoint has no base.
+    """
+    if not checkpoint or "base" not in checkpoint:
+        return None
+
+    state = copy.deepcopy(checkpoint["base"])
+    deltas = checkpoint.get("deltas") or {}
+    for seq in sorted(deltas):
+        apply_delta(state, deltas[seq])
+    return state
+
+
+def delta_key(seq: int) -> str:
+    """Key for a delta, zero padded so keys sort in write order"""
+    return f"d{seq:05d}"
@@ -0,0 +1,282 @@
+"""
+Persistent combat event store.
+
+Each combat gets an append-only event log. Recent events are kept in memory
+in a bounded ring buffer and written to a JSON lines file in batches, so
+the full history survives restarts without growing memory.
+
+Indexes by character, event type and round are kept for every event (as
+lists of sequence numbers), so filtered queries only touch matching events.
+Events that fell out of the ring buffer are read back from disk by their
+byte offset.
+
+All writes go through one writer thread, so batches reach the file in the
+order they were appended. Only the newest KEEP_COMBATS logs are kept on disk.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+EVENT_DIR = "data/combat_events"
+RING_CAPACITY = 500
+FLUSH_BATCH = 25
+KEEP_COMBATS = 50  # Older combat logs are deleted when a new combat starts
+
+# Single writer thread shared by every store: one worker keeps writes in submit order
+_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="combat-events")
+
+
+@dataclass
+class CombatEvent:
+    """One recorded combat event"""
+    seq: int
+    type: str
+    message: str
+    character: Optional[str] = None
+    round: int = 0
+    timestamp: float = 0.0
+    details: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CombatEvent':
+        return cls(**{key: data[key] for key in cls.__dataclass_fields__ if key in data})
+
+
+class CombatEventStore:
+    """Append-only event log for a single combat"""
+
+    def __init__(
+            self,
+            combat_id: str,
+            directory: str = EVENT_DIR,
+            capacity: int = RING_CAPACITY,
+            flush_batch: int = FLUSH_BATCH
+        ):
+        # Unflushed events must always still be in the ring buffer
+        assert capacity > flush_batch, "capacity must be larger than flush_batch"
+
+        self.combat_id = combat_id
+        self.path = os.path.join(directory, f"{combat_id}.jsonl")
+        self.capacity = capacity
+        self.flush_batch = flush_batch
+
+        self._ring: deque = deque(maxlen=capacity)
+        self._next_seq = 0
+        self._offsets: Dict[int, int] = {}
+        self._pending: List[CombatEvent] = []
+        self._write_lock = threading.Lock()
+
+        # Indexes: key -> sequence numbers in order
+        self._by_character: Dict[str, List[int]] = {}
+        self._by_type: Dict[str, List[int]] = {}
+        self._by_round: Dict[int, List[int]] = {}
+        self._names: Dict[str, str] = {}  # Lowercase -> display name
+
+    @staticmethod
+    def new_combat_id() -> str:
+        return datetime.now().strftime("combat_%Y%m%d_%H%M%S_%f")
+
+    @classmethod
+    def start(cls, directory: str = EVENT_DIR, keep: int = KEEP_COMBATS, **kwargs) -> 'CombatEventStore':
+        """Create the event log for a new combat, deleting the oldest logs past `keep`"""
+        cls.prune(directory, keep - 1)
+        return cls(cls.new_combat_id(), directory=directory, **kwargs)
+
+    @staticmethod
+    def prune(directory: str = EVENT_DIR, keep: int = KEEP_COMBATS) -> int:
+        """Delete all but the newest `keep` combat logs. Returns how many were deleted."""
+        try:
+            files = sorted(name for name in os.listdir(directory) if name.endswith(".jsonl"))
+        except FileNotFoundError:
+            return 0
+
+        old = files[:-keep] if keep > 0 else files
+        for name in old:
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError as e:
+                logger.error(f"Failed to delete old combat log {name}: {e}")
+        return len(old)
+
+    @classmethod
+    def open(cls, path: str, **kwargs) -> 'CombatEventStore':
+        """Load an existing combat's events from disk, rebuilding the indexes"""
+        directory, filename = os.path.split(path)
+        store = cls(os.path.splitext(filename)[0], directory=directory, **kwargs)
+
+        with open(path, "rb") as f:
+            offset = 0
+            for line in f:
+                try:
+                    event = CombatEvent.from_dict(json.loads(line))
+                except (ValueError, TypeError):
+                    offset += len(line)
+                    continue
+                store._offsets[event.seq] = offset
+                store._index(event)
+                store._ring.append(event)
+                store._next_seq = max(store._next_seq, event.seq + 1)
+                offset += len(line)
+        return store
+
+    @classmethod
+    def latest(cls, directory: str = EVENT_DIR, **kwargs) -> Optional['CombatEventStore']:
+        """Open the most recent combat on disk"""
+        try:
+            files = sorted(name for name in os.listdir(directory) if name.endswith(".jsonl"))
+        except FileNotFoundError:
+            return None
+        if not files:
+            return None
+        return cls.open(os.path.join(directory, files[-1]), **kwargs)
+
+    def __len__(self) -> int:
+        return self._next_seq
+
+    def _index(self, event: CombatEvent) -> None:
+        if event.character:
+            key = event.character.lower()
+            self._by_character.setdefault(key, []).append(event.seq)
+            self._names.setdefault(key, event.character)
+        self._by_type.setdefault(event.type, []).append(event.seq)
+        self._by_round.setdefault(event.round, []).append(event.seq)
+
+    def append(
+            self,
+            event_type,
+            message: str,
+            character: Optional[str] = None,
+            round_number: int = 0,
+            details: Optional[Dict[str, Any]] = None
+        ) -> CombatEvent:
+        """Record an event. Accepts a CombatEventType or its string value."""
+        event = CombatEvent(
+            seq=self._next_seq,
+            type=getattr(event_type, "value", event_type),
+            message=message,
+            character=character,
+            round=round_number or 0,
+            timestamp=time.time(),
+            details={key: value for key, value in (details or {}).items() if _is_json(value)}
+        )
+        self._next_seq += 1
+        self._ring.append(event)
+        self._index(event)
+        self._pending.append(event)
+
+        if len(self._pending) >= self.flush_batch:
+            self._schedule_flush()
+        return event
+
+    # Persistence
+
+    def _write(self, events: List[CombatEvent]) -> None:
+        """Append events to the log file, recording their offsets"""
+        if not events:
+            return
+        with self._write_lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "ab") as f:
+                offset = f.tell()
+                for event in events:
+                    line = (json.dumps(event.to_dict(), default=str) + "\n").encode("utf-8")
+                    f.write(line)
+                    self._offsets[event.seq] = offset
+                    offset += len(line)
+
+    def _take_pending(self) -> List[CombatEvent]:
+        events, self._pending = self._pending, []
+        return events
+
+    def _schedule_flush(self) -> None:
+        """Queue pending events on the writer thread without waiting"""
+        _writer.submit(self._safe_write, self._take_pending())
+
+    def _safe_write(self, events: List[CombatEvent]) -> None:
+        try:
+            self._write(events)
+        except Exception as e:
+            logger.error(f"Failed to write combat events for {self.combat_id}: {e}", exc_info=True)
+
+    async def flush(self) -> None:
+        """Write all pending events, after any batches already queued"""
+        await asyncio.wrap_future(_writer.submit(self._safe_write, self._take_pending()))
+
+    def flush_sync(self) -> None:
+        _writer.submit(self._safe_write, self._take_pending()).result()
+
+    # Queries
+
+    def _get(self, seq: int) -> Optional[CombatEvent]:
+        """Get an event from the ring buffer, or from disk if it fell out"""
+        if self._ring and seq >= self._ring[0].seq:
+            index = seq - self._ring[0].seq
+            if index < len(self._ring) and self._ring[index].seq == seq:
+                return self._ring[index]
+
+        offset = self._offsets.get(seq)
+        if offset is None:
+            return None
+        with self._write_lock, open(self.path, "rb") as f:
+            f.seek(offset)
+            return CombatEvent.from_dict(json.loads(f.readline()))
+
+    def query(
+            self,
+            character: Optional[str] = None,
+            event_type=None,
+            round_number: Optional[int] = None,
+            limit: int = 10
+        ) -> List[CombatEvent]:
+        """
+        Get the most recent events matching every given filter, newest first.
+        Only the index lists for the filters are walked, never the whole log.
+        """
+        candidates = []
+        if character:
+            candidates.append(self._by_character.get(character.lower(), []))
+        if event_type:
+            candidates.append(self._by_type.get(getattr(event_type, "value", event_type), []))
+        if round_number is not None:
+            candidates.append(self._by_round.get(round_number, []))
+
+        if not candidates:
+            start = max(0, self._next_seq - limit)
+            seqs = list(range(self._next_seq - 1, start - 1, -1))
+        else:
+            # Walk the shortest index, check the others with sets
+            candidates.sort(key=len)
+            others = [set(seqs) for seqs in candidates[1:]]
+            seqs = []
+            for seq in reversed(candidates[0]):
+                if all(seq in other for other in others):
+                    seqs.append(seq)
+                    if len(seqs) >= limit:
+                        break
+
+        events = [self._get(seq) for seq in seqs]
+        return [event for event in events if event is not None]
+
+    def characters(self) -> List[str]:
+        return sorted(self._names.values(), key=str.lower)
+
+    def rounds(self) -> List[int]:
+        return sorted(self._by_round)
+
+
+def _is_json(value: Any) -> bool:
+    return isinstance(value, (str, int, float, bool, type(None), list, dict))
@@ -8,6 +8,7 @@ Key Features:
 - Progress bar visualization
 - Formatted message output
 - Effect feedback message handling
+- Turn output sent as one message per turn, paced per channel
 
 IMPLEMENTATION MANDATES:
 - Use CombatLogger for ALL combat events
@@ -22,18 +23,26 @@ from typing import List, Dict, Optional, Tuple
 import discord
 from discord.ext import commands
 import asyncio
+import functools
 import logging
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 
 from core.character import Character, StatType
 from core.state import CombatLogger, CombatEventType
-from core.effects.manager import process_effects  # Import the async function
+from core.effects.combat import invalidate_damage_modifiers
+from core.effects.events import EffectEvent, EffectEventKind, render_events
+from core.effects.manager import process_effects, process_effect_events  # Import the async functions
 from core.effects.status import FrostbiteEffect, SkipEffect
+from utils.cooldowns import CooldownScheduler
 from utils.dice import DiceRoller
 from utils.error_handler import handle_error
 from utils.formatting import MessageFormatter
-from .save_handler import SaveHandler, InitiativeSaveData
+from utils.message_pipeline import MessagePipeline, chunk_embeds
+from .save_handler import SaveHandler, InitiativeSaveData, AutosaveScheduler
+from .checkpoint import capture_combatant, restore_combatant
+from .auto_advance import AutoAdvanceSummary, stops_auto_advance
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +63,7 @@ class TurnData:
     used_actions: List[str] = field(default_factory=list)
     skipped: bool = False  # Track if this turn was skipped
     skip_reason: Optional[str] = None
+    auto: bool = False  # Run automatically by /next (effect-only NPC turns)
 
     def format_progress(self) -> str:
         progress = self.current_ip
@@ -64,9 +74,12 @@ class TurnData:
 
 @dataclass
 class CombatLog:
-    """Tracks recent combat actions and effects"""
-    entries: List[Dict] = field(default_factory=list)
+    """Tracks recent combat actions and effects (full history is in the logger's event store)"""
     max_entries: int = 5
+    entries: deque = field(default=None)
+
+    def __post_init__(self):
+        self.entries = deque(self.entries or [], maxlen=self.max_entries)
 
     def add_entry(self, entry_type: str, message: str, character: str = None):
         entry = {
@@ -76,8 +89,6 @@ class CombatLog:
             "timestamp": discord.utils.utcnow()
         }
         self.entries.append(entry)
-        if len(self.entries) > self.max_entries:
-            self.entries.pop(0)
 
 class InitiativeTracker:
     """
@@ -99,21 +110,27 @@ class InitiativeTracker:
         self.round_number: int = 0
         self.combat_log = CombatLog()
         self.last_state = None
-        self.current_turn_message: Optional[discord.Message] = None
+        self.current_turn_message: Optional[discord.Message] = None  # Message holding the current turn's output
+        self.current_turn_embeds: List[discord.Embed] = []
+        self.turn_output: List[discord.Embed] = []           # Embeds queued for the next turn message
+        self.previous_turn_output: List[discord.Embed] = []  # End-of-turn embeds for current_turn_message
+        self.pipeline = MessagePipeline()
         self.logger = bot.game_state.logger
         self.save_handler = SaveHandler(bot.db, self.logger)
+        self.autosave = AutosaveScheduler(self.save_handler, self._autosave_snapshot)
         self.quiet_mode = False  # For suppressing debug prints
         self.previous_turn_end_msgs = []  # Track previous turn's end messages
         self.expiry_pending_msgs = []     # Track messages for effects about to expire
+        self.cooldowns = CooldownScheduler()  # Move cooldowns; a new epoch per combat resets them all
 
     def set_quiet_mode(self, quiet: bool = True):
         """Enable/disable debug prints"""
         self.quiet_mode = quiet
 
-    def debug_print(self, *args, **kwargs):
-        """Print only if not in quiet mode"""
+    def debug_print(self, message, *args):
+        """Log debug info unless in quiet mode. Args are %-formatted only when logged."""
         if not self.quiet_mode:
-            print(*args, **kwargs)
+            logger.debug(message.strip(), *args)
 
     @property
     def current_turn(self) -> Optional[TurnData]:
@@ -122,6 +139,64 @@ class InitiativeTracker:
             return None
         return self.turn_order[self.current_index]
 
+    def can_use_move(self, character: Character, move) -> Tuple[bool, Optional[str]]:
+        """Check a move's uses and cooldown in this combat"""
+        return self.cooldowns.can_use(character.name, move, self.round_number)
+
+    def cooldown_remaining(self, character: Character, move_name: str) -> int:
+        """Rounds until a character's move is off cooldown in this combat"""
+        return self.cooldowns.remaining(character.name, move_name, self.round_number)
+
+    def record_move_use(self, character: Character, move) -> None:
+        """Record a move's use and start its cooldown for this combat"""
+        move.use(self.round_number, self.cooldowns.epoch)
+        if move.cooldown:
+            self.cooldowns.start(character.name, move.name, self.round_number, move.cooldown)
+
+    def release_cooldowns(self) -> None:
+        """Drop cooldowns that end this round"""
+        ready = self.cooldowns.release(self.round_number)
+        if ready:
+            self.debug_print("Off cooldown in round %s: %s", self.round_number, ready)
+
+    def queue_output(self, embed: discord.Embed) -> None:
+        """Add an embed to the turn message being built"""
+        self.turn_output.append(embed)
+
+    def take_output(self) -> List[discord.Embed]:
+        """Remove and return the queued embeds"""
+        embeds, self.turn_output = self.turn_output, []
+        return embeds
+
+    async def flush_output(self, interaction: discord.Interaction) -> None:
+        """
+        Send the turn's queued embeds as one message, which becomes the
+        current turn message. End-of-turn updates for the previous turn are
+        edited into that turn's message when they fit; otherwise they lead
+        the new message.
+        """
+        previous, self.previous_turn_output = self.previous_turn_output, []
+        embeds = self.take_output()
+        bucket = getattr(interaction, 'channel_id', None)
+        
+        try:
+            if previous:
+                combined = self.current_turn_embeds + previous
+                if await self.pipeline.edit(self.current_turn_message, combined, bucket):
+                    self.current_turn_embeds = combined
+                else:
+                    embeds = previous + embeds
+                    
+            if not embeds:
+                return
+                
+            send = functools.partial(interaction.followup.send, wait=True)
+            self.current_turn_message = await self.pipeline.send(send, embeds, bucket)
+            self.current_turn_embeds = chunk_embeds(embeds)[-1]
+            
+        except Exception as e:
+            logger.error(f"Error sending turn output: {e}", exc_info=True)
+
     async def announce_turn(self, interaction: discord.Interaction, effect_messages: List[str] = None):
         """Announce turn with effect messages"""
         current_char = self.bot.game_state.get_character(self.current_turn.character_name)
@@ -158,8 +233,8 @@ class InitiativeTracker:
                 )
                 fields["Effects"] = "\n".join(formatted_messages)
 
-        # Send turn announcement
-        await interaction.followup.send(embed=embed)
+        # Queue turn announcement (sent with the rest of the turn's output)
+        self.queue_output(embed)
         
         # Log turn announcement
         if self.logger:
@@ -168,34 +243,29 @@ class InitiativeTracker:
                 fields
             )
 
-    async def send_effect_update(self, interaction: discord.Interaction, effect_msgs: List[str], expiry_msgs: List[str] = None):
-        """Send effect update embed via followup with improved formatting"""
+    async def send_effect_update(
+            self,
+            interaction: discord.Interaction,
+            events: List[EffectEvent]
+        ):
+        """
+        Send effect update embed via followup with improved formatting.
+        Events are grouped by kind and only formatted here.
+        """
         # Initialize message categories
         duration_msgs = []
-        expiry_warning_msgs = []
         final_turn_msgs = []
-        expiry_msgs = expiry_msgs or []
+        expiry_msgs = []
         
-        # FIXED: Process each message and categorize appropriately
-        for msg in effect_msgs:
-            if not msg:
-                continue
-            
-            # FIXED: Improved pattern matching for expiry messages
-            if any(pattern in msg.lower() for pattern in 
-                ["worn off", "expired", "has ended", "wears off", "has worn off"]):
+        for event in events:
+            if event.kind == EffectEventKind.EXPIRY:
+                msg = str(event)
                 if msg not in expiry_msgs:
                     expiry_msgs.append(msg)
-                continue
-                
-            # Check for final turn warnings
-            if "final turn" in msg.lower() or "will expire" in msg.lower():
-                if "final turn" in msg.lower():
-                    final_turn_msgs.append(msg)
-                else:
-                    expiry_warning_msgs.append(msg)
+            elif event.kind == EffectEventKind.EXPIRY_WARNING:
+                final_turn_msgs.append(str(event))
             else:
-                duration_msgs.append(msg)
+                duration_msgs.append(str(event))
         
         # Create embed for all effect updates
         embed = discord.Embed(title="Effects Update", color=discord.Color.gold())
@@ -215,13 +285,6 @@ class InitiativeTracker:
                 inline=False
             )
         
-        if expiry_warning_msgs:
-            embed.add_field(
-                name="Will Expire Next Turn",
-                value="\n".join(expiry_warning_msgs),
-                inline=False
-            )
-        
         if expiry_msgs:
             embed.add_field(
                 name="Effects Expired",
@@ -231,7 +294,7 @@ class InitiativeTracker:
         
         # Only send if there's content
         if len(embed.fields) > 0:
-            await interaction.followup.send(embed=embed)
+            self.queue_output(embed)
             
             # Log to CombatLogger
             if self.logger:
@@ -246,51 +309,23 @@ class InitiativeTracker:
         current_char_name = self.current_turn.character_name
         current_char = self.bot.game_state.get_character(current_char_name)
         
-        # FIXED: Initialize message lists
-        end_effect_messages = []
-        expiry_messages = []
-        
         # Process end-of-turn effects for skipped character
         if current_char:
             # FIXED: Check for pending effect feedback first
-            pending_feedback = current_char.get_pending_feedback()
-            if pending_feedback:
-                for feedback in pending_feedback:
-                    if feedback.expiry_message and not feedback.displayed:
-                        expiry_messages.append(feedback.expiry_message)
-                
-                # Mark feedback as displayed
-                current_char.mark_feedback_displayed()
+            end_events = self._pending_expiry_events(current_char)
             
             # Process effects - properly await the call
-            was_skipped, start_msgs, end_msgs = await process_effects(
+            was_skipped, _, turn_end_events = await process_effect_events(
                 current_char,
                 self.round_number,
                 current_char.name,
                 self.logger
             )
-            
-            # FIXED: Improved expiry message detection
-            for msg in end_msgs:
-                if not msg:
-                    continue
-                    
-                # Enhanced pattern matching for expiry messages
-                is_expiry = False
-                if any(pattern in msg.lower() for pattern in 
-                    ["worn off", "expired", "has ended", "wears off", "has worn off"]):
-                    is_expiry = True
-                    
-                if is_expiry:
-                    if msg not in expiry_messages:  # Avoid duplicates
-                        expiry_messages.append(msg)
-                else:
-                    end_effect_messages.append(msg)
+            end_events.extend(turn_end_events)
             
             # Show end effects if any
-            if end_effect_messages or expiry_messages:
-                # Send the update with separated expiry messages
-                await self.send_effect_update(interaction, end_effect_messages, expiry_messages)
+            if end_events:
+                await self.send_effect_update(interaction, end_events)
             
             # Save character state
             await self.bot.db.save_character(current_char)
@@ -300,7 +335,7 @@ class InitiativeTracker:
         if self.current_index >= len(self.turn_order):
             self.round_number += 1
             self.current_index = 0
-            await interaction.followup.send(embed=discord.Embed(
+            self.queue_output(discord.Embed(
                 title=f"Round {self.round_number} Begins!",
                 color=discord.Color.blue(),
                 description="Action stars refreshed for all characters!"
@@ -309,22 +344,15 @@ class InitiativeTracker:
                 char = self.bot.game_state.get_character(turn.character_name)
                 if char:
                     char.refresh_stars()
+            self.release_cooldowns()
         
         new_char = self.bot.game_state.get_character(self.current_turn.character_name)
         if new_char:
             # FIXED: Check for pending effect feedback first
-            start_effect_messages = []
-            pending_feedback = new_char.get_pending_feedback()
-            if pending_feedback:
-                for feedback in pending_feedback:
-                    if feedback.expiry_message and not feedback.displayed:
-                        start_effect_messages.append(feedback.expiry_message)
-                
-                # Mark feedback as displayed
-                new_char.mark_feedback_displayed()
+            start_events = self._pending_expiry_events(new_char)
             
             # Process new turn - properly await the call
-            was_skipped, start_msgs, _ = await process_effects(
+            was_skipped, turn_start_events, _ = await process_effect_events(
                 new_char,
                 self.round_number,
                 new_char.name,
@@ -335,8 +363,8 @@ class InitiativeTracker:
             self.current_turn.skipped = was_skipped
             
             # Handle effect messages
-            if start_msgs:
-                start_effect_messages.extend(start_msgs)
+            start_events.extend(turn_start_events)
+            start_effect_messages = render_events(start_events)
                 
             # Save character state
             await self.bot.db.save_character(new_char)
@@ -358,8 +386,8 @@ class InitiativeTracker:
         skip_reason = None
         messages = []
         
-        self.debug_print(f"\nProcessing effects for {character.name}")
-        self.debug_print(f"Initial state: {[e.name for e in character.effects]}")
+        self.debug_print("\nProcessing effects for %s", character.name)
+        self.debug_print("Initial state: %s", [e.name for e in character.effects])
         
         # Take snapshot if logging enabled
         if self.logger:
@@ -390,7 +418,7 @@ class InitiativeTracker:
                 
             # Update turn data
             self.current_turn.skip_reason = skip_reason
-            self.debug_print(f"Turn skipped: {skip_reason}")
+            self.debug_print("Turn skipped: %s", skip_reason)
         
         # Take another snapshot after processing
         if self.logger:
@@ -409,6 +437,9 @@ class InitiativeTracker:
                 self.logger.channel_id = interaction.channel_id
                 self.logger.start_combat(characters)
 
+                # New cooldown epoch: every move's uses and cooldowns start fresh
+                self.cooldowns.reset()
+
                 # Clear temporary effects and handle stars
                 cleanup_messages = []
                 for char in characters:
@@ -423,19 +454,6 @@ class InitiativeTracker:
                     # Reset action stars
                     char.refresh_stars()
                     
-                    # Reset move uses for all moves
-                    if hasattr(char, 'moveset') and hasattr(char.moveset, 'moves'):
-                        for move_name, move in char.moveset.moves.items():
-                            if hasattr(move, 'uses') and move.uses is not None:
-                                move.uses_remaining = move.uses
-                    
-                    # Clear move cooldowns
-                    if hasattr(char, 'moveset'):
-                        for move_name in char.list_moves():
-                            move = char.get_move(move_name)
-                            if move:
-                                move.last_used_round = None
-                    
                     await self.bot.db.save_character(char)
                     
                     # Log state changes
@@ -523,11 +541,11 @@ class InitiativeTracker:
         
     async def clear_combat_effects(self, character: Character) -> List[str]:
         """
-        Clear temporary effects and reset cooldowns at combat start.
+        Clear temporary effects at combat start.
         
         This is an improved version that:
         1. Properly handles permanent effects
-        2. Cleans up move cooldowns in both moveset and effects
+        2. Removes move effects (cooldowns themselves reset with the combat epoch)
         3. Preserves natural resistances/vulnerabilities
         4. Returns all cleanup messages
         5. Clears effect feedback
@@ -538,7 +556,7 @@ class InitiativeTracker:
         for effect in character.effects[:]:  # Copy list since we're modifying it
             # Skip permanent effects if they're marked as such
             if hasattr(effect, 'permanent') and effect.permanent:
-                self.debug_print(f"Keeping permanent effect: {effect.name}")
+                self.debug_print("Keeping permanent effect: %s", effect.name)
                 continue
                 
             # Handle different effect categories
@@ -577,6 +595,7 @@ class InitiativeTracker:
         # Clear effect-based resistances/vulnerabilities, but keep natural ones
         character.defense.damage_resistances = {}
         character.defense.damage_vulnerabilities = {}
+        invalidate_damage_modifiers(character)
         
         # Reset AC to base value
         character.defense.current_ac = character.defense.base_ac
@@ -585,18 +604,8 @@ class InitiativeTracker:
         if hasattr(character, 'heat_stacks'):
             delattr(character, 'heat_stacks')
             
-        # Clear all move cooldowns - FIXING THE VARIABLE NAME HERE
-        if hasattr(character, 'moveset'):
-            for move_name in character.list_moves():
-                move = character.get_move(move_name)  # FIXED: changed 'char' to 'character'
-                if move:
-                    move.last_used_round = None
-                    if hasattr(move, 'uses') and move.uses is not None:
-                        move.uses_remaining = move.uses
-        
-        # Clear action star cooldowns
-        if hasattr(character, 'action_stars'):
-            character.action_stars.clear_cooldowns()
+        # Move uses and cooldowns (moveset and action stars) are reset by the
+        # new cooldown epoch from start_combat, without touching each move
             
         # Clear effect feedback
         character.effect_feedback = []
@@ -698,17 +707,18 @@ class InitiativeTracker:
                 current_char = self.bot.game_state.get_character(self.current_turn.character_name)
                 if current_char:
                     # Process effects - properly await the call
-                    was_skipped, start_msgs, _ = await process_effects(
+                    was_skipped, start_events, _ = await process_effect_events(
                         current_char,
                         self.round_number,
                         current_char.name,
                         self.logger
                     )
                     self.current_turn.skipped = was_skipped
+                    start_msgs = render_events(start_events)
                     await self.bot.db.save_character(current_char)
 
                     # First round announcement
-                    await interaction.followup.send(embed=discord.Embed(
+                    self.queue_output(discord.Embed(
                         title=f"Round {self.round_number} Begins!",
                         color=discord.Color.blue(),
                         description="Action stars refreshed for all characters!"
@@ -726,75 +736,48 @@ class InitiativeTracker:
             current_char = self.bot.game_state.get_character(current_char_name)
             
             # Process current character's turn end
-            end_effect_messages = []
-            expiry_messages = []  # Specifically track expiry messages
             if current_char:
                 # Get end of turn effects
                 # Process effects - properly await the call
-                was_skipped, start_msgs, end_msgs = await process_effects(
+                was_skipped, _, end_events = await process_effect_events(
                     current_char,
                     self.round_number,
                     current_char.name,
                     self.logger
                 )
                 
-                self.debug_print(f"\n=== Processing turn end for {current_char.name} ===")
-                self.debug_print(f"Received {len(end_msgs)} end messages")
+                self.debug_print("\n=== Processing turn end for %s ===", current_char.name)
+                self.debug_print("Received %s end events", len(end_events))
                 
                 # Check for pending effect feedback first
-                pending_feedback = current_char.get_pending_feedback()
-                if pending_feedback:
-                    self.debug_print(f"Found {len(pending_feedback)} pending feedback entries")
-                    for feedback in pending_feedback:
-                        if feedback.expiry_message and not feedback.displayed:
-                            self.debug_print(f"Adding feedback expiry message: {feedback.expiry_message}")
-                            expiry_messages.append(feedback.expiry_message)
-                
-                # IMPROVED HANDLING: Better identification of expiry messages in end_msgs
-                for msg in end_msgs:
-                    if not msg:
-                        continue
-                        
-                    # Enhanced pattern matching for expiry messages
-                    is_expiry = False
-                    
-                    if any(phrase in msg.lower() for phrase in ["worn off", "ended", "expired", "wears off"]):
-                        is_expiry = True
-                    elif "has worn off" in msg.lower() or "has expired" in msg.lower():
-                        is_expiry = True
-                        
-                    if is_expiry:
-                        self.debug_print(f"Found expiry message: {msg}")
-                        if msg not in expiry_messages:  # Avoid duplicates
-                            expiry_messages.append(msg)
-                    else:
-                        self.debug_print(f"Regular end message: {msg}")
-                        end_effect_messages.append(msg)
+                end_events = self._pending_expiry_events(current_char) + end_events
                 
                 # Save the character after processing effects
                 await self.bot.db.save_character(current_char)
                 
                 # IMPROVED: More clear logging for effect update processing
-                self.debug_print(f"Sending effect update with:")
-                self.debug_print(f"- Regular messages: {len(end_effect_messages)}")
-                self.debug_print(f"- Expiry messages: {len(expiry_messages)}")
+                self.debug_print("Sending effect update with:")
+                for event in end_events:
+                    self.debug_print("- %s: %s", event.kind.value, event.effect_name)
                 
                 # Always show the end-of-turn effect updates before moving to next character
-                # Ensure expiry messages are included separately for proper categorization
-                if end_effect_messages or expiry_messages:
-                    await self.send_effect_update(interaction, end_effect_messages, expiry_messages)
+                # Events are grouped into the update's fields by kind
+                if end_events:
+                    await self.send_effect_update(interaction, end_events)
+                    
+                # The ending turn's update goes into that turn's message
+                self.previous_turn_output = self.take_output()
 
             # Handle round transition
-            start_effect_messages = []
             if self.current_index == len(self.turn_order) - 1:
-                self.debug_print(f"\n=== Round {self.round_number} Complete ===")
+                self.debug_print("\n=== Round %s Complete ===", self.round_number)
                 self.round_number += 1
                 self.current_index = 0
                 
-                self.debug_print(f"\n=== Round {self.round_number} Begins ===")
+                self.debug_print("\n=== Round %s Begins ===", self.round_number)
                 
                 # Announce new round AFTER showing previous turn's end effects
-                await interaction.followup.send(embed=discord.Embed(
+                self.queue_output(discord.Embed(
                     title=f"Round {self.round_number} Begins!",
                     color=discord.Color.blue(),
                     description="Action stars refreshed for all characters!"
@@ -805,21 +788,24 @@ class InitiativeTracker:
                     char = self.bot.game_state.get_character(turn.character_name)
                     if char:
                         char.refresh_stars()
+                self.release_cooldowns()
             else:
                 self.current_index += 1
 
             # Process next character's turn
             new_char = self.bot.game_state.get_character(self.current_turn.character_name)
+            if new_char and self.logger:
+                self.logger.current_round = self.round_number
+                self.logger.add_event(
+                    CombatEventType.TURN_START,
+                    message="Turn started",
+                    character=new_char.name,
+                    round_number=self.round_number
+                )
             if new_char:
-                # Check for pending effect feedback first
-                pending_feedback = new_char.get_pending_feedback()
-                if pending_feedback:
-                    for feedback in pending_feedback:
-                        if feedback.expiry_message and not feedback.displayed:
-                            start_effect_messages.append(feedback.expiry_message)
-                
+                # Pending effect feedback is picked up by the effect processing
                 # Process new turn - properly await the call
-                was_skipped, start_msgs, _ = await process_effects(
+                was_skipped, start_events, _ = await process_effect_events(
                     new_char,
                     self.round_number,
                     new_char.name,
@@ -829,9 +815,8 @@ class InitiativeTracker:
                 # Update skip status
                 self.current_turn.skipped = was_skipped
                 
-                # Handle effect messages
-                if start_msgs:
-                    start_effect_messages.extend(start_msgs)
+                # Effect messages are formatted for the announcement
+                start_effect_messages = render_events(start_events)
                     
                 # Save character state
                 await self.bot.db.save_character(new_char)
@@ -848,7 +833,6 @@ class InitiativeTracker:
                         )
                     
                     await self.announce_turn(interaction, start_effect_messages)
-                    await asyncio.sleep(1)
                     return await self.process_skipped_turn(interaction)
                         
                 # Announce next turn
@@ -858,9 +842,169 @@ class InitiativeTracker:
             return True, "", []
 
         except Exception as e:
-            self.debug_print(f"Error in next_turn: {str(e)}")
+            self.debug_print("Error in next_turn: %s", e)
             return False, f"Error processing turn: {str(e)}", []
+            
+        finally:
+            await self.flush_output(interaction)
+        
+    def set_auto_turn(self, character_name: str, enabled: bool = True) -> bool:
+        """Flag a combatant's turns to be run automatically. Returns False if they aren't in combat."""
+        for turn in self.turn_order:
+            if turn.character_name.lower() == character_name.lower():
+                turn.auto = enabled
+                return True
+        return False
+
+    async def auto_advance(
+            self,
+            interaction: discord.Interaction,
+            until: Optional[str] = None
+        ) -> Tuple[bool, str, List[str]]:
+        """
+        Advance through automated turns in one pass.
+        
+        Runs turns until `until` is up, or without it until a character not
+        flagged as automatic is up (skipped turns never stop it). The
+        automated turns' effect messages are sent as one summary embed and
+        every character they changed is saved in one write. At most one
+        full round is run per call.
+        """
+        try:
+            await interaction.response.defer()
+            
+            if self.state != CombatState.ACTIVE:
+                return False, "Combat is not active", []
+                
+            if until and not any(turn.character_name.lower() == until.lower() for turn in self.turn_order):
+                return False, f"{until} is not in combat", []
+                
+            summary = AutoAdvanceSummary()
+            changed: Dict[str, Character] = {}
+            start_effect_messages = []
+            
+            for step in range(len(self.turn_order)):
+                # End the current turn
+                current_char = self.bot.game_state.get_character(self.current_turn.character_name)
+                if current_char:
+                    if not summary.turns:
+                        summary.begin_turn(current_char.name, self.round_number, self.current_turn.skipped)
+                    _, _, end_events = await process_effect_events(
+                        current_char,
+                        self.round_number,
+                        current_char.name,
+                        self.logger
+                    )
+                    summary.add_messages(render_events(self._pending_expiry_events(current_char) + end_events))
+                    changed[current_char.name] = current_char
+                    
+                # Move to the next turn
+                if self.current_index == len(self.turn_order) - 1:
+                    self.round_number += 1
+                    self.current_index = 0
+                    for turn in self.turn_order:
+                        char = self.bot.game_state.get_character(turn.character_name)
+                        if char:
+                            char.refresh_stars()
+                            changed[char.name] = char
+                    self.release_cooldowns()
+                else:
+                    self.current_index += 1
+                    
+                # Start the next turn
+                new_char = self.bot.game_state.get_character(self.current_turn.character_name)
+                if not new_char:
+                    continue
+                    
+                if self.logger:
+                    self.logger.current_round = self.round_number
+                    self.logger.add_event(
+                        CombatEventType.TURN_START,
+                        message="Turn started",
+                        character=new_char.name,
+                        round_number=self.round_number
+                    )
+                    
+                start_events = self._pending_expiry_events(new_char)
+                was_skipped, turn_start_events, _ = await process_effect_events(
+                    new_char,
+                    self.round_number,
+                    new_char.name,
+                    self.logger
+                )
+                self.current_turn.skipped = was_skipped
+                start_effect_messages = render_events(start_events + turn_start_events)
+                changed[new_char.name] = new_char
+                
+                if was_skipped and self.logger:
+                    self.logger.add_event(
+                        CombatEventType.STATUS_UPDATE,
+                        message=f"{new_char.name}'s turn skipped",
+                        character=new_char.name,
+                        details={"reason": self.current_turn.skip_reason},
+                        round_number=self.round_number
+                    )
+                    
+                stop = not was_skipped and stops_auto_advance(new_char.name, self.current_turn.auto, until)
+                if stop or step == len(self.turn_order) - 1:
+                    break
+                    
+                summary.begin_turn(new_char.name, self.round_number, was_skipped)
+                summary.add_messages(start_effect_messages)
+                
+            # One write for every character the pass touched
+            if changed:
+                await self.bot.db.save_characters(list(changed.values()))
+                
+            self.debug_print("Auto-advanced %s turns to %s", len(summary), self.current_turn.character_name)
+            await self.send_auto_summary(interaction, summary)
+            await self.announce_turn(interaction, start_effect_messages)
+            return True, "", start_effect_messages
+            
+        except Exception as e:
+            logger.error(f"Error auto-advancing turns: {e}", exc_info=True)
+            return False, f"Error processing turns: {str(e)}", []
+            
+        finally:
+            await self.flush_output(interaction)
+
+    def _pending_expiry_events(self, character: Character) -> List[EffectEvent]:
+        """Expiry messages from effect feedback that haven't been shown yet (marks them shown)"""
+        events = [
+            EffectEvent.from_message(
+                feedback.expiry_message,
+                EffectEventKind.EXPIRY,
+                feedback.effect_name,
+                character.name,
+                feedback.round_expired
+            )
+            for feedback in character.get_pending_feedback()
+            if feedback.expiry_message and not feedback.displayed
+        ]
+        if events:
+            character.mark_feedback_displayed()
+        return events
+
+    async def send_auto_summary(self, interaction: discord.Interaction, summary: AutoAdvanceSummary):
+        """Send one embed summarizing auto-advanced turns"""
+        if not summary.turns:
+            return
+            
+        embed = discord.Embed(
+            title="Turns Auto-Advanced",
+            description=f"`{len(summary)} turn(s) processed`",
+            color=discord.Color.gold()
+        )
+        fields = {}
+        for name, value in summary.fields():
+            embed.add_field(name=name, value=value, inline=False)
+            fields[name] = value
+            
+        self.queue_output(embed)
         
+        if self.logger:
+            self.logger.log_embed("Turns Auto-Advanced", fields)
+
     async def end_combat(self, interaction: discord.Interaction = None) -> Tuple[bool, str]:
         """
         End the current combat session without modifying character states.
@@ -874,11 +1018,16 @@ class InitiativeTracker:
             if self.logger:
                 self.logger.end_combat()
                 
+            # Write any pending autosave before the state is cleared
+            await self.autosave.stop()
+                
             # Reset tracker state
             self.state = CombatState.INACTIVE
             self.turn_order = []
             self.current_index = 0
             self.round_number = 0
+            self.current_turn_message = None
+            self.current_turn_embeds = []
             
             # Only send message if interaction is provided (not in tests)
             if interaction:
@@ -913,6 +1062,90 @@ class InitiativeTracker:
         print("\n=== Combat Ended ===")
         print("Test combat complete")
 
+    def get_checkpoint_state(self) -> Dict:
+        """
+        Capture the full combat state for a save: tracker state plus
+        each combatant's HP, effects, stars and cooldowns.
+        """
+        characters = {}
+        for turn in self.turn_order:
+            char = self.bot.game_state.get_character(turn.character_name)
+            if char:
+                characters[char.name] = capture_combatant(char)
+                
+        return {
+            "tracker": {
+                "state": self.state.value,
+                "current_index": self.current_index,
+                "round_number": self.round_number,
+                "cooldown_epoch": self.cooldowns.epoch,
+                "turn_order": [
+                    {
+                        "character_name": turn.character_name,
+                        "initiative_roll": turn.initiative_roll,
+                        "skipped": turn.skipped,
+                        "skip_reason": turn.skip_reason,
+                        "auto": turn.auto
+                    }
+                    for turn in self.turn_order
+                ]
+            },
+            "characters": characters
+        }
+
+    def _autosave_snapshot(self) -> Optional[Tuple[List[str], int, int, Dict]]:
+        """Current state for the autosave scheduler, or None if no combat is running"""
+        if self.state == CombatState.INACTIVE or not self.turn_order:
+            return None
+        order = [turn.character_name for turn in self.turn_order]
+        return order, self.current_index, self.round_number, self.get_checkpoint_state()
+
+    async def restore_checkpoint(self, state: Dict) -> List[Character]:
+        """
+        Apply a saved combat checkpoint after set_battle has rebuilt the turn order.
+        Restores turn details and combatant state, then saves all combatants in one write.
+        
+        Returns the restored characters.
+        """
+        tracker_state = state.get("tracker") or {}
+        saved_turns = {
+            turn["character_name"]: turn
+            for turn in tracker_state.get("turn_order") or []
+            if isinstance(turn, dict) and "character_name" in turn
+        }
+        
+        # Restore per-turn details
+        for turn in self.turn_order:
+            saved = saved_turns.get(turn.character_name)
+            if saved:
+                turn.initiative_roll = saved.get("initiative_roll", 0)
+                turn.skipped = saved.get("skipped", False)
+                turn.skip_reason = saved.get("skip_reason")
+                turn.auto = saved.get("auto", False)
+                
+        # A fight saved mid-turn continues from that turn rather than re-running its start
+        if tracker_state.get("state") == CombatState.ACTIVE.value:
+            self.state = CombatState.ACTIVE
+            
+        # Resume the saved combat's cooldown epoch so its cooldowns still count
+        if tracker_state.get("cooldown_epoch"):
+            self.cooldowns.reset(tracker_state["cooldown_epoch"])
+            
+        # Restore combatant state in memory
+        restored = []
+        for name, char_state in (state.get("characters") or {}).items():
+            char = self.bot.game_state.get_character(name)
+            if char and char_state:
+                restore_combatant(char, char_state)
+                self.cooldowns.track(char, self.round_number)
+                restored.append(char)
+                
+        if restored:
+            await self.bot.db.save_characters(restored)
+            
+        self.debug_print("Restored checkpoint for %s combatants", len(restored))
+        return restored
+
     def _get_current_state(self) -> Dict:
         """Get the current combat state for undo functionality"""
         return {
@@ -3,19 +3,35 @@ Save and load system for initiative tracking.
 Allows combat state to be saved, loaded, and restored.
 
 This updated version stores saves in Firebase rather than local files.
+A small initiative_saves_index node (name, key, timestamp, round, character
+count) is kept next to the saves and cached in memory, so listing saves,
+autocomplete and name lookups never download the saves themselves.
+
+Saves can also carry a full combat checkpoint (see checkpoint.py). Repeated
+writes to the same save slot only store a delta against the previous one.
+
+Autosaves are written by AutosaveScheduler in a background task, so /next
+never waits on Firebase.
 """
 
 import discord
+import asyncio
+import copy
 import json
 import os
 import glob
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from dataclasses import dataclass
 from datetime import datetime
 import logging
 
+from .checkpoint import diff_state, rebuild_state, delta_key, MAX_DELTAS
+
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between background autosaves (round changes save right away)
+AUTOSAVE_INTERVAL = 30.0
+
 @dataclass
 class InitiativeSaveData:
     """Data structure for initiative saves"""
@@ -25,6 +41,7 @@ class InitiativeSaveData:
     round_number: int
     timestamp: str
     description: Optional[str] = None
+    state: Optional[Dict[str, Any]] = None  # Full combat checkpoint, if the save has one
 
 class SaveConfirmView(discord.ui.View):
     """Confirmation view for potentially destructive operations"""
@@ -72,18 +89,21 @@ class SaveHandler:
         self.db = database
         self.autosave_enabled = False
         self.logger = logger
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None  # Cached save index by key
+        self._checkpoints: Dict[str, Dict[str, Any]] = {}  # key -> {"state", "seq"} last written
         
         # Reference to initiative_saves in Firebase
         self._ensure_firebase_ref()
     
     def _ensure_firebase_ref(self):
-        """Ensure we have a Firebase reference for initiative saves"""
-        if not hasattr(self.db, '_refs'):
+        """Ensure we have Firebase references for initiative saves and their index"""
+        if not hasattr(self.db, '_refs') or self.db._db is None:
             return
             
-        if 'initiative_saves' not in self.db._refs:
-            # Create reference if it doesn't exist
-            self.db._refs['initiative_saves'] = self.db._db.reference('initiative_saves')
+        for ref_name in ('initiative_saves', 'initiative_saves_index'):
+            if ref_name not in self.db._refs:
+                # Create reference if it doesn't exist
+                self.db._refs[ref_name] = self.db._db.child(ref_name)
         
     def debug_print(self, *args, **kwargs):
         """Print debug message if available"""
@@ -98,30 +118,127 @@ class SaveHandler:
         # Remove special characters and spaces
         return "".join(c if c.isalnum() else "_" for c in name.lower())
     
-    async def list_saves(self) -> List[Dict[str, Any]]:
-        """List all available saves from Firebase"""
+    def _index_entry(self, key: str, save_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the index entry for a save"""
+        return {
+            "name": save_data.get("name", key),
+            "key": key,
+            "timestamp": save_data.get("timestamp"),
+            "round": save_data.get("round_number", 1),
+            "characters": len(save_data.get("order", [])),
+            "description": save_data.get("description")
+        }
+    
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the save index, loading it from Firebase on first use.
+        Builds the index from the saves once if it doesn't exist yet.
+        """
+        if self._index is not None:
+            return self._index
+            
         self._ensure_firebase_ref()
-        saves = []
+        index = self.db._refs['initiative_saves_index'].get() or {}
         
-        try:
-            # Get all saves
-            if 'initiative_saves' in self.db._refs:
-                save_data = self.db._refs['initiative_saves'].get()
+        if not index:
+            # No index yet - build it from any existing saves
+            all_saves = self.db._refs['initiative_saves'].get() or {}
+            index = {
+                key: self._index_entry(key, data)
+                for key, data in all_saves.items()
+                if isinstance(data, dict)
+            }
+            if index:
+                self.db._refs['initiative_saves_index'].set(index)
+                self.debug_print(f"Built initiative save index with {len(index)} saves")
                 
-                # Convert to list format
-                if save_data:
-                    for key, data in save_data.items():
-                        saves.append({
-                            "name": data.get("name", key),
-                            "round": data.get("round_number", 1),
-                            "characters": len(data.get("order", [])),
-                            "timestamp": data.get("timestamp"),
-                            "description": data.get("description")
-                        })
+        self._index = index
+        return index
+    
+    def _write_save(
+            self,
+            save_key: str,
+            save_data: Dict[str, Any],
+            state: Optional[Dict[str, Any]] = None
+        ) -> None:
+        """
+        Write a save and its index entry together in one update.
+        
+        With a checkpoint state, the first write to a slot stores the full
+        state as the base. Later writes to the same slot only store a delta
+        against the previous checkpoint, until MAX_DELTAS is reached and a
+        fresh base is written.
+        """
+        entry = self._index_entry(save_key, save_data)
+        updates = {f"initiative_saves_index/{save_key}": entry}
+        previous = self._checkpoints.get(save_key)
+        
+        if state is not None and previous and previous["seq"] < MAX_DELTAS:
+            # Only the small metadata fields and the delta are written
+            for field_name, value in save_data.items():
+                updates[f"initiative_saves/{save_key}/{field_name}"] = value
+                
+            ops = diff_state(previous["state"], state)
+            seq = previous["seq"]
+            if ops:
+                seq += 1
+                updates[f"initiative_saves/{save_key}/checkpoint/deltas/{delta_key(seq)}"] = ops
+        else:
+            # Full write - replaces any old base and deltas
+            node = dict(save_data)
+            if state is not None:
+                node["checkpoint"] = {"base": state}
+            updates[f"initiative_saves/{save_key}"] = node
+            seq = 0
+            
+        self.db._db.update(updates)
+        
+        # Remember what was written so the next save can be a delta
+        if state is not None:
+            self._checkpoints[save_key] = {"state": copy.deepcopy(state), "seq": seq}
+        else:
+            self._checkpoints.pop(save_key, None)
+        
+        # Keep the cached index in step
+        if self._index is not None:
+            self._index[save_key] = entry
+    
+    def resolve_save_key(self, save_name: str) -> Optional[str]:
+        """
+        Find the Firebase key for a save by key or display name (case-insensitive).
+        Uses the cached index, so no saves are downloaded.
+        """
+        index = self._load_index()
+        
+        save_key = self._format_save_name(save_name)
+        if save_key in index:
+            return save_key
             
-            # Sort by timestamp (newest first)
-            saves.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-            return saves
+        name_lower = save_name.lower()
+        for key, entry in index.items():
+            if (entry.get("name") or "").lower() == name_lower or key.lower() == name_lower:
+                return key
+                
+        return None
+    
+    def search_saves(self, current: str, limit: int = 25) -> List[str]:
+        """Get save names matching the current input, newest first (for autocomplete)"""
+        current = current.lower()
+        return [
+            save["name"] for save in self._sorted_saves()
+            if current in save["name"].lower()
+        ][:limit]
+    
+    def _sorted_saves(self) -> List[Dict[str, Any]]:
+        """Index entries sorted by timestamp (newest first)"""
+        saves = [dict(entry) for entry in self._load_index().values()]
+        saves.sort(key=lambda x: x.get("timestamp") or "", reverse=True)
+        return saves
+    
+    async def list_saves(self) -> List[Dict[str, Any]]:
+        """List all available saves from the save index"""
+        try:
+            return self._sorted_saves()
         except Exception as e:
             self.debug_print(f"Error listing saves: {e}")
             return []
@@ -133,7 +250,8 @@ class SaveHandler:
             current_turn: int,
             round_number: int,
             name: Optional[str] = None,
-            description: Optional[str] = None
+            description: Optional[str] = None,
+            state: Optional[Dict[str, Any]] = None
         ) -> Tuple[bool, str]:
         """
         Save initiative state to Firebase
@@ -145,6 +263,7 @@ class SaveHandler:
             round_number: Current round number
             name: Optional custom name for the save
             description: Optional description
+            state: Optional full combat checkpoint (InitiativeTracker.get_checkpoint_state)
             
         Returns:
             (success, save_name)
@@ -171,7 +290,7 @@ class SaveHandler:
             
             # Save to Firebase
             if 'initiative_saves' in self.db._refs:
-                self.db._refs['initiative_saves'].child(save_name).set(save_data)
+                await asyncio.to_thread(self._write_save, save_name, save_data, state)
                 self.debug_print(f"Combat state saved to Firebase: {save_name}")
             else:
                 self.debug_print("ERROR: initiative_saves reference not available")
@@ -219,7 +338,8 @@ class SaveHandler:
             interaction: discord.Interaction,
             order: List[str],
             current_turn: int,
-            round_number: int
+            round_number: int,
+            state: Optional[Dict[str, Any]] = None
         ) -> bool:
         """
         Create/update quicksave in Firebase
@@ -229,6 +349,7 @@ class SaveHandler:
             order: List of character names in initiative order
             current_turn: Index of current character in order
             round_number: Current round number
+            state: Optional full combat checkpoint
             
         Returns:
             Success flag
@@ -247,7 +368,7 @@ class SaveHandler:
             
             # Save to Firebase
             if 'initiative_saves' in self.db._refs:
-                self.db._refs['initiative_saves'].child("quicksave").set(save_data)
+                await asyncio.to_thread(self._write_save, "quicksave", save_data, state)
                 self.debug_print(f"Quicksave saved to Firebase: {len(order)} characters, round {round_number}")
             else:
                 self.debug_print("ERROR: initiative_saves reference not available")
@@ -281,7 +402,8 @@ class SaveHandler:
             self,
             order: List[str],
             current_turn: int,
-            round_number: int
+            round_number: int,
+            state: Optional[Dict[str, Any]] = None
         ) -> bool:
         """
         Create/update autosave in Firebase (no interaction response)
@@ -290,6 +412,7 @@ class SaveHandler:
             order: List of character names in initiative order
             current_turn: Index of current character in order
             round_number: Current round number
+            state: Optional full combat checkpoint
             
         Returns:
             Success flag
@@ -311,7 +434,7 @@ class SaveHandler:
             
             # Save to Firebase
             if 'initiative_saves' in self.db._refs:
-                self.db._refs['initiative_saves'].child("autosave").set(save_data)
+                await asyncio.to_thread(self._write_save, "autosave", save_data, state)
                 self.debug_print(f"Autosave updated in Firebase: round {round_number}")
                 return True
             else:
@@ -339,23 +462,18 @@ class SaveHandler:
         """
         self._ensure_firebase_ref()
         try:
-            # Normalize save name
-            save_key = self._format_save_name(save_name)
+            # Resolve the key from the index (handles display names and case)
+            save_key = self.resolve_save_key(save_name)
             
-            # Check for exact match first
+            # Only the matching save is downloaded
             save_data = None
-            if 'initiative_saves' in self.db._refs:
+            if save_key and 'initiative_saves' in self.db._refs:
                 save_data = self.db._refs['initiative_saves'].child(save_key).get()
-            
-            # If not found, try case-insensitive search
-            if not save_data and 'initiative_saves' in self.db._refs:
-                all_saves = self.db._refs['initiative_saves'].get()
-                if all_saves:
-                    # Look through all saves for a name match
-                    for key, data in all_saves.items():
-                        if data.get("name", "").lower() == save_name.lower():
-                            save_data = data
-                            break
+                
+                # Drop index entries whose save no longer exists
+                if not save_data and self._index is not None:
+                    self._index.pop(save_key, None)
+                    self.db._refs['initiative_saves_index'].child(save_key).delete()
             
             # If still not found, notify user
             if not save_data:
@@ -365,6 +483,16 @@ class SaveHandler:
                 )
                 return None
                 
+            # Rebuild the combat checkpoint in memory (base + deltas)
+            checkpoint = save_data.get("checkpoint") or {}
+            state = rebuild_state(checkpoint)
+            if state is not None:
+                # Later writes to this slot can continue the delta chain
+                self._checkpoints[save_key] = {
+                    "state": copy.deepcopy(state),
+                    "seq": len(checkpoint.get("deltas") or {})
+                }
+                
             # Create return object
             return InitiativeSaveData(
                 name=save_data.get("name", save_key),
@@ -372,7 +500,8 @@ class SaveHandler:
                 current_turn=save_data.get("current_turn", 0),
                 round_number=save_data.get("round_number", 1),
                 timestamp=save_data.get("timestamp", ""),
-                description=save_data.get("description")
+                description=save_data.get("description"),
+                state=state
             )
             
         except Exception as e:
@@ -435,6 +564,13 @@ class SaveHandler:
                 inline=False
             )
             
+        # Note whether character state came with the save
+        if save_data.state:
+            restored = len(save_data.state.get("characters") or {})
+            embed.set_footer(text=f"Restored HP, effects, stars and cooldowns for {restored} combatants")
+        else:
+            embed.set_footer(text="Turn order only - character state was not saved with this save")
+            
         return embed
     
     async def enable_autosave(self, interaction: discord.Interaction) -> None:
@@ -457,4 +593,118 @@ class SaveHandler:
                 ephemeral=True
             )
         else:
-            self.autosave_enabled = False
\ No newline at end of file
+            self.autosave_enabled = False
+
+class AutosaveScheduler:
+    """
+    Debounced background autosave for one combat session.
+    
+    Turn changes only mark the session dirty. A background task coalesces
+    those changes and writes at most once every `interval` seconds, or right
+    away when a round ends. Writes are skipped if nothing changed since the
+    last autosave. Writes never overlap, and stopping lets a write that has
+    already started finish before the final flush.
+    """
+    
+    def __init__(
+            self,
+            save_handler: SaveHandler,
+            snapshot: Callable[[], Optional[Tuple[List[str], int, int, Dict[str, Any]]]],
+            interval: float = AUTOSAVE_INTERVAL
+        ):
+        """
+        Args:
+            save_handler: Handler used to write the autosave
+            snapshot: Returns (order, current_turn, round_number, state), or None if there's nothing to save
+            interval: Minimum seconds between writes
+        """
+        self.save_handler = save_handler
+        self.snapshot = snapshot
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self._in_flight: Optional[asyncio.Task] = None
+        self._write_lock = asyncio.Lock()
+        self._dirty = asyncio.Event()
+        self._flush_now = asyncio.Event()
+        self._last_write = 0.0
+        self._last_snapshot = None
+        self.writes = 0
+        self.skipped = 0
+    
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+    
+    def mark_dirty(self, round_boundary: bool = False) -> None:
+        """Note that combat state changed. Never blocks."""
+        self._dirty.set()
+        if round_boundary:
+            self._flush_now.set()
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self, flush: bool = True) -> None:
+        """Stop the background task, writing any pending changes first"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            
+        # Cancelling the loop doesn't cut off a write it had started
+        if self._in_flight:
+            await self._in_flight
+            self._in_flight = None
+            
+        if flush and self._dirty.is_set():
+            self._dirty.clear()
+            await self._write()
+            
+        self._flush_now.clear()
+        self._last_snapshot = None
+    
+    async def _run(self) -> None:
+        """Background loop - wait for changes, debounce, then write"""
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._dirty.wait()
+            
+            # Wait out the rest of the interval unless a round just ended
+            delay = self.interval - (loop.time() - self._last_write)
+            if delay > 0 and not self._flush_now.is_set():
+                try:
+                    await asyncio.wait_for(self._flush_now.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                    
+            self._dirty.clear()
+            self._flush_now.clear()
+            self._in_flight = asyncio.create_task(self._write())
+            await asyncio.shield(self._in_flight)
+            self._in_flight = None
+    
+    async def _write(self) -> None:
+        """Write the autosave if state changed since the last one"""
+        if not self.save_handler.autosave_enabled:
+            return
+            
+        async with self._write_lock:
+            try:
+                snapshot = self.snapshot()
+                if snapshot is None:
+                    return
+                    
+                if snapshot == self._last_snapshot:
+                    self.skipped += 1
+                    return
+                    
+                order, current_turn, round_number, state = snapshot
+                if await self.save_handler.autosave(order, current_turn, round_number, state=state):
+                    self._last_snapshot = snapshot
+                    self._last_write = asyncio.get_running_loop().time()
+                    self.writes += 1
+                    
+            except Exception as e:
+                logger.error(f"Error in background autosave: {e}", exc_info=True)
@@ -25,6 +25,13 @@ MOVES_PER_PAGE = 4
 CATEGORIES = ["All", "Offense", "Utility", "Defense"]
 DEFAULT_CATEGORY = "All"
 
+def combat_cooldowns(bot) -> Tuple[int, Optional[int]]:
+    """Current round and cooldown epoch for move checks, or (1, None) outside combat"""
+    tracker = getattr(bot, 'initiative_tracker', None)
+    if tracker is None or tracker.state.value != 'active':
+        return 1, None
+    return tracker.round_number, tracker.cooldowns.epoch
+
 class ActionSelectMenu(ui.Select):
     """Select menu for choosing an action"""
     
@@ -117,7 +124,7 @@ class ActionMenuView(ui.View):
                 return
                 
             # Check if character has enough stars
-            can_use, reason = self.character.can_use_move(action_info.star_cost, action_info.name)
+            can_use, reason = self.character.can_use_move(action_info.star_cost)
             if not can_use:
                 await interaction.response.send_message(
                     f"Cannot use {action_info.name}: {reason}",
@@ -622,8 +629,7 @@ class ActionHandler:
     def __init__(self, bot = None):
         self.bot = bot
     
-    @staticmethod
-    def create_action_embed(character: Character) -> Embed:
+    def create_action_embed(self, character: Character) -> Embed:
         """Create embed showing action information"""
         embed = Embed(
             title=f"{character.name}'s Actions",
@@ -646,18 +652,21 @@ class ActionHandler:
             inline=False
         )
 
-        # Show any used moves
-        used_moves = getattr(character.action_stars, 'used_moves', {})
-        if used_moves:
+        # Show moves on cooldown in the current combat
+        tracker = getattr(self.bot, 'initiative_tracker', None)
+        if tracker is not None and tracker.state.value == 'active':
             moves_list = []
-            for move, cooldown in used_moves.items():
-                moves_list.append(f"• {move} - Cooldown: {cooldown} round(s)")
-                
-            embed.add_field(
-                name="Used Moves",
-                value="\n".join(moves_list),
-                inline=False
-            )
+            for move_name in character.list_moves():
+                remaining = tracker.cooldown_remaining(character, move_name)
+                if remaining:
+                    moves_list.append(f"• {move_name} - Ready in {remaining} rounds")
+                    
+            if moves_list:
+                embed.add_field(
+                    name="On Cooldown",
+                    value="\n".join(moves_list),
+                    inline=False
+                )
             
         # Add available attack levels based on modifiers
         from utils.stat_helper import StatHelper, StatType
@@ -787,19 +796,13 @@ class ActionHandler:
             
             # Create status text
             status = []
-            if move.cooldown and move.last_used_round:
-                # Check if on cooldown
-                current_round = 1  # Default
-                if hasattr(self.bot, 'initiative_tracker') and self.bot.initiative_tracker.state != 'inactive':
-                    current_round = self.bot.initiative_tracker.round_number
-                    
-                if move.last_used_round >= current_round - move.cooldown:
-                    rounds_left = move.cooldown - (current_round - move.last_used_round)
-                    status.append(f"Cooldown: {rounds_left} round(s)")
+            current_round, epoch = combat_cooldowns(self.bot)
+            rounds_left = move.cooldown_remaining(current_round, epoch)
+            if rounds_left:
+                status.append(f"Cooldown: {rounds_left} round(s)")
                     
             if move.uses is not None:
-                uses_left = move.uses_remaining if move.uses_remaining is not None else move.uses
-                status.append(f"Uses: {uses_left}/{move.uses}")
+                status.append(f"Uses: {move.uses_left(epoch)}/{move.uses}")
                 
             status_text = " | ".join(status) if status else "Ready"
             
@@ -972,21 +975,14 @@ class ActionHandler:
             
         # Add usage info
         usage = []
+        current_round, epoch = combat_cooldowns(self.bot)
         if hasattr(move, 'uses') and move.uses is not None:
-            uses_text = f"Uses: {move.uses}"
-            if hasattr(move, 'uses_remaining') and move.uses_remaining is not None:
-                uses_text = f"Uses: {move.uses_remaining}/{move.uses}"
-            usage.append(uses_text)
+            usage.append(f"Uses: {move.uses_left(epoch)}/{move.uses}")
             
         # Check cooldown status
-        if hasattr(move, 'cooldown') and move.cooldown and hasattr(move, 'last_used_round') and move.last_used_round:
-            current_round = 1  # Default
-            if hasattr(self.bot, 'initiative_tracker') and self.bot.initiative_tracker.state != 'inactive':
-                current_round = self.bot.initiative_tracker.round_number
-                
-            if move.last_used_round >= current_round - move.cooldown:
-                rounds_left = move.cooldown - (current_round - move.last_used_round)
-                usage.append(f"On Cooldown: {rounds_left} round(s) remaining")
+        rounds_left = move.cooldown_remaining(current_round, epoch)
+        if rounds_left:
+            usage.append(f"On Cooldown: {rounds_left} round(s) remaining")
                 
         if usage:
             embed.add_field(
@@ -1084,7 +1080,8 @@ class MoveSelectMenu(ui.Select):
         self, 
         moves: List[MoveData], 
         placeholder: str = "Select a move...",
-        max_options: int = 25
+        max_options: int = 25,
+        epoch: Optional[int] = None
     ):
         # Create options from moves
         options = []
@@ -1109,8 +1106,7 @@ class MoveSelectMenu(ui.Select):
             # Add uses info if available
             uses_text = ""
             if move.uses is not None:
-                uses_remaining = move.uses_remaining if hasattr(move, 'uses_remaining') and move.uses_remaining is not None else move.uses
-                uses_text = f" | Uses:{uses_remaining}/{move.uses}"
+                uses_text = f" | Uses:{move.uses_left(epoch)}/{move.uses}"
             
             # Create category text
             category_text = move.category if hasattr(move, 'category') and move.category else ""
@@ -1155,7 +1151,8 @@ class UseMoveView(ui.View):
         # Add move select menu
         self.move_select = MoveSelectMenu(
             moves, 
-            placeholder="Select a move to use..."
+            placeholder="Select a move to use...",
+            epoch=combat_cooldowns(bot)[1]
         )
         
         # Define a callback for the move selection
@@ -1183,9 +1180,7 @@ class UseMoveView(ui.View):
                     return
                 
                 # Get current round if in combat
-                current_round = 1
-                if hasattr(self.bot, 'initiative_tracker') and self.bot.initiative_tracker.state != 'inactive':
-                    current_round = self.bot.initiative_tracker.round_number
+                current_round, epoch = combat_cooldowns(self.bot)
                 
                 # Check if move is on cooldown first
                 existing_cooldown = False
@@ -1210,8 +1205,11 @@ class UseMoveView(ui.View):
                 
                 # Only check moveset cooldown if no active cooldown effect
                 if not existing_cooldown:
-                    # Check cooldowns in the move data
-                    can_use, reason = move.can_use(current_round)
+                    # Check uses and cooldown (the combat's scheduler during combat)
+                    if epoch is not None:
+                        can_use, reason = self.bot.initiative_tracker.can_use_move(self.character, move)
+                    else:
+                        can_use, reason = move.can_use(current_round, epoch)
                     if not can_use:
                         await interaction.response.send_message(
                             f"{self.character.name} can't use {move.name}: {reason}",
@@ -1319,9 +1317,7 @@ class UseMoveView(ui.View):
                 target_char = self.bot.game_state.get_character(target)
                 
             # Get current round
-            current_round = 1
-            if hasattr(self.bot, 'initiative_tracker') and self.bot.initiative_tracker.state != 'inactive':
-                current_round = self.bot.initiative_tracker.round_number
+            current_round, epoch = combat_cooldowns(self.bot)
                 
             # Import needed modules
             from core.effects.move import MoveEffect
@@ -1351,7 +1347,9 @@ class UseMoveView(ui.View):
             result = await apply_effect(character, move_effect, current_round)
             
             # Mark as used
-            if hasattr(move, 'use'):
+            if epoch is not None:
+                self.bot.initiative_tracker.record_move_use(character, move)
+            elif hasattr(move, 'use'):
                 move.use(current_round)
             
             # Save character
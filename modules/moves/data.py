@@ -85,6 +85,7 @@ class MoveData:
     6: Added move category support
     7: Deprecated save parameters and heat tracking
     8: Added bonus_on_hit, removed deprecated parameters
+    9: Added roll_modifier
     
     Moveset Creation Guidelines:
     ----------------------------
@@ -123,6 +124,13 @@ class MoveData:
     """
     CURRENT_VERSION = 9
 
+    # Keys that older move formats used and from_dict still understands.
+    # They are dropped once a move has been upgraded and saved again.
+    LEGACY_KEYS = (
+        "save_type", "save_dc", "half_on_save", "enable_heat_tracking",
+        "target_selection", "enable_hit_bonus", "advanced_json"
+    )
+
     # Version 1 parameters (base)
     name: str
     description: str
@@ -142,6 +150,7 @@ class MoveData:
     uses_remaining: Optional[int] = None  # Current uses remaining
     cooldown: Optional[int] = None  # Recommended only for 3+ star moves
     last_used_round: Optional[int] = None  # Round when last used (for cooldown tracking)
+    combat_epoch: Optional[int] = None  # Combat that uses_remaining/last_used_round belong to
 
     # Version 3 parameters (basic attack)
     attack_roll: Optional[str] = None  # e.g., "1d20+dex", "1d20+str advantage", "3d20 multihit 2"
@@ -182,6 +191,7 @@ class MoveData:
             "uses_remaining": self.uses_remaining,
             "cooldown": self.cooldown,
             "last_used_round": self.last_used_round,
+            "combat_epoch": self.combat_epoch,
             
             # Version 3+
             "attack_roll": self.attack_roll,
@@ -238,6 +248,7 @@ class MoveData:
             move.uses_remaining = data.get("uses_remaining")
             move.cooldown = data.get("cooldown")
             move.last_used_round = data.get("last_used_round")
+            move.combat_epoch = data.get("combat_epoch")
             
         # Version 3+ parameters
         if version >= 3:
@@ -319,7 +330,7 @@ class MoveData:
         known_keys = {
             "version", "name", "description", "mp_cost", "hp_cost", "star_cost",
             "cast_time", "duration", "cast_description", "uses", "uses_remaining",
-            "cooldown", "last_used_round", "attack_roll", "damage", "crit_range",
+            "cooldown", "last_used_round", "combat_epoch", "attack_roll", "damage", "crit_range",
             "targets", "conditions", "roll_timing", "category", 
             "bonus_on_hit", "aoe_mode", "custom_parameters", "advanced_json", "roll_modifier",
             # Include deprecated keys to prevent them from going to custom_parameters
@@ -338,9 +349,25 @@ class MoveData:
         # Also include custom_parameters from the data
         if "custom_parameters" in data and isinstance(data["custom_parameters"], dict):
             move.custom_parameters.update(data["custom_parameters"])
+        
+        # Everything above has been read into the current layout, so the move
+        # is saved back as the current version from here on
+        move.version = cls.CURRENT_VERSION
             
         return move
     
+    @classmethod
+    def needs_upgrade(cls, data: dict) -> bool:
+        """
+        Check if stored move data is older than the current schema.
+        Used to queue a write-back so old data is only upgraded once.
+        """
+        if not isinstance(data, dict):
+            return False
+        if data.get("version", 1) < cls.CURRENT_VERSION:
+            return True
+        return any(key in data for key in cls.LEGACY_KEYS)
+    
     def validate(self) -> Tuple[bool, Optional[str]]:
         """
         Validate the move data according to established guidelines.
@@ -378,36 +405,58 @@ class MoveData:
         
         return True, None
 
-    def can_use(self, current_round: Optional[int] = None) -> tuple[bool, Optional[str]]:
+    def is_current(self, epoch: Optional[int] = None) -> bool:
+        """
+        Whether the usage record belongs to the given combat epoch.
+        A record from another combat counts as refreshed. Without an epoch
+        (outside combat) the record always applies.
+        """
+        return epoch is None or self.combat_epoch == epoch
+
+    def uses_left(self, epoch: Optional[int] = None) -> Optional[int]:
+        """Uses left this combat (None if uses aren't limited)"""
+        if self.uses is None:
+            return None
+        if self.uses_remaining is None or not self.is_current(epoch):
+            return self.uses
+        return self.uses_remaining
+
+    def cooldown_remaining(self, current_round: Optional[int], epoch: Optional[int] = None) -> int:
+        """Rounds until the move is off cooldown (0 if ready)"""
+        if (not self.cooldown or
+            self.last_used_round is None or
+            current_round is None or
+            not self.is_current(epoch)):
+            return 0
+        return max(0, self.cooldown - (current_round - self.last_used_round))
+
+    def can_use(self, current_round: Optional[int] = None, epoch: Optional[int] = None) -> tuple[bool, Optional[str]]:
         """
         Check if move can be used.
         Returns (can_use, reason) tuple.
         """
         # Check uses
-        if self.uses is not None:
-            if self.uses_remaining is None:
-                self.uses_remaining = self.uses
-            if self.uses_remaining <= 0:
-                return False, f"No uses remaining (0/{self.uses})"
+        uses_left = self.uses_left(epoch)
+        if uses_left is not None and uses_left <= 0:
+            return False, f"No uses remaining (0/{self.uses})"
         
         # Check cooldown
-        if (self.cooldown is not None and 
-            self.last_used_round is not None and
-            current_round is not None):
-            rounds_since = current_round - self.last_used_round
-            if rounds_since < self.cooldown:
-                remaining = self.cooldown - rounds_since
-                return False, f"On cooldown ({remaining} rounds remaining)"
+        remaining = self.cooldown_remaining(current_round, epoch)
+        if remaining:
+            return False, f"On cooldown ({remaining} rounds remaining)"
         
         return True, None
     
-    def use(self, current_round: Optional[int] = None) -> None:
+    def use(self, current_round: Optional[int] = None, epoch: Optional[int] = None) -> None:
         """Mark move as used"""
+        # First use in a new combat starts from a fresh record
+        if not self.is_current(epoch):
+            self.refresh()
+            self.combat_epoch = epoch
+            
         # Track uses if configured
         if self.uses is not None:
-            if self.uses_remaining is None:
-                self.uses_remaining = self.uses
-            self.uses_remaining = max(0, self.uses_remaining - 1)
+            self.uses_remaining = max(0, self.uses_left() - 1)
             
         # Track cooldown if round provided
         if current_round is not None:
@@ -418,6 +467,7 @@ class MoveData:
         if self.uses is not None:
             self.uses_remaining = self.uses
         self.last_used_round = None
+        self.combat_epoch = None
         
     @property
     def needs_target(self) -> bool:
@@ -477,6 +527,14 @@ class Moveset:
         self.moves.clear()
         self.reference = None
     
+    @staticmethod
+    def needs_upgrade(data: dict) -> bool:
+        """Check if any stored move in moveset data needs upgrading"""
+        if not isinstance(data, dict):
+            return False
+        moves_data = data.get("moves") or {}
+        return any(MoveData.needs_upgrade(move_data) for move_data in moves_data.values())
+    
     def to_dict(self) -> dict:
         """Convert to dictionary for storage"""
         base = {
@@ -269,6 +269,7 @@ class MovesetManager:
             if include_cooldowns:
                 move_copy.last_used_round = move.last_used_round
                 move_copy.uses_remaining = move.uses_remaining
+                move_copy.combat_epoch = move.combat_epoch
                 
             export_moveset.add_move(move_copy)
             
@@ -0,0 +1,15 @@
+"""
+Offline benchmarks for the bot's hot paths.
+
+Everything runs against synthetic characters, with no Discord connection or
+database. Timings are divided by a fixed pure-Python calibration loop, so
+baselines recorded on one machine stay comparable on another.
+
+Usage:
+    python -m tests.benchmarks              # run and compare to baselines
+    python -m tests.benchmarks --update     # record new baselines
+    python -m tests.benchmarks -k dice      # only benchmarks matching "dice"
+
+Exits with status 1 if any benchmark is slower than its baseline by more
+than the tolerance (default 1.5x).
+"""
@@ -0,0 +1,52 @@
+"""
+Run the benchmark suite: python -m tests.benchmarks [--update] [-k pattern]
+"""
+
+import argparse
+import sys
+
+from . import cases  # noqa: F401 - registers the benchmarks
+from .harness import (
+    DEFAULT_TOLERANCE, DEFAULT_ROUNDS,
+    cases as registered, run_all, load_baselines, save_baselines, compare, missing_baselines, format_report
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run the hot path benchmarks")
+    parser.add_argument("-k", dest="pattern", help="Only run benchmarks whose name contains this")
+    parser.add_argument("--update", action="store_true", help="Record the results as the new baselines")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Fail when slower than tolerance x baseline")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS)
+    args = parser.parse_args()
+
+    results, skipped = run_all(args.pattern, args.rounds)
+    baselines = load_baselines()
+    print(format_report(results, baselines, skipped))
+
+    if args.update:
+        save_baselines(results)
+        print(f"\nRecorded {len(results)} baselines")
+        return 0
+
+    failed = False
+    regressions = compare(results, baselines, args.tolerance)
+    if regressions:
+        print("\nRegressions:")
+        for name, ratio in regressions:
+            print(f"  {name}: {ratio:.2f}x slower than baseline")
+        failed = True
+
+    # A benchmark without a baseline can't regress, so it fails the run until one is recorded
+    missing = missing_baselines([case.name for case in registered(args.pattern)], baselines)
+    if missing:
+        print("\nNo baseline (record with --update where every dependency is installed):")
+        for name in missing:
+            print(f"  {name}")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
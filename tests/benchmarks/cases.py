@@ -0,0 +1,257 @@
+"""
+Benchmark cases for the bot's hot paths, using synthetic characters.
+
+The attack calculator and initiative tracker are imported inside their
+benchmarks, so without discord installed those cases are reported as
+skipped instead of stopping the whole run.
+"""
+
+import functools
+from types import SimpleNamespace
+
+from .harness import bench
+
+from core.character import Character, Stats, Resources, DefenseStats, StatType
+from core.effects.base import CustomEffect, EffectRegistry
+from core.effects.burn_effect import BurnEffect
+from core.effects.manager import process_effects, register_effects
+from utils.advanced_dice.calculator import DiceCalculator
+
+
+def make_character(name: str = "Bench", effects: int = 0) -> Character:
+    """Synthetic character with the given number of effects"""
+    stats = {stat: 10 + (i * 2) % 8 for i, stat in enumerate(StatType)}
+    character = Character(
+        name=name,
+        stats=Stats(base=dict(stats), modified=dict(stats)),
+        resources=Resources(current_hp=500, max_hp=500, current_mp=50, max_mp=50),
+        defense=DefenseStats(base_ac=14, current_ac=14)
+    )
+    for i in range(effects):
+        character.add_effect(_make_effect(i), round_number=1)
+    return character
+
+
+def _make_effect(i: int):
+    if i % 2 == 0:
+        return BurnEffect("1d4", duration=10)
+    return CustomEffect(f"Blessing {i}", duration=10, description="Feels lucky", bullets=["+1 to rolls"])
+
+
+@functools.lru_cache(maxsize=None)
+def character_data(effects: int = 5) -> dict:
+    return make_character(effects=effects).to_dict()
+
+
+@functools.lru_cache(maxsize=None)
+def game_state(size: int):
+    """GameState with the given number of characters (built once per size)"""
+    from core.state import GameState
+
+    state = GameState()
+    template = make_character()
+    for i in range(size):
+        state.characters[f"Character{i}"] = template
+    return state
+
+
+# Characters
+
+@bench("character.to_dict", setup=lambda: make_character(effects=5))
+def character_to_dict(character):
+    character.to_dict()
+
+
+@bench("character.from_dict", setup=lambda: character_data(5))
+def character_from_dict(data):
+    Character.from_dict(data)
+
+
+# Effects
+
+def _effect_data():
+    register_effects()
+    return character_data(3)["effects"][0]
+
+
+@bench("effects.registry_from_dict", number=500, setup=_effect_data)
+def effect_from_dict(data):
+    EffectRegistry.from_dict(data)
+
+
+def _process_effects_case(count: int):
+    async def process(character):
+        await process_effects(character, 2, character.name)
+
+    bench(f"effects.process[{count}]", number=20, setup=lambda: make_character(effects=count))(process)
+
+
+for _count in (1, 10, 50):
+    _process_effects_case(_count)
+
+
+# Dice
+
+@bench("dice.calculate", number=500, setup=make_character)
+def dice_calculate(character):
+    DiceCalculator.calculate("2d20kh1+5+1d6", character)
+
+
+@bench("dice.calculate_stat", number=500, setup=make_character)
+def dice_calculate_stat(character):
+    DiceCalculator.calculate("1d20+str+prof", character)
+
+
+# Damage
+
+def _damage_setup():
+    from core.effects.combat import ResistanceEffect, TempHPEffect, WeaknessEffect
+
+    attacker, target = make_character("Attacker", effects=10), make_character("Target", effects=10)
+    for effect in (ResistanceEffect("fire", 25), TempHPEffect(5)):
+        target.add_effect(effect, round_number=1)
+    attacker.add_effect(WeaknessEffect("ice", 10), round_number=1)
+    return attacker, target
+
+
+@bench("damage.multihit[30]", number=100, setup=_damage_setup)
+def damage_multihit(args):
+    """Ten hits of three damage components each"""
+    from core.effects.combat import DamageCalculator, DamageType
+    attacker, target = args
+    for _ in range(10):
+        for damage_type in (DamageType.FIRE, DamageType.ICE, DamageType.SLASHING):
+            DamageCalculator.calculate_damage(12, damage_type, target, attacker)
+
+
+# Attacks
+
+def _attack_case(targets: int):
+    def setup():
+        attacker = make_character("Attacker")
+        return attacker, [make_character(f"Target{i}") for i in range(targets)]
+
+    async def attack(args):
+        from utils.advanced_dice.attack_calculator import AttackCalculator, AttackParameters
+        attacker, target_list = args
+        await AttackCalculator.process_attack(AttackParameters(
+            roll_expression="1d20+5",
+            character=attacker,
+            targets=target_list,
+            damage_str="2d6 fire",
+            aoe_mode="multi"
+        ))
+
+    bench(f"attack.process_attack[{targets}]", number=20, setup=setup)(attack)
+
+
+for _count in (1, 5, 20):
+    _attack_case(_count)
+
+
+def _aoe_case(targets: int):
+    def setup():
+        from utils.advanced_dice.aoe_resolver import CompiledAttack
+        attack = CompiledAttack("1d20+5", "2d6 fire, 1d4 slashing", make_character("Attacker"))
+        return attack, [make_character(f"Target{i}") for i in range(targets)]
+
+    def resolve(args):
+        attack, target_list = args
+        attack.resolve(target_list, 'single', apply_damage=True)
+
+    bench(f"aoe.resolve[{targets}]", number=20, setup=setup)(resolve)
+
+
+for _count in (5, 20):
+    _aoe_case(_count)
+
+
+def _saves_case(targets: int):
+    def setup():
+        from core.effects.move import SavingThrowProcessor
+        return SavingThrowProcessor(), make_character("Caster"), [make_character(f"Target{i}") for i in range(targets)]
+
+    def resolve(args):
+        processor, caster, target_list = args
+        check = processor.save_check(caster, "dex", "8+prof+int", half_on_save=True)
+        processor.resolve_saves(caster, target_list, check, "3d6 fire")
+
+    bench(f"saves.resolve[{targets}]", number=20, setup=setup)(resolve)
+
+
+for _count in (5, 20):
+    _saves_case(_count)
+
+
+# Initiative
+
+class StubSender:
+    """Accepts messages and throws them away"""
+    async def send(self, *args, **kwargs):
+        return None
+
+    async def defer(self, *args, **kwargs):
+        return None
+
+    def is_done(self) -> bool:
+        return True
+
+
+class StubDatabase:
+    async def save_character(self, character, debug_paths=None):
+        return None
+
+    async def save_characters(self, characters):
+        return None
+
+
+def _tracker(size: int = 10, effects: int = 3):
+    from core.state import GameState
+    from modules.combat.initiative import InitiativeTracker, CombatState, TurnData
+
+    state = GameState()
+    for i in range(size):
+        character = make_character(f"Combatant{i}", effects=effects)
+        state.characters[character.name] = character
+
+    bot = SimpleNamespace(game_state=state, db=StubDatabase())
+    tracker = InitiativeTracker(bot)
+    tracker.set_quiet_mode(True)
+    tracker.turn_order = [TurnData(name, 1) for name in state.characters]
+    tracker.state = CombatState.ACTIVE
+    tracker.round_number = 1
+    interaction = SimpleNamespace(response=StubSender(), followup=StubSender(), channel=StubSender())
+    return tracker, interaction
+
+
+@bench("initiative.next_turn", number=20, setup=_tracker)
+async def initiative_next_turn(args):
+    tracker, interaction = args
+    await tracker.next_turn(interaction)
+
+
+def _auto_tracker():
+    tracker, interaction = _tracker()
+    for turn in tracker.turn_order[1:]:
+        turn.auto = True
+    return tracker, interaction
+
+
+@bench("initiative.auto_advance", number=20, setup=_auto_tracker)
+async def initiative_auto_advance(args):
+    """A full round of automated NPC turns back to the one player"""
+    tracker, interaction = args
+    await tracker.auto_advance(interaction)
+
+
+# Game state lookups (worst case: the last character added)
+
+def _lookup_case(size: int):
+    def lookup(state):
+        state.get_character(f"character{size - 1}")
+
+    bench(f"state.get_character[{size}]", number=200, setup=lambda: game_state(size))(lookup)
+
+
+for _count in (10, 1_000, 10_000):
+    _lookup_case(_count)
@@ -0,0 +1,167 @@
+"""
+Benchmark registry, runner and baseline comparison.
+"""
+
+import asyncio
+import json
+import os
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "baselines.json")
+DEFAULT_TOLERANCE = 1.5
+DEFAULT_ROUNDS = 5
+CALIBRATION_LOOPS = 200_000
+
+
+@dataclass
+class BenchCase:
+    """A registered benchmark"""
+    name: str
+    func: Callable  # Sync or async, called with the setup result (if any)
+    setup: Optional[Callable] = None  # Runs before every call, not timed
+    number: int = 100  # Calls per round
+
+
+@dataclass
+class BenchResult:
+    name: str
+    seconds: float  # Median time per call
+    normalized: float  # seconds / calibration time
+
+    def to_dict(self) -> Dict[str, float]:
+        return {"seconds": self.seconds, "normalized": self.normalized}
+
+
+_cases: Dict[str, BenchCase] = {}
+
+
+def bench(name: str, number: int = 100, setup: Optional[Callable] = None):
+    """Register a benchmark function"""
+    def decorator(func):
+        _cases[name] = BenchCase(name, func, setup, number)
+        return func
+    return decorator
+
+
+def cases(pattern: Optional[str] = None) -> List[BenchCase]:
+    return [case for name, case in _cases.items() if not pattern or pattern in name]
+
+
+def calibrate(rounds: int = DEFAULT_ROUNDS) -> float:
+    """Time a fixed pure-Python loop, used to normalize results across machines"""
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        total = 0
+        for i in range(CALIBRATION_LOOPS):
+            total += i % 7
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def run_case(case: BenchCase, calibration: float, rounds: int = DEFAULT_ROUNDS) -> BenchResult:
+    """Run a benchmark and return the median time per call"""
+    loop = asyncio.new_event_loop()
+    try:
+        per_call = []
+        for _ in range(rounds):
+            elapsed = 0.0
+            for _ in range(case.number):
+                args = (case.setup(),) if case.setup else ()
+                start = time.perf_counter()
+                result = case.func(*args)
+                if asyncio.iscoroutine(result):
+                    loop.run_until_complete(result)
+                elapsed += time.perf_counter() - start
+            per_call.append(elapsed / case.number)
+    finally:
+        loop.close()
+
+    seconds = statistics.median(per_call)
+    return BenchResult(case.name, seconds, seconds / calibration)
+
+
+def run_all(
+        pattern: Optional[str] = None,
+        rounds: int = DEFAULT_ROUNDS
+    ) -> Tuple[List[BenchResult], Dict[str, str]]:
+    """
+    Run every matching benchmark.
+    Returns (results, skipped) where skipped maps names to the missing module.
+    """
+    calibration = calibrate()
+    results, skipped = [], {}
+    for case in cases(pattern):
+        try:
+            results.append(run_case(case, calibration, rounds))
+        except ModuleNotFoundError as e:
+            skipped[case.name] = e.name or str(e)
+    return results, skipped
+
+
+def load_baselines(path: str = BASELINE_FILE) -> Dict[str, Dict[str, float]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f).get("benchmarks", {})
+    except FileNotFoundError:
+        return {}
+
+
+def save_baselines(results: List[BenchResult], path: str = BASELINE_FILE) -> None:
+    """Merge results into the baseline file (benchmarks that didn't run are kept)"""
+    baselines = load_baselines(path)
+    baselines.update({result.name: result.to_dict() for result in results})
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"benchmarks": dict(sorted(baselines.items()))}, f, indent=2)
+        f.write("\n")
+
+
+def compare(
+        results: List[BenchResult],
+        baselines: Dict[str, Dict[str, float]],
+        tolerance: float = DEFAULT_TOLERANCE
+    ) -> List[Tuple[str, float]]:
+    """Benchmarks slower than tolerance x baseline, as (name, ratio)"""
+    regressions = []
+    for result in results:
+        baseline = baselines.get(result.name)
+        if not baseline:
+            continue
+        ratio = result.normalized / baseline["normalized"]
+        if ratio > tolerance:
+            regressions.append((result.name, ratio))
+    return regressions
+
+
+def missing_baselines(
+        names: List[str],
+        baselines: Dict[str, Dict[str, float]]
+    ) -> List[str]:
+    """Benchmarks with no recorded baseline, whether they ran or were skipped"""
+    return [name for name in names if name not in baselines]
+
+
+def format_report(
+        results: List[BenchResult],
+        baselines: Dict[str, Dict[str, float]],
+        skipped: Dict[str, str]
+    ) -> str:
+    lines = [f"{'benchmark':<36} {'per call':>12} {'vs baseline':>12}"]
+    for result in results:
+        baseline = baselines.get(result.name)
+        ratio = f"{result.normalized / baseline['normalized']:.2f}x" if baseline else "no baseline"
+        lines.append(f"{result.name:<36} {_format_time(result.seconds):>12} {ratio:>12}")
+    for name, module in skipped.items():
+        lines.append(f"{name:<36} {'skipped':>12}  (needs {module})")
+    return "\n".join(lines)
+
+
+def _format_time(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds:.2f}s"
@@ -0,0 +1,25 @@
+"""
+Shared test setup: the import path and a plain character factory.
+"""
+
+import os
+import sys
+from typing import Dict, Optional
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from core.character import Character, Stats, Resources, DefenseStats, StatType
+
+
+def make_character(name: str, hp: int = 50, ac: int = 10,
+                   stats: Optional[Dict[StatType, int]] = None) -> Character:
+    """A character with 10 in every stat unless overridden, and 10 MP"""
+    values = {stat: 10 for stat in StatType}
+    values.update(stats or {})
+    return Character(
+        name=name,
+        stats=Stats(base=dict(values), modified=dict(values)),
+        resources=Resources(current_hp=hp, max_hp=hp, current_mp=10, max_mp=10),
+        defense=DefenseStats(base_ac=ac, current_ac=ac)
+    )
@@ -0,0 +1,53 @@
+"""
+Tests for batched AoE attack resolution.
+"""
+
+import random
+
+from core.character import StatType
+from core.effects.combat import ResistanceEffect
+from utils.advanced_dice.aoe_resolver import CompiledAttack, CompiledDamage, SaveCheck
+from tests.conftest import make_character
+
+
+def test_damage_is_compiled_once():
+    damage = CompiledDamage.compile("2d6+3 slashing, 4 fire")
+    assert [(d.roll_expression, d.damage_type, d.crit_expression) for d in damage] == [
+        ("2d6+3", "slashing", "2d6"),
+        ("4", "fire", None)
+    ]
+
+
+def test_single_mode_shares_roll_and_damage():
+    targets = [make_character(f"T{i}", ac=1) for i in range(30)]
+    resolution = CompiledAttack("10", "2d6 fire").resolve(targets, 'single')
+
+    assert all(outcome.hit for outcome in resolution.outcomes)
+    assert len({outcome.total_damage for outcome in resolution.outcomes}) == 1
+    assert set(resolution.hit_data()) == {t.name for t in targets}
+
+
+def test_hits_follow_each_targets_ac():
+    low, high = make_character("Low", ac=5), make_character("High", ac=15)
+    resolution = CompiledAttack("10", "5 fire").resolve([low, high], 'multi')
+    assert [(o.target.name, o.hit) for o in resolution.outcomes] == [("Low", True), ("High", False)]
+    assert resolution.attack_results()[1].damage_rolls is None
+
+
+def test_saves_and_resistances_when_applying_damage():
+    random.seed(1)
+    resistant = make_character("Resistant", hp=100)
+    resistant.add_effect(ResistanceEffect("fire", 50), round_number=1)
+    plain = make_character("Plain", hp=100)
+
+    save = SaveCheck(StatType.DEXTERITY, dc=100, half_on_save=True)  # Nobody saves
+    resolution = CompiledAttack(None, "20 fire").resolve([resistant, plain], save=save, apply_damage=True)
+
+    assert [o.damage_taken for o in resolution.outcomes] == [10, 20]
+    assert (resistant.resources.current_hp, plain.resources.current_hp) == (90, 80)
+    assert resolution.affected == [resistant, plain]
+
+    # Saving halves the damage
+    easy = SaveCheck(StatType.DEXTERITY, dc=-100, half_on_save=True)
+    outcome = CompiledAttack(None, "20 fire").resolve([plain], save=easy).outcomes[0]
+    assert outcome.saved and outcome.total_damage == 10
@@ -0,0 +1,238 @@
+"""
+Tests for art queue paging, filters and index maintenance against an in-memory database.
+"""
+
+import asyncio
+import copy
+import datetime
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from commands.qol import AddRequestModal, EditRequestModal, QOLCommands
+
+
+class FakeQuery:
+    """order_by_key() queries with start_at/end_at/limit_to_last"""
+    def __init__(self, ref):
+        self.ref = ref
+        self.start = self.end = self.last = None
+
+    def start_at(self, key):
+        self.start = key
+        return self
+
+    def end_at(self, key):
+        self.end = key
+        return self
+
+    def limit_to_last(self, count):
+        self.last = count
+        return self
+
+    def get(self):
+        self.ref.db.reads.append(self.ref.path)
+        data = self.ref.value() or {}
+        keys = sorted(
+            key for key in data
+            if (self.start is None or key >= self.start) and (self.end is None or key <= self.end)
+        )
+        if self.last:
+            keys = keys[-self.last:]
+        return {key: copy.deepcopy(data[key]) for key in keys}
+
+
+class FakeRef:
+    """A path in a FakeDatabase, with the Firebase reference calls the art queue uses"""
+    def __init__(self, db, path=""):
+        self.db = db
+        self.path = path
+
+    @property
+    def key(self):
+        return self.path.rsplit('/', 1)[-1]
+
+    def child(self, key):
+        return FakeRef(self.db, f"{self.path}/{key}" if self.path else key)
+
+    def value(self):
+        node = self.db.tree
+        for part in filter(None, self.path.split('/')):
+            if not isinstance(node, dict) or part not in node:
+                return None
+            node = node[part]
+        return node
+
+    def get(self, shallow=False):
+        self.db.reads.append(self.path)
+        value = copy.deepcopy(self.value())
+        if shallow and isinstance(value, dict):
+            return {key: True for key in value}
+        return value
+
+    def order_by_key(self):
+        return FakeQuery(self)
+
+    def push(self):
+        self.db.pushed += 1
+        return self.child(f"-id{self.db.pushed:04d}")
+
+    def update(self, paths):
+        for path, value in paths.items():
+            self.db.set(f"{self.path}/{path}" if self.path else path, value)
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.tree = {}
+        self.reads = []
+        self.pushed = 0
+
+    def set(self, path, value):
+        parts = path.split('/')
+        nodes = [self.tree]
+        for part in parts[:-1]:
+            nodes.append(nodes[-1].setdefault(part, {}))
+        if value is not None:
+            nodes[-1][parts[-1]] = copy.deepcopy(value)
+            return
+
+        # Like Firebase, parents left empty by a delete disappear too
+        nodes[-1].pop(parts[-1], None)
+        for parent, part, node in reversed(list(zip(nodes, parts, nodes[1:]))):
+            if node:
+                break
+            del parent[part]
+
+    def get(self, path):
+        return FakeRef(self).child(path).value()
+
+
+@pytest.fixture
+def art(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    root = FakeRef(FakeDatabase())
+    cog = QOLCommands(SimpleNamespace(db=SimpleNamespace(_db=root, _refs={})))
+    return cog, root.db
+
+
+def add(cog, title, status="pending", tags=(), date="2026-01-01 12:00"):
+    request = {"title": title, "status": status, "tags": list(tags), "timestamp": date}
+    assert asyncio.run(cog.add_art_request(request))
+    return f"-id{cog.bot.db._db.db.pushed:04d}"
+
+
+def titles(requests):
+    return [request["title"] for request in requests]
+
+
+def test_pages_walk_newest_first(art):
+    cog, _ = art
+    for i in range(7):
+        add(cog, f"R{i}")
+
+    first, cursor = asyncio.run(cog.get_art_page(limit=3))
+    second, cursor2 = asyncio.run(cog.get_art_page(cursor=cursor, limit=3))
+    last, end = asyncio.run(cog.get_art_page(cursor=cursor2, limit=3))
+
+    assert titles(first) == ["R6", "R5", "R4"]
+    assert titles(second) == ["R3", "R2", "R1"]
+    assert titles(last) == ["R0"] and end is None
+
+    # An exactly full last page has no next cursor
+    _, cursor = asyncio.run(cog.get_art_page(cursor=second[0]["id"], limit=3))
+    assert cursor is None
+
+
+def request_reads(db):
+    """Paths read under art_queue, one entry per request read"""
+    return sorted(path for path in db.reads if path.startswith("art_queue/"))
+
+
+def test_filters_read_only_matching_requests(art):
+    cog, db = art
+    add(cog, "Old sketch", status="completed", tags=["sketch"])
+    add(cog, "Portrait", tags=["portrait", "color"])
+    add(cog, "Done portrait", status="completed", tags=["portrait"])
+    for i in range(4):
+        add(cog, f"Filler{i}", tags=["portrait"])
+    add(cog, "Colored", status="completed", tags=["portrait", "color"])
+
+    db.reads.clear()
+    page, cursor = asyncio.run(cog.get_art_page(status="Completed", tags=["portrait"], limit=1))
+    assert titles(page) == ["Colored"]
+    page, cursor = asyncio.run(cog.get_art_page(status="completed", tags=["portrait"], cursor=cursor, limit=1))
+    assert titles(page) == ["Done portrait"] and cursor is None
+
+    page, _ = asyncio.run(cog.get_art_page(tags=["portrait", "color"]))
+    assert titles(page) == ["Colored", "Portrait"]
+
+    # Only the requests on each page (and the lookahead) are read
+    assert "art_queue" not in db.reads
+    assert len(request_reads(db)) == 2 + 1 + 2
+
+
+def test_sparse_matches_read_only_those_requests(art):
+    cog, db = art
+    first = add(cog, "First", status="completed")
+    for i in range(40):
+        add(cog, f"Pending{i}")
+    last = add(cog, "Last", status="completed")
+
+    db.reads.clear()
+    page, cursor = asyncio.run(cog.get_art_page(status="completed"))
+    assert titles(page) == ["Last", "First"] and cursor is None
+    assert "art_queue" not in db.reads
+    assert request_reads(db) == sorted([f"art_queue/{first}", f"art_queue/{last}"])
+
+
+def test_index_follows_add_edit_delete(art):
+    cog, db = art
+    request_id = add(cog, "Dragon", tags=["Scales"])
+    assert db.get(f"art_queue_status/pending/{request_id}") == "2026-01-01 12:00"
+    assert db.get(f"art_queue_tag_index/scales/{request_id}") is True
+
+    updates = {"status": "completed", "tags": ["wings"], "last_edited": "2026-01-02 09:00"}
+    assert asyncio.run(cog.update_art_request(request_id, updates))
+    assert db.get(f"art_queue_status/pending/{request_id}") is None
+    assert db.get(f"art_queue_status/completed/{request_id}") == "2026-01-02 09:00"
+    assert db.get(f"art_queue_tag_index/scales/{request_id}") is None
+    assert db.get(f"art_queue_tag_index/wings/{request_id}") is True
+    assert db.get("art_queue_tags/wings") is True
+
+    assert asyncio.run(cog.delete_art_request(request_id))
+    assert db.get(f"art_queue/{request_id}") is None
+    assert not db.get("art_queue_status") and not db.get("art_queue_tag_index")
+
+
+def test_cleanup_removes_old_completed_requests(art):
+    cog, db = art
+    old_date = (datetime.datetime.now() - datetime.timedelta(days=30)).strftime("%Y-%m-%d %H:%M")
+    new_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
+    old = [add(cog, f"Old{i}", status="completed", tags=["done"], date=old_date) for i in range(3)]
+    recent = add(cog, "Recent", status="completed", tags=["done"], date=new_date)
+
+    db.reads.clear()
+    assert asyncio.run(cog.cleanup_old_completed_requests()) == 3
+    assert "art_queue" not in db.reads
+    assert request_reads(db) == sorted(f"art_queue/{request_id}" for request_id in old)
+    assert all(db.get(f"art_queue/{request_id}") is None for request_id in old)
+    assert list(db.get("art_queue_status/completed")) == [recent]
+    assert list(db.get("art_queue_tag_index/done")) == [recent]
+
+
+def test_typed_local_references_are_refused(art):
+    cog, _ = art
+    add_modal = AddRequestModal(cog, "local:assets/art_references/objects/ab/new.png", "1")
+    assert add_modal.reference_allowed("https://example.com/ref.png")
+    assert add_modal.reference_allowed("local:assets/art_references/objects/ab/new.png")
+    assert not add_modal.reference_allowed("local:/etc/passwd")
+
+    edit_modal = EditRequestModal(cog, {}, "-id0001", current_reference="local:assets/art_references/old.png")
+    assert edit_modal.reference_allowed("local:assets/art_references/old.png")
+    assert not edit_modal.reference_allowed("local:assets/art_references/other.png")
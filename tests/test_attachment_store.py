@@ -0,0 +1,115 @@
+"""
+Tests for content-addressed attachment storage.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.attachment_store import AttachmentStore, AttachmentError
+
+
+async def chunked(data: bytes, size: int = 4):
+    """Async chunk source like aiohttp's iter_chunked"""
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+def store_file(store, data, user="1", name="ref.png"):
+    return asyncio.run(store.store(chunked(data), name, user))
+
+
+def test_same_content_is_stored_once(tmp_path):
+    store = AttachmentStore(str(tmp_path))
+    first = store_file(store, b"image bytes", user="1")
+    second = store_file(store, b"image bytes", user="2", name="copy.png")
+
+    assert first == second
+    assert first.endswith(".png")
+    with open(first, "rb") as f:
+        assert f.read() == b"image bytes"
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".part")]
+
+
+def test_file_deleted_after_last_release(tmp_path):
+    store = AttachmentStore(str(tmp_path))
+    path = store_file(store, b"abc", user="1")
+    store_file(store, b"abc", user="2")
+
+    assert not asyncio.run(store.release(path, "1"))
+    assert os.path.exists(path)
+    assert asyncio.run(store.release(path, "2"))
+    assert not os.path.exists(path)
+
+
+def test_size_limit(tmp_path):
+    store = AttachmentStore(str(tmp_path), max_size=8)
+    with pytest.raises(AttachmentError):
+        store_file(store, b"way more than eight bytes")
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".part")]
+
+
+def test_user_quota(tmp_path):
+    store = AttachmentStore(str(tmp_path), user_quota=10)
+    store_file(store, b"12345678", user="1")
+
+    with pytest.raises(AttachmentError):
+        store_file(store, b"abcdefgh", user="1")
+
+    # Storing a file the user already holds doesn't use more quota
+    store_file(store, b"12345678", user="1")
+    assert asyncio.run(store.usage("1")) == 8
+
+
+def test_index_survives_restart(tmp_path):
+    path = store_file(AttachmentStore(str(tmp_path)), b"persist", user="1")
+    store = AttachmentStore(str(tmp_path))
+    assert asyncio.run(store.usage("1")) == 7
+    assert asyncio.run(store.release(path))
+
+
+def test_release_lowers_the_uploaders_quota(tmp_path):
+    store = AttachmentStore(str(tmp_path))
+    path = store_file(store, b"shared", user="1")
+    store_file(store, b"shared", user="2")
+
+    asyncio.run(store.release(path, 2))
+    assert asyncio.run(store.usage("1")) == 6
+    assert asyncio.run(store.usage("2")) == 0
+
+
+def test_quota_checks_wait_for_writes(tmp_path):
+    store = AttachmentStore(str(tmp_path), user_quota=10)
+
+    async def run():
+        await store._lock.acquire()
+        check = asyncio.create_task(store.check_upload("1", 4))
+        await asyncio.sleep(0.01)
+        assert not check.done()
+        store._lock.release()
+        await check
+
+    asyncio.run(run())
+
+
+def test_paths_outside_the_root_are_never_deleted(tmp_path):
+    store = AttachmentStore(str(tmp_path / "store"))
+    outside = tmp_path / "secret.txt"
+    outside.write_text("keep me")
+    legacy = tmp_path / "store" / "old_upload.png"
+    legacy.parent.mkdir()
+    legacy.write_bytes(b"old")
+    (tmp_path / "store" / "link.txt").symlink_to(outside)
+
+    for path in (str(outside), str(tmp_path / "store" / ".." / "secret.txt"), str(tmp_path / "store" / "link.txt")):
+        assert not asyncio.run(store.release(path))
+    assert outside.read_text() == "keep me"
+
+    # Older uploads inside the root are still cleaned up
+    assert asyncio.run(store.release(str(legacy)))
+    assert not legacy.exists()
@@ -0,0 +1,58 @@
+"""
+Tests for auto-advanced turn summaries.
+"""
+
+import os
+import sys
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from modules.combat.auto_advance import (
+    AutoAdvanceSummary, should_auto_advance, stops_auto_advance, MAX_FIELDS, MAX_FIELD_LENGTH
+)
+
+
+def test_auto_pass_only_when_next_turn_is_automatic():
+    flags = [False, True, False]
+    assert should_auto_advance(flags, 0)
+    assert not should_auto_advance(flags, 1)
+    assert not should_auto_advance(flags, 2)  # Wraps to the first turn
+    assert should_auto_advance(flags, 1, until="Alice")
+    assert not should_auto_advance([], 0)
+
+
+def test_stops_at_until_or_first_manual_turn():
+    assert stops_auto_advance("Alice", auto=False)
+    assert not stops_auto_advance("Goblin", auto=True)
+
+    # With a target, only that character stops it
+    assert not stops_auto_advance("Alice", auto=False, until="Bob")
+    assert stops_auto_advance("Bob", auto=True, until="bob")
+
+
+def test_summary_groups_messages_by_turn():
+    summary = AutoAdvanceSummary()
+    summary.add_messages(["Dropped before any turn"])
+    summary.begin_turn("Goblin", 2)
+    summary.add_messages(["🔥 `Goblin takes 3 fire damage`", "", "Bleeding wears off"])
+    summary.begin_turn("Orc", 2, skipped=True)
+
+    assert summary.fields() == [
+        ("Round 2 • Goblin", "🔥 `Goblin takes 3 fire damage`\n`Bleeding wears off`"),
+        ("Round 2 • Orc (skipped)", "No effects")
+    ]
+
+
+def test_summary_fields_stay_inside_embed_limits():
+    summary = AutoAdvanceSummary()
+    for i in range(40):
+        summary.begin_turn(f"Goblin{i}", 1)
+        summary.add_messages(["x" * 50] * 30)
+
+    fields = summary.fields()
+    assert len(fields) <= MAX_FIELDS
+    assert all(len(value) <= MAX_FIELD_LENGTH for _, value in fields)
+    assert sum(len(name) + len(value) for name, value in fields) <= 6000
+    assert fields[-1][0] == "More Turns"
+    assert f"{40 - (len(fields) - 1)} more turn(s)" in fields[-1][1]
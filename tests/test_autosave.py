@@ -0,0 +1,101 @@
+"""
+Tests for the debounced background autosave.
+"""
+
+import asyncio
+import os
+import sys
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from modules.combat.save_handler import AutosaveScheduler
+
+
+class FakeSaveHandler:
+    """Records autosaves, optionally taking a while to write each one"""
+    def __init__(self, delay: float = 0):
+        self.autosave_enabled = True
+        self.delay = delay
+        self.saves = []
+        self.active = 0
+        self.overlapped = False
+
+    async def autosave(self, order, current_turn, round_number, state=None):
+        self.active += 1
+        self.overlapped |= self.active > 1
+        await asyncio.sleep(self.delay)
+        self.saves.append(round_number)
+        self.active -= 1
+        return True
+
+
+def make_scheduler(handler, state, interval=0.05):
+    return AutosaveScheduler(
+        handler,
+        lambda: (["Rai", "Lizzy"], 0, state["round"], dict(state)),
+        interval=interval
+    )
+
+
+def test_changes_are_debounced_into_one_write():
+    async def run():
+        handler = FakeSaveHandler()
+        state = {"round": 1}
+        scheduler = make_scheduler(handler, state)
+        for turn in range(5):
+            state["turn"] = turn
+            scheduler.mark_dirty()
+        await asyncio.sleep(0.1)
+        await scheduler.stop()
+        return handler
+
+    assert asyncio.run(run()).saves == [1]
+
+
+def test_no_write_when_nothing_changed():
+    async def run():
+        handler = FakeSaveHandler()
+        scheduler = make_scheduler(handler, {"round": 1}, interval=0)
+        scheduler.mark_dirty()
+        await asyncio.sleep(0.01)
+        scheduler.mark_dirty()
+        await asyncio.sleep(0.01)
+        await scheduler.stop()
+        return handler, scheduler
+
+    handler, scheduler = asyncio.run(run())
+    assert handler.saves == [1]
+    assert scheduler.skipped >= 1
+
+
+def test_stop_flushes_pending_changes():
+    async def run():
+        handler = FakeSaveHandler()
+        state = {"round": 1}
+        scheduler = make_scheduler(handler, state, interval=60)
+        scheduler.mark_dirty(round_boundary=True)
+        await asyncio.sleep(0.01)
+        state["round"] = 2
+        scheduler.mark_dirty()
+        await scheduler.stop()
+        return handler
+
+    assert asyncio.run(run()).saves == [1, 2]
+
+
+def test_stop_waits_for_write_in_progress():
+    async def run():
+        handler = FakeSaveHandler(delay=0.05)
+        state = {"round": 1}
+        scheduler = make_scheduler(handler, state, interval=0)
+        scheduler.mark_dirty()
+        await asyncio.sleep(0.01)  # The first write has started
+        state["round"] = 2
+        scheduler.mark_dirty()
+        await scheduler.stop()
+        return handler
+
+    handler = asyncio.run(run())
+    assert handler.saves == [1, 2]
+    assert not handler.overlapped
@@ -0,0 +1,49 @@
+"""
+Tests for the benchmark harness and a quick smoke run of the offline cases.
+The timed runs themselves are done with: python -m tests.benchmarks
+"""
+
+import dataclasses
+import os
+import sys
+
+import pytest
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from tests.benchmarks import cases  # noqa: F401 - registers the benchmarks
+from tests.benchmarks.harness import (
+    BenchResult, cases as registered, run_case, compare, load_baselines, missing_baselines, save_baselines
+)
+
+
+def test_compare_flags_only_slow_benchmarks():
+    baselines = {"fast": {"seconds": 1.0, "normalized": 1.0}, "slow": {"seconds": 1.0, "normalized": 1.0}}
+    results = [
+        BenchResult("fast", 1.2, 1.2),
+        BenchResult("slow", 2.0, 2.0),
+        BenchResult("new", 5.0, 5.0)
+    ]
+    assert compare(results, baselines, tolerance=1.5) == [("slow", 2.0)]
+
+
+def test_baselines_merge(tmp_path):
+    path = str(tmp_path / "baselines.json")
+    save_baselines([BenchResult("a", 1.0, 0.1)], path)
+    save_baselines([BenchResult("b", 2.0, 0.2)], path)
+    assert set(load_baselines(path)) == {"a", "b"}
+
+
+def test_every_registered_case_has_a_baseline():
+    # Including the cases that are skipped here without discord
+    names = [case.name for case in registered()]
+    assert names and missing_baselines(names, load_baselines()) == []
+    assert missing_baselines(["dice.calculate", "unrecorded"], load_baselines()) == ["unrecorded"]
+
+
+@pytest.mark.parametrize("prefix", ["character.", "effects.", "dice.", "state."])
+def test_offline_cases_run(prefix):
+    for case in registered(prefix):
+        result = run_case(dataclasses.replace(case, number=1), calibration=1.0, rounds=1)
+        assert result.seconds > 0
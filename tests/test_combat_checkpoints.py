@@ -0,0 +1,134 @@
+"""
+Tests for delta-encoded combat checkpoints.
+"""
+
+import copy
+
+from modules.combat.checkpoint import (
+    diff_state, apply_delta, rebuild_state, delta_key,
+    capture_combatant, restore_combatant, normalize_combatant
+)
+from tests.conftest import make_character
+
+
+def make_state(hp: int = 30) -> dict:
+    """Checkpoint state for a two character fight"""
+    return {
+        "tracker": {"state": "active", "current_index": 0, "round_number": 2},
+        "characters": {
+            "Rai": {
+                "resources": {"current_hp": hp, "max_hp": 30},
+                "effects": [{"type": "BurnEffect", "name": "Burn"}],
+                "action_stars": {"current_stars": 5, "used_moves": {"Blast": 2}}
+            },
+            "Lizzy": {
+                "resources": {"current_hp": 25, "max_hp": 25},
+                "effects": []
+            }
+        }
+    }
+
+
+class TestDiff:
+    def test_no_changes_is_empty(self):
+        assert diff_state(make_state(), make_state()) == []
+
+    def test_only_changed_values_are_stored(self):
+        ops = diff_state(make_state(hp=30), make_state(hp=12))
+        assert ops == [{"p": ["characters", "Rai", "resources", "current_hp"], "v": 12}]
+
+    def test_removed_keys_are_deleted(self):
+        old = make_state()
+        new = make_state()
+        del new["characters"]["Rai"]["action_stars"]["used_moves"]["Blast"]
+        ops = diff_state(old, new)
+        assert ops == [{"p": ["characters", "Rai", "action_stars", "used_moves", "Blast"], "d": True}]
+
+
+class TestRebuild:
+    def test_apply_matches_new_state(self):
+        old = make_state()
+        new = make_state(hp=4)
+        new["characters"]["Lizzy"]["effects"].append({"type": "CustomEffect", "name": "Shield"})
+        new["tracker"]["current_index"] = 1
+        assert apply_delta(copy.deepcopy(old), diff_state(old, new)) == new
+
+    def test_rebuild_applies_deltas_in_order(self):
+        states = [make_state(hp=hp) for hp in (30, 20, 10)]
+        checkpoint = {
+            "base": states[0],
+            "deltas": {
+                delta_key(2): diff_state(states[1], states[2]),
+                delta_key(1): diff_state(states[0], states[1])
+            }
+        }
+        assert rebuild_state(checkpoint) == states[2]
+
+    def test_missing_base(self):
+        assert rebuild_state({}) is None
+
+
+def strip_empty(value):
+    """What Firebase hands back: empty lists/dicts and None values are dropped"""
+    if isinstance(value, dict):
+        stripped = {k: strip_empty(v) for k, v in value.items()}
+        return {k: v for k, v in stripped.items() if v not in (None, [], {})}
+    if isinstance(value, list):
+        return [strip_empty(v) for v in value]
+    return value
+
+
+def make_fighter(name: str):
+    from modules.moves.data import MoveData
+
+    character = make_character(name, hp=30, ac=12)
+    character.add_move(MoveData(name="Blast", description="Boom", uses=3, cooldown=2))
+    return character
+
+
+class TestRestore:
+    def test_round_trip_through_stripped_state(self):
+        from core.character import StatType
+        from core.effects.base import CustomEffect
+        from core.effects.manager import register_effects
+
+        register_effects()
+        character = make_fighter("Rai")
+        character.effects.append(CustomEffect("Blessed", 2, "Holy light"))
+        character.action_stars.use_stars(1, "Blast")
+        character.moveset.get_move("Blast").use(current_round=1)
+        checkpoint = {"base": strip_empty(capture_combatant(character))}
+
+        # The fight moves on, the effect ends and the sheet is edited
+        character.resources.current_hp = 5
+        character.action_stars.refresh()
+        character.effects = []
+        character.stats.modified[StatType.STRENGTH] = 18
+        character.moveset.get_move("Blast").description = "Bigger boom"
+        character.custom_parameters["note"] = "kept"
+        checkpoint["deltas"] = {
+            delta_key(1): strip_empty(diff_state(checkpoint["base"], capture_combatant(character)))
+        }
+
+        restored = rebuild_state(checkpoint)
+        assert "effects" not in restored
+        restore_combatant(character, restored)
+        assert character.effects == []
+        assert character.resources.current_hp == 5
+        assert character.stats.modified[StatType.STRENGTH] == 18
+
+        # Restoring the base brings combat state back but not sheet edits
+        restore_combatant(character, checkpoint["base"])
+        move = character.moveset.get_move("Blast")
+        assert [effect.name for effect in character.effects] == ["Blessed"]
+        assert character.resources.current_hp == 30
+        assert move.uses_remaining == 2 and move.last_used_round == 1
+        assert move.description == "Bigger boom"
+        assert character.custom_parameters["note"] == "kept"
+        assert character.action_stars.current_stars == 4
+
+    def test_empty_value_without_v_is_not_none(self):
+        state = {"Rai": {"effects": [{"name": "Burn"}]}}
+        apply_delta(state, strip_empty([{"p": ["Rai", "effects"], "v": []}]))
+        assert normalize_combatant(state["Rai"])["effects"] == []
+        assert normalize_combatant(None)["moves"] == {}
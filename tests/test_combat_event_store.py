@@ -0,0 +1,99 @@
+"""
+Tests for the persistent combat event store.
+"""
+
+import asyncio
+import os
+import sys
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from core.state import CombatEventType
+from modules.combat.event_store import CombatEventStore
+
+
+def fill(store: CombatEventStore) -> None:
+    """Three rounds of events for two characters"""
+    for round_number in range(1, 4):
+        for name in ("Rai", "Lizzy"):
+            store.append(CombatEventType.TURN_START, "Turn started", name, round_number)
+            store.append(CombatEventType.DAMAGE_DEALT, f"Hit for {round_number}", name, round_number,
+                         details={"amount": round_number})
+
+
+def test_filters_combine(tmp_path):
+    store = CombatEventStore("c1", directory=str(tmp_path))
+    fill(store)
+
+    events = store.query(character="rai", event_type=CombatEventType.DAMAGE_DEALT)
+    assert [e.round for e in events] == [3, 2, 1]
+    assert all(e.character == "Rai" for e in events)
+
+    events = store.query(event_type="turn_start", round_number=2)
+    assert [e.character for e in events] == ["Lizzy", "Rai"]
+
+
+def test_unfiltered_is_newest_first_with_limit(tmp_path):
+    store = CombatEventStore("c1", directory=str(tmp_path))
+    fill(store)
+    events = store.query(limit=3)
+    assert [e.seq for e in events] == [11, 10, 9]
+
+
+def test_old_events_are_read_from_disk(tmp_path):
+    store = CombatEventStore("c1", directory=str(tmp_path), capacity=4, flush_batch=2)
+    fill(store)
+    store.flush_sync()
+
+    assert len(store._ring) == 4
+    events = store.query(character="Rai", round_number=1)
+    assert [e.message for e in events] == ["Hit for 1", "Turn started"]
+
+
+def test_events_survive_restart(tmp_path):
+    store = CombatEventStore("c1", directory=str(tmp_path))
+    fill(store)
+    asyncio.run(store.flush())
+
+    reopened = CombatEventStore.latest(directory=str(tmp_path))
+    assert reopened.combat_id == "c1"
+    assert len(reopened) == 12
+    assert reopened.characters() == ["Lizzy", "Rai"]
+    assert reopened.query(event_type="damage_dealt", limit=1)[0].details == {"amount": 3}
+
+    # Appending continues the sequence
+    assert reopened.append(CombatEventType.COMBAT_END, "Combat ended").seq == 12
+
+
+def test_batches_are_written_in_append_order(tmp_path):
+    async def run():
+        store = CombatEventStore("c1", directory=str(tmp_path), capacity=50, flush_batch=2)
+        for i in range(40):
+            store.append(CombatEventType.STATUS_UPDATE, f"Event {i}", round_number=1)
+        await store.flush()
+
+    asyncio.run(run())
+    reopened = CombatEventStore.latest(directory=str(tmp_path))
+    assert [e.seq for e in reopened.query(limit=40)] == list(range(39, -1, -1))
+
+
+def test_open_continues_after_highest_seq(tmp_path):
+    path = tmp_path / "c1.jsonl"
+    path.write_text(
+        '{"seq": 5, "type": "status_update", "message": "late"}\n'
+        '{"seq": 2, "type": "status_update", "message": "early"}\n'
+    )
+    assert len(CombatEventStore.open(str(path))) == 6
+
+
+def test_new_combat_prunes_old_logs(tmp_path):
+    for i in range(4):
+        (tmp_path / f"combat_2024010{i}.jsonl").write_text("")
+
+    store = CombatEventStore.start(directory=str(tmp_path), keep=3)
+    store.append(CombatEventType.COMBAT_START, "Combat started")
+    store.flush_sync()
+
+    files = sorted(os.listdir(tmp_path))
+    assert files == ["combat_20240102.jsonl", "combat_20240103.jsonl", f"{store.combat_id}.jsonl"]
@@ -0,0 +1,109 @@
+"""
+Tests for the round-keyed move cooldown scheduler and combat epochs.
+"""
+
+from modules.moves.data import MoveData
+from utils.action_stars import ActionStars
+from utils.cooldowns import CooldownScheduler
+from tests.conftest import make_character
+
+
+def test_release_pops_only_ready_moves():
+    scheduler = CooldownScheduler()
+    scheduler.start("Alice", "Fireball", 1, 3)
+    scheduler.start("Bob", "Slash", 1, 1)
+
+    assert scheduler.remaining("alice", "fireball", 2) == 0  # Unknown character
+    assert scheduler.remaining("Alice", "FIREBALL", 2) == 2
+    assert scheduler.release(2) == [("Bob", "slash")]
+    assert len(scheduler) == 1
+    assert scheduler.release(4) == [("Alice", "fireball")]
+    assert scheduler.remaining("Alice", "Fireball", 4) == 0
+
+
+def test_reused_move_skips_stale_entry():
+    scheduler = CooldownScheduler()
+    scheduler.start("Alice", "Fireball", 1, 2)
+    scheduler.start("Alice", "Fireball", 3, 2)
+
+    assert scheduler.release(3) == []
+    assert scheduler.available_round("Alice", "Fireball") == 5
+    assert scheduler.release(5) == [("Alice", "fireball")]
+
+
+def test_reset_starts_a_new_epoch():
+    scheduler = CooldownScheduler()
+    first = scheduler.epoch
+    scheduler.start("Alice", "Fireball", 1, 2)
+
+    assert scheduler.reset() > first
+    assert len(scheduler) == 0
+    assert scheduler.release(10) == []
+    assert scheduler.reset(first) == first
+
+
+def test_move_record_from_another_combat_counts_as_fresh():
+    move = MoveData("Fireball", description="Boom", cooldown=2, uses=2)
+    move.use(1, epoch=100)
+    move.use(2, epoch=100)
+
+    assert move.can_use(2, epoch=100) == (False, "No uses remaining (0/2)")
+    assert move.uses_left(epoch=100) == 0
+
+    # A new combat needs no reset pass over the moves
+    assert move.can_use(1, epoch=200) == (True, None)
+    assert move.uses_left(epoch=200) == 2
+    move.use(1, epoch=200)
+    assert move.combat_epoch == 200
+    assert move.uses_left(epoch=200) == 1
+    assert move.cooldown_remaining(2, epoch=200) == 1
+
+    restored = MoveData.from_dict(move.to_dict())
+    assert restored.combat_epoch == 200
+    assert restored.uses_left(epoch=200) == 1
+
+
+def test_scheduler_checks_uses_and_cooldown():
+    character = make_character("Alice")
+    move = MoveData("Fireball", description="Boom", cooldown=2, uses=2)
+    character.add_move(move)
+    scheduler = CooldownScheduler()
+
+    assert scheduler.can_use("Alice", move, 1) == (True, None)
+    move.use(1, scheduler.epoch)
+    scheduler.start("Alice", move.name, 1, move.cooldown)
+    assert scheduler.can_use("Alice", move, 2) == (False, "On cooldown (1 rounds remaining)")
+    assert scheduler.can_use("Alice", move, 3) == (True, None)
+
+    move.use(3, scheduler.epoch)
+    assert scheduler.can_use("Alice", move, 5) == (False, "No uses remaining (0/2)")
+
+    # A new combat clears both without touching the move
+    scheduler.reset()
+    assert scheduler.can_use("Alice", move, 1) == (True, None)
+
+
+def test_legacy_star_cooldowns_are_dropped():
+    stars = ActionStars.from_dict({
+        "current_stars": 3,
+        "used_moves": {"Fireball": 99},
+        "cooldown_epoch": 100
+    })
+
+    assert stars.can_use(3) == (True, "")
+    assert stars.can_use(4)[0] is False
+    assert "used_moves" not in stars.to_dict()
+
+
+def test_track_rebuilds_from_saved_moves():
+    character = make_character("Alice")
+    character.add_move(MoveData("Fireball", description="Boom", cooldown=3))
+    character.add_move(MoveData("Slash", description="Cut", cooldown=1))
+
+    scheduler = CooldownScheduler()
+    character.get_move("Fireball").use(2, scheduler.epoch)
+    character.get_move("Slash").use(1, epoch=scheduler.epoch - 1)  # Previous combat
+
+    scheduler.track(character, 3)
+    assert len(scheduler) == 1
+    assert scheduler.available_round("Alice", "Fireball") == 5
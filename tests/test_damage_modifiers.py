@@ -0,0 +1,91 @@
+"""
+Tests for the cached per-character damage modifier table.
+"""
+
+from core.character import Character
+from core.effects.combat import (
+    DamageCalculator, DamageModifierTable, DamageType,
+    ResistanceEffect, TempHPEffect, WeaknessEffect, invalidate_damage_modifiers
+)
+from tests.conftest import make_character
+
+
+def apply(character: Character, effect) -> None:
+    character.add_effect(effect, 1)
+
+
+def test_table_is_reused_between_hits():
+    target = make_character("Target")
+    target.defense.natural_resistances["fire"] = 50
+
+    first = DamageCalculator.calculate_damage(20, DamageType.FIRE, target)
+    table = target._damage_modifiers
+    second = DamageCalculator.calculate_damage(20, "fire", target)
+
+    assert first.final_damage == second.final_damage == 10
+    assert target._damage_modifiers is table
+
+
+def test_applying_and_expiring_effects_rebuilds_table():
+    target = make_character("Target")
+    attacker = make_character("Attacker")
+    assert DamageCalculator.calculate_damage(20, DamageType.FIRE, target, attacker).final_damage == 20
+
+    resistance = ResistanceEffect("fire", 50, duration=2)
+    apply(target, resistance)
+    apply(attacker, WeaknessEffect("fire", 25, duration=2))
+    assert DamageCalculator.calculate_damage(20, DamageType.FIRE, target, attacker).final_damage == 5
+
+    resistance.on_expire(target)
+    target.effects.remove(resistance)
+    assert DamageCalculator.calculate_damage(20, DamageType.FIRE, target, attacker).final_damage == 15
+
+
+def test_weakness_covers_damage_category():
+    attacker = make_character("Attacker")
+    apply(attacker, WeaknessEffect("slashing", 50))
+    table = DamageModifierTable.for_character(attacker)
+    assert table.weakness(DamageType.PIERCING) == 50
+    assert table.weakness(DamageType.FIRE) == 0
+
+
+def test_temp_hp_absorbs_lowest_shield_first_across_hits():
+    target = make_character("Target")
+    big, small = TempHPEffect(10, duration=3), TempHPEffect(4, duration=3)
+    apply(target, big)
+    apply(target, small)
+
+    first = DamageCalculator.calculate_damage(3, DamageType.GENERIC, target)
+    assert (first.absorbed_by_temp_hp, first.final_damage) == (3, 0)
+    assert small.remaining == 1
+
+    second = DamageCalculator.calculate_damage(6, DamageType.GENERIC, target)
+    assert (second.absorbed_by_temp_hp, second.final_damage) == (6, 0)
+    assert (small.remaining, big.remaining) == (0, 5)
+
+    third = DamageCalculator.calculate_damage(8, DamageType.GENERIC, target)
+    assert (third.absorbed_by_temp_hp, third.final_damage) == (5, 3)
+
+
+def test_clearing_effects_list_is_detected():
+    target = make_character("Target")
+    apply(target, TempHPEffect(10, duration=3))
+    DamageCalculator.calculate_damage(1, DamageType.GENERIC, target)
+
+    target.effects = []
+    assert DamageCalculator.calculate_damage(5, DamageType.GENERIC, target).final_damage == 5
+
+
+def test_character_effect_changes_and_direct_defense_edits():
+    target = make_character("Target")
+    shield = TempHPEffect(10, duration=3)
+    apply(target, shield)
+    DamageCalculator.calculate_damage(1, DamageType.GENERIC, target)
+
+    # Removed without expiring, so only the effects version changes
+    assert target.remove_effect(shield)
+    assert DamageCalculator.calculate_damage(5, DamageType.GENERIC, target).final_damage == 5
+
+    target.defense.damage_resistances["fire"] = 50
+    invalidate_damage_modifiers(target)
+    assert DamageCalculator.calculate_damage(20, DamageType.FIRE, target).final_damage == 10
@@ -0,0 +1,171 @@
+"""
+Tests for Database helpers that don't need a Firebase connection.
+"""
+
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from core.character import Character, StatType
+from core.database import BYTES_SAMPLE_EVERY, Database
+from core.state import GameState
+from utils.perf import perf
+
+
+class FakeRoot:
+    """Records multi-path updates instead of sending them"""
+    def __init__(self, on_update=None):
+        self.updates = []
+        self.on_update = on_update
+
+    def update(self, batch):
+        self.updates.append(dict(batch))
+        if self.on_update:
+            self.on_update()
+
+
+class FakeRef:
+    """A node that records shallow reads and deletes"""
+    def __init__(self, data=None):
+        self.data = data
+        self.calls = []
+
+    def get(self, shallow=False):
+        self.calls.append(("get", shallow))
+        if shallow and isinstance(self.data, dict):
+            return {key: True for key in self.data}
+        return self.data
+
+    def delete(self):
+        self.calls.append(("delete",))
+        self.data = None
+
+
+def make_db(root) -> Database:
+    db = Database()
+    db.initialized = True
+    db._db = root
+    return db
+
+
+class TestFlushMigrations:
+    def test_writes_in_batches(self):
+        root = FakeRoot()
+        db = make_db(root)
+        for name in ("A", "B", "C"):
+            db.queue_migration(f"characters/{name}", {"name": name})
+
+        assert asyncio.run(db.flush_migrations(batch_size=2)) == 3
+        assert [list(batch) for batch in root.updates] == [
+            ["characters/A", "characters/B"], ["characters/C"]
+        ]
+        assert db.pending_migrations == 0
+
+    def test_paths_saved_during_flush_are_skipped(self):
+        db = None
+
+        def save_b():
+            # What save_character does for a document saved mid-flush
+            db._pending_migrations.pop("characters/B", None)
+
+        root = FakeRoot(on_update=save_b)
+        db = make_db(root)
+        db.queue_migration("characters/A", {"name": "A"})
+        db.queue_migration("characters/B", {"name": "B"})
+
+        assert asyncio.run(db.flush_migrations(batch_size=1)) == 1
+        assert root.updates == [{"characters/A": {"name": "A"}}]
+
+    def test_failed_batch_is_requeued(self):
+        def fail():
+            raise RuntimeError("offline")
+
+        db = make_db(FakeRoot(on_update=fail))
+        db.queue_migration("characters/A", {"name": "A"})
+
+        assert asyncio.run(db.flush_migrations()) == 0
+        assert db.pending_migrations == 1
+
+
+def test_payload_bytes_are_sampled():
+    db = make_db(FakeRoot())
+    perf.reset()
+    for _ in range(BYTES_SAMPLE_EVERY + 1):
+        db._track("get", {"name": "A"})
+    db._track("delete")
+
+    size = len('{"name": "A"}')
+    assert perf.counters[("firebase.calls", "get")] == BYTES_SAMPLE_EVERY + 1
+    assert perf.counters[("firebase.bytes", "get")] == 2 * size * BYTES_SAMPLE_EVERY
+    assert ("firebase.bytes", "delete") not in perf.counters
+
+
+class TestShallowHelpers:
+    def test_list_keys_reads_only_keys(self):
+        db = make_db(FakeRoot())
+        db._refs['characters'] = FakeRef({"Alice": {"hp": 10}, "Bob": {"hp": 5}})
+        db._refs['empty'] = FakeRef()
+
+        assert db.list_keys('characters') == ["Alice", "Bob"]
+        assert db._refs['characters'].calls == [("get", True)]
+        assert db.list_keys('empty') == []
+
+    def test_exists(self):
+        db = make_db(FakeRoot())
+        assert db._exists(FakeRef({"hp": 10}))
+        assert db._exists(FakeRef(0))
+        assert not db._exists(FakeRef())
+
+    def test_delete_skips_the_existence_check(self):
+        db = make_db(FakeRoot())
+        present, missing = FakeRef({"hp": 10}), FakeRef()
+        db._refs['characters'] = SimpleNamespace(child=lambda name: {"Alice": present}.get(name, missing))
+
+        assert asyncio.run(db.delete_character("Alice"))
+        assert asyncio.run(db.delete_character("Nobody"))
+        assert present.calls == missing.calls == [("delete",)]
+        assert present.data is None
+
+    def test_moveset_delete_reports_missing(self):
+        db = make_db(FakeRoot())
+        present, missing = FakeRef({"moves": {}}), FakeRef()
+        db._refs['shared_movesets'] = SimpleNamespace(child=lambda name: {"Fire": present}.get(name, missing))
+
+        assert not asyncio.run(db.delete_moveset("Nothing"))
+        assert missing.calls == [("get", True)]
+        assert asyncio.run(db.delete_moveset("Fire"))
+        assert present.calls == [("get", True), ("delete",)]
+        assert present.data is None
+
+
+def test_game_state_load_queues_outdated_characters():
+    stats = {stat.value: 12 for stat in StatType}
+    old = {
+        "version": 1,
+        "name": "Old",
+        "stats": {"base": stats, "modified": dict(stats)},
+        "resources": {"current_hp": 20, "max_hp": 20, "current_mp": 10, "max_mp": 10},
+        "defense": {"base_ac": 12, "current_ac": 12},
+        "effects": []
+    }
+    current = Character.upgrade_dict(dict(old, name="Current"))
+    root = FakeRoot()
+    db = make_db(root)
+    db._refs['characters'] = FakeRef({"Old": old, "Current": current})
+
+    async def load():
+        state = GameState()
+        await state.load(db)
+        queued = db.pending_migrations
+        await db._migration_task
+        return state, queued
+
+    state, queued = asyncio.run(load())
+    assert set(state.characters) == {"Old", "Current"}
+    assert queued == 1
+    assert list(root.updates[0]) == ["characters/Old"]
+    assert root.updates[0]["characters/Old"]["version"] == Character.CURRENT_VERSION
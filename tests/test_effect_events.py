@@ -0,0 +1,81 @@
+"""
+Tests for typed effect events (kinds, rendering, and how the manager collects them).
+"""
+
+import asyncio
+
+from core.effects.base import CustomEffect
+from core.effects.burn_effect import BurnEffect
+from core.effects.events import EffectEvent, EffectEventKind, as_events, render_event
+from core.effects.manager import apply_effect, process_effect_events, process_effects
+from tests.conftest import make_character
+
+
+async def run_turns(character, effect, rounds):
+    """Apply an effect, then process the character's turns. Returns (start, end) events per round."""
+    await apply_effect(character, effect, 1)
+    turns = []
+    for round_number in range(1, rounds + 1):
+        _, start, end = await process_effect_events(character, round_number, character.name)
+        turns.append((start, end))
+    return turns
+
+
+def test_render_matches_effect_message_format():
+    effect = CustomEffect("Blessed", 2, "Holy light")
+    event = EffectEvent(
+        EffectEventKind.STATUS, "Blessed", "Alice", "Blessed continues",
+        details=("2 turns remaining",), emoji="🌟"
+    )
+    assert render_event(event) == effect.format_effect_message("Blessed continues", ["2 turns remaining"], "🌟")
+    assert str(event) == render_event(event)
+
+
+def test_hook_strings_are_wrapped_with_hook_kind():
+    event = EffectEvent(EffectEventKind.TICK_DAMAGE, "Burn", "Alice", "Alice takes 3 fire damage", amount=3)
+    events = as_events(["Plain text", None, event], EffectEventKind.EXPIRY, "Burn", "Alice", round_number=4)
+
+    assert [e.kind for e in events] == [EffectEventKind.EXPIRY, EffectEventKind.TICK_DAMAGE]
+    assert render_event(events[0]) == "Plain text"
+    assert events[1].round_number == 4
+    assert as_events(None, EffectEventKind.STATUS, "Burn", "Alice") == []
+
+
+def test_duration_events_follow_effect_lifetime():
+    character = make_character("Alice")
+    turns = asyncio.run(run_turns(character, CustomEffect("Blessed", 2, "Holy light"), 3))
+
+    end_kinds = [[event.kind for event in end] for _, end in turns]
+    assert end_kinds == [
+        [EffectEventKind.STATUS],
+        [EffectEventKind.EXPIRY_WARNING],
+        [EffectEventKind.EXPIRY]
+    ]
+    assert not character.effects
+
+
+def test_burn_reports_tick_damage_data():
+    character = make_character("Alice")
+    turns = asyncio.run(run_turns(character, BurnEffect("3", duration=2), 2))
+
+    ticks = [event for start, _ in turns for event in start if event.kind == EffectEventKind.TICK_DAMAGE]
+    assert [(e.amount, e.resource, e.damage_type) for e in ticks] == [(3, "hp", "fire")] * 2
+    assert character.resources.current_hp == 44
+    assert ticks[0].to_dict()["amount"] == 3
+
+
+def test_expiry_reported_once_and_wrapper_renders():
+    character = make_character("Alice")
+
+    async def run():
+        await apply_effect(character, CustomEffect("Blessed", 1, "Holy light"), 1)
+        await process_effect_events(character, 1, "Alice")
+        return await process_effect_events(character, 2, "Alice")
+
+    _, _, end = asyncio.run(run())
+    assert [(e.kind, e.effect_name) for e in end if e.is_expiry] == [(EffectEventKind.EXPIRY, "Blessed")]
+
+    # The pending expiry feedback is shown at the next turn start, as text for older callers
+    _, start_msgs, end_msgs = asyncio.run(process_effects(character, 3, "Alice"))
+    assert start_msgs == [render_event(end[-1])]
+    assert end_msgs == []
@@ -0,0 +1,50 @@
+"""
+Tests for group check selection, ranking and DC counts.
+"""
+
+from utils.group_checks import GroupCheckResult, MAX_DESCRIPTION, resolve_group
+from tests.conftest import make_character
+
+
+CHARACTERS = {name.lower(): make_character(name) for name in ("Alice", "Bob", "Goblin")}
+
+
+def find(group: str, roster=()):
+    characters, missing = resolve_group(
+        group,
+        lambda name: CHARACTERS.get(name.lower()),
+        lambda: list(CHARACTERS.values()),
+        roster
+    )
+    return [character.name for character in characters], missing
+
+
+def test_group_selectors():
+    assert find("bob, Alice, BOB, Nobody") == (["Bob", "Alice"], ["Nobody"])
+    assert find("combat", roster=["Goblin", "Alice"]) == (["Goblin", "Alice"], [])
+    assert find(" ALL ") == (["Alice", "Bob", "Goblin"], [])
+    assert find(" , ") == ([], [])
+
+
+def test_results_ranked_with_dc_counts():
+    result = GroupCheckResult(dc=12)
+    result.add("bob", 12)
+    result.add("Alice", 12)
+    result.add("Goblin", 7)
+    result.add("Zed", 19, "🎲 `1d20: [19] = 19`")
+
+    assert [roll.character_name for roll in result.ranked()] == ["Zed", "Alice", "bob", "Goblin"]
+    assert result.counts() == (3, 1)
+    assert result.lines()[0] == "✅ **19** Zed • 🎲 `1d20: [19] = 19`"
+    assert result.lines()[-1] == "❌ **7** Goblin"
+    assert GroupCheckResult(rolls=result.rolls).lines()[-1] == "**7** Goblin"
+
+
+def test_description_fits_in_embed():
+    result = GroupCheckResult()
+    for i in range(200):
+        result.add(f"Goblin{i}", i, "x" * 40)
+
+    description = result.description()
+    assert len(description) <= MAX_DESCRIPTION + 30
+    assert description.endswith("more*")
@@ -0,0 +1,60 @@
+"""
+Tests for the queued logging setup and per-subsystem levels.
+"""
+
+import logging
+import os
+import sys
+
+import pytest
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils import logging_config
+from utils.logging_config import setup_logging, stop_logging, set_level, get_levels
+
+
+@pytest.fixture
+def restore_logging():
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield
+    stop_logging()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+    for prefix in logging_config.SUBSYSTEMS.values():
+        logging.getLogger(prefix).setLevel(logging.NOTSET)
+
+
+def test_subsystem_levels(restore_logging):
+    set_level("effects", "debug")
+    assert logging.getLogger("core.effects.move").isEnabledFor(logging.DEBUG)
+    assert get_levels()["effects"] == "debug"
+
+    set_level("all", "warning")
+    assert get_levels()["effects"] == "warning"
+    assert not logging.getLogger("modules.combat.initiative").isEnabledFor(logging.INFO)
+
+
+def test_unknown_subsystem_or_level(restore_logging):
+    with pytest.raises(ValueError):
+        set_level("nope", "debug")
+    with pytest.raises(ValueError):
+        set_level("combat", "loud")
+
+
+def test_records_reach_rotating_file(tmp_path, restore_logging):
+    log_file = tmp_path / "bot.log"
+    setup_logging(log_file=str(log_file), max_bytes=200, backups=2)
+
+    log = logging.getLogger("modules.combat.test")
+    for i in range(20):
+        log.info("turn %s processed", i)
+    stop_logging()
+
+    assert "turn 19 processed" in log_file.read_text()
+    assert (tmp_path / "bot.log.1").exists()
@@ -0,0 +1,54 @@
+"""
+Tests for the event loop lag watchdog.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.perf import PerfStats
+from utils.loop_watchdog import LoopWatchdog
+
+
+def blocking_call():
+    time.sleep(0.3)
+
+
+def test_blocking_call_is_blamed():
+    stats = PerfStats()
+
+    async def run():
+        watchdog = LoopWatchdog(interval=0.02, threshold=0.1, stats=stats)
+        watchdog.start()
+        await asyncio.sleep(0.05)
+        blocking_call()
+        await asyncio.sleep(0.05)
+        await watchdog.stop()
+        return watchdog
+
+    watchdog = asyncio.run(run())
+
+    location, lag, stack = watchdog.recent()[0]
+    assert "test_loop_watchdog.py" in location and "blocking_call" in location
+    assert lag >= 0.15
+    assert "time.sleep" in stack
+    assert stats.top("blocking")[0][0] == location
+
+
+def test_idle_loop_has_no_offenders():
+    stats = PerfStats()
+
+    async def run():
+        watchdog = LoopWatchdog(interval=0.02, threshold=0.1, stats=stats)
+        watchdog.start()
+        await asyncio.sleep(0.2)
+        await watchdog.stop()
+        return watchdog
+
+    watchdog = asyncio.run(run())
+    assert not watchdog.offenders
+    assert stats.top("loop")[0][1].count > 0
@@ -0,0 +1,163 @@
+"""
+Tests for bounded, cached media downloads.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.media_cache import (
+    MediaCache, MediaFetcher, MediaError, CachedMedia, cache_key, sniff_content_type
+)
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
+
+
+class FakeContent:
+    def __init__(self, data):
+        self.data = data
+
+    async def iter_chunked(self, size):
+        for i in range(0, len(self.data), size):
+            yield self.data[i:i + size]
+
+
+class FakeResponse:
+    def __init__(self, status=200, data=b"", headers=None):
+        self.status = status
+        self.content = FakeContent(data)
+        self.headers = headers or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+
+class FakeSession:
+    """Returns queued responses and records request headers"""
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+        self.urls = []
+
+    def get(self, url, headers=None):
+        self.requests.append(headers or {})
+        self.urls.append(url)
+        return self.responses.pop(0)
+
+
+def test_sniffing():
+    assert sniff_content_type(PNG, "application/octet-stream") == "image/png"
+    assert sniff_content_type(b"<!DOCTYPE html><html>", "image/png") == "text/html"
+    assert sniff_content_type(b"????", "video/mp4; codecs=x") == "video/mp4"
+
+
+def test_repeat_fetch_uses_cache(tmp_path):
+    fetcher = MediaFetcher(MediaCache(str(tmp_path)))
+    session = FakeSession(FakeResponse(data=PNG))
+
+    filename, data = asyncio.run(fetcher.fetch(session, "https://x/cat"))
+    assert filename == "cat.png"
+    assert data.read() == PNG
+
+    _, again = asyncio.run(fetcher.fetch(session, "https://x/cat"))
+    assert again.read() == PNG
+    assert len(session.requests) == 1
+
+
+def test_too_large_is_aborted(tmp_path):
+    fetcher = MediaFetcher(MediaCache(str(tmp_path)), max_bytes=50)
+
+    with pytest.raises(MediaError):
+        asyncio.run(fetcher.fetch(FakeSession(FakeResponse(data=PNG)), "https://x/a.png"))
+
+    declared = FakeResponse(data=b"", headers={"Content-Length": "999"})
+    with pytest.raises(MediaError):
+        asyncio.run(fetcher.fetch(FakeSession(declared), "https://x/b.png"))
+
+
+def test_web_pages_are_rejected(tmp_path):
+    fetcher = MediaFetcher(MediaCache(str(tmp_path)))
+    page = FakeResponse(data=b"<html><body>" + b" " * 64, headers={"Content-Type": "text/html"})
+    with pytest.raises(MediaError):
+        asyncio.run(fetcher.fetch(FakeSession(page), "https://x/page"))
+
+
+def test_stale_entry_is_revalidated_from_disk(tmp_path):
+    url = "https://x/cat.png"
+    asyncio.run(MediaCache(str(tmp_path)).put(CachedMedia(
+        url=url, filename="cat.png", content_type="image/png",
+        size=len(PNG), etag='"v1"', fetched_at=time.time() - 10, data=PNG
+    )))
+
+    # New cache instance with a short TTL reads the stale entry from disk
+    fetcher = MediaFetcher(MediaCache(str(tmp_path), ttl=1))
+    session = FakeSession(FakeResponse(status=304))
+    _, data = asyncio.run(fetcher.fetch(session, url))
+
+    assert data.read() == PNG
+    assert session.requests[0] == {"If-None-Match": '"v1"'}
+
+
+def test_memory_lru_budget(tmp_path):
+    cache = MediaCache(str(tmp_path), memory_bytes=250)
+    for name in ("a", "b", "c"):
+        asyncio.run(cache.put(CachedMedia(
+            url=name, filename=name, content_type="image/png",
+            size=100, fetched_at=time.time(), data=b"x" * 100
+        )))
+    assert list(cache._memory) == ["b", "c"]
+
+
+def test_signed_links_share_an_entry(tmp_path):
+    assert cache_key("https://cdn/a.png?ex=1&is=2&hm=3&size=64") == "https://cdn/a.png?size=64"
+
+    fetcher = MediaFetcher(MediaCache(str(tmp_path)))
+    session = FakeSession(FakeResponse(data=PNG))
+    asyncio.run(fetcher.fetch(session, "https://cdn/a.png?ex=1&is=2&hm=3"))
+    _, data = asyncio.run(fetcher.fetch(session, "https://cdn/a.png?ex=4&is=5&hm=6"))
+    assert data.read() == PNG
+    assert len(session.requests) == 1
+
+
+def test_stale_entry_revalidates_with_the_new_link(tmp_path):
+    fetcher = MediaFetcher(MediaCache(str(tmp_path), ttl=0))
+    session = FakeSession(FakeResponse(data=PNG, headers={"ETag": '"v1"'}), FakeResponse(status=304))
+    asyncio.run(fetcher.fetch(session, "https://cdn/a.png?ex=1&hm=old"))
+    asyncio.run(fetcher.fetch(session, "https://cdn/a.png?ex=2&hm=new"))
+
+    assert session.urls[1] == "https://cdn/a.png?ex=2&hm=new"
+    assert session.requests[1] == {"If-None-Match": '"v1"'}
+
+
+def test_disk_budget_evicts_least_recently_used(tmp_path):
+    def entry(name):
+        return CachedMedia(
+            url=f"https://x/{name}", filename=name, content_type="image/png",
+            size=100, fetched_at=time.time(), data=b"x" * 100
+        )
+
+    cache = MediaCache(str(tmp_path), memory_bytes=0, disk_bytes=250)
+    asyncio.run(cache.put(entry("a")))
+    asyncio.run(cache.put(entry("b")))
+    assert asyncio.run(cache.get("https://x/a"))  # a is now more recent than b
+    asyncio.run(cache.put(entry("c")))
+
+    # A new instance indexes what's left on disk
+    reopened = MediaCache(str(tmp_path), memory_bytes=0, disk_bytes=250)
+    assert asyncio.run(reopened.get("https://x/b")) is None
+    assert asyncio.run(reopened.get("https://x/a")).data == b"x" * 100
+    assert len(list(tmp_path.glob("*.bin"))) == 2
+
+    # Files unused for longer than the max age are dropped on the next write
+    old = MediaCache(str(tmp_path), memory_bytes=0, disk_max_age=-1)
+    asyncio.run(old.put(entry("d")))
+    assert list(tmp_path.glob("*.bin")) == []
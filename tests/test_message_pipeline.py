@@ -0,0 +1,121 @@
+"""
+Tests for the outbound message pipeline (coalesced sends, edits, rate limit buckets).
+"""
+
+import asyncio
+import os
+import sys
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.message_pipeline import MessagePipeline, RateLimitBuckets, chunk_embeds
+
+
+class FakeEmbed:
+    """Stands in for discord.Embed: only its length matters here"""
+    def __init__(self, size: int = 100):
+        self.size = size
+
+    def __len__(self):
+        return self.size
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeMessage:
+    def __init__(self, embeds):
+        self.embeds = embeds
+        self.edits = 0
+
+    async def edit(self, embeds):
+        self.edits += 1
+        self.embeds = embeds
+
+
+class RateLimited(Exception):
+    status = 429
+    retry_after = 2.0
+
+
+def test_chunk_embeds_respects_count_and_size_limits():
+    assert [len(chunk) for chunk in chunk_embeds([FakeEmbed()] * 23)] == [10, 10, 3]
+    assert [len(chunk) for chunk in chunk_embeds([FakeEmbed(2500)] * 5)] == [2, 2, 1]
+    assert chunk_embeds([]) == []
+
+
+def test_bucket_delay_follows_window_and_penalty():
+    clock = FakeClock()
+    buckets = RateLimitBuckets(limit=2, window=5.0, clock=clock)
+
+    async def fill():
+        await buckets.acquire("channel")
+        await buckets.acquire("channel")
+    asyncio.run(fill())
+
+    assert buckets.delay("channel") == 5.0
+    assert buckets.delay("other") == 0
+    clock.now = 5.0
+    assert buckets.delay("channel") == 0
+
+    buckets.penalize("channel", 3.0)
+    assert buckets.delay("channel") == 3.0
+
+
+def test_send_coalesces_turn_output():
+    sent = []
+
+    async def send(embeds):
+        sent.append(embeds)
+        return FakeMessage(embeds)
+
+    async def run():
+        pipeline = MessagePipeline()
+        return await pipeline.send(send, [FakeEmbed()] * 12, "channel")
+
+    message = asyncio.run(run())
+    assert [len(embeds) for embeds in sent] == [10, 2]
+    assert message.embeds is sent[-1]
+
+
+def test_edit_in_place_only_when_it_fits():
+    message = FakeMessage([FakeEmbed()])
+
+    async def run():
+        pipeline = MessagePipeline()
+        fits = await pipeline.edit(message, [FakeEmbed()] * 3, "channel")
+        too_many = await pipeline.edit(message, [FakeEmbed()] * 11, "channel")
+        missing = await pipeline.edit(None, [FakeEmbed()], "channel")
+        return fits, too_many, missing
+
+    assert asyncio.run(run()) == (True, False, False)
+    assert message.edits == 1
+    assert len(message.embeds) == 3
+
+
+def test_rate_limited_call_holds_bucket_and_retries(monkeypatch):
+    clock = FakeClock()
+    buckets = RateLimitBuckets(clock=clock)
+    calls = []
+
+    async def send(embeds):
+        calls.append(clock.now)
+        if len(calls) == 1:
+            raise RateLimited()
+        return FakeMessage(embeds)
+
+    async def fake_sleep(seconds):
+        clock.now += seconds
+
+    async def run():
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        return await MessagePipeline(buckets).send(send, [FakeEmbed()], "channel")
+
+    assert asyncio.run(run()) is not None
+    assert calls == [0.0, 2.0]
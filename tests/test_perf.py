@@ -0,0 +1,59 @@
+"""
+Tests for the latency histograms, timing decorator and Prometheus output.
+"""
+
+import asyncio
+import os
+import sys
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.perf import Histogram, PerfStats, perf, timed
+
+
+def test_histogram_percentiles():
+    hist = Histogram()
+    for ms in range(1, 101):
+        hist.observe(ms / 1000)
+
+    assert hist.count == 100
+    assert abs(hist.percentile(50) - 0.050) < 0.002
+    assert abs(hist.percentile(99) - 0.099) < 0.002
+    assert hist.max == 0.1
+    assert sum(hist.buckets) == 100
+
+
+def test_timed_sync_and_async():
+    perf.reset()
+
+    @timed("test.sync")
+    def add(a, b):
+        return a + b
+
+    @timed("test.async")
+    async def wait():
+        await asyncio.sleep(0.01)
+        return "done"
+
+    assert add(1, 2) == 3
+    assert asyncio.run(wait()) == "done"
+
+    names = {name: hist for name, hist in perf.top("span")}
+    assert names["test.sync"].count == 1
+    assert names["test.async"].percentile(50) >= 0.01
+    perf.reset()
+
+
+def test_prometheus_format():
+    stats = PerfStats()
+    stats.observe("command", 'initiative "next"', 0.004)
+    stats.count("firebase.calls", op="get")
+    stats.count("firebase.bytes", 512, op="get")
+
+    text = stats.prometheus()
+    assert "# TYPE rpbot_command_seconds histogram" in text
+    assert 'rpbot_command_seconds_bucket{name="initiative \\"next\\"",le="0.005"} 1' in text
+    assert 'rpbot_command_seconds_count{name="initiative \\"next\\""} 1' in text
+    assert 'rpbot_firebase_calls_total{op="get"} 1' in text
+    assert 'rpbot_firebase_bytes_total{op="get"} 512' in text
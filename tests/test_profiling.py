@@ -0,0 +1,81 @@
+"""
+Tests for the on-demand profile and memory captures.
+"""
+
+import asyncio
+import marshal
+import os
+import sys
+
+import pytest
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils import profiling
+from utils.profiling import CaptureBusy, memory_capture, profile_capture
+
+
+def busy_work():
+    return sum(i * i for i in range(20000))
+
+
+def test_profile_ranks_work_done_during_window():
+    async def run():
+        async def work():
+            for _ in range(5):
+                busy_work()
+                await asyncio.sleep(0.01)
+        task = asyncio.create_task(work())
+        report, raw = await profile_capture(0.2)
+        await task
+        return report, raw
+
+    report, raw = asyncio.run(run())
+    assert "cumulative" in report
+    assert "busy_work" in report
+    assert any(key[2] == "busy_work" for key in marshal.loads(raw))
+
+
+def test_memory_capture_ends_after_commands():
+    async def run():
+        kept = []
+
+        async def commands():
+            await asyncio.sleep(0.01)
+            kept.append([object() for _ in range(5000)])
+            profiling.window.note_command()
+            profiling.window.note_command()
+
+        task = asyncio.create_task(commands())
+        report = await memory_capture(30, commands=2)
+        await task
+        return report
+
+    report = asyncio.run(run())
+    sites = report.splitlines()[3:6]
+    assert any("test_profiling.py" in site for site in sites)
+
+
+def test_only_one_capture_at_a_time():
+    async def run():
+        first = asyncio.create_task(profiling.window.run(0.1))
+        await asyncio.sleep(0)
+        with pytest.raises(CaptureBusy):
+            await profiling.window.run(0.1)
+        await first
+
+    asyncio.run(run())
+
+
+def test_profile_while_busy_raises_capture_busy():
+    async def run():
+        first = asyncio.create_task(profile_capture(0.1))
+        await asyncio.sleep(0)
+        with pytest.raises(CaptureBusy):
+            await profile_capture(0.1)
+        with pytest.raises(CaptureBusy):
+            await memory_capture(0.1)
+        await first
+
+    asyncio.run(run())
@@ -0,0 +1,82 @@
+"""
+Tests for the roll modifier stack applied by DiceCalculator.
+"""
+
+from core.effects.rollmod import RollModifierEffect, RollModifierStack, RollModifierType, add_roll_modifier
+from utils.advanced_dice.calculator import DiceCalculator
+from tests.conftest import make_character
+
+
+def modifier(modifier_type: RollModifierType, value: int, next_roll_only: bool = False) -> RollModifierEffect:
+    return RollModifierEffect(
+        name=f"{modifier_type.value} {value}",
+        modifier_type=modifier_type,
+        value=value,
+        next_roll_only=next_roll_only
+    )
+
+
+def test_stack_folds_advantage_and_bonuses():
+    character = make_character("Alice")
+    add_roll_modifier(character, modifier(RollModifierType.ADVANTAGE, 2))
+    add_roll_modifier(character, modifier(RollModifierType.DISADVANTAGE, 1))
+    add_roll_modifier(character, modifier(RollModifierType.BONUS, 2))
+    add_roll_modifier(character, modifier(RollModifierType.BONUS, -5))
+
+    stack = RollModifierStack.for_character(character)
+    assert (stack.advantage, stack.bonus) == (1, -3)
+    assert RollModifierStack.for_character(character) is stack
+
+
+def test_direct_list_changes_rebuild_the_stack():
+    character = make_character("Alice")
+    add_roll_modifier(character, modifier(RollModifierType.BONUS, 3))
+    stack = RollModifierStack.for_character(character)
+
+    character.custom_parameters['roll_modifiers'].append(modifier(RollModifierType.BONUS, 1))
+    assert RollModifierStack.for_character(character).bonus == 4
+
+    character.custom_parameters['roll_modifiers'] = []
+    rebuilt = RollModifierStack.for_character(character)
+    assert rebuilt is not stack
+    assert (rebuilt.advantage, rebuilt.bonus) == (0, 0)
+
+
+def test_roll_applies_net_advantage_and_bonus():
+    character = make_character("Alice")
+    add_roll_modifier(character, modifier(RollModifierType.ADVANTAGE, 1))
+    add_roll_modifier(character, modifier(RollModifierType.BONUS, 3))
+
+    breakdown = DiceCalculator.calculate("d20 advantage", character)
+    assert len(breakdown.rolls) == 3
+    assert breakdown.advantage_state == 'advantage'
+    assert breakdown.advantage_count == 2
+    assert breakdown.final_result == max(breakdown.rolls) + 3
+    assert "+3" in breakdown.modifiers_applied
+
+    # Disadvantage on the roll cancels the modifier's advantage
+    breakdown = DiceCalculator.calculate("d20 disadvantage", character)
+    assert breakdown.advantage_state is None
+    assert len(breakdown.rolls) == 1
+
+
+def test_next_roll_modifiers_are_consumed():
+    character = make_character("Alice")
+    lasting = modifier(RollModifierType.BONUS, 1)
+    once = modifier(RollModifierType.DISADVANTAGE, 1, next_roll_only=True)
+    add_roll_modifier(character, lasting)
+    add_roll_modifier(character, once)
+
+    first = DiceCalculator.calculate("d20", character)
+    assert first.advantage_state == 'disadvantage'
+    assert once.used
+    assert character.custom_parameters['roll_modifiers'] == [lasting]
+
+    second = DiceCalculator.calculate("d20", character)
+    assert second.advantage_state is None
+    assert second.final_result == second.rolls[0] + 1
+
+    # Flat numbers aren't rolls and don't use modifiers up
+    add_roll_modifier(character, once)
+    assert DiceCalculator.calculate("7", character).final_result == 7
+    assert once in character.custom_parameters['roll_modifiers']
@@ -0,0 +1,69 @@
+"""
+Tests for compiled save DCs and batched saving throws.
+"""
+
+import asyncio
+
+from core.character import Character, StatType
+from core.effects.move import SavingThrowProcessor
+from utils.advanced_dice.aoe_resolver import CompiledDC
+from tests.conftest import make_character
+
+
+def make_combatant(name: str, dex_save: int = 0) -> Character:
+    character = make_character(name, hp=100, stats={StatType.INTELLIGENCE: 16})
+    character.saves[StatType.DEXTERITY] = dex_save
+    return character
+
+
+def test_dc_expression_compiled_once():
+    compiled = CompiledDC.compile("8 + prof + INT")
+    assert CompiledDC.compile("8 + prof + INT") is compiled
+    assert compiled.evaluate(make_combatant("Caster")) == 8 + 2 + 3
+    assert CompiledDC.compile("12-dex+unknown").evaluate(make_combatant("Caster")) == 12
+    assert CompiledDC.compile(None).evaluate(make_combatant("Caster")) == 10
+
+
+def test_save_check_cached_per_source_until_stats_change():
+    processor = SavingThrowProcessor()
+    caster = make_combatant("Caster")
+
+    check = processor.save_check(caster, "dex", "8+prof+int")
+    assert processor.save_check(caster, "dex", "8+prof+int") is check
+    assert check.stat == StatType.DEXTERITY and check.dc == 13
+
+    caster.stats.modified[StatType.INTELLIGENCE] = 20
+    assert processor.save_check(caster, "dex", "8+prof+int").dc == 15
+
+
+def test_batch_returns_pass_fail_and_half_damage():
+    processor = SavingThrowProcessor()
+    caster = make_combatant("Caster")
+    targets = [make_combatant(f"Fail{i}", dex_save=-100) for i in range(20)]
+    targets += [make_combatant(f"Pass{i}", dex_save=100) for i in range(20)]
+
+    check = processor.save_check(caster, "dex", "8+prof+int", half_on_save=True)
+    outcomes = processor.resolve_saves(caster, targets, check, "10 fire")
+
+    assert [outcome.target for outcome in outcomes] == targets
+    failed, passed = outcomes[:20], outcomes[20:]
+    assert not any(outcome.saved for outcome in failed)
+    assert all(outcome.saved for outcome in passed)
+    assert {outcome.damage_taken for outcome in failed} == {10}
+    assert {outcome.damage_taken for outcome in passed} == {5}
+    assert processor.targets_saved == {target.name for target in targets[20:]}
+    assert targets[0].resources.current_hp == 90
+
+
+def test_process_save_formats_results():
+    processor = SavingThrowProcessor()
+    caster = make_combatant("Caster")
+    target = make_combatant("Goblin", dex_save=-100)
+
+    messages = asyncio.run(processor.process_save(
+        caster, [target], "dex", "8+prof+int", "Fireball", damage="12 fire"
+    ))
+    assert len(messages) == 1
+    assert "DEX Save DC 13 | Fireball" in messages[0]
+    assert "Goblin:" in messages[0] and "❌ | 12 damage" in messages[0]
+    assert asyncio.run(processor.process_save(caster, [], "dex", "10", "Fireball")) == []
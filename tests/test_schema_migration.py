@@ -0,0 +1,87 @@
+"""
+Tests for upgrading stored characters and moves to the current schema.
+"""
+
+import os
+import sys
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from core.character import Character, StatType
+from modules.moves.data import MoveData
+
+
+def make_character_data(version: int = 1) -> dict:
+    """Stored character data at the given version"""
+    stats = {stat.value: 12 for stat in StatType}
+    return {
+        "version": version,
+        "name": "Old",
+        "stats": {"base": stats, "modified": dict(stats)},
+        "resources": {"current_hp": 20, "max_hp": 20, "current_mp": 10, "max_mp": 10},
+        "defense": {"base_ac": 12, "current_ac": 12},
+        "effects": []
+    }
+
+
+class TestMoveUpgrade:
+    def test_old_move_needs_upgrade(self):
+        assert MoveData.needs_upgrade({"name": "Hit", "description": "", "version": 3})
+        assert not MoveData.needs_upgrade(MoveData(name="Hit", description="").to_dict())
+
+    def test_legacy_keys_need_upgrade(self):
+        data = MoveData(name="Hit", description="").to_dict()
+        data["enable_heat_tracking"] = True
+        assert MoveData.needs_upgrade(data)
+
+    def test_upgraded_move_is_current(self):
+        data = {"name": "Hit", "description": "", "version": 5, "enable_heat_tracking": True}
+        upgraded = MoveData.from_dict(data).to_dict()
+        assert upgraded["version"] == MoveData.CURRENT_VERSION
+        assert upgraded["bonus_on_hit"] == {"stars": 1}
+        assert "enable_heat_tracking" not in upgraded
+        assert not MoveData.needs_upgrade(upgraded)
+
+
+class TestCharacterUpgrade:
+    def test_old_character_needs_upgrade(self):
+        assert Character.needs_upgrade(make_character_data(version=1))
+
+    def test_upgrade_is_stable(self):
+        upgraded = Character.upgrade_dict(make_character_data(version=1))
+        assert upgraded["version"] == Character.CURRENT_VERSION
+        assert not Character.needs_upgrade(upgraded)
+
+    def test_outdated_move_marks_character(self):
+        data = make_character_data(version=Character.CURRENT_VERSION)
+        data["moveset"] = {"moves": {"hit": {"name": "Hit", "description": "", "version": 2}}}
+        assert Character.needs_upgrade(data)
+
+    def test_unregistered_effects_are_kept(self):
+        data = make_character_data(version=1)
+        data["effects"] = [{"type": "NotARealEffect", "name": "Mystery"}]
+        upgraded = Character.upgrade_dict(data)
+        assert upgraded["effects"] == data["effects"]
+
+    def test_upgrade_keeps_stored_fields(self):
+        data = make_character_data(version=1)
+        data["style"] = "fire"
+        data["effects"] = [{"type": "BurnEffect", "name": "Burn", "damage": "1d6", "source": "Rai"}]
+        upgraded = Character.upgrade_dict(data)
+        assert upgraded["style"] == "fire"
+        assert upgraded["effects"] == data["effects"]
+        assert upgraded["effect_feedback"] == []
+        assert data["version"] == 1
+
+    def test_only_outdated_moves_are_rebuilt(self):
+        current = MoveData(name="Hit", description="").to_dict()
+        data = make_character_data(version=Character.CURRENT_VERSION)
+        data["moveset"] = {"reference": None, "moves": {
+            "hit": current,
+            "old": {"name": "Old", "description": "", "version": 5, "enable_heat_tracking": True}
+        }}
+        moves = Character.upgrade_dict(data)["moveset"]["moves"]
+        assert moves["hit"] is current
+        assert moves["old"]["bonus_on_hit"] == {"stars": 1}
+        assert not Character.needs_upgrade(Character.upgrade_dict(data))
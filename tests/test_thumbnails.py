@@ -0,0 +1,51 @@
+"""
+Tests for the art reference thumbnail cache.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.thumbnails import ThumbnailService
+
+
+def test_non_images_are_skipped(tmp_path):
+    source = tmp_path / "notes.pdf"
+    source.write_bytes(b"%PDF")
+    service = ThumbnailService(str(tmp_path / "thumbs"))
+    assert asyncio.run(service.get(str(source))) is None
+
+
+def test_thumbnail_is_resized_and_cached(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+
+    source = tmp_path / "big.png"
+    Image.new("RGB", (1024, 512), "purple").save(source)
+    service = ThumbnailService(str(tmp_path / "thumbs"), size=(64, 64), max_workers=1)
+
+    async def run():
+        try:
+            first = await service.get(str(source))
+            second = await service.get(str(source))
+            return first, second
+        finally:
+            service.shutdown()
+
+    first, second = asyncio.run(run())
+    assert first == second
+    with Image.open(first) as thumb:
+        assert thumb.size == (64, 32)
+
+
+def test_files_outside_the_source_root_are_not_opened(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+
+    source = tmp_path / "private.png"
+    Image.new("RGB", (8, 8), "purple").save(source)
+    service = ThumbnailService(str(tmp_path / "refs" / "thumbs"), source_root=str(tmp_path / "refs"))
+    assert asyncio.run(service.get(str(tmp_path / "refs" / ".." / "private.png"))) is None
@@ -0,0 +1,284 @@
+"""
+Batched attack resolution for moves against many targets.
+
+The attack and damage are compiled once (damage string split into
+components, crit dice extracted), then hits, crits, saves and damage are
+resolved for every target in a single pass. Results are structured per
+target, so callers can format them, track hits, or apply damage and then
+persist every affected character in one write (Database.save_characters).
+
+AoE modes:
+- single: one attack roll and one damage roll shared by all targets
+- multi: a separate attack and damage roll for each target
+"""
+
+import functools
+import random
+import re
+import logging
+from dataclasses import dataclass, field
+from typing import List, Optional, Dict, Any, Tuple
+
+from core.character import StatType
+from .calculator import DiceCalculator
+from .target_handler import TargetHandler, AttackResult
+
+logger = logging.getLogger(__name__)
+
+CRIT_DICE_PATTERN = re.compile(r'(\d+)?[dD](\d+)')
+DC_TERM_PATTERN = re.compile(r'([+-]?)([^+-]+)')
+
+STAT_NAMES = {
+    'str': StatType.STRENGTH, 'strength': StatType.STRENGTH,
+    'dex': StatType.DEXTERITY, 'dexterity': StatType.DEXTERITY,
+    'con': StatType.CONSTITUTION, 'constitution': StatType.CONSTITUTION,
+    'int': StatType.INTELLIGENCE, 'intelligence': StatType.INTELLIGENCE,
+    'wis': StatType.WISDOM, 'wisdom': StatType.WISDOM,
+    'cha': StatType.CHARISMA, 'charisma': StatType.CHARISMA
+}
+
+
+@dataclass(frozen=True)
+class CompiledDamage:
+    """One damage component with its crit dice worked out ahead of time"""
+    roll_expression: str
+    damage_type: str
+    crit_expression: Optional[str] = None  # Dice rolled again on a crit
+
+    @classmethod
+    def compile(cls, damage_str: Optional[str]) -> Tuple['CompiledDamage', ...]:
+        """Parse a damage string like '2d6+3 slashing, 1d8 fire'"""
+        compiled = []
+        for component in TargetHandler.parse_damage_string(damage_str):
+            dice = CRIT_DICE_PATTERN.match(component.roll_expression)
+            compiled.append(cls(
+                roll_expression=component.roll_expression,
+                damage_type=component.damage_type,
+                crit_expression=dice.group(0) if dice else None
+            ))
+        return tuple(compiled)
+
+
+@dataclass
+class SaveCheck:
+    """A saving throw every target makes against a fixed DC"""
+    stat: Optional[StatType]
+    dc: int
+    half_on_save: bool = False
+
+
+@dataclass(frozen=True)
+class CompiledDC:
+    """A save DC expression like '8+prof+int' parsed once, evaluated per source"""
+    constant: int = 10
+    proficiency: int = 0                          # Times the source's proficiency is added
+    stats: Tuple[Tuple[StatType, int], ...] = ()  # (stat, sign) modifiers added
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def compile(cls, expression: Optional[str]) -> 'CompiledDC':
+        """Parse a DC expression. Empty expressions give DC 10; unknown terms are ignored."""
+        if not expression:
+            return cls()
+
+        constant, proficiency, stats = 0, 0, []
+        for sign, term in DC_TERM_PATTERN.findall(expression.lower().replace(" ", "")):
+            factor = -1 if sign == "-" else 1
+            if term.isdigit():
+                constant += factor * int(term)
+            elif term == "prof":
+                proficiency += factor
+            elif term in STAT_NAMES:
+                stats.append((STAT_NAMES[term], factor))
+            else:
+                logger.debug("Ignoring unknown DC term '%s' in %s", term, expression)
+        return cls(constant, proficiency, tuple(stats))
+
+    def inputs(self, source: 'Character') -> Tuple[int, ...]:
+        """The source values the DC depends on (to tell when a cached DC is stale)"""
+        return (source.base_proficiency, *(source.stats.modified[stat] for stat, _ in self.stats))
+
+    def evaluate(self, source: 'Character') -> int:
+        return (
+            self.constant
+            + self.proficiency * source.base_proficiency
+            + sum(sign * source.stats.get_modifier(stat) for stat, sign in self.stats)
+        )
+
+
+@dataclass
+class TargetOutcome:
+    """How an attack resolved against one target"""
+    target: 'Character'
+    attack_roll: int = 0
+    natural_roll: int = 0
+    hit: bool = True
+    is_crit: bool = False
+    damage_rolls: List[Tuple[int, str]] = field(default_factory=list)  # [(damage, type)]
+    save_roll: Optional[int] = None
+    save_total: Optional[int] = None
+    saved: bool = False
+    damage_taken: int = 0  # After resistances and temp HP (only when damage is applied)
+    absorbed: int = 0
+
+    @property
+    def total_damage(self) -> int:
+        return sum(damage for damage, _ in self.damage_rolls)
+
+    def to_attack_result(self) -> AttackResult:
+        return AttackResult(
+            target_name=self.target.name,
+            attack_roll=self.attack_roll,
+            natural_roll=self.natural_roll,
+            ac=self.target.defense.current_ac,
+            hit=self.hit,
+            is_crit=self.is_crit,
+            damage_rolls=self.damage_rolls or None,
+            total_damage=self.total_damage
+        )
+
+
+@dataclass
+class AoEResolution:
+    """Per-target results of one resolved attack"""
+    formatted_roll: str
+    outcomes: List[TargetOutcome]
+
+    def attack_results(self) -> List[AttackResult]:
+        return [outcome.to_attack_result() for outcome in self.outcomes]
+
+    def hit_data(self) -> Dict[str, Dict[str, Any]]:
+        """Hit tracking data in the shape AttackCalculator.process_attack returns"""
+        return {
+            outcome.target.name: {'hit': True, 'damage': outcome.total_damage, 'is_crit': outcome.is_crit}
+            for outcome in self.outcomes if outcome.hit
+        }
+
+    @property
+    def affected(self) -> List['Character']:
+        """Targets whose state changed and need saving"""
+        return [outcome.target for outcome in self.outcomes if outcome.damage_taken or outcome.absorbed]
+
+
+class CompiledAttack:
+    """An attack roll and damage string compiled once, resolved against many targets"""
+
+    def __init__(
+            self,
+            roll_expression: Optional[str],
+            damage_str: Optional[str] = None,
+            character: Optional['Character'] = None,
+            crit_range: int = 20,
+            crits_always_hit: bool = False
+        ):
+        self.roll_expression = roll_expression
+        self.damage = CompiledDamage.compile(damage_str)
+        self.character = character
+        self.crit_range = crit_range
+        self.crits_always_hit = crits_always_hit
+
+    def roll_attack(self) -> Tuple[int, int, str]:
+        """Roll the attack. Returns (total, natural roll, formatted roll)."""
+        total, formatted, _ = DiceCalculator.calculate_complex(
+            self.roll_expression,
+            self.character,
+            concise=True
+        )
+        return total, TargetHandler.extract_natural_roll(formatted), formatted
+
+    def roll_damage(self, is_crit: bool = False) -> List[Tuple[int, str]]:
+        """Roll every damage component, adding the dice again on a crit"""
+        results = []
+        for component in self.damage:
+            total, _, _ = DiceCalculator.calculate_complex(
+                component.roll_expression,
+                self.character,
+                concise=True
+            )
+            if is_crit and component.crit_expression:
+                crit_total, _, _ = DiceCalculator.calculate_complex(
+                    component.crit_expression,
+                    self.character,
+                    concise=True
+                )
+                total += crit_total
+            results.append((total, component.damage_type))
+        return results
+
+    def resolve(
+            self,
+            targets: List['Character'],
+            aoe_mode: str = 'single',
+            save: Optional[SaveCheck] = None,
+            apply_damage: bool = False
+        ) -> AoEResolution:
+        """
+        Resolve the attack against every target in one pass.
+
+        Args:
+            targets: Characters being attacked
+            aoe_mode: 'single' (one shared roll) or 'multi' (a roll per target)
+            save: Optional saving throw each target makes against the damage
+            apply_damage: Apply damage through each target's resistances and temp HP
+        """
+        formatted_roll = ""
+        shared = None  # (total, natural, is_crit, damage) for single mode
+        damage_cache: Dict[bool, List[Tuple[int, str]]] = {}
+
+        if self.roll_expression and aoe_mode == 'single':
+            total, natural, formatted_roll = self.roll_attack()
+            shared = (total, natural, natural >= self.crit_range)
+
+        outcomes = []
+        for target in targets:
+            outcome = TargetOutcome(target=target)
+
+            # Attack roll
+            if self.roll_expression:
+                if shared:
+                    outcome.attack_roll, outcome.natural_roll, outcome.is_crit = shared
+                else:
+                    outcome.attack_roll, outcome.natural_roll, formatted = self.roll_attack()
+                    outcome.is_crit = outcome.natural_roll >= self.crit_range
+                    formatted_roll = formatted_roll or formatted
+                outcome.hit = outcome.attack_roll >= target.defense.current_ac or (
+                    self.crits_always_hit and outcome.is_crit
+                )
+
+            # Saving throw
+            if save and outcome.hit:
+                outcome.save_roll = random.randint(1, 20)
+                outcome.save_total = outcome.save_roll + target.saves.get(save.stat, 0)
+                outcome.saved = outcome.save_total >= save.dc
+
+            # Damage: rolled once for a shared roll, per target otherwise
+            if outcome.hit and self.damage and not (outcome.saved and not save.half_on_save):
+                if shared:
+                    if outcome.is_crit not in damage_cache:
+                        damage_cache[outcome.is_crit] = self.roll_damage(outcome.is_crit)
+                    damage_rolls = damage_cache[outcome.is_crit]
+                else:
+                    damage_rolls = self.roll_damage(outcome.is_crit)
+                if outcome.saved:
+                    damage_rolls = [(damage // 2, damage_type) for damage, damage_type in damage_rolls]
+                outcome.damage_rolls = list(damage_rolls)
+
+                if apply_damage:
+                    self._apply(outcome)
+
+            outcomes.append(outcome)
+
+        return AoEResolution(formatted_roll, outcomes)
+
+    def _apply(self, outcome: TargetOutcome) -> None:
+        """Apply an outcome's damage through the target's resistances and temp HP"""
+        # Import here to avoid circular import
+        from core.effects.combat import DamageCalculator
+
+        target = outcome.target
+        for damage, damage_type in outcome.damage_rolls:
+            result = DamageCalculator.calculate_damage(damage, damage_type, target, self.character)
+            outcome.damage_taken += result.final_damage
+            outcome.absorbed += result.absorbed_by_temp_hp
+        if outcome.damage_taken:
+            target.resources.current_hp = max(0, target.resources.current_hp - outcome.damage_taken)
@@ -10,6 +10,7 @@ from dataclasses import dataclass
 from discord import Embed, Color
 from .calculator import DiceCalculator
 from .target_handler import TargetHandler, AttackResult, DamageComponent
+from .aoe_resolver import CompiledAttack
 
 logger = logging.getLogger(__name__)
 
@@ -175,6 +176,16 @@ class AttackCalculator:
         
         return "".join(parts)
 
+    @staticmethod
+    def compile(params: AttackParameters) -> CompiledAttack:
+        """Compile the attack and damage once so they can be resolved for many targets"""
+        return CompiledAttack(
+            params.roll_expression,
+            params.damage_str,
+            params.character,
+            params.crit_range
+        )
+
     @staticmethod
     async def process_attack(params: AttackParameters) -> Tuple[str, Dict[str, Any]]:
         """
@@ -197,22 +208,12 @@ class AttackCalculator:
             if not params.targets:
                 if params.damage_str:
                     # Attack roll
-                    attack_total, attack_formatted, _ = DiceCalculator.calculate_complex(
-                        params.roll_expression,
-                        params.character,
-                        concise=True
-                    )
-                    
-                    # Get natural roll
-                    natural_roll = TargetHandler.extract_natural_roll(attack_formatted)
+                    attack = AttackCalculator.compile(params)
+                    attack_total, natural_roll, attack_formatted = attack.roll_attack()
                     is_crit = natural_roll >= params.crit_range
                     
                     # Calculate damage
-                    damage_components = TargetHandler.parse_damage_string(params.damage_str)
-                    for comp in damage_components:
-                        comp.character = params.character
-                        
-                    damage_rolls = TargetHandler.calculate_damage(damage_components, is_crit)
+                    damage_rolls = attack.roll_damage(is_crit)
                     total_damage = sum(dmg for dmg, _ in damage_rolls)
                     
                     # Format attack result
@@ -256,6 +257,7 @@ class AttackCalculator:
                 
                 results = []
                 hit_data = {}
+                attack = AttackCalculator.compile(params)
                 
                 # Each roll in multihit is a separate attack
                 rolls = TargetHandler.extract_all_rolls(attack_formatted)
@@ -298,10 +300,7 @@ class AttackCalculator:
                     damage_rolls = None
                     total_damage = 0
                     if hit and params.damage_str:
-                        damage_components = TargetHandler.parse_damage_string(params.damage_str)
-                        for comp in damage_components:
-                            comp.character = params.character
-                        damage_rolls = TargetHandler.calculate_damage(damage_components, is_crit)
+                        damage_rolls = attack.roll_damage(is_crit)
                         total_damage = sum(dmg for dmg, _ in damage_rolls)
                     
                     result = AttackResult(
@@ -332,124 +331,20 @@ class AttackCalculator:
                 
                 return message, hit_data
 
-            # AoE single mode (one roll against multiple targets)
-            if params.aoe_mode == 'single':
-                # Make a single attack roll for all targets
-                attack_total, attack_formatted, _ = DiceCalculator.calculate_complex(
-                    params.roll_expression,
-                    params.character,
-                    concise=True
-                )
-                
-                # Get natural roll
-                natural_roll = TargetHandler.extract_natural_roll(attack_formatted)
-                is_crit = natural_roll >= params.crit_range
-                
-                results = []
-                hit_data = {}
-                
-                for target in params.targets:
-                    hit = attack_total >= target.defense.current_ac
-                    
-                    # Calculate damage if hit
-                    damage_rolls = None
-                    total_damage = 0
-                    if hit and params.damage_str:
-                        damage_components = TargetHandler.parse_damage_string(params.damage_str)
-                        for comp in damage_components:
-                            comp.character = params.character
-                        damage_rolls = TargetHandler.calculate_damage(damage_components, is_crit)
-                        total_damage = sum(dmg for dmg, _ in damage_rolls)
-                    
-                    result = AttackResult(
-                        target_name=target.name,
-                        attack_roll=attack_total,
-                        natural_roll=natural_roll,
-                        ac=target.defense.current_ac,
-                        hit=hit,
-                        is_crit=is_crit,
-                        damage_rolls=damage_rolls,
-                        total_damage=total_damage
-                    )
-                    
-                    results.append(result)
-                    
-                    # Store in hit data for bonus tracking
-                    if hit:
-                        hit_data[target.name] = {'hit': True, 'damage': total_damage, 'is_crit': is_crit}
-                
-                message = AttackCalculator.format_attack_output(
-                    attack_formatted,
-                    results,
-                    False,
-                    params.reason,
-                    'single'
-                )
-                
-                return message, hit_data
-                
-            # AoE multi mode (separate roll for each target)
-            else:  # params.aoe_mode == 'multi'
-                results = []
-                hit_data = {}
-                
-                # Store first roll's formatted output for display
-                _, first_formatted, _ = DiceCalculator.calculate_complex(
-                    params.roll_expression,
-                    params.character,
-                    concise=True
-                )
-                
-                for target in params.targets:
-                    # Make separate attack roll for each target
-                    attack_total, attack_formatted, _ = DiceCalculator.calculate_complex(
-                        params.roll_expression,
-                        params.character,
-                        concise=True
-                    )
-                    
-                    # Get natural roll
-                    natural_roll = TargetHandler.extract_natural_roll(attack_formatted)
-                    is_crit = natural_roll >= params.crit_range
-                    
-                    hit = attack_total >= target.defense.current_ac
-                    
-                    # Calculate damage if hit
-                    damage_rolls = None
-                    total_damage = 0
-                    if hit and params.damage_str:
-                        damage_components = TargetHandler.parse_damage_string(params.damage_str)
-                        for comp in damage_components:
-                            comp.character = params.character
-                        damage_rolls = TargetHandler.calculate_damage(damage_components, is_crit)
-                        total_damage = sum(dmg for dmg, _ in damage_rolls)
-                    
-                    result = AttackResult(
-                        target_name=target.name,
-                        attack_roll=attack_total,
-                        natural_roll=natural_roll,
-                        ac=target.defense.current_ac,
-                        hit=hit,
-                        is_crit=is_crit,
-                        damage_rolls=damage_rolls,
-                        total_damage=total_damage
-                    )
-                    
-                    results.append(result)
-                    
-                    # Store in hit data for bonus tracking
-                    if hit:
-                        hit_data[target.name] = {'hit': True, 'damage': total_damage, 'is_crit': is_crit}
-                
-                message = AttackCalculator.format_attack_output(
-                    first_formatted,
-                    results,
-                    False,
-                    params.reason,
-                    'multi'
-                )
-                
-                return message, hit_data
+            # AoE: resolve every target in one pass with the attack compiled once
+            # (single mode shares one roll, multi mode rolls for each target)
+            aoe_mode = 'single' if params.aoe_mode == 'single' else 'multi'
+            resolution = AttackCalculator.compile(params).resolve(params.targets, aoe_mode)
+            
+            message = AttackCalculator.format_attack_output(
+                resolution.formatted_roll,
+                resolution.attack_results(),
+                False,
+                params.reason,
+                aoe_mode
+            )
+            
+            return message, resolution.hit_data()
 
         except Exception as e:
             logger.error(f"Error in process_attack: {str(e)}", exc_info=True)
@@ -1,6 +1,11 @@
 """
 Calculator for dice expressions with improved advantage/disadvantage handling.
 Now with roll modifier effect support and fixed multihit advantage.
+
+Roll modifier effects are read from the character's RollModifierStack
+(core/effects/rollmod.py) and applied to the parsed roll: the net
+advantage level changes how many dice are kept from, the flat bonus is
+added to the total.
 """
 
 from typing import List, Tuple, Dict, Any, Optional
@@ -9,7 +14,9 @@ import re
 import random
 from .base import DieRoll, RollResult, DicePool, DieType
 from core.character import StatType
+from core.effects.rollmod import RollModifierStack
 from ..stat_helper import StatHelper
+from ..perf import timed
 import logging
 
 logger = logging.getLogger(__name__)
@@ -43,171 +50,12 @@ class DiceCalculator:
     MULTIHIT_PATTERN = re.compile(r'\bmultihit\s+(\d+)\b', re.IGNORECASE)
     
     @classmethod
-    def apply_roll_modifiers(cls, expression: str, character: 'Character') -> Tuple[str, List[str], bool]:
-        """
-        Check for and apply roll modifiers from character effects.
-        
-        Returns:
-        - Modified expression
-        - List of applied modifier messages
-        - Whether any "next roll only" effects were used
-        """
-        if not character or not hasattr(character, 'custom_parameters'):
-            return expression, [], False
-            
-        # Check if roll_modifiers exist in custom parameters
-        roll_modifiers = character.custom_parameters.get('roll_modifiers', [])
-        if not roll_modifiers:
-            return expression, [], False
-            
-        # Initialize tracking
-        applied_messages = []
-        used_next_roll = False
-        
-        # Track current advantage/disadvantage state
-        has_advantage = cls.ADVANTAGE_PATTERN.search(expression) is not None
-        has_disadvantage = cls.DISADVANTAGE_PATTERN.search(expression) is not None
-        
-        # Extract advantage/disadvantage count if specified
-        adv_count = 0
-        if has_advantage:
-            adv_match = re.search(r'advantage\s+(\d+)', expression, re.IGNORECASE)
-            if adv_match:
-                adv_count = int(adv_match.group(1))
-            else:
-                adv_count = 1
-                
-        disadv_count = 0
-        if has_disadvantage:
-            disadv_match = re.search(r'disadvantage\s+(\d+)', expression, re.IGNORECASE)
-            if disadv_match:
-                disadv_count = int(disadv_match.group(1))
-            else:
-                disadv_count = 1
-                
-        # Process each roll modifier
-        for modifier in roll_modifiers[:]:  # Copy the list since we might modify it
-            if not hasattr(modifier, 'modifier_type'):
-                continue
-                
-            # Apply based on modifier type
-            modifier_type = modifier.modifier_type.value
-            
-            if modifier_type == 'bonus':
-                # Add numeric bonus - handle both positive and negative
-                sign = "+" if modifier.value >= 0 else ""
-                new_expr = expression + f"{sign}{modifier.value}"
-                expression = new_expr
-                applied_messages.append(f"Applied {sign}{modifier.value} from {modifier.name}")
-                
-            elif modifier_type == 'advantage':
-                # Apply advantage effect
-                if has_disadvantage:
-                    # If roll already has disadvantage, reduce it
-                    if modifier.value >= disadv_count:
-                        # Disadvantage is completely canceled
-                        expression = expression.replace('disadvantage', '').strip()
-                        if ' disadvantage' in expression:
-                            expression = expression.replace(' disadvantage', '')
-                        has_disadvantage = False
-                        disadv_count = 0
-                        has_advantage = True
-                        adv_count = modifier.value - disadv_count
-                        if adv_count > 0:
-                            expression += f" advantage {adv_count}"
-                        applied_messages.append(f"Disadvantage canceled and converted to Advantage {adv_count} by {modifier.name}")
-                    else:
-                        # Disadvantage is reduced but not canceled
-                        remaining = disadv_count - modifier.value
-                        expression = expression.replace(f"disadvantage {disadv_count}", f"disadvantage {remaining}")
-                        if "disadvantage" in expression and not "disadvantage " in expression:
-                            expression = expression.replace("disadvantage", f"disadvantage {remaining}")
-                        disadv_count = remaining
-                        applied_messages.append(f"Disadvantage reduced to {remaining} by {modifier.name}")
-                elif has_advantage:
-                    # Increase existing advantage
-                    new_adv_count = adv_count + modifier.value
-                    if "advantage " in expression:
-                        expression = expression.replace(f"advantage {adv_count}", f"advantage {new_adv_count}")
-                    else:
-                        expression = expression.replace("advantage", f"advantage {new_adv_count}")
-                    adv_count = new_adv_count
-                    applied_messages.append(f"Advantage increased to {new_adv_count} by {modifier.name}")
-                else:
-                    # Add new advantage
-                    adv_value = modifier.value
-                    expression += f" advantage {adv_value}" if adv_value > 1 else " advantage"
-                    has_advantage = True
-                    adv_count = adv_value
-                    applied_messages.append(f"Added Advantage {adv_value} from {modifier.name}")
-                    
-            elif modifier_type == 'disadvantage':
-                # Apply disadvantage effect
-                if has_advantage:
-                    # If roll already has advantage, reduce it
-                    if modifier.value >= adv_count:
-                        # Advantage is completely canceled
-                        expression = expression.replace('advantage', '').strip()
-                        if ' advantage' in expression:
-                            expression = expression.replace(' advantage', '')
-                        has_advantage = False
-                        adv_count = 0
-                        has_disadvantage = True
-                        disadv_count = modifier.value - adv_count
-                        if disadv_count > 0:
-                            expression += f" disadvantage {disadv_count}"
-                        applied_messages.append(f"Advantage canceled and converted to Disadvantage {disadv_count} by {modifier.name}")
-                    else:
-                        # Advantage is reduced but not canceled
-                        remaining = adv_count - modifier.value
-                        expression = expression.replace(f"advantage {adv_count}", f"advantage {remaining}")
-                        if "advantage" in expression and not "advantage " in expression:
-                            expression = expression.replace("advantage", f"advantage {remaining}")
-                        adv_count = remaining
-                        applied_messages.append(f"Advantage reduced to {remaining} by {modifier.name}")
-                elif has_disadvantage:
-                    # Increase existing disadvantage
-                    new_disadv_count = disadv_count + modifier.value
-                    if "disadvantage " in expression:
-                        expression = expression.replace(f"disadvantage {disadv_count}", f"disadvantage {new_disadv_count}")
-                    else:
-                        expression = expression.replace("disadvantage", f"disadvantage {new_disadv_count}")
-                    disadv_count = new_disadv_count
-                    applied_messages.append(f"Disadvantage increased to {new_disadv_count} by {modifier.name}")
-                else:
-                    # Add new disadvantage
-                    disadv_value = modifier.value
-                    expression += f" disadvantage {disadv_value}" if disadv_value > 1 else " disadvantage"
-                    has_disadvantage = True
-                    disadv_count = disadv_value
-                    applied_messages.append(f"Added Disadvantage {disadv_value} from {modifier.name}")
-            
-            # Mark next roll only effects as used
-            if hasattr(modifier, 'next_roll_only') and modifier.next_roll_only:
-                # Mark the effect as used
-                if hasattr(modifier, 'mark_used'):
-                    modifier.mark_used()
-                    used_next_roll = True
-        
-        # Clean up expression - ensure proper spacing
-        expression = ' '.join(expression.split())
-        
-        return expression, applied_messages, used_next_roll
-    
-    @classmethod
+    @timed("dice.calculate")
     def calculate(cls, expression: str, character: Optional['Character'] = None) -> RollBreakdown:
         """Calculate results of a roll expression with improved advantage handling"""
         try:
             logger.debug(f"Calculating roll: {expression}")
             
-            # Apply roll modifiers from character effects if available
-            if character:
-                modified_expression, applied_modifiers, used_next_roll = cls.apply_roll_modifiers(expression, character)
-                if modified_expression != expression:
-                    logger.debug(f"Modified expression due to roll modifiers: {modified_expression}")
-                    logger.debug(f"Applied modifiers: {applied_modifiers}")
-                    expression = modified_expression
-            
             # Initialize breakdown with stat tracking
             breakdown = RollBreakdown(
                 original_expression=expression,
@@ -283,17 +131,29 @@ class DiceCalculator:
                 adv_match = re.search(r'advantage\s+(\d+)', expression, re.IGNORECASE)
                 if adv_match:
                     adv_count = int(adv_match.group(1))
-                breakdown.advantage_count = adv_count  # Store for formatting
             
             disadv_count = 1
             if has_disadvantage:
                 disadv_match = re.search(r'disadvantage\s+(\d+)', expression, re.IGNORECASE)
                 if disadv_match:
                     disadv_count = int(disadv_match.group(1))
-                breakdown.advantage_count = disadv_count  # Store for formatting
     
             if has_advantage and has_disadvantage:
                 raise ValueError("Cannot have both advantage and disadvantage")
+                
+            # Net advantage level: the roll's own plus the character's roll modifiers
+            advantage_level = adv_count if has_advantage else -disadv_count if has_disadvantage else 0
+            modifier_stack = None
+            if character and hasattr(character, 'custom_parameters'):
+                modifier_stack = RollModifierStack.for_character(character)
+            if modifier_stack:
+                advantage_level += modifier_stack.advantage
+                
+            has_advantage = advantage_level > 0
+            has_disadvantage = advantage_level < 0
+            adv_count = disadv_count = abs(advantage_level) or 1
+            if advantage_level:
+                breakdown.advantage_count = abs(advantage_level)  # Store for formatting
     
             # Handle multihit with advantage/disadvantage - THE FIXED VERSION
             if multihit_match and (has_advantage or has_disadvantage):
@@ -380,6 +240,13 @@ class DiceCalculator:
             
             if extra_mods:
                 breakdown.modifiers_applied.extend(extra_mods)
+                
+            # Flat bonus from roll modifiers, then use up next-roll-only ones
+            if modifier_stack:
+                if modifier_stack.bonus:
+                    breakdown.final_result += modifier_stack.bonus
+                    breakdown.modifiers_applied.append(f"{modifier_stack.bonus:+d}")
+                modifier_stack.consume_next_roll()
     
             return breakdown
     
@@ -465,24 +332,9 @@ class DiceCalculator:
             # Prepare detailed log if needed
             detailed = None if concise else formatted
             
-            # If we used any next_roll_only effects, save the character
-            if character and hasattr(character, 'custom_parameters'):
-                roll_modifiers = character.custom_parameters.get('roll_modifiers', [])
-                # Check if any were marked as used
-                used_effects = [mod for mod in roll_modifiers if hasattr(mod, 'used') and mod.used]
-                if used_effects:
-                    # Remove used one-time effects
-                    character.custom_parameters['roll_modifiers'] = [
-                        mod for mod in roll_modifiers 
-                        if not (hasattr(mod, 'next_roll_only') and 
-                               mod.next_roll_only and 
-                               hasattr(mod, 'used') and 
-                               mod.used)
-                    ]
-                    
-                    # If this was implemented in a command context, we'd save the character here
-                    # but since we're in calculator.py, we'll let the calling code handle that
-                    
+            # Next-roll-only effects were taken off the character by calculate;
+            # the calling code saves the character
+            
             return breakdown.final_result, formatted, detailed
             
         except Exception as e:
@@ -281,42 +281,20 @@ class TargetHandler:
             logger.debug(f"Crit Range: {crit_range}")
             logger.debug(f"Targets: {[t.name for t in targets]}")
 
-            # Get attack roll
-            attack_total, formatted_roll, _ = DiceCalculator.calculate_complex(
+            # Import here to avoid circular import
+            from .aoe_resolver import CompiledAttack
+
+            # One shared roll for every target, crits always hit
+            attack = CompiledAttack(
                 roll_expression,
+                damage_str,
                 character,
-                concise=True
+                crit_range,
+                crits_always_hit=True
             )
-
-            # Get natural roll for crit check
-            natural_roll = TargetHandler.extract_natural_roll(formatted_roll)
-            
-            results = []
-            for target in targets:
-                # Check for critical hit
-                is_crit = natural_roll >= crit_range
-                hit = attack_total >= target.defense.current_ac or is_crit  # Crits always hit
-
-                # Calculate damage if hit
-                damage_rolls = None
-                total_damage = 0
-                if hit and damage_str:
-                    damage_components = TargetHandler.parse_damage_string(damage_str)
-                    for comp in damage_components:
-                        comp.character = character
-                    damage_rolls = TargetHandler.calculate_damage(damage_components, is_crit)
-                    total_damage = sum(dmg for dmg, _ in damage_rolls)
-
-                results.append(AttackResult(
-                    target_name=target.name,
-                    attack_roll=attack_total,
-                    natural_roll=natural_roll,
-                    ac=target.defense.current_ac,
-                    hit=hit,
-                    is_crit=is_crit,
-                    damage_rolls=damage_rolls,
-                    total_damage=total_damage
-                ))
+            resolution = attack.resolve(targets, 'single')
+            results = resolution.attack_results()
+            formatted_roll = resolution.formatted_roll
 
             return results, formatted_roll
 
@@ -0,0 +1,266 @@
+"""
+Content-addressed storage for uploaded files.
+
+Files are streamed to disk in chunks (disk writes run in a worker thread)
+and named by the SHA-256 hash of their contents, so uploading the same file
+twice only stores it once. Each stored file keeps a reference count and is
+deleted when the last reference is released.
+
+Layout under the root directory:
+- objects/<first 2 hash chars>/<hash><ext>: file contents
+- index.json: size, reference count and owners of every stored file
+
+Every user has a quota: the total size of the files they hold a reference to.
+
+Paths handed back for release can come from stored data that users can
+edit, so nothing outside the root directory is ever deleted.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from typing import AsyncIterable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTACHMENT_SIZE = 8 * 1024 * 1024   # 8 MB per file
+USER_QUOTA = 100 * 1024 * 1024          # 100 MB per user
+CHUNK_SIZE = 64 * 1024
+
+
+class AttachmentError(Exception):
+    """Raised when an attachment is too large or would go over the user's quota"""
+    pass
+
+
+def is_within(path: str, root: str) -> bool:
+    """Whether a path resolves (following symlinks) to somewhere under root"""
+    try:
+        real_root = os.path.realpath(root)
+        return os.path.commonpath([os.path.realpath(path), real_root]) == real_root
+    except ValueError:
+        return False  # Different drives, or a mix of absolute and relative paths
+
+
+def format_size(size: int) -> str:
+    """Human readable file size"""
+    if size >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.1f} MB"
+    if size >= 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size} B"
+
+
+class AttachmentStore:
+    """Deduplicated, reference counted file storage with per-user quotas"""
+
+    def __init__(
+            self,
+            root: str,
+            max_size: int = MAX_ATTACHMENT_SIZE,
+            user_quota: int = USER_QUOTA,
+            chunk_size: int = CHUNK_SIZE
+        ):
+        self.root = root
+        self.max_size = max_size
+        self.user_quota = user_quota
+        self.chunk_size = chunk_size
+        self._objects_dir = os.path.join(root, "objects")
+        self._index_path = os.path.join(root, "index.json")
+        self._index: Optional[Dict[str, Dict]] = None
+        self._lock = asyncio.Lock()
+
+    # Index
+
+    def _load_index(self) -> Dict[str, Dict]:
+        """Load the object index from disk once"""
+        if self._index is None:
+            try:
+                with open(self._index_path, "r") as f:
+                    self._index = json.load(f).get("objects", {})
+            except FileNotFoundError:
+                self._index = {}
+            except (OSError, ValueError) as e:
+                logger.error(f"Couldn't read attachment index, starting empty: {e}")
+                self._index = {}
+        return self._index
+
+    def _save_index(self) -> None:
+        """Write the index atomically"""
+        os.makedirs(self.root, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".json")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"objects": self._index}, f)
+        os.replace(tmp_path, self._index_path)
+
+    def _usage(self, user_id: str) -> int:
+        """Call with the lock held: the index may be changing in another thread"""
+        return sum(
+            obj["size"] for obj in self._load_index().values()
+            if obj.get("owners", {}).get(user_id)
+        )
+
+    def _check(self, user_id: str, size: int, digest: Optional[str] = None) -> None:
+        """Raise AttachmentError if a file of this size can't be stored for the user"""
+        if size > self.max_size:
+            raise AttachmentError(
+                f"File is too large ({format_size(size)}, limit {format_size(self.max_size)})"
+            )
+
+        # Files the user already holds don't count against the quota again
+        obj = self._load_index().get(digest) if digest else None
+        if obj and obj.get("owners", {}).get(user_id):
+            return
+
+        usage = self._usage(user_id)
+        if usage + size > self.user_quota:
+            raise AttachmentError(
+                f"Storage quota exceeded ({format_size(usage)} of {format_size(self.user_quota)} used)"
+            )
+
+    async def usage(self, user_id) -> int:
+        """Total size of the files a user holds a reference to"""
+        async with self._lock:
+            return await asyncio.to_thread(self._usage, str(user_id))
+
+    async def check_upload(self, user_id, size: int) -> None:
+        """Check the size limit and quota before downloading anything"""
+        async with self._lock:
+            await asyncio.to_thread(self._check, str(user_id), size)
+
+    # Storing
+
+    def _object_path(self, digest: str, ext: str) -> str:
+        return os.path.join(self._objects_dir, digest[:2], digest + ext)
+
+    @staticmethod
+    def _extension(filename: str) -> str:
+        ext = os.path.splitext(filename or "")[1].lower()
+        return ext if re.fullmatch(r"\.[a-z0-9]{1,8}", ext) else ""
+
+    def _open_temp(self):
+        os.makedirs(self.root, exist_ok=True)
+        return tempfile.NamedTemporaryFile(dir=self.root, suffix=".part", delete=False)
+
+    def _commit(self, tmp_path: str, digest: str, ext: str, size: int, user_id: str) -> str:
+        """Move a finished download into place, or drop it if the content already exists"""
+        self._check(user_id, size, digest)
+        index = self._load_index()
+        obj = index.get(digest)
+
+        if obj and os.path.exists(obj["path"]):
+            os.remove(tmp_path)
+            obj["refs"] += 1
+        else:
+            path = self._object_path(digest, ext)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(tmp_path, path)
+            obj = index[digest] = {"path": path, "size": size, "refs": 1, "owners": {}}
+
+        obj["owners"][user_id] = obj["owners"].get(user_id, 0) + 1
+        self._save_index()
+        return obj["path"]
+
+    async def store(
+            self,
+            chunks: AsyncIterable[bytes],
+            filename: str,
+            user_id,
+            size: Optional[int] = None
+        ) -> str:
+        """
+        Stream a file to disk and return its stored path.
+
+        Args:
+            chunks: Async iterable of file data (e.g. response.content.iter_chunked())
+            filename: Original filename, used for the extension
+            user_id: Uploader, for the quota
+            size: Expected size, checked before reading anything if known
+
+        Raises:
+            AttachmentError: If the file is too large or the user is over quota
+        """
+        user_id = str(user_id)
+        if size is not None:
+            await self.check_upload(user_id, size)
+
+        tmp = await asyncio.to_thread(self._open_temp)
+        digest = hashlib.sha256()
+        total = 0
+        try:
+            async for chunk in chunks:
+                total += len(chunk)
+                if total > self.max_size:
+                    raise AttachmentError(
+                        f"File is too large (over {format_size(self.max_size)})"
+                    )
+                digest.update(chunk)
+                await asyncio.to_thread(tmp.write, chunk)
+            await asyncio.to_thread(tmp.close)
+
+            async with self._lock:
+                return await asyncio.to_thread(
+                    self._commit, tmp.name, digest.hexdigest(), self._extension(filename), total, user_id
+                )
+        except BaseException:
+            tmp.close()
+            if os.path.exists(tmp.name):
+                os.remove(tmp.name)
+            raise
+
+    # Releasing
+
+    def contains(self, path: str) -> bool:
+        """Whether a path is inside the store's root directory"""
+        return is_within(path, self.root)
+
+    def _release(self, path: str, user_id: Optional[str]) -> bool:
+        if not self.contains(path):
+            logger.warning(f"Refusing to release a file outside the attachment store: {path}")
+            return False
+
+        digest = os.path.splitext(os.path.basename(path))[0]
+        index = self._load_index()
+        obj = index.get(digest)
+
+        if obj is None or os.path.normpath(obj["path"]) != os.path.normpath(path):
+            # Not a stored object (older uploads in the root) - just remove the file
+            if os.path.isfile(path):
+                os.remove(path)
+                return True
+            return False
+
+        obj["refs"] -= 1
+        owners = obj["owners"]
+        # Without a user, release the oldest owner's reference
+        owner = user_id if user_id in owners else next(iter(owners), None)
+        if owner is not None:
+            owners[owner] -= 1
+            if owners[owner] <= 0:
+                del owners[owner]
+
+        deleted = False
+        if obj["refs"] <= 0:
+            del index[digest]
+            if os.path.exists(path):
+                os.remove(path)
+            deleted = True
+
+        self._save_index()
+        return deleted
+
+    async def release(self, path: str, user_id=None) -> bool:
+        """
+        Drop one reference to a stored file, deleting it when none are left.
+        Pass the user the reference was stored for so their quota goes down;
+        without one the oldest owner's reference is released.
+        Returns True if the file was deleted.
+        """
+        async with self._lock:
+            return await asyncio.to_thread(
+                self._release, path, str(user_id) if user_id is not None else None
+            )
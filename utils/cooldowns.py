@@ -0,0 +1,107 @@
+"""
+Round-keyed cooldown scheduler for moves.
+
+One scheduler per combat tracks when each character's moves come off
+cooldown, in a min-heap keyed by the round a move becomes available plus
+an index for O(1) lookups. Releasing cooldowns at the start of a round
+only pops the moves that are ready, instead of counting every cooldown
+down.
+
+The scheduler is the only place move availability is checked during
+combat (the tracker's can_use_move goes through can_use here). Moves keep
+their own usage record so it can be saved; track() rebuilds the schedule
+from those records when a saved combat is loaded.
+
+Each combat gets a new epoch. Move usage records are stamped with the
+epoch they were used in, and a record from another epoch counts as reset.
+Starting a combat therefore resets every combatant's cooldowns and uses
+without touching each move.
+"""
+
+import heapq
+import time
+from typing import Dict, List, Optional, Tuple
+
+MoveKey = Tuple[str, str]  # (character name, move name lowercased)
+
+
+def new_epoch(previous: int = 0) -> int:
+    """A combat epoch that is unique across restarts and always increases"""
+    return max(previous + 1, int(time.time() * 1000))
+
+
+class CooldownScheduler:
+    """Move cooldowns for one combat"""
+
+    def __init__(self):
+        self.epoch = new_epoch()
+        self._heap: List[Tuple[int, str, str]] = []  # (available round, character, move)
+        self._available: Dict[MoveKey, int] = {}
+
+    @staticmethod
+    def key(character_name: str, move_name: str) -> MoveKey:
+        return character_name, move_name.lower()
+
+    def reset(self, epoch: Optional[int] = None) -> int:
+        """
+        Start a new combat epoch, clearing every cooldown at once.
+        Pass an epoch to resume a saved combat.
+        """
+        self.epoch = epoch if epoch is not None else new_epoch(self.epoch)
+        self._heap = []
+        self._available = {}
+        return self.epoch
+
+    def __len__(self) -> int:
+        return len(self._available)
+
+    def start(self, character_name: str, move_name: str, round_number: int, cooldown: int) -> int:
+        """Put a move on cooldown. Returns the round it becomes available."""
+        available = round_number + cooldown
+        key = self.key(character_name, move_name)
+        self._available[key] = available
+        heapq.heappush(self._heap, (available, *key))
+        return available
+
+    def available_round(self, character_name: str, move_name: str) -> Optional[int]:
+        return self._available.get(self.key(character_name, move_name))
+
+    def remaining(self, character_name: str, move_name: str, round_number: int) -> int:
+        """Rounds until a move is available (0 if it's ready)"""
+        available = self._available.get(self.key(character_name, move_name))
+        if available is None:
+            return 0
+        return max(0, available - round_number)
+
+    def can_use(self, character_name: str, move, round_number: int) -> Tuple[bool, Optional[str]]:
+        """Check a move's uses left this combat and its cooldown. Returns (can_use, reason)."""
+        uses_left = move.uses_left(self.epoch)
+        if uses_left is not None and uses_left <= 0:
+            return False, f"No uses remaining (0/{move.uses})"
+
+        remaining = self.remaining(character_name, move.name, round_number)
+        if remaining:
+            return False, f"On cooldown ({remaining} rounds remaining)"
+        return True, None
+
+    def release(self, round_number: int) -> List[MoveKey]:
+        """Drop cooldowns that have ended by this round. Returns the moves now ready."""
+        ready = []
+        while self._heap and self._heap[0][0] <= round_number:
+            available, character_name, move_name = heapq.heappop(self._heap)
+            key = (character_name, move_name)
+            # Skip entries replaced by a later use of the same move
+            if self._available.get(key) == available:
+                del self._available[key]
+                ready.append(key)
+        return ready
+
+    def track(self, character, round_number: int) -> None:
+        """Schedule a character's cooldowns from its moves (after loading a saved combat)"""
+        moveset = getattr(character, 'moveset', None)
+        if not moveset:
+            return
+        for move in moveset.moves.values():
+            remaining = move.cooldown_remaining(round_number, self.epoch)
+            if remaining:
+                self.start(character.name, move.name, round_number, remaining)
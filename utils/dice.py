@@ -7,11 +7,13 @@ import re
 import random
 from typing import Tuple, List, Optional, Union
 from core.character import StatType
+from utils.perf import timed
 
 class DiceRoller:
     """Handles dice rolling and calculation with various notations"""
     
     @staticmethod
+    @timed("dice.roll")
     def roll_dice(dice_str: str, character: Optional['Character'] = None) -> Tuple[int, str]:
         """
         Roll dice based on notation. Returns (total, explanation)
@@ -5,6 +5,8 @@ from discord import app_commands
 import logging
 import re
 
+from utils.perf import perf
+
 logger = logging.getLogger(__name__)
 
 class ErrorTranslator:
@@ -278,4 +280,6 @@ def setup(bot):
         
     @bot.tree.error
     async def on_app_command_error(interaction: discord.Interaction, error: app_commands.AppCommandError):
+        command_name = interaction.command.qualified_name if interaction.command else None
+        perf.count("command.errors", op=command_name or "unknown")
         await handle_command_error(interaction, error, interaction.command.name if interaction.command else None)
\ No newline at end of file
@@ -0,0 +1,101 @@
+"""
+Group checks: one check or save rolled for many characters at once.
+
+A group is given as a comma separated list of names, "combat" for everyone
+in the initiative order, or "all" for every loaded character. Each
+character rolls with their own proficiencies and modifiers (the command
+builds the expressions); the results are collected here, sorted, and
+counted against an optional DC for a single embed.
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, List, Optional, Tuple
+
+COMBAT_GROUP = "combat"
+ALL_GROUP = "all"
+
+# Discord embed description limit, with room for the overflow line
+MAX_DESCRIPTION = 4000
+
+
+def resolve_group(
+        group: str,
+        get_character: Callable[[str], Optional['Character']],
+        all_characters: Callable[[], List['Character']],
+        roster: Iterable[str] = ()
+    ) -> Tuple[List['Character'], List[str]]:
+    """
+    Find the characters in a group. Returns (characters, names not found).
+    Duplicates are dropped, keeping the first mention.
+    """
+    selector = group.strip().lower()
+    if selector == ALL_GROUP:
+        return list(all_characters()), []
+
+    names = list(roster) if selector == COMBAT_GROUP else [
+        name.strip() for name in group.split(',') if name.strip()
+    ]
+
+    characters, missing, seen = [], [], set()
+    for name in names:
+        if name.lower() in seen:
+            continue
+        seen.add(name.lower())
+        character = get_character(name)
+        if character:
+            characters.append(character)
+        else:
+            missing.append(name)
+    return characters, missing
+
+
+@dataclass
+class GroupRoll:
+    """One character's roll in a group check"""
+    character_name: str
+    total: int
+    formatted: str = ""
+
+    def passed(self, dc: Optional[int]) -> Optional[bool]:
+        return None if dc is None else self.total >= dc
+
+
+@dataclass
+class GroupCheckResult:
+    """Every roll of a group check"""
+    dc: Optional[int] = None
+    rolls: List[GroupRoll] = field(default_factory=list)
+
+    def add(self, character_name: str, total: int, formatted: str = "") -> None:
+        self.rolls.append(GroupRoll(character_name, total, formatted))
+
+    def ranked(self) -> List[GroupRoll]:
+        """Highest total first, ties by name"""
+        return sorted(self.rolls, key=lambda roll: (-roll.total, roll.character_name.lower()))
+
+    def counts(self) -> Tuple[int, int]:
+        """(passed, failed) against the DC"""
+        passed = sum(1 for roll in self.rolls if roll.passed(self.dc))
+        return passed, len(self.rolls) - passed
+
+    def lines(self) -> List[str]:
+        """One line per roll in ranked order, marked pass/fail when there's a DC"""
+        lines = []
+        for roll in self.ranked():
+            passed = roll.passed(self.dc)
+            mark = "" if passed is None else ("✅ " if passed else "❌ ")
+            line = f"{mark}**{roll.total}** {roll.character_name}"
+            if roll.formatted:
+                line += f" • {roll.formatted}"
+            lines.append(line)
+        return lines
+
+    def description(self) -> str:
+        """The ranked lines, cut off with a count of the rest if they don't fit in an embed"""
+        lines = self.lines()
+        text = ""
+        for index, line in enumerate(lines):
+            if len(text) + len(line) + 1 > MAX_DESCRIPTION:
+                return text + f"*…and {len(lines) - index} more*"
+            text += line + "\n"
+        return text.rstrip("\n")
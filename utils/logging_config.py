@@ -0,0 +1,119 @@
+"""
+Logging setup for the bot.
+
+All records go through a QueueHandler, and a QueueListener thread writes them
+to the console and a rotating bot.log, so file I/O never runs on the event
+loop.
+
+Loggers follow module names (logging.getLogger(__name__)), so each subsystem
+is a logger prefix whose level can be changed at runtime with set_level()
+(used by /debug loglevel). Debug output on hot paths uses logger.debug with
+lazy %-style arguments, so it costs nothing unless that subsystem is set to
+DEBUG.
+"""
+
+import logging
+import logging.handlers
+import queue
+from typing import Dict, Optional
+
+LOG_FILE = "bot.log"
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUPS = 5
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Subsystem name -> logger prefix
+SUBSYSTEMS = {
+    "bot": "__main__",
+    "database": "core.database",
+    "state": "core.state",
+    "characters": "core.character",
+    "effects": "core.effects",
+    "combat": "modules.combat",
+    "moves": "modules.moves",
+    "menus": "modules.menu",
+    "commands": "commands",
+    "utils": "utils",
+    "discord": "discord",
+}
+
+LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_logging(
+        level: int = logging.INFO,
+        log_file: str = LOG_FILE,
+        max_bytes: int = LOG_MAX_BYTES,
+        backups: int = LOG_BACKUPS
+    ) -> logging.handlers.QueueListener:
+    """Route all logging through a queue to a console and rotating file handler"""
+    global _listener
+    if _listener:
+        return _listener
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=max_bytes, backupCount=backups, encoding="utf-8"
+    )
+    file_handler.setFormatter(formatter)
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _listener.start()
+    return _listener
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener:
+        _listener.stop()
+        _listener = None
+
+
+def set_level(subsystem: str, level: str) -> None:
+    """
+    Change the log level of a subsystem (or "all" for every subsystem)
+
+    Raises:
+        ValueError: If the subsystem or level is unknown
+    """
+    level_value = LEVELS.get(level.lower())
+    if level_value is None:
+        raise ValueError(f"Unknown log level '{level}'")
+
+    if subsystem == "all":
+        logging.getLogger().setLevel(level_value)
+        for prefix in SUBSYSTEMS.values():
+            logging.getLogger(prefix).setLevel(logging.NOTSET)
+        return
+
+    prefix = SUBSYSTEMS.get(subsystem)
+    if prefix is None:
+        raise ValueError(f"Unknown subsystem '{subsystem}'")
+    logging.getLogger(prefix).setLevel(level_value)
+
+
+def get_levels() -> Dict[str, str]:
+    """Effective level of every subsystem"""
+    return {
+        name: logging.getLevelName(logging.getLogger(prefix).getEffectiveLevel()).lower()
+        for name, prefix in SUBSYSTEMS.items()
+    }
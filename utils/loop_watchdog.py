@@ -0,0 +1,132 @@
+"""
+Event loop lag watchdog.
+
+A heartbeat task sleeps for a short interval and measures how late it wakes
+up; that lateness is the event loop's scheduling lag. A separate thread
+watches the heartbeat, and when the loop hasn't come back within the
+threshold it captures the loop thread's current stack - which is the code
+blocking the loop (a sync Firebase call, a file write, a big computation).
+
+When the loop recovers, the stall is recorded in the perf report under the
+innermost bot source line on that stack, so /debug perf shows which command
+or subsystem is holding up interactions.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import List, Optional, Tuple
+
+from utils.perf import perf, PerfStats
+
+logger = logging.getLogger(__name__)
+
+WATCHDOG_INTERVAL = 0.1
+WATCHDOG_THRESHOLD = 0.25
+STACK_DEPTH = 8
+
+# Bot source root; frames outside it (stdlib, site-packages) are skipped
+# when deciding who to blame for a stall
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class LoopWatchdog:
+    """Measures event loop lag and captures stacks of blocking calls"""
+
+    def __init__(
+            self,
+            interval: float = WATCHDOG_INTERVAL,
+            threshold: float = WATCHDOG_THRESHOLD,
+            stats: PerfStats = perf
+        ):
+        self.interval = interval
+        self.threshold = threshold
+        self.stats = stats
+        self.offenders: deque = deque(maxlen=20)  # (location, seconds, stack)
+
+        self._loop_thread: Optional[int] = None
+        self._last_beat = time.monotonic()
+        self._captured: Optional[Tuple[str, str]] = None
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        """Start watching the running event loop. Must be called from inside it."""
+        if self._task:
+            return
+        self._loop_thread = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._beat())
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._thread:
+            await asyncio.to_thread(self._thread.join, 1.0)
+            self._thread = None
+
+    async def _beat(self) -> None:
+        """Heartbeat on the event loop"""
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self._last_beat = now
+            lag = max(0.0, now - start - self.interval)
+            self.stats.observe("loop", "lag", lag)
+
+            captured, self._captured = self._captured, None
+            if captured:
+                self._record(captured, lag)
+
+    def _watch(self) -> None:
+        """Watcher thread: grab the loop thread's stack while it's stuck"""
+        while not self._stop.wait(self.interval / 2):
+            if self._captured or time.monotonic() - self._last_beat < self.threshold:
+                continue
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is not None:
+                self._captured = describe_stack(frame)
+
+    def _record(self, captured: Tuple[str, str], lag: float) -> None:
+        location, stack = captured
+        self.stats.observe("blocking", location, lag)
+        self.offenders.append((location, lag, stack))
+        logger.warning("Event loop blocked for %.0fms at %s\n%s", lag * 1000, location, stack)
+
+    def recent(self, limit: int = 5) -> List[Tuple[str, float, str]]:
+        """Most recent stalls, newest first"""
+        return list(self.offenders)[-limit:][::-1]
+
+
+def describe_stack(frame) -> Tuple[str, str]:
+    """
+    Summarize a stack as (location, formatted stack).
+    The location is the innermost frame from the bot's own source.
+    """
+    stack = traceback.extract_stack(frame)
+    location = None
+    for entry in reversed(stack):
+        path = os.path.abspath(entry.filename)
+        if path.startswith(PROJECT_ROOT) and path != os.path.abspath(__file__):
+            location = f"{os.path.relpath(path, PROJECT_ROOT)}:{entry.lineno} in {entry.name}"
+            break
+    if location is None:
+        entry = stack[-1]
+        location = f"{os.path.basename(entry.filename)}:{entry.lineno} in {entry.name}"
+    return location, "".join(traceback.format_list(stack[-STACK_DEPTH:]))
@@ -0,0 +1,396 @@
+"""
+Bounded, cached media downloads for /say and /embed.
+
+Downloads are streamed with a byte limit and aborted as soon as they go over
+it (or as soon as the response turns out to be a web page instead of media).
+Finished downloads are kept in a two level cache keyed by URL, without the
+signature params Discord adds to CDN links (so a re-signed link to the same
+file is a hit):
+- memory: LRU with a total byte budget, for small files
+- disk: LRU with its own byte budget, survives restarts
+
+Entries expire after a TTL. Expired entries with an ETag are revalidated
+with If-None-Match instead of downloading them again. Files nobody has asked
+for in DISK_CACHE_MAX_AGE are deleted from disk.
+"""
+
+import asyncio
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+MAX_MEDIA_BYTES = 25 * 1024 * 1024      # Discord's upload limit
+MEMORY_CACHE_BYTES = 64 * 1024 * 1024
+MEMORY_ITEM_BYTES = 8 * 1024 * 1024     # Larger files are only cached on disk
+DISK_CACHE_BYTES = 1024 * 1024 * 1024
+MEDIA_CACHE_TTL = 60 * 60               # seconds
+DISK_CACHE_MAX_AGE = 7 * 24 * 60 * 60   # seconds since last use
+MAX_CONCURRENT_FETCHES = 4
+CHUNK_SIZE = 64 * 1024
+
+# Discord CDN link signature params (expiry, issued at, HMAC). They change
+# every time a link is re-signed but the file behind it doesn't.
+SIGNATURE_PARAMS = {"ex", "is", "hm"}
+
+# Magic bytes for content-type sniffing
+SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"%PDF", "application/pdf"),
+    (b"OggS", "audio/ogg"),
+    (b"ID3", "audio/mpeg"),
+    (b"\x1a\x45\xdf\xa3", "video/webm"),
+)
+
+EXTENSIONS = {
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+    "video/mp4": ".mp4",
+    "video/webm": ".webm",
+    "video/quicktime": ".mov",
+    "audio/mpeg": ".mp3",
+    "audio/ogg": ".ogg",
+    "application/pdf": ".pdf",
+}
+
+
+class MediaError(ValueError):
+    """Raised when a URL can't be fetched as media"""
+    pass
+
+
+def cache_key(url: str) -> str:
+    """The URL without its signature params, so re-signed links share an entry"""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in SIGNATURE_PARAMS]
+    return urlunsplit(parts._replace(query=urlencode(query), fragment=""))
+
+
+def sniff_content_type(head: bytes, declared: str = "") -> str:
+    """Get the real content type from a file's first bytes, falling back to the declared type"""
+    for signature, content_type in SIGNATURES:
+        if head.startswith(signature):
+            return content_type
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    if head[4:8] == b"ftyp":
+        return "video/quicktime" if head[8:10] == b"qt" else "video/mp4"
+
+    declared = (declared or "").split(";")[0].strip().lower()
+    stripped = head.lstrip().lower()
+    if stripped.startswith((b"<!doctype html", b"<html")):
+        return "text/html"
+    return declared or "application/octet-stream"
+
+
+@dataclass
+class CachedMedia:
+    """A downloaded file and what's needed to revalidate it (url is the last link it was fetched from)"""
+    url: str
+    filename: str
+    content_type: str
+    size: int
+    etag: Optional[str] = None
+    fetched_at: float = 0.0
+    data: Optional[bytes] = None
+
+    @property
+    def key(self) -> str:
+        return cache_key(self.url)
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.time() - self.fetched_at < ttl
+
+
+class MediaCache:
+    """LRU memory cache in front of an LRU disk cache, with a TTL"""
+
+    def __init__(
+            self,
+            cache_dir: str,
+            ttl: float = MEDIA_CACHE_TTL,
+            memory_bytes: int = MEMORY_CACHE_BYTES,
+            memory_item_bytes: int = MEMORY_ITEM_BYTES,
+            disk_bytes: int = DISK_CACHE_BYTES,
+            disk_max_age: float = DISK_CACHE_MAX_AGE
+        ):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.memory_bytes = memory_bytes
+        self.memory_item_bytes = memory_item_bytes
+        self.disk_bytes = disk_bytes
+        self.disk_max_age = disk_max_age
+        self._memory: "OrderedDict[str, CachedMedia]" = OrderedDict()
+        self._memory_used = 0
+        # Disk index: hashed key -> (size, last used), least recently used first.
+        # Built from the directory on first use; the disk methods run in threads.
+        self._disk: Optional["OrderedDict[str, Tuple[int, float]]"] = None
+        self._disk_used = 0
+        self._disk_lock = threading.Lock()
+
+    def _paths(self, key: str) -> Tuple[str, str]:
+        name = hashlib.sha256(key.encode()).hexdigest()
+        base = os.path.join(self.cache_dir, name)
+        return base + ".bin", base + ".json"
+
+    def _remember(self, entry: CachedMedia) -> None:
+        """Put an entry in the memory LRU, evicting the oldest ones over budget"""
+        self._forget(entry.key)
+        if entry.data is None or entry.size > self.memory_item_bytes:
+            return
+
+        self._memory[entry.key] = entry
+        self._memory_used += entry.size
+        while self._memory_used > self.memory_bytes and self._memory:
+            _, old = self._memory.popitem(last=False)
+            self._memory_used -= old.size
+
+    def _forget(self, key: str) -> None:
+        old = self._memory.pop(key, None)
+        if old:
+            self._memory_used -= old.size
+
+    def _disk_index(self) -> "OrderedDict[str, Tuple[int, float]]":
+        """The disk index, scanned from the cache directory the first time (call with the lock held)"""
+        if self._disk is None:
+            found = []
+            try:
+                names = os.listdir(self.cache_dir)
+            except OSError:
+                names = []
+            for name in names:
+                if not name.endswith(".bin"):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(self.cache_dir, name))
+                except OSError:
+                    continue
+                found.append((stat.st_mtime, name[:-4], stat.st_size))
+            self._disk = OrderedDict((name, (size, used)) for used, name, size in sorted(found))
+            self._disk_used = sum(size for size, _ in self._disk.values())
+        return self._disk
+
+    def _mark_used(self, key: str, size: int) -> None:
+        """Move a file to the most recently used end of the disk index (call with the lock held)"""
+        index = self._disk_index()
+        name = os.path.basename(self._paths(key)[0])[:-4]
+        old = index.pop(name, None)
+        if old:
+            self._disk_used -= old[0]
+        index[name] = (size, time.time())
+        self._disk_used += size
+
+    def _evict_disk(self) -> None:
+        """Delete files unused for too long, then the least recently used ones over budget (call with the lock held)"""
+        index = self._disk_index()
+        cutoff = time.time() - self.disk_max_age
+        while index:
+            name, (size, used) = next(iter(index.items()))
+            if used >= cutoff and self._disk_used <= self.disk_bytes:
+                break
+            del index[name]
+            self._disk_used -= size
+            base = os.path.join(self.cache_dir, name)
+            for path in (base + ".bin", base + ".json"):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def _read_disk(self, key: str) -> Optional[CachedMedia]:
+        data_path, meta_path = self._paths(key)
+        with self._disk_lock:
+            try:
+                with open(meta_path, "r") as f:
+                    meta = json.load(f)
+                with open(data_path, "rb") as f:
+                    data = f.read()
+                os.utime(data_path)
+            except (OSError, ValueError):
+                return None
+            self._mark_used(key, len(data))
+        meta["data"] = data
+        return CachedMedia(**meta)
+
+    def _write_disk(self, entry: CachedMedia) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        data_path, meta_path = self._paths(entry.key)
+        meta = asdict(entry)
+        del meta["data"]
+        with self._disk_lock:
+            with open(data_path + ".part", "wb") as f:
+                f.write(entry.data)
+            os.replace(data_path + ".part", data_path)
+            with open(meta_path, "w") as f:
+                json.dump(meta, f)
+            self._mark_used(entry.key, entry.size)
+            self._evict_disk()
+
+    def _touch_disk(self, entry: CachedMedia) -> None:
+        data_path, meta_path = self._paths(entry.key)
+        meta = asdict(entry)
+        del meta["data"]
+        with self._disk_lock:
+            try:
+                os.utime(data_path)
+            except OSError:
+                evicted = True
+            else:
+                evicted = False
+                with open(meta_path, "w") as f:
+                    json.dump(meta, f)
+                self._mark_used(entry.key, entry.size)
+        if evicted and entry.data is not None:
+            self._write_disk(entry)
+
+    async def get(self, url: str) -> Optional[CachedMedia]:
+        """Get a cached entry (fresh or stale), checking memory then disk"""
+        key = cache_key(url)
+        entry = self._memory.get(key)
+        if entry:
+            self._memory.move_to_end(key)
+            return entry
+
+        entry = await asyncio.to_thread(self._read_disk, key)
+        if entry:
+            self._remember(entry)
+        return entry
+
+    async def put(self, entry: CachedMedia) -> None:
+        """Cache a freshly downloaded entry"""
+        self._remember(entry)
+        await asyncio.to_thread(self._write_disk, entry)
+
+    async def refresh(self, entry: CachedMedia) -> None:
+        """Mark a revalidated entry as fresh again"""
+        entry.fetched_at = time.time()
+        self._remember(entry)
+        await asyncio.to_thread(self._touch_disk, entry)
+
+
+class MediaFetcher:
+    """Streaming, size-limited downloads through a MediaCache"""
+
+    def __init__(
+            self,
+            cache: MediaCache,
+            max_bytes: int = MAX_MEDIA_BYTES,
+            max_concurrent: int = MAX_CONCURRENT_FETCHES
+        ):
+        self.cache = cache
+        self.max_bytes = max_bytes
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    async def fetch(self, session, url: str) -> Tuple[str, io.BytesIO]:
+        """
+        Fetch media from a URL, using the cache when possible.
+
+        Args:
+            session: aiohttp.ClientSession to download with
+            url: URL to fetch
+
+        Returns:
+            tuple: (filename, file_data)
+
+        Raises:
+            MediaError: If the download fails, is too large or isn't media
+        """
+        # Share one download between concurrent requests for the same file
+        key = cache_key(url)
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch_entry(session, url))
+            self._pending[key] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(key, None))
+        entry = await asyncio.shield(pending)
+        return entry.filename, io.BytesIO(entry.data)
+
+    async def _fetch_entry(self, session, url: str) -> CachedMedia:
+        cached = await self.cache.get(url)
+        if cached and cached.is_fresh(self.cache.ttl):
+            return cached
+
+        headers = {}
+        if cached and cached.etag:
+            headers["If-None-Match"] = cached.etag
+
+        async with self._semaphore:
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304 and cached:
+                    cached.url = url  # The old link's signature may have expired
+                    await self.cache.refresh(cached)
+                    return cached
+
+                if response.status != 200:
+                    raise MediaError(f"Failed to fetch media: {response.status}")
+
+                # Abort before downloading anything if the size is known to be too big
+                length = response.headers.get("Content-Length")
+                if length and length.isdigit() and int(length) > self.max_bytes:
+                    raise MediaError(f"Media is too large ({int(length) // (1024 * 1024)} MB)")
+
+                buffer = bytearray()
+                content_type = None
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    buffer.extend(chunk)
+                    if len(buffer) > self.max_bytes:
+                        raise MediaError(f"Media is larger than {self.max_bytes // (1024 * 1024)} MB")
+
+                    # Check what we're getting as soon as the first bytes arrive
+                    if content_type is None and len(buffer) >= 16:
+                        content_type = self._check_type(buffer, response.headers)
+
+                if content_type is None:
+                    content_type = self._check_type(buffer, response.headers)
+
+                entry = CachedMedia(
+                    url=url,
+                    filename=self._filename(url, response.headers, content_type),
+                    content_type=content_type,
+                    size=len(buffer),
+                    etag=response.headers.get("ETag"),
+                    fetched_at=time.time(),
+                    data=bytes(buffer)
+                )
+
+        await self.cache.put(entry)
+        return entry
+
+    @staticmethod
+    def _check_type(head: bytes, headers) -> str:
+        content_type = sniff_content_type(bytes(head[:64]), headers.get("Content-Type", ""))
+        if content_type.startswith("text/html"):
+            raise MediaError("URL points to a web page, not media")
+        return content_type
+
+    @staticmethod
+    def _filename(url: str, headers, content_type: str) -> str:
+        """Get the filename from the headers or URL, adding an extension if missing"""
+        filename = None
+        content_disposition = headers.get("Content-Disposition")
+        if content_disposition:
+            filename_match = re.search(r'filename="?([^"]+)"?', content_disposition)
+            if filename_match:
+                filename = filename_match.group(1)
+        if not filename:
+            filename = url.split('/')[-1].split('?')[0] or 'attachment'
+
+        if '.' not in filename:
+            filename += EXTENSIONS.get(content_type, "")
+        return filename
@@ -0,0 +1,156 @@
+"""
+Outbound message pipeline for combat output.
+
+A turn's output (effect updates, round banner, turn announcements) is
+collected and sent as one message with several embeds, split only where
+Discord's per-message limits require it. Output that belongs to a message
+already sent is edited into it instead of being posted again.
+
+Calls are paced per bucket (a channel). Each bucket allows a number of
+calls per window; callers wait in FIFO order on the bucket's queue until a
+slot is free, instead of sleeping for a fixed time between messages. When
+Discord still answers with a 429, its retry_after holds the whole bucket.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Discord limits per message
+MAX_EMBEDS = 10
+MAX_EMBED_TOTAL = 6000
+
+# Discord allows about 5 messages per 5 seconds in a channel
+BUCKET_LIMIT = 5
+BUCKET_WINDOW = 5.0
+
+
+def embed_size(embed: Any) -> int:
+    """Characters an embed counts towards the per-message total (discord.Embed supports len())"""
+    try:
+        return len(embed)
+    except TypeError:
+        return 0
+
+
+def chunk_embeds(
+        embeds: List[Any],
+        max_embeds: int = MAX_EMBEDS,
+        max_total: int = MAX_EMBED_TOTAL
+    ) -> List[List[Any]]:
+    """Split embeds into as few messages as Discord's limits allow, keeping their order"""
+    chunks = []
+    current, total = [], 0
+    for embed in embeds:
+        size = embed_size(embed)
+        if current and (len(current) >= max_embeds or total + size > max_total):
+            chunks.append(current)
+            current, total = [], 0
+        current.append(embed)
+        total += size
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def fits_in_message(embeds: List[Any]) -> bool:
+    return len(chunk_embeds(embeds)) <= 1
+
+
+class RateLimitBuckets:
+    """Sliding-window call limits per bucket, with a FIFO queue of waiting callers"""
+
+    def __init__(
+            self,
+            limit: int = BUCKET_LIMIT,
+            window: float = BUCKET_WINDOW,
+            clock: Callable[[], float] = time.monotonic
+        ):
+        self.limit = limit
+        self.window = window
+        self.clock = clock
+        self._calls: Dict[Hashable, Deque[float]] = {}
+        self._blocked_until: Dict[Hashable, float] = {}
+        self._queues: Dict[Hashable, asyncio.Lock] = {}
+
+    def delay(self, bucket: Hashable) -> float:
+        """Seconds until the bucket has a free slot (0 if one is free now)"""
+        now = self.clock()
+        calls = self._calls.setdefault(bucket, deque())
+        while calls and calls[0] <= now - self.window:
+            calls.popleft()
+
+        wait = max(0.0, self._blocked_until.get(bucket, 0.0) - now)
+        if len(calls) >= self.limit:
+            wait = max(wait, calls[0] + self.window - now)
+        return wait
+
+    async def acquire(self, bucket: Hashable) -> None:
+        """Wait for a free slot in the bucket and take it. Waiters are served in order."""
+        # asyncio.Lock wakes waiters first come, first served
+        queue = self._queues.setdefault(bucket, asyncio.Lock())
+        async with queue:
+            wait = self.delay(bucket)
+            while wait > 0:
+                await asyncio.sleep(wait)
+                wait = self.delay(bucket)
+            self._calls[bucket].append(self.clock())
+
+    def penalize(self, bucket: Hashable, retry_after: float) -> None:
+        """Hold a bucket after a 429"""
+        self._blocked_until[bucket] = max(self._blocked_until.get(bucket, 0.0), self.clock() + retry_after)
+
+
+class MessagePipeline:
+    """Sends and edits messages through rate limit buckets"""
+
+    def __init__(self, buckets: Optional[RateLimitBuckets] = None):
+        self.buckets = buckets or RateLimitBuckets()
+
+    async def _call(self, bucket: Hashable, func: Callable[..., Awaitable[Any]], **kwargs) -> Any:
+        """Make one API call in a bucket, retrying once after a 429"""
+        await self.buckets.acquire(bucket)
+        try:
+            return await func(**kwargs)
+        except Exception as e:
+            if getattr(e, 'status', None) != 429:
+                raise
+            retry_after = getattr(e, 'retry_after', None) or self.buckets.window
+            logger.warning(f"Rate limited in bucket {bucket}, retrying after {retry_after:.2f}s")
+            self.buckets.penalize(bucket, retry_after)
+            await self.buckets.acquire(bucket)
+            return await func(**kwargs)
+
+    async def send(
+            self,
+            send: Callable[..., Awaitable[Any]],
+            embeds: List[Any],
+            bucket: Hashable
+        ) -> Optional[Any]:
+        """
+        Send embeds in as few messages as possible.
+        send is the sending coroutine (e.g. interaction.followup.send).
+        Returns the last message sent.
+        """
+        message = None
+        for chunk in chunk_embeds(embeds):
+            message = await self._call(bucket, send, embeds=chunk)
+        return message
+
+    async def edit(self, message: Any, embeds: List[Any], bucket: Hashable) -> bool:
+        """
+        Replace a sent message's embeds. Returns False if they don't fit in
+        one message or the edit failed (message deleted, token expired).
+        """
+        if message is None or not fits_in_message(embeds):
+            return False
+        try:
+            await self._call(bucket, message.edit, embeds=embeds)
+            return True
+        except Exception as e:
+            logger.debug(f"Couldn't edit message in bucket {bucket}: {e}")
+            return False
@@ -0,0 +1,179 @@
+"""
+Lightweight performance instrumentation.
+
+Timing spans feed per-name latency histograms (with p50/p95/p99 from a
+window of recent samples), and counters track things like Firebase calls
+and bytes. Everything is kept in memory and shown by /debug perf, which
+can also dump it in Prometheus text format.
+
+Usage:
+    with perf.span("effects.process"):
+        ...
+
+    @timed("db.load_character")
+    async def load_character(...):
+        ...
+
+    perf.count("firebase.calls", op="get")
+"""
+
+import asyncio
+import bisect
+import functools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+# Histogram bucket upper bounds in seconds
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SAMPLE_WINDOW = 1024
+
+
+class Histogram:
+    """Latency histogram with fixed buckets and a window of recent samples"""
+
+    def __init__(self, window: int = SAMPLE_WINDOW):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)
+        self.samples: deque = deque(maxlen=window)
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.buckets[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.samples.append(seconds)
+
+    def percentile(self, pct: float) -> float:
+        """Percentile (0-100) of the recent samples"""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class PerfStats:
+    """In-memory registry of histograms and counters"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.histograms: Dict[Tuple[str, str], Histogram] = {}
+        self.counters: Dict[Tuple[str, str], float] = {}
+        self.started = time.time()
+
+    def observe(self, metric: str, name: str, seconds: float) -> None:
+        """Record a duration for a metric (e.g. "command") and name (e.g. "initiative next")"""
+        with self._lock:
+            histogram = self.histograms.get((metric, name))
+            if histogram is None:
+                histogram = self.histograms[(metric, name)] = Histogram()
+            histogram.observe(seconds)
+
+    def count(self, name: str, value: float = 1, op: str = "") -> None:
+        """Increment a counter, optionally split by operation"""
+        with self._lock:
+            key = (name, op)
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    @contextmanager
+    def span(self, name: str, metric: str = "span"):
+        """Time a block of code"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(metric, name, time.perf_counter() - start)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+            self.started = time.time()
+
+    def top(self, metric: str, limit: int = 10) -> List[Tuple[str, Histogram]]:
+        """Slowest names for a metric, by p95"""
+        with self._lock:
+            items = [(name, hist) for (kind, name), hist in self.histograms.items() if kind == metric]
+        items.sort(key=lambda item: item[1].percentile(95), reverse=True)
+        return items[:limit]
+
+    def prometheus(self, prefix: str = "rpbot") -> str:
+        """All metrics in Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            histograms = sorted(self.histograms.items())
+            counters = sorted(self.counters.items())
+
+        seen = set()
+        for (metric, name), hist in histograms:
+            full = f"{prefix}_{_metric_name(metric)}_seconds"
+            if full not in seen:
+                lines.append(f"# TYPE {full} histogram")
+                seen.add(full)
+            label = f'name="{_escape(name)}"'
+            cumulative = 0
+            for bound, bucket in zip(BUCKETS, hist.buckets):
+                cumulative += bucket
+                lines.append(f'{full}_bucket{{{label},le="{bound}"}} {cumulative}')
+            lines.append(f'{full}_bucket{{{label},le="+Inf"}} {hist.count}')
+            lines.append(f"{full}_sum{{{label}}} {hist.total:.6f}")
+            lines.append(f"{full}_count{{{label}}} {hist.count}")
+
+        for (name, op), value in counters:
+            full = f"{prefix}_{_metric_name(name)}_total"
+            if full not in seen:
+                lines.append(f"# TYPE {full} counter")
+                seen.add(full)
+            label = f'{{op="{_escape(op)}"}}' if op else ""
+            lines.append(f"{full}{label} {value:g}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _metric_name(name: str) -> str:
+    return "".join(ch if ch.isalnum() else "_" for ch in name)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+# Shared registry for the whole bot
+perf = PerfStats()
+
+
+def timed(name: str, metric: str = "span"):
+    """Decorator that records how long a sync or async function takes"""
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    perf.observe(metric, name, time.perf_counter() - start)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                perf.observe(metric, name, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def format_ms(seconds: float) -> str:
+    return f"{seconds * 1000:.1f}ms" if seconds < 1 else f"{seconds:.2f}s"
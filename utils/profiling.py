@@ -0,0 +1,144 @@
+"""
+On-demand profiling of the live bot.
+
+Used by /debug profile and /debug memory. A capture runs for a bounded number
+of seconds, or until a number of slash commands have completed, whichever
+comes first:
+
+- profile_capture() runs cProfile over the event loop thread and returns a
+  text report ranked by cumulative time plus the raw .pstats file
+- memory_capture() takes tracemalloc snapshots before and after and returns
+  the allocation sites that grew the most
+
+Only one capture can run at a time.
+"""
+
+import asyncio
+import cProfile
+import io
+import marshal
+import pstats
+import tracemalloc
+from typing import Optional, Tuple
+
+MAX_CAPTURE_SECONDS = 120
+REPORT_LINES = 40
+TRACE_FRAMES = 10
+
+
+class CaptureBusy(Exception):
+    """Raised when a capture is already running"""
+
+
+class CaptureWindow:
+    """Ends after a number of seconds or a number of completed commands"""
+
+    def __init__(self):
+        self._lock = asyncio.Lock()
+        self._commands_left: Optional[int] = None
+        self._done: Optional[asyncio.Event] = None
+
+    @property
+    def running(self) -> bool:
+        return self._lock.locked()
+
+    def note_command(self) -> None:
+        """Called whenever a slash command completes"""
+        if self._commands_left is None or self._done is None:
+            return
+        self._commands_left -= 1
+        if self._commands_left <= 0:
+            self._done.set()
+
+    async def run(self, seconds: float, commands: Optional[int] = None) -> None:
+        """Wait for the window to close. Raises CaptureBusy if one is already open."""
+        if self._lock.locked():
+            raise CaptureBusy("A capture is already running")
+        async with self._lock:
+            self._done = asyncio.Event()
+            self._commands_left = commands if commands and commands > 0 else None
+            try:
+                await asyncio.wait_for(self._done.wait(), timeout=min(seconds, MAX_CAPTURE_SECONDS))
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                self._done = None
+                self._commands_left = None
+
+
+# Shared window so command completions can end a running capture
+window = CaptureWindow()
+
+
+async def profile_capture(
+        seconds: float,
+        commands: Optional[int] = None,
+        sort: str = "cumulative"
+    ) -> Tuple[str, bytes]:
+    """
+    Profile everything the event loop runs during the window.
+    Returns (text report, pstats file contents).
+    """
+    # Check before enabling: a second profiler can't be enabled while one is running
+    if window.running:
+        raise CaptureBusy("A capture is already running")
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        await window.run(seconds, commands)
+    finally:
+        profiler.disable()
+
+    output = io.StringIO()
+    stats = pstats.Stats(profiler, stream=output)
+    stats.strip_dirs().sort_stats(sort).print_stats(REPORT_LINES)
+
+    # Same format as Stats.dump_stats, so it opens with pstats/snakeviz
+    raw = marshal.dumps(pstats.Stats(profiler).stats)
+    return output.getvalue(), raw
+
+
+async def memory_capture(
+        seconds: float,
+        commands: Optional[int] = None,
+        limit: int = REPORT_LINES
+    ) -> str:
+    """Diff tracemalloc snapshots taken before and after the window"""
+    if window.running:
+        raise CaptureBusy("A capture is already running")
+
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start(TRACE_FRAMES)
+
+    try:
+        before = _snapshot()
+        await window.run(seconds, commands)
+        after = _snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        if started:
+            tracemalloc.stop()
+
+    diff = after.compare_to(before, "lineno")
+    lines = [
+        f"Top {limit} allocation sites by growth",
+        f"Traced memory: {current / 1024:.1f} KiB (peak {peak / 1024:.1f} KiB)",
+        ""
+    ]
+    for stat in diff[:limit]:
+        frame = stat.traceback[0]
+        lines.append(
+            f"{frame.filename}:{frame.lineno}: {stat.size_diff / 1024:+.1f} KiB "
+            f"({stat.count_diff:+d} blocks, {stat.size / 1024:.1f} KiB total)"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    ))
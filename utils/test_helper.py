@@ -572,9 +572,11 @@ async def test_cooldown_move(bot, interaction):
     else:
         print("Move effect not found (expected to be in cooldown state)")
     
-    # Register move in action stars system (normally done by the move command)
+    # Start the cooldown in the combat's scheduler (normally done by the move command)
     # Use the safely extracted cooldown_duration
-    char.action_stars.start_cooldown(move.name, cooldown_duration)
+    bot.initiative_tracker.cooldowns.start(
+        char.name, move.name, bot.initiative_tracker.round_number, cooldown_duration
+    )
     
     # Save character
     await bot.db.save_character(char)
@@ -586,8 +588,8 @@ async def test_cooldown_move(bot, interaction):
     # Refresh character reference
     char = bot.game_state.get_character("test")
     
-    # Check cooldown status in action stars
-    in_cooldown = move.name in char.action_stars.used_moves
+    # Check cooldown status in the combat's scheduler
+    in_cooldown = bot.initiative_tracker.cooldown_remaining(char, move.name) > 0
     print(f"\nFinal state - Move in cooldown: {in_cooldown} (expected: False after cooldown)")
     
     # Try to use the move again after cooldown
@@ -702,8 +704,8 @@ async def test_full_phase_move(bot, interaction):
     has_effect = any(e.name == move.name for e in char.effects)
     print(f"\nFinal state - Has effect: {has_effect} (expected: False after all phases)")
     
-    # Check cooldown status in action stars
-    in_cooldown = move.name in char.action_stars.used_moves
+    # Check cooldown status in the combat's scheduler
+    in_cooldown = bot.initiative_tracker.cooldown_remaining(char, move.name) > 0
     print(f"Move in cooldown: {in_cooldown} (expected: False after all phases)")
     
     print("Full phase move test complete")
@@ -1106,8 +1108,8 @@ async def test_cleanup(bot, interaction):
         char.resources.max_temp_hp = 0
         char.defense.current_ac = char.defense.base_ac
         
-        # Clear action stars cooldowns
-        char.action_stars.clear_cooldowns()
+        # Clear move cooldowns and uses
+        char.clear_cooldowns()
         
         # Log changes
         print(f"\nCleanup for {char.name}:")
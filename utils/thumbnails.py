@@ -0,0 +1,162 @@
+"""
+Thumbnail generation for stored art references.
+
+Images are decoded and resized in a process pool so the CPU work never runs
+on the bot's event loop. Thumbnails are cached on disk by the content hash
+of the source image, so each image is only resized once no matter how many
+requests reference it.
+
+Needs Pillow. Without it get() always returns None and embeds simply go
+without previews.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from utils.attachment_store import is_within
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_SIZE = (256, 256)
+THUMBNAIL_QUALITY = 80
+THUMBNAIL_WORKERS = 2
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".bmp"}
+
+
+def render_thumbnail(source: str, dest: str, size: Tuple[int, int], quality: int) -> str:
+    """
+    Resize an image and save it as WebP (or JPEG if WebP isn't supported).
+    Runs in a worker process.
+    """
+    with Image.open(source) as img:
+        img.seek(0)  # First frame of animated images
+        img.thumbnail(size)
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA" if "transparency" in img.info else "RGB")
+
+        tmp_path = dest + ".part"
+        try:
+            img.save(tmp_path, format="WEBP", quality=quality)
+        except (OSError, KeyError):
+            # Pillow built without WebP support
+            dest = os.path.splitext(dest)[0] + ".jpg"
+            img.convert("RGB").save(tmp_path, format="JPEG", quality=quality)
+
+    os.replace(tmp_path, dest)
+    return dest
+
+
+def file_hash(path: str, chunk_size: int = 64 * 1024) -> str:
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ThumbnailService:
+    """Process-pool backed thumbnail generator with an on-disk cache"""
+
+    def __init__(
+            self,
+            cache_dir: str,
+            source_root: Optional[str] = None,
+            size: Tuple[int, int] = THUMBNAIL_SIZE,
+            quality: int = THUMBNAIL_QUALITY,
+            max_workers: int = THUMBNAIL_WORKERS
+        ):
+        self.cache_dir = cache_dir
+        self.source_root = source_root  # Only images under here are opened, if set
+        self.size = size
+        self.quality = quality
+        self.max_workers = max_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    @property
+    def available(self) -> bool:
+        return PIL_AVAILABLE
+
+    def _content_key(self, path: str) -> str:
+        """Content hash of an image. Stored attachments are already named by it."""
+        name = os.path.splitext(os.path.basename(path))[0]
+        if re.fullmatch(r"[0-9a-f]{64}", name):
+            return name
+        return file_hash(path)
+
+    def _cached_path(self, key: str) -> Optional[str]:
+        base = os.path.join(self.cache_dir, f"{key}_{self.size[0]}x{self.size[1]}")
+        for ext in (".webp", ".jpg"):
+            if os.path.exists(base + ext):
+                return base + ext
+        return None
+
+    async def get(self, path: str) -> Optional[str]:
+        """
+        Get the path of a thumbnail for an image, generating it if needed.
+        Returns None if the file isn't an image or can't be read.
+        """
+        if not PIL_AVAILABLE or os.path.splitext(path)[1].lower() not in IMAGE_EXTENSIONS:
+            return None
+        if self.source_root and not is_within(path, self.source_root):
+            logger.warning(f"Refusing to thumbnail a file outside {self.source_root}: {path}")
+            return None
+
+        try:
+            if not os.path.exists(path):
+                return None
+            key = await asyncio.to_thread(self._content_key, path)
+
+            cached = self._cached_path(key)
+            if cached:
+                return cached
+
+            # Share one render between concurrent requests for the same image
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = asyncio.ensure_future(self._render(path, key))
+                self._pending[key] = pending
+                pending.add_done_callback(lambda _: self._pending.pop(key, None))
+            return await asyncio.shield(pending)
+
+        except Exception as e:
+            logger.warning(f"Couldn't create thumbnail for {path}: {e}")
+            return None
+
+    async def _render(self, path: str, key: str) -> str:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        dest = os.path.join(self.cache_dir, f"{key}_{self.size[0]}x{self.size[1]}.webp")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._pool, render_thumbnail, path, dest, self.size, self.quality
+        )
+
+    def discard(self, path: str) -> None:
+        """Remove cached thumbnails for a stored attachment that was deleted"""
+        name = os.path.splitext(os.path.basename(path))[0]
+        if not re.fullmatch(r"[0-9a-f]{64}", name):
+            return
+        cached = self._cached_path(name)
+        if cached:
+            os.remove(cached)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes"""
+        if self._pool:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None